@@ -0,0 +1,65 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lazy package exports (PEP 562 module ``__getattr__``).
+
+A package ``__init__`` that re-exports names from its submodules imports
+every one of them — and their matplotlib/pandas/pint dependencies — even
+when the caller needs one function.  :func:`lazy_exports` lets the
+``__init__`` declare which submodule provides each name instead; the
+submodule is imported the first time one of its names is touched:
+
+    __getattr__, __dir__ = lazy_exports(__name__, {
+        "boring": ("Borehole", "Sample"),
+        "spt": (),  # the submodule itself, as ``package.spt``
+    })
+
+``from package import Borehole`` and ``package.spt`` keep working
+unchanged.  Exported names that shadow a submodule of the same name are
+the one exception and are bound eagerly.
+"""
+
+import importlib
+import sys
+
+
+def lazy_exports(package: str, exports: dict[str, tuple[str, ...]]):
+    """``(__getattr__, __dir__)`` for ``package``, resolving each name in
+    ``exports[submodule]`` (and each submodule name) on first access."""
+    owner = {name: submodule for submodule, names in exports.items()
+             for name in names}
+    # A name that shadows its own submodule (``box_beam_design`` the
+    # function in ``box_beam_design`` the module) is bound now: a later
+    # direct import of the submodule would otherwise rebind the package
+    # attribute to the module and ``__getattr__`` would never see it.
+    for name in set(owner) & set(exports):
+        module = importlib.import_module(f"{package}.{owner[name]}")
+        setattr(sys.modules[package], name, getattr(module, name))
+
+    def __getattr__(name: str):
+        if name in exports:
+            return importlib.import_module(f"{package}.{name}")
+        if name not in owner:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(f"{package}.{owner[name]}")
+        value = getattr(module, name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(owner) | set(exports))
+
+    return __getattr__, __dir__
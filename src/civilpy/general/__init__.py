@@ -16,22 +16,49 @@ You should have received a copy of the GNU Affero General Public License
 along with this program.  If not, see <http://www.gnu.org/licenses/>.
 """
 
-from pint import UnitRegistry
-import pandas as pd
+import threading
 
-try:
-    from sqlalchemy import text
-except ImportError:  # SQLAlchemy is an optional dependency (db extra)
-    text = None
 
-units = UnitRegistry()
+def _unit_registry():
+    from pint import UnitRegistry
+
+    return UnitRegistry()
+
+
+def _sqlalchemy_text():
+    try:
+        from sqlalchemy import text
+    except ImportError:  # SQLAlchemy is an optional dependency (db extra)
+        text = None
+    return text
+
+
+# Module attributes built on first access: the shared pint registry costs
+# more to create than importing most of the package, and SQLAlchemy is only
+# needed by the DB helpers.  The lock keeps concurrent first users on one
+# registry.
+_LAZY_ATTRIBUTES = {"units": _unit_registry, "text": _sqlalchemy_text}
+_lazy_lock = threading.Lock()
+
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    with _lazy_lock:
+        if name not in globals():
+            globals()[name] = _LAZY_ATTRIBUTES[name]()
+    return globals()[name]
+
 
 def get_table_as_df(conn, schema, table):
+    text = __getattr__("text")
     if text is None:
         raise ImportError(
             "SQLAlchemy is required for database functions. "
             "Install with: pip install civilpy[db]"
         )
+    import pandas as pd
+
     query = text(f"SELECT * FROM {schema}.{table}")
     result = conn.execute(query)
     df = pd.DataFrame(result.fetchall(), columns=result.keys())
@@ -18,18 +18,18 @@ along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import math
 import numpy as np
-import matplotlib.pyplot as plt
-
-from civilpy.geotech import deep_foundation, spt
-from civilpy.geotech.boring import (
-    Borehole,
-    DriveIncrement,
-    GradingPoint,
-    GradingResult,
-    Sample,
-    SPTResult,
-)
-from civilpy.geotech.boring_io import parse_diggs, read_pdf_log
+
+from civilpy._lazy import lazy_exports
+
+# Submodule exports resolve on first use so importing the package for the
+# earth-pressure functions below stays cheap.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "deep_foundation": (),
+    "spt": (),
+    "boring": ("Borehole", "DriveIncrement", "GradingPoint", "GradingResult",
+               "Sample", "SPTResult"),
+    "boring_io": ("parse_diggs", "read_pdf_log"),
+})
 
 # civilpy.geotech.cande_adapter is intentionally not imported here: it
 # depends on civilpy.structural.cande, so it stays an opt-in submodule
@@ -247,6 +247,8 @@ def culmann_lateral_pressure(
             max_pressure = P_a
             best_failure_angle = np.degrees(theta)
 
+    import matplotlib.pyplot as plt
+
     # Plotting the failure surfaces
     theta_values = np.linspace(0, np.pi / 2, num_slices)
     pressure_values = [
@@ -338,6 +340,8 @@ def culmann_lateral_pressure_with_surcharge(
             max_pressure = P_total
             best_failure_angle = np.degrees(theta)
 
+    import matplotlib.pyplot as plt
+
     # Plotting the failure surfaces
     theta_values = np.linspace(0, np.pi / 2, num_slices)
     pressure_values = [
@@ -48,6 +48,8 @@ from dataclasses import dataclass
 
 import numpy as np
 
+from civilpy.geotech.curve_stack import CurveStack
+
 #: A small displacement floor (in) so a secant modulus stays finite at w = 0.
 _W_FLOOR = 1.0e-6
 
@@ -65,9 +67,14 @@ _API_QZ = ((0.0, 0.0), (0.002, 0.25), (0.013, 0.50), (0.042, 0.75),
 def _interp_ratio(table, x: float) -> float:
     """Linear interpolation on a normalised ``((x, ratio), ...)`` backbone,
     clamped flat beyond the last point."""
+    return float(_interp_ratio_array(table, x))
+
+
+def _interp_ratio_array(table, x) -> np.ndarray:
+    """:func:`_interp_ratio` over an array of ``x``."""
     xs = [p[0] for p in table]
     ys = [p[1] for p in table]
-    return float(np.interp(abs(x), xs, ys))
+    return np.interp(np.abs(x), xs, ys)
 
 
 # ============================================================ t-z curves
@@ -90,6 +97,20 @@ class TZCurve:
         ww = max(abs(w), _W_FLOOR)
         return self.t(ww) / ww
 
+    #: True when the ``*_array`` methods use only NumPy operations on the
+    #: dataclass fields (see :mod:`civilpy.geotech.curve_stack`).
+    _array_fields = False
+
+    def t_array(self, w) -> np.ndarray:
+        """:meth:`t` over an array of displacements.  This generic version
+        loops; the API curve overrides it with a NumPy expression."""
+        return np.vectorize(self.t, otypes=[float])(w)
+
+    def secant_array(self, w) -> np.ndarray:
+        """:meth:`secant_modulus` over an array of displacements."""
+        ww = np.maximum(np.abs(w), _W_FLOOR)
+        return self.t_array(ww) / ww
+
 
 @dataclass
 class APITZCurve(TZCurve):
@@ -114,6 +135,23 @@ class APITZCurve(TZCurve):
             raise ValueError(f"unknown soil {self.soil!r} (use 'clay' or 'sand')")
         return math.copysign(ratio * self.t_max, w) if w else 0.0
 
+    _array_fields = True
+
+    def t_array(self, w) -> np.ndarray:
+        w = np.asarray(w, dtype=float)
+        soil = np.asarray(self.soil)
+        sand = soil == "sand"
+        unknown = ~sand & (soil != "clay")
+        if np.any(unknown):
+            bad = soil[unknown].flat[0] if soil.ndim else self.soil
+            raise ValueError(f"unknown soil {bad!r} (use 'clay' or 'sand')")
+        ratio = np.where(
+            sand,
+            _interp_ratio_array(_API_TZ_SAND, w),
+            _interp_ratio_array(_API_TZ_CLAY, np.abs(w) / self.diameter),
+        )
+        return np.sign(w) * ratio * self.t_max
+
 
 # ============================================================ q-z curve
 
@@ -133,6 +171,17 @@ class QZCurve:
         ww = max(abs(w), _W_FLOOR)
         return self.q(ww) / ww
 
+    _array_fields = False
+
+    def q_array(self, w) -> np.ndarray:
+        """:meth:`q` over an array of settlements (generic loop)."""
+        return np.vectorize(self.q, otypes=[float])(w)
+
+    def secant_array(self, w) -> np.ndarray:
+        """:meth:`secant_modulus` over an array of settlements."""
+        ww = np.maximum(np.abs(w), _W_FLOOR)
+        return self.q_array(ww) / ww
+
 
 @dataclass
 class APIQZCurve(QZCurve):
@@ -148,6 +197,13 @@ class APIQZCurve(QZCurve):
         # q-z is one-sided: the tip bears only in compression (downward +).
         return ratio * self.q_max if w > 0 else 0.0
 
+    _array_fields = True
+
+    def q_array(self, w) -> np.ndarray:
+        w = np.asarray(w, dtype=float)
+        ratio = _interp_ratio_array(_API_QZ, np.abs(w) / self.diameter)
+        return np.where(w > 0.0, ratio * self.q_max, 0.0)
+
 
 # ============================================================ helpers
 
@@ -158,7 +214,7 @@ def spring_constant_kip_per_in(force_lb_per_in_or_lb: float) -> float:
 
 
 def axial_pile_springs(
-    curve: TZCurve,
+    curve,
     embedded_length: float,
     n_nodes: int,
     design_disp: float,
@@ -170,14 +226,18 @@ def axial_pile_springs(
     (in) times the tributary length (in) the node represents -- a linearised
     Winkler spring suitable for a MIDAS nodal spring support.  ``end`` nodes
     carry half the tributary length.  ``embedded_length`` is in inches.
+    ``curve`` is one :class:`TZCurve` or a layered
+    :class:`~civilpy.geotech.curve_stack.CurveStack` of them (layer depths
+    in inches).
     """
     if n_nodes < 2:
         raise ValueError("need at least two nodes to span the embedment")
     h = embedded_length / (n_nodes - 1)
-    es = curve.secant_modulus(design_disp)
-    out = []
-    for i in range(n_nodes):
-        trib = h if 0 < i < n_nodes - 1 else h / 2.0
-        depth = i * h
-        out.append((round(depth, 6), es * trib))
-    return out
+    depth = np.arange(n_nodes) * h
+    trib = np.full(n_nodes, h)
+    trib[[0, -1]] = h / 2.0
+    if isinstance(curve, CurveStack):
+        es = curve.evaluate("secant_array", depth, np.full(n_nodes, design_disp))
+    else:
+        es = curve.secant_modulus(design_disp)
+    return list(zip(np.round(depth, 6).tolist(), (es * trib).tolist()))
@@ -0,0 +1,153 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Layered soil-spring curves evaluated over depth arrays.
+
+A :class:`CurveStack` is the array counterpart of a ``curve_at(z)``
+callable: it holds one curve per layer -- p-y
+(:mod:`civilpy.geotech.lateral_pile`) or t-z / q-z
+(:mod:`civilpy.geotech.axial_load_transfer`) -- with the layer boundaries,
+and maps a whole depth array to layers at once.  Layers whose curves belong
+to the same family are merged into one curve instance whose parameters are
+per-node arrays, so a family's springs at every node are a single NumPy
+expression however many layers use it.
+
+>>> import numpy as np
+>>> from civilpy.geotech.curve_stack import CurveStack
+>>> from civilpy.geotech.lateral_pile import SoftClayPY
+>>> stack = CurveStack(
+...     [SoftClayPY(cu=5.0, b=12.0, gamma=0.04),
+...      SoftClayPY(cu=10.0, b=12.0, gamma=0.04)],
+...     tops=[0.0, 120.0],
+... )
+>>> depth = np.array([60.0, 119.0, 120.0, 500.0])
+>>> stack.layer_index(depth)
+array([0, 0, 1, 1])
+>>> stack.evaluate("pu_array", depth, depth).round(1)
+array([ 358.8,  534.6, 1017.6, 1080. ])
+
+A family takes part in the merge when its class sets ``_array_fields =
+True``, i.e. its ``*_array`` methods use only NumPy operations on the
+dataclass fields; any other curve is evaluated layer by layer.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+
+import numpy as np
+
+
+def group_curves(node_curves) -> list[tuple[object, np.ndarray]]:
+    """Group a per-node sequence of curves into ``(curve, node_indices)``
+    pairs: one pair per distinct curve, with all curves of an array-capable
+    family merged into a single instance with per-node parameter arrays."""
+    distinct = {}
+    for i, curve in enumerate(node_curves):
+        distinct.setdefault(id(curve), (curve, []))[1].append(i)
+
+    groups = []
+    families = {}
+    for curve, nodes in distinct.values():
+        if getattr(type(curve), "_array_fields", False) and dataclasses.is_dataclass(curve):
+            families.setdefault(type(curve), []).append((curve, nodes))
+        else:
+            groups.append((curve, np.array(nodes)))
+    for cls, members in families.items():
+        if len(members) == 1:
+            curve, nodes = members[0]
+            groups.append((curve, np.array(nodes)))
+            continue
+        counts = [len(nodes) for _, nodes in members]
+        params = {
+            f.name: np.repeat(np.array([getattr(c, f.name) for c, _ in members]), counts)
+            for f in dataclasses.fields(cls) if f.init
+        }
+        nodes = np.concatenate([np.array(n) for _, n in members])
+        groups.append((cls(**params), nodes))
+    return groups
+
+
+class CurveStack:
+    """Soil-spring curves by layer.
+
+    ``curves[i]`` governs depths ``tops[i] <= z < bottoms[i]``; ``bottoms``
+    defaults to the next layer's top (the last layer is unbounded).  A depth
+    inside no layer takes the deepest layer, matching
+    :meth:`civilpy.geotech.lpile.LPileModel.curve_at`.  The stack is also a
+    ``curve_at`` callable, so it can stand in wherever one is accepted.
+    """
+
+    def __init__(self, curves, tops, bottoms=None):
+        if not len(curves):
+            raise ValueError("a curve stack needs at least one layer")
+        tops = np.asarray(tops, dtype=float)
+        if bottoms is None:
+            bottoms = np.append(tops[1:], np.inf)
+        bottoms = np.asarray(bottoms, dtype=float)
+        if not len(curves) == len(tops) == len(bottoms):
+            raise ValueError("need one top and bottom per curve")
+        self.curves = list(curves)
+        self.tops = tops
+        self.bottoms = bottoms
+
+    @classmethod
+    def from_layers(cls, layers) -> "CurveStack":
+        """Stack from layer objects with ``top``, ``bottom`` and ``curve``
+        (e.g. :class:`~civilpy.geotech.lpile.LPileSoilLayer`), in order."""
+        return cls(
+            [lyr.curve for lyr in layers],
+            [lyr.top for lyr in layers],
+            [lyr.bottom for lyr in layers],
+        )
+
+    def __len__(self) -> int:
+        return len(self.curves)
+
+    def __repr__(self) -> str:
+        names = ", ".join(type(c).__name__ for c in self.curves)
+        return f"CurveStack([{names}])"
+
+    def layer_index(self, depth) -> np.ndarray:
+        """Layer number governing each depth."""
+        depth = np.asarray(depth, dtype=float)
+        index = np.full(depth.shape, len(self.curves) - 1)
+        # walk bottom-up so the first (shallowest) containing layer wins
+        for i in range(len(self.curves) - 1, -1, -1):
+            index[(self.tops[i] <= depth) & (depth < self.bottoms[i])] = i
+        return index
+
+    def curve_at(self, depth: float):
+        """The curve governing a single depth."""
+        return self.curves[int(self.layer_index(depth))]
+
+    __call__ = curve_at
+
+    def groups(self, depth) -> list[tuple[object, np.ndarray]]:
+        """:func:`group_curves` for the nodes at ``depth``."""
+        return group_curves([self.curves[i] for i in self.layer_index(depth)])
+
+    def evaluate(self, method: str, depth, *args) -> np.ndarray:
+        """Call ``curve.<method>(*args)`` for the nodes of every group and
+        assemble the result.  ``args`` are arrays whose last axis runs over
+        the nodes at ``depth`` -- e.g. ``evaluate("p_array", z, y, z)`` for
+        p-y resistance or ``evaluate("t_array", z, w)`` for t-z."""
+        depth = np.asarray(depth, dtype=float)
+        args = np.broadcast_arrays(*(np.asarray(a, dtype=float) for a in args))
+        out = np.empty(args[0].shape if args else depth.shape)
+        for curve, nodes in self.groups(depth):
+            out[..., nodes] = getattr(curve, method)(*(a[..., nodes] for a in args))
+        return out
@@ -22,7 +22,11 @@ The p-y curve classes (:class:`SoftClayPY`, :class:`StiffClayPY`,
 :class:`SandPY`, :class:`LinearPY`) are the reusable core: they expose a
 common ``p(y, z)`` (soil resistance per unit length) and ``pu(z)`` (ultimate
 resistance) so the same soil models drive both the in-process solver here
-and the LPILE input-file generator in :mod:`civilpy.geotech.lpile`.
+and the LPILE input-file generator in :mod:`civilpy.geotech.lpile`.  Their
+``p_array(y, z)`` / ``pu_array(z)`` forms take arrays of deflection and
+depth (and array-valued parameters, which is how a layered
+:class:`~civilpy.geotech.curve_stack.CurveStack` evaluates a whole family
+at once), so the solver evaluates every node's spring in one expression.
 
 Curve references: soft clay -- Matlock (1970); stiff clay without free
 water -- Reese & Welch (1975); sand -- the API RP 2A / O'Neill & Murchison
@@ -40,6 +44,9 @@ from dataclasses import dataclass, field
 
 import matplotlib.pyplot as plt
 import numpy as np
+from scipy.linalg import solveh_banded
+
+from civilpy.geotech.curve_stack import CurveStack, group_curves
 
 #: A small deflection floor (in) used to form a secant soil modulus near
 #: y = 0 without dividing by zero.
@@ -65,6 +72,39 @@ class PYCurve:
         yy = max(abs(y), _Y_FLOOR)
         return self.p(yy, z) / yy
 
+    #: True when the ``*_array`` methods use only NumPy operations on the
+    #: dataclass fields, so layers of this family can be merged into one
+    #: instance with per-node parameter arrays (see
+    #: :mod:`civilpy.geotech.curve_stack`).
+    _array_fields = False
+
+    def pu_array(self, z) -> np.ndarray:
+        """:meth:`pu` over an array of depths (generic loop)."""
+        return np.vectorize(self.pu, otypes=[float])(z)
+
+    def p_array(self, y, z) -> np.ndarray:
+        """:meth:`p` over broadcast arrays of deflection ``y`` and depth
+        ``z``.  This generic version loops over :meth:`p`; the built-in
+        families override it with a single NumPy expression."""
+        return np.vectorize(self.p, otypes=[float])(y, z)
+
+    def secant_array(self, y, z) -> np.ndarray:
+        """:meth:`secant_modulus` over broadcast arrays."""
+        yy = np.maximum(np.abs(y), _Y_FLOOR)
+        return self.p_array(yy, z) / yy
+
+    def tangent_array(self, y, z) -> np.ndarray:
+        """Tangent modulus (psi) of the floored curve ``secant * y`` the
+        solver works with (linear below the deflection floor), by a central
+        difference over broadcast arrays -- the curves have kinks at pu, so
+        no closed form is assumed."""
+        y = np.asarray(y, dtype=float)
+        dy = 1.0e-4 * np.maximum(np.abs(y), _Y_FLOOR)
+        up, down = y + dy, y - dy
+        return (
+            self.secant_array(up, z) * up - self.secant_array(down, z) * down
+        ) / (2.0 * dy)
+
 
 @dataclass
 class LinearPY(PYCurve):
@@ -81,6 +121,15 @@ class LinearPY(PYCurve):
     def p(self, y: float, z: float) -> float:
         return math.copysign(min(self.k * abs(y), self.p_ult), y)
 
+    _array_fields = True
+
+    def pu_array(self, z) -> np.ndarray:
+        return np.broadcast_to(self.p_ult, np.shape(z)).astype(float)
+
+    def p_array(self, y, z) -> np.ndarray:
+        y, _ = np.broadcast_arrays(np.asarray(y, dtype=float), z)
+        return np.sign(y) * np.minimum(self.k * np.abs(y), self.p_ult)
+
 
 @dataclass
 class SoftClayPY(PYCurve):
@@ -117,6 +166,20 @@ class SoftClayPY(PYCurve):
         p = min(p, pu)
         return math.copysign(p, y) if y else 0.0
 
+    _array_fields = True
+
+    def pu_array(self, z) -> np.ndarray:
+        z = np.asarray(z, dtype=float)
+        np_ = 3.0 + self.gamma * z / self.cu + self.J * z / self.b
+        return np.minimum(np_, 9.0) * self.cu * self.b
+
+    def p_array(self, y, z) -> np.ndarray:
+        y = np.asarray(y, dtype=float)
+        pu = self.pu_array(z)
+        ya = np.abs(y)
+        p = np.where(ya >= 8.0 * self.y50, pu, 0.5 * pu * (ya / self.y50) ** (1.0 / 3.0))
+        return np.sign(y) * np.minimum(p, pu)
+
 
 @dataclass
 class StiffClayPY(PYCurve):
@@ -150,29 +213,45 @@ class StiffClayPY(PYCurve):
         p = min(p, pu)
         return math.copysign(p, y) if y else 0.0
 
+    _array_fields = True
+
+    def pu_array(self, z) -> np.ndarray:
+        z = np.asarray(z, dtype=float)
+        np_ = 3.0 + self.gamma * z / self.cu + self.J * z / self.b
+        return np.minimum(np_, 9.0) * self.cu * self.b
+
+    def p_array(self, y, z) -> np.ndarray:
+        y = np.asarray(y, dtype=float)
+        pu = self.pu_array(z)
+        ya = np.abs(y)
+        p = np.where(ya >= 16.0 * self.y50, pu, 0.5 * pu * (ya / self.y50) ** 0.25)
+        return np.sign(y) * np.minimum(p, pu)
+
 
 def reese_sand_pu(phi_deg: float, gamma: float, b: float, z: float) -> float:
     """Reese (1974) ultimate sand resistance per unit length (lb/in), the
     lesser of the wedge (shallow) and flow-around (deep) failure values.
 
     ``phi_deg`` friction angle, ``gamma`` effective unit weight (pci), ``b``
-    diameter (in), ``z`` depth (in)."""
-    phi = math.radians(phi_deg)
+    diameter (in), ``z`` depth (in).  Any argument may be an array (the
+    result is then an array)."""
+    phi = np.radians(phi_deg)
     alpha = phi / 2.0
-    beta = math.radians(45.0 + phi_deg / 2.0)
+    beta = np.radians(45.0 + np.asarray(phi_deg) / 2.0)
     k0 = 0.4
-    ka = math.tan(math.radians(45.0 - phi_deg / 2.0)) ** 2
-    tan_bmp = math.tan(beta - phi)
+    ka = np.tan(np.radians(45.0 - np.asarray(phi_deg) / 2.0)) ** 2
+    tan_bmp = np.tan(beta - phi)
     pst = gamma * z * (
-        k0 * z * math.tan(phi) * math.sin(beta) / (tan_bmp * math.cos(alpha))
-        + math.tan(beta) / tan_bmp * (b + z * math.tan(beta) * math.tan(alpha))
-        + k0 * z * math.tan(beta) * (math.tan(phi) * math.sin(beta) - math.tan(alpha))
+        k0 * z * np.tan(phi) * np.sin(beta) / (tan_bmp * np.cos(alpha))
+        + np.tan(beta) / tan_bmp * (b + z * np.tan(beta) * np.tan(alpha))
+        + k0 * z * np.tan(beta) * (np.tan(phi) * np.sin(beta) - np.tan(alpha))
         - ka * b
     )
-    psd = ka * b * gamma * z * (math.tan(beta) ** 8 - 1.0) + k0 * b * gamma * z * (
-        math.tan(phi) * math.tan(beta) ** 4
+    psd = ka * b * gamma * z * (np.tan(beta) ** 8 - 1.0) + k0 * b * gamma * z * (
+        np.tan(phi) * np.tan(beta) ** 4
     )
-    return min(pst, psd)
+    pu = np.minimum(pst, psd)
+    return float(pu) if np.ndim(pu) == 0 else pu
 
 
 def sand_subgrade_modulus(phi_deg: float, submerged: bool = False) -> float:
@@ -230,6 +309,23 @@ class SandPY(PYCurve):
         p = a * pu * math.tanh(arg)
         return math.copysign(p, y) if y else 0.0
 
+    _array_fields = True
+
+    def a_factor_array(self, z) -> np.ndarray:
+        z = np.asarray(z, dtype=float)
+        return np.where(self.static, np.maximum(3.0 - 0.8 * z / self.b, 0.9), 0.9)
+
+    def pu_array(self, z) -> np.ndarray:
+        return np.asarray(reese_sand_pu(self.phi_deg, self.gamma, self.b, z), dtype=float)
+
+    def p_array(self, y, z) -> np.ndarray:
+        y = np.asarray(y, dtype=float)
+        z = np.asarray(z, dtype=float)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a_pu = self.a_factor_array(z) * self.pu_array(z)
+            p = a_pu * np.tanh(self.k * z * np.abs(y) / a_pu)
+        return np.where(z > 0.0, np.sign(y) * p, 0.0)
+
 
 # ====================================================== FE p-y solver
 
@@ -305,32 +401,157 @@ def _beam_element_stiffness(ei: float, h: float) -> np.ndarray:
     ])
 
 
-def solve_lateral_pile(
+@dataclass
+class LateralPileBatchResult:
+    """Responses of several load cases / pile configurations solved
+    together.  Row ``i`` of each 2-D array is case ``i``; indexing gives
+    that case as a :class:`LateralPileResult`."""
+
+    depth: np.ndarray          # in, shared by every case
+    deflection: np.ndarray     # in, (n_case, n_node)
+    moment: np.ndarray         # lb-in
+    shear: np.ndarray          # lb
+    soil_reaction: np.ndarray  # lb/in
+    iterations: np.ndarray     # per case
+    converged: np.ndarray      # per case
+
+    def __len__(self) -> int:
+        return len(self.deflection)
+
+    def __getitem__(self, i: int) -> LateralPileResult:
+        return LateralPileResult(
+            depth=self.depth, deflection=self.deflection[i],
+            moment=self.moment[i], shear=self.shear[i],
+            soil_reaction=self.soil_reaction[i],
+            iterations=int(self.iterations[i]),
+            converged=bool(self.converged[i]),
+        )
+
+    @property
+    def head_deflection(self) -> np.ndarray:
+        return self.deflection[:, 0]
+
+    @property
+    def max_moment(self) -> np.ndarray:
+        return np.max(np.abs(self.moment), axis=1)
+
+
+class _NodeCurves:
+    """The p-y curve at every node, looked up once and grouped (see
+    :func:`~civilpy.geotech.curve_stack.group_curves`) so each curve family
+    evaluates all of its nodes, for every case, in one array call."""
+
+    def __init__(self, curves, depth: np.ndarray):
+        if isinstance(curves, CurveStack):
+            self.groups = curves.groups(depth)
+        else:
+            curve_at = curves if callable(curves) else (lambda z: curves)
+            self.groups = group_curves([curve_at(z) for z in depth])
+        self.depth = depth
+
+    def _apply(self, method: str, y: np.ndarray, **kw) -> np.ndarray:
+        out = np.empty_like(y)
+        for curve, idx in self.groups:
+            out[:, idx] = getattr(curve, method)(y[:, idx], self.depth[idx], **kw)
+        return out
+
+    def p(self, y):
+        return self._apply("p_array", y)
+
+    def secant(self, y):
+        return self._apply("secant_array", y)
+
+    def tangent(self, y):
+        return self._apply("tangent_array", y)
+
+
+# DOFs are [y_0, th_0, y_1, th_1, ...]: half-bandwidth 3, and the stacked
+# systems of a batch are independent diagonal blocks of one banded matrix.
+_BANDWIDTH = 3
+
+
+def _pile_band(ke: np.ndarray, n_elem: int) -> np.ndarray:
+    """Upper banded storage (``solveh_banded`` layout) of a pile of
+    ``n_elem`` identical elements with stiffness ``ke``."""
+    ab = np.zeros((_BANDWIDTH + 1, 2 * (n_elem + 1)))
+    first = 2 * np.arange(n_elem)
+    for a in range(4):
+        for b in range(a, 4):
+            ab[_BANDWIDTH + a - b, first + b] += ke[a, b]
+    return ab
+
+
+def _band_matvec(band: np.ndarray, u: np.ndarray) -> np.ndarray:
+    """``K @ u`` for each case, ``band`` (n_case, 4, ndof) symmetric upper
+    storage and ``u`` (n_case, ndof)."""
+    out = band[:, _BANDWIDTH] * u
+    for k in range(1, _BANDWIDTH + 1):
+        a = band[:, _BANDWIDTH - k, k:]
+        out[:, :-k] += a * u[:, k:]
+        out[:, k:] += a * u[:, :-k]
+    return out
+
+
+def _solve_blocks(band: np.ndarray, springs: np.ndarray, rhs: np.ndarray,
+                  fixed: np.ndarray) -> np.ndarray:
+    """Solve every case's ``(K + diag(springs on y DOFs)) u = rhs`` in one
+    banded Cholesky factorization, with head rotation held at zero where
+    ``fixed``."""
+    ab = band.copy()
+    ab[:, _BANDWIDTH, 0::2] += springs
+    rhs = rhs.copy()
+    if fixed.any():
+        # zero row/column of DOF 1 within the band, unit diagonal
+        ab[fixed, :, 1] = 0.0
+        for k in range(1, _BANDWIDTH + 1):
+            ab[fixed, _BANDWIDTH - k, 1 + k] = 0.0
+        ab[fixed, _BANDWIDTH, 1] = 1.0
+        rhs[fixed, 1] = 0.0
+    n_case, _, ndof = ab.shape
+    stacked = ab.transpose(1, 0, 2).reshape(_BANDWIDTH + 1, n_case * ndof)
+    return solveh_banded(stacked, rhs.ravel()).reshape(n_case, ndof)
+
+
+def solve_lateral_pile_batch(
     curves,
     length: float,
-    ei: float,
-    shear: float,
-    moment: float = 0.0,
+    ei,
+    shear,
+    moment=0.0,
     n_elem: int = 100,
-    fixed_head: bool = False,
+    fixed_head=False,
     max_iter: int = 100,
     tol: float = 1.0e-6,
     relax: float = 0.5,
-) -> LateralPileResult:
-    """Solve a laterally loaded pile by finite elements on nonlinear p-y
-    springs (the in-process equivalent of an LPILE run).
-
-    ``curves`` is one :class:`PYCurve` for the whole pile or a callable
-    ``curve(z)`` returning the curve at depth ``z`` (in).  ``length`` is the
-    embedded length (in), ``ei`` the flexural stiffness (lb-in^2), and
-    ``shear``/``moment`` the load applied at the pile head (lb, lb-in).  A
-    ``fixed_head`` pile has zero head rotation.  Soil springs use the secant
-    modulus and are iterated with under-relaxation ``relax`` until the head
-    deflection settles within ``tol``.
+    method: str = "secant",
+) -> LateralPileBatchResult:
+    """Solve many head-load cases / pile configurations on the same soil at
+    once -- a load-deflection curve, or the load cases of a pile group.
+
+    ``ei``, ``shear``, ``moment`` and ``fixed_head`` broadcast to the number
+    of cases; the other arguments are as for :func:`solve_lateral_pile`.
+    All cases are stacked as independent blocks of one banded system, so
+    each iteration is a single O(n) factorization and the p-y springs of
+    every node of every case are evaluated together; a case stops updating
+    once it has converged.
+
+    ``method="secant"`` iterates secant soil moduli with under-relaxation
+    ``relax`` (the classic scheme).  ``method="newton"`` uses the tangent
+    stiffness of the (floored) p-y curves with a line search and typically
+    converges in 5-20 iterations where the secant scheme needs 50-100.
     """
-    if length <= 0 or ei <= 0 or n_elem < 2:
+    if length <= 0 or n_elem < 2 or np.any(np.asarray(ei) <= 0):
         raise ValueError("length, ei must be positive and n_elem >= 2")
-    curve_at = curves if callable(curves) else (lambda z: curves)
+    if method not in ("secant", "newton"):
+        raise ValueError(f"unknown method {method!r}; use 'secant' or 'newton'")
+    ei, shear, moment, fixed_head = np.broadcast_arrays(
+        np.asarray(ei, dtype=float), np.asarray(shear, dtype=float),
+        np.asarray(moment, dtype=float), np.asarray(fixed_head, dtype=bool),
+    )
+    ei, shear, moment, fixed = (
+        np.atleast_1d(a).ravel() for a in (ei, shear, moment, fixed_head)
+    )
+    n_case = len(ei)
 
     n_node = n_elem + 1
     h = length / n_elem
@@ -338,62 +559,135 @@ def solve_lateral_pile(
     depth = np.linspace(0.0, length, n_node)
     trib = np.full(n_node, h)
     trib[0] = trib[-1] = h / 2.0
+    soil = _NodeCurves(curves, depth)
 
-    k_beam = np.zeros((ndof, ndof))
-    ke = _beam_element_stiffness(ei, h)
-    for e in range(n_elem):
-        idx = [2 * e, 2 * e + 1, 2 * e + 2, 2 * e + 3]
-        k_beam[np.ix_(idx, idx)] += ke
+    ke_unit = _beam_element_stiffness(1.0, h)
+    band = ei[:, None, None] * _pile_band(ke_unit, n_elem)
+    f = np.zeros((n_case, ndof))
+    f[:, 0] = shear
+    f[:, 1] = np.where(fixed, 0.0, moment)
 
-    f = np.zeros(ndof)
-    f[0] = shear
-    f[1] = moment
-
-    y = np.zeros(n_node)
-    converged = False
-    it = 0
+    u = np.zeros((n_case, ndof))
+    iterations = np.zeros(n_case, dtype=int)
+    converged = np.zeros(n_case, dtype=bool)
     for it in range(1, max_iter + 1):
-        k = k_beam.copy()
-        for i in range(n_node):
-            es = curve_at(depth[i]).secant_modulus(y[i], depth[i])
-            k[2 * i, 2 * i] += es * trib[i]
-        if fixed_head:
-            # enforce zero rotation at the head (DOF 1)
-            k[1, :] = 0.0
-            k[:, 1] = 0.0
-            k[1, 1] = 1.0
-        u = np.linalg.solve(k, f)
-        y_new = u[0::2]
-        delta = abs(y_new[0] - y[0])
-        y = relax * y_new + (1.0 - relax) * y if it > 1 else y_new
-        if delta < tol * max(abs(y_new[0]), _Y_FLOOR):
-            converged = True
+        act = np.flatnonzero(~converged)
+        if not len(act):
             break
+        iterations[act] = it
+        if method == "secant":
+            y = u[act, 0::2]
+            u_new = _solve_blocks(
+                band[act], soil.secant(y) * trib, f[act], fixed[act],
+            )
+            y_new = u_new[:, 0::2]
+            delta = np.abs(y_new[:, 0] - y[:, 0])
+            if it > 1:
+                u_new[:, 0::2] = relax * y_new + (1.0 - relax) * y
+        else:
+            u_new, delta = _newton_step(
+                soil, band[act], trib, u[act], f[act], fixed[act],
+            )
+            y_new = u_new[:, 0::2]
+        u[act] = u_new
+        converged[act] = delta < tol * np.maximum(np.abs(y_new[:, 0]), _Y_FLOOR)
+
+    y = u[:, 0::2]
+    # Recover element-end forces [V_i, M_i, V_j, M_j] for every element.
+    element_dofs = 2 * np.arange(n_elem)[:, None] + np.arange(4)
+    fe = ei[:, None, None] * (u[:, element_dofs] @ ke_unit.T)
+    moment_arr = np.zeros((n_case, n_node))
+    shear_arr = np.zeros((n_case, n_node))
+    moment_arr[:, :-1] -= fe[:, :, 1]
+    moment_arr[:, 1:] += fe[:, :, 3]
+    shear_arr[:, :-1] += fe[:, :, 0]
+    shear_arr[:, 1:] -= fe[:, :, 2]
+    counts = np.full(n_node, 2.0)
+    counts[[0, -1]] = 1.0
+
+    return LateralPileBatchResult(
+        depth=depth, deflection=y, moment=moment_arr / counts,
+        shear=shear_arr / counts, soil_reaction=soil.p(y),
+        iterations=iterations, converged=converged,
+    )
 
-    rot = u[1::2]
-    # Recover moments and shears element-by-element from nodal forces.
-    moment_arr = np.zeros(n_node)
-    shear_arr = np.zeros(n_node)
-    counts = np.zeros(n_node)
-    for e in range(n_elem):
-        ue = np.array([y[e], rot[e], y[e + 1], rot[e + 1]])
-        fe = ke @ ue  # [V_i, M_i, V_j, M_j] nodal forces
-        moment_arr[e] += -fe[1]
-        moment_arr[e + 1] += fe[3]
-        shear_arr[e] += fe[0]
-        shear_arr[e + 1] += -fe[2]
-        counts[e] += 1
-        counts[e + 1] += 1
-    moment_arr /= np.maximum(counts, 1.0)
-    shear_arr /= np.maximum(counts, 1.0)
-    soil = np.array([
-        curve_at(depth[i]).p(y[i], depth[i]) for i in range(n_node)
-    ])
 
-    return LateralPileResult(
-        depth=depth, deflection=y, moment=moment_arr, shear=shear_arr,
-        soil_reaction=soil, iterations=it, converged=converged,
-    )
+def _newton_step(soil, band, trib, u, f, fixed, max_search: int = 8):
+    """One tangent-stiffness Newton update of each case.  Returns the new
+    displacements and the size of the full head-deflection correction.
+
+    The p-y springs are monotone, so the response minimizes a convex
+    potential and ``g(a) = du . R(u + a du)`` increases with the step
+    length ``a``; the full step is kept unless it overshoots the minimum
+    along ``du`` (g > 0), in which case the root of ``g`` on ``(0, 1)`` is
+    bracketed with Illinois-style false position.  This keeps Newton stable
+    on the steep initial branch of the clay curves."""
+
+    def residual(u):
+        r = _band_matvec(band, u) - f
+        y = u[:, 0::2]
+        r[:, 0::2] += soil.secant(y) * y * trib
+        r[fixed, 1] = 0.0
+        return r
+
+    r = residual(u)
+    du = _solve_blocks(band, soil.tangent(u[:, 0::2]) * trib, -r, fixed)
+    g_lo = np.einsum("ij,ij->i", du, r)  # < 0: du is a descent direction
+    a_lo = np.zeros(len(u))
+    a_hi = np.ones(len(u))
+    g_hi = np.einsum("ij,ij->i", du, residual(u + du))
+    alpha = a_hi.copy()
+    search = g_hi > 0.25 * np.abs(g_lo)
+    for _ in range(max_search):
+        if not search.any():
+            break
+        with np.errstate(divide="ignore", invalid="ignore"):
+            a = np.where(search, a_lo - g_lo * (a_hi - a_lo) / (g_hi - g_lo), 1.0)
+        g = np.einsum("ij,ij->i", du, residual(u + a[:, None] * du))
+        alpha = np.where(search, a, alpha)
+        low = search & (g < 0.0)
+        high = search & (g >= 0.0)
+        # Illinois: halve the retained end's g so the bracket keeps shrinking
+        g_hi = np.where(low, 0.5 * g_hi, g_hi)
+        g_lo = np.where(high, 0.5 * g_lo, g_lo)
+        a_lo, g_lo = np.where(low, a, a_lo), np.where(low, g, g_lo)
+        a_hi, g_hi = np.where(high, a, a_hi), np.where(high, g, g_hi)
+        search &= np.abs(g) > 0.25 * np.abs(np.einsum("ij,ij->i", du, r))
+    return u + alpha[:, None] * du, np.abs(du[:, 0])
+
+
+def solve_lateral_pile(
+    curves,
+    length: float,
+    ei: float,
+    shear: float,
+    moment: float = 0.0,
+    n_elem: int = 100,
+    fixed_head: bool = False,
+    max_iter: int = 100,
+    tol: float = 1.0e-6,
+    relax: float = 0.5,
+    method: str = "secant",
+) -> LateralPileResult:
+    """Solve a laterally loaded pile by finite elements on nonlinear p-y
+    springs (the in-process equivalent of an LPILE run).
+
+    ``curves`` is one :class:`PYCurve` for the whole pile, a layered
+    :class:`~civilpy.geotech.curve_stack.CurveStack`, or a callable
+    ``curve(z)`` returning the curve at depth ``z`` (in).  ``length`` is the
+    embedded length (in), ``ei`` the flexural stiffness (lb-in^2), and
+    ``shear``/``moment`` the load applied at the pile head (lb, lb-in).  A
+    ``fixed_head`` pile has zero head rotation.  Soil springs use the secant
+    modulus and are iterated with under-relaxation ``relax`` until the head
+    deflection settles within ``tol``; ``method="newton"`` uses the tangent
+    stiffness instead (see :func:`solve_lateral_pile_batch`, which also
+    solves many load cases at once).
+    """
+    return solve_lateral_pile_batch(
+        curves, length, ei, shear, moment=moment, n_elem=n_elem,
+        fixed_head=fixed_head, max_iter=max_iter, tol=tol, relax=relax,
+        method=method,
+    )[0]
 
 
 # ====================================================== Broms ultimate load
@@ -50,6 +50,7 @@ from pathlib import Path
 
 import numpy as np
 
+from civilpy.geotech.curve_stack import CurveStack
 from civilpy.geotech.lateral_pile import (
     LinearPY,
     PYCurve,
@@ -215,6 +216,11 @@ class LPileModel:
                 return layer.curve
         return self.layers[-1].curve
 
+    def curve_stack(self) -> CurveStack:
+        """The layers as a :class:`~civilpy.geotech.curve_stack.CurveStack`
+        -- :meth:`curve_at` for a whole depth array at once."""
+        return CurveStack.from_layers(self.layers)
+
     # ----------------------------------------------------------- codegen
 
     def to_lpd(self) -> str:
@@ -273,7 +279,7 @@ class LPileModel:
         engine needed) and return :class:`LPileResults`."""
         fixed = self.load.condition == 2 and self.load.slope == 0.0
         res = solve_lateral_pile(
-            self.curve_at,
+            self.curve_stack(),
             length=self.section.length,
             ei=self.section.ei,
             shear=self.load.shear,
@@ -20,6 +20,8 @@ import requests
 import pandas as pd
 from datetime import datetime, timedelta
 
+from civilpy.state.ohio.DOT.arcgis_download import ArcGISDownloader
+
 
 # NBI Code Dictionaries for Material and Design/Construction Type
 NBI_MATERIAL_CODES = {
@@ -62,12 +64,15 @@ NBI_DESIGN_TYPE_CODES = {
 }
 
 
-def get_tims_data(data_source='Roadway'):
+def get_tims_data(data_source='Roadway', max_workers=4, checkpoint_dir=None):
     """
     Download all records from an ODOT TIMS ArcGIS MapServer layer into a DataFrame.
 
-    Paginates through the service in batches of 1000 records until all features
-    are retrieved. Prints progress to stdout.
+    The layer's object IDs are read first and split into pages of the
+    server's record cap, which are fetched concurrently over one pooled
+    connection and checked for completeness. Failed pages are retried with
+    backoff; if one still fails an ``IncompleteDownloadError`` is raised
+    rather than returning a truncated table. Prints progress to stdout.
 
     Args:
         data_source (str): Which TIMS layer to query. One of:
@@ -75,12 +80,17 @@ def get_tims_data(data_source='Roadway'):
             - ``'Roadway'`` — Roadway Information layer (default)
             - ``'Bridge'`` — Bridge Assets layer
 
+        max_workers (int): Number of pages fetched at once.
+        checkpoint_dir (str, optional): Directory in which finished pages
+            are kept; rerunning after an interruption fetches only the
+            missing pages.
+
     Returns:
         pandas.DataFrame: All feature attributes from the selected layer, one row
         per feature. Returns an empty DataFrame if no records are found.
 
     Example:
-        >>> df = get_tims_data('Bridge')
+        >>> df = get_tims_data('Bridge', checkpoint_dir='bridge_pull')
         >>> 'SFN' in df.columns
         True
     """
@@ -88,65 +98,22 @@ def get_tims_data(data_source='Roadway'):
         'Roadway': "https://gis.dot.state.oh.us/arcgis/rest/services/TIMS/Roadway_Information/MapServer/8",
         'Bridge': "https://gis.dot.state.oh.us/arcgis/rest/services/TIMS/Assets/MapServer/5"
     }
+    if data_source not in types:
+        raise ValueError(f"Unknown data_source {data_source!r}; use one of {sorted(types)}")
 
-    metadata_url = types[data_source]
-    query_url = metadata_url + "/query"
-
-    data = requests.get(f"{metadata_url}?f=json").json()
-    all_fields = [field['name'] for field in data.get('fields', [])]
-
-    # Set the batch size (MaxRecordCount limit)
-    # BATCH_SIZE = int(data['maxRecordCount'])
-    BATCH_SIZE = 1000
-
-    # Initialize an empty list to store all feature attributes
-    all_attributes = []
-    offset = 0
-
-    while True:
-        params = {
-            'where': '1=1',
-            'outFields': ','.join(all_fields),
-            'resultOffset': offset,
-            'resultRecordCount': BATCH_SIZE,
-            'returnGeometry': False,
-            'f': 'json'
-        }
-
-        try:
-            response = requests.post(query_url, data=params)
-            response.raise_for_status()
-            data = response.json()
-
-            # Check for features in the response
-            features = data.get('features', [])
-
-            if not features:
-                print(f"No more features found. Fetched {offset} total records.")
-                break
-
-            # Extract attributes and add to the main list
-            attributes_list = [feature['attributes'] for feature in features]
-            all_attributes.extend(attributes_list)
-
-            print(f"Fetched {len(attributes_list)} records. Total so far: {len(all_attributes)}")
-
-            # Increment the offset for the next loop iteration
-            offset += BATCH_SIZE
+    def report(done, total):
+        print(f"Fetched page {done} of {total}.")
 
-        except requests.exceptions.HTTPError as err:
-            print(f"HTTP Error: {err}")
-            break
-        except Exception as err:
-            print(f"An error occurred: {err}")
-            break
+    downloader = ArcGISDownloader(types[data_source], max_workers=max_workers,
+                                  checkpoint_dir=checkpoint_dir)
+    all_attributes = downloader.run(progress=report)
 
     # Build the final DataFrame from all collected attributes
+    df = pd.DataFrame(all_attributes)
     if all_attributes:
-        df = pd.DataFrame(all_attributes)
         print("DataFrame successfully created with shape:", df.shape)
     else:
-        print("Failed to retrieve any data.")
+        print("No records found.")
 
     return df
 
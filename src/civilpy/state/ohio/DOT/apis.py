@@ -10,6 +10,9 @@ Provides Pythonic wrappers around ODOT's core data systems:
 - **NHDFlowline** / **USGSStreamStats** / **USGSGauge**: USGS hydrology APIs
 - **SNBIComplianceChecker**: FHWA SNBI field validation
 - **BridgeEngineeringChecks**: High-level spatial analysis utilities
+
+TIMS, NHD and USGS responses go through a shared response cache with
+per-layer TTLs; switch it to SQLite (or off) with :func:`configure_cache`.
 """
 
 from __future__ import annotations
@@ -18,17 +21,39 @@ import json
 import logging
 import math
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import requests
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 from sqlalchemy.engine import Engine
 
+from civilpy.state.ohio.DOT.arcgis_download import (
+    ArcGISDownloader,
+    arcgis_json,
+)
+from civilpy.state.ohio.DOT.http_cache import configure_cache, get_cache
+from civilpy.state.ohio.DOT.spatial_join import (
+    DEG_PER_MILE_LAT,
+    DEG_PER_MILE_LON,
+    max_per_point,
+    polyline_segments,
+    segments_in_boxes,
+    tile_groups,
+)
+from civilpy.state.ohio.DOT.tims_index import (
+    PointSnapshot,
+    haversine_miles,
+    load_or_pull,
+    parse_where,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -1546,11 +1571,14 @@ class ArcGISLayer:
     Args:
         url: Full URL to the MapServer layer (ending in ``/MapServer/N``).
         max_records: Maximum records per request (server-side limit).
+        cache_ttl: Seconds a query response is served from the response
+            cache (see :func:`configure_cache`) before being revalidated.
     """
 
-    def __init__(self, url: str, max_records: int = 1000):
+    def __init__(self, url: str, max_records: int = 1000, cache_ttl: float = 3600.0):
         self._url = url.rstrip("/")
         self._max_records = max_records
+        self.cache_ttl = cache_ttl
 
     def query(
         self,
@@ -1562,6 +1590,7 @@ class ArcGISLayer:
         return_geometry: bool = True,
         result_record_count: Optional[int] = None,
         order_by: Optional[str] = None,
+        out_sr: Optional[int] = None,
     ) -> List[dict]:
         """Query features from the ArcGIS layer.
 
@@ -1574,10 +1603,48 @@ class ArcGISLayer:
             return_geometry: Whether to include geometry in results.
             result_record_count: Limit number of results.
             order_by: ORDER BY clause (e.g. 'SFN ASC').
+            out_sr: Spatial reference WKID for returned geometry (the
+                layer's own when omitted).
 
         Returns:
             List of feature attribute dicts (with optional 'geometry' key).
         """
+        try:
+            results, truncated = self._query_page(
+                where, out_fields, geometry, geometry_type, spatial_rel,
+                return_geometry, result_record_count, order_by, out_sr,
+            )
+        except Exception as e:
+            logger.warning("ArcGIS query failed on %s: %s", self._url, e)
+            return []
+        if truncated:
+            logger.warning(
+                "ArcGIS query on %s hit the server record cap; results are "
+                "truncated (use query_all or download)", self._url,
+            )
+        return results
+
+    def _query_page(
+        self,
+        where: str,
+        out_fields: str,
+        geometry: Optional[Dict[str, Any]] = None,
+        geometry_type: str = "esriGeometryEnvelope",
+        spatial_rel: str = "esriSpatialRelIntersects",
+        return_geometry: bool = True,
+        result_record_count: Optional[int] = None,
+        order_by: Optional[str] = None,
+        out_sr: Optional[int] = None,
+    ) -> Tuple[List[dict], bool]:
+        """One ``/query`` request (see :meth:`query` for the arguments).
+
+        Returns:
+            The feature attribute dicts and whether the server flagged the
+            response with ``exceededTransferLimit``.
+
+        Raises:
+            IncompleteDownloadError: If the request fails after retries.
+        """
         params: Dict[str, Any] = {
             "where": where,
             "outFields": out_fields,
@@ -1593,22 +1660,99 @@ class ArcGISLayer:
             params["resultRecordCount"] = result_record_count
         if order_by:
             params["orderByFields"] = order_by
+        if out_sr:
+            params["outSR"] = str(out_sr)
 
-        try:
-            resp = requests.get(f"{self._url}/query", params=params, timeout=30)
-            resp.raise_for_status()
-            data = resp.json()
-            features = data.get("features", [])
-            results = []
-            for f in features:
-                rec = dict(f.get("attributes", {}))
-                if return_geometry and "geometry" in f:
-                    rec["_geometry"] = f["geometry"]
-                results.append(rec)
-            return results
-        except Exception as e:
-            logger.warning("ArcGIS query failed on %s: %s", self._url, e)
-            return []
+        data = get_cache().get_json(f"{self._url}/query", params=params,
+                                    ttl=self.cache_ttl, validate=arcgis_json)
+        results = []
+        for f in data.get("features", []):
+            rec = dict(f.get("attributes", {}))
+            if return_geometry and "geometry" in f:
+                rec["_geometry"] = f["geometry"]
+            results.append(rec)
+        return results, bool(data.get("exceededTransferLimit"))
+
+    def query_all(
+        self,
+        where: str = "1=1",
+        out_fields: str = "*",
+        id_field: str = "OBJECTID",
+        **kwargs,
+    ) -> List[dict]:
+        """Like :meth:`query`, but pages past the server's record cap by
+        walking ``id_field`` in ascending order (keyset pagination).
+
+        Paging continues while the server flags a page with
+        ``exceededTransferLimit`` (its cap may be below ``max_records``) or
+        returns a full page, and stops at a short unflagged or empty page.
+        Unlike :meth:`query`, a failed request raises rather than ending
+        the walk early with partial results.
+
+        Args:
+            where: SQL-style WHERE clause.
+            out_fields: Comma-separated field names or '*' (``id_field``
+                is added when missing).
+            id_field: Unique, orderable integer field used to page.
+            **kwargs: Further :meth:`query` arguments (geometry, ...).
+
+        Returns:
+            List of feature attribute dicts across all pages.
+
+        Raises:
+            IncompleteDownloadError: If a page request fails after retries.
+        """
+        if out_fields != "*" and id_field not in out_fields.split(","):
+            out_fields = f"{out_fields},{id_field}"
+        results: List[dict] = []
+        clause = where
+        while True:
+            page, truncated = self._query_page(
+                clause, out_fields, result_record_count=self._max_records,
+                order_by=f"{id_field} ASC", **kwargs,
+            )
+            results.extend(page)
+            ids = [r[id_field] for r in page if r.get(id_field) is not None]
+            if not ids or (not truncated and len(page) < self._max_records):
+                return results
+            clause = f"({where}) AND {id_field} > {max(ids)}"
+
+    def download(
+        self,
+        where: str = "1=1",
+        out_fields: str = "*",
+        return_geometry: bool = False,
+        max_workers: int = 4,
+        checkpoint_dir: Optional[str] = None,
+        progress=None,
+    ) -> List[dict]:
+        """Download every feature matching ``where``, fetching pages in
+        parallel and verifying each one (see :class:`ArcGISDownloader`).
+
+        Pages hold ``max_records`` features, or the server's own
+        ``maxRecordCount`` when that is lower.
+
+        Unlike :meth:`query`, a page that still fails after retrying raises
+        :class:`~civilpy.state.ohio.DOT.arcgis_download.IncompleteDownloadError`
+        instead of returning partial data.
+
+        Args:
+            where: SQL-style WHERE clause.
+            out_fields: Comma-separated field names or '*'.
+            return_geometry: Whether to include geometry in results.
+            max_workers: Pages fetched concurrently.
+            checkpoint_dir: Directory that keeps finished pages so an
+                interrupted download resumes where it stopped.
+            progress: Optional ``progress(pages_done, pages_total)`` callback.
+
+        Returns:
+            List of feature attribute dicts in object-ID order.
+        """
+        return ArcGISDownloader(
+            self._url, where=where, out_fields=out_fields,
+            return_geometry=return_geometry, page_size=self._max_records,
+            max_workers=max_workers, checkpoint_dir=checkpoint_dir,
+        ).run(progress=progress)
 
     def query_by_bbox(
         self,
@@ -1748,7 +1892,10 @@ class TIMSBridge:
         ValueError: If no bridge found with the given SFN.
     """
 
-    _layer = ArcGISLayer(TIMS_URLS["bridge_inventory"])
+    _layer = ArcGISLayer(TIMS_URLS["bridge_inventory"], cache_ttl=86400.0)
+
+    # Offline copy of the whole layer; searches use it when set
+    _snapshot: Optional[PointSnapshot] = None
 
     # Condition rating codes: 0-3 = structurally deficient threshold
     _SD_THRESHOLD = 4
@@ -2097,6 +2244,46 @@ class TIMSBridge:
             f"suff={self.sufficiency_rating})"
         )
 
+    @classmethod
+    def load_snapshot(
+        cls,
+        path: Optional[str] = None,
+        max_age_days: Optional[float] = 7.0,
+        refresh: bool = False,
+    ) -> PointSnapshot:
+        """Load (or pull and save) the offline bridge-layer snapshot and
+        route :meth:`search_near`, :meth:`search_by_bbox` and
+        :meth:`nearest` through it.
+
+        Args:
+            path: Snapshot file (defaults to the civilpy cache directory).
+            max_age_days: Re-pull a saved snapshot older than this.
+            refresh: Always re-pull from TIMS.
+
+        Returns:
+            The snapshot now in use.
+
+        Raises:
+            IncompleteDownloadError: If the pull from TIMS fails part-way;
+                nothing is saved and any snapshot file already there is kept.
+        """
+        snapshot = load_or_pull(
+            "tims_bridges", lambda: PointSnapshot.from_layer(cls._layer),
+            path=path, max_age_days=max_age_days, refresh=refresh,
+        )
+        cls.use_snapshot(snapshot)
+        return snapshot
+
+    @classmethod
+    def use_snapshot(cls, snapshot: Optional[PointSnapshot]) -> None:
+        """Search ``snapshot`` instead of the live layer (None to go back
+        to live queries)."""
+        cls._snapshot = snapshot
+
+    @classmethod
+    def _offline(cls, where: str) -> bool:
+        return cls._snapshot is not None and parse_where(where) is not None
+
     @classmethod
     def search_by_bbox(
         cls,
@@ -2118,6 +2305,8 @@ class TIMSBridge:
         Returns:
             List of bridge attribute dicts.
         """
+        if cls._offline(where):
+            return cls._snapshot.within_bbox(xmin, ymin, xmax, ymax, where=where)
         return cls._layer.query_by_bbox(xmin, ymin, xmax, ymax, where=where)
 
     @classmethod
@@ -2130,6 +2319,11 @@ class TIMSBridge:
     ) -> List[Dict[str, Any]]:
         """Find bridges near a coordinate.
 
+        With a snapshot loaded (and a simple ``FIELD='value'`` filter) the
+        search is a true great-circle radius, nearest first, and each dict
+        carries ``distance_miles``; live queries return the bounding box
+        around the radius.
+
         Args:
             lon: Longitude.
             lat: Latitude.
@@ -2139,8 +2333,33 @@ class TIMSBridge:
         Returns:
             List of bridge attribute dicts.
         """
+        if cls._offline(where):
+            return cls._snapshot.near(lon, lat, radius_miles, where=where)
         return cls._layer.query_by_point(lon, lat, radius_miles, where=where)
 
+    @classmethod
+    def nearest(
+        cls,
+        lon: float,
+        lat: float,
+        k: int = 1,
+        where: str = "1=1",
+    ) -> List[Dict[str, Any]]:
+        """The ``k`` bridges nearest a coordinate, from the snapshot
+        (loaded on first use).
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            k: Number of bridges.
+            where: Simple ``FIELD='value'`` filter.
+
+        Returns:
+            List of bridge attribute dicts with ``distance_miles``.
+        """
+        snapshot = cls._snapshot or cls.load_snapshot()
+        return snapshot.nearest(lon, lat, k=k, where=where)
+
     @classmethod
     def search_by_county(cls, county_cd: str) -> List[Dict[str, Any]]:
         """Find all bridges in a county.
@@ -2181,8 +2400,8 @@ class TIMSProject:
             print(p["PID_NBR"], p["PROJECT_NME"])
     """
 
-    _lines_layer = ArcGISLayer(TIMS_URLS["dwp_lines"])
-    _points_layer = ArcGISLayer(TIMS_URLS["dwp_points"])
+    _lines_layer = ArcGISLayer(TIMS_URLS["dwp_lines"], cache_ttl=3600.0)
+    _points_layer = ArcGISLayer(TIMS_URLS["dwp_points"], cache_ttl=3600.0)
 
     @classmethod
     def search_by_district(cls, district: str) -> List[Dict[str, Any]]:
@@ -2251,10 +2470,10 @@ class TIMSRoad:
     and freight network layers.
     """
 
-    _func_class = ArcGISLayer(TIMS_URLS["functional_class"])
-    _nhs = ArcGISLayer(TIMS_URLS["nhs"])
-    _freight = ArcGISLayer(TIMS_URLS["freight_network"])
-    _road_inv = ArcGISLayer(TIMS_URLS["road_inventory"])
+    _func_class = ArcGISLayer(TIMS_URLS["functional_class"], cache_ttl=7 * 86400.0)
+    _nhs = ArcGISLayer(TIMS_URLS["nhs"], cache_ttl=7 * 86400.0)
+    _freight = ArcGISLayer(TIMS_URLS["freight_network"], cache_ttl=7 * 86400.0)
+    _road_inv = ArcGISLayer(TIMS_URLS["road_inventory"], cache_ttl=7 * 86400.0)
 
     @classmethod
     def functional_class_near(
@@ -2314,9 +2533,9 @@ class TIMSWaterway:
     environmental constraint checking.
     """
 
-    _scenic = ArcGISLayer(TIMS_URLS["scenic_rivers"])
-    _mussel = ArcGISLayer(TIMS_URLS["mussel_streams"])
-    _wetlands = ArcGISLayer(TIMS_URLS["wetlands"])
+    _scenic = ArcGISLayer(TIMS_URLS["scenic_rivers"], cache_ttl=30 * 86400.0)
+    _mussel = ArcGISLayer(TIMS_URLS["mussel_streams"], cache_ttl=30 * 86400.0)
+    _wetlands = ArcGISLayer(TIMS_URLS["wetlands"], cache_ttl=30 * 86400.0)
 
     @classmethod
     def scenic_rivers_near(
@@ -2386,11 +2605,11 @@ class NHDFlowline:
 
     _url = "https://hydro.nationalmap.gov/arcgis/rest/services/NHDPlus_HR/MapServer"
     # Layer 3 = NetworkNHDFlowline (stream lines with StreamOrder)
-    _flowline_layer = ArcGISLayer(f"{_url}/3", max_records=2000)
+    _flowline_layer = ArcGISLayer(f"{_url}/3", max_records=2000, cache_ttl=30 * 86400.0)
     # Layer 9 = NHDWaterbody (lakes, ponds, reservoirs)
-    _waterbody_layer = ArcGISLayer(f"{_url}/9", max_records=2000)
+    _waterbody_layer = ArcGISLayer(f"{_url}/9", max_records=2000, cache_ttl=30 * 86400.0)
     # Layer 12 = WBDHU12 (12-digit HUC watershed boundaries)
-    _huc12_layer = ArcGISLayer(f"{_url}/12", max_records=2000)
+    _huc12_layer = ArcGISLayer(f"{_url}/12", max_records=2000, cache_ttl=30 * 86400.0)
 
     @classmethod
     def near(
@@ -2415,6 +2634,75 @@ class NHDFlowline:
             lon, lat, radius_miles, out_fields=out_fields,
         )
 
+    @classmethod
+    def max_stream_orders(
+        cls,
+        lons: List[float],
+        lats: List[float],
+        radius_miles: float = 0.1,
+        tile_miles: float = 25.0,
+        max_workers: int = 4,
+    ) -> List[Optional[int]]:
+        """Highest NHD stream order near each of many points, batched.
+
+        Equivalent to taking ``max(StreamOrder)`` over
+        ``NHDFlowline.near(lon, lat, radius_miles)`` for every point, but
+        the flowlines are fetched once per tile of ``tile_miles`` covering
+        the points (one request for a typical project area) and joined to
+        the points locally.  When the points span several tiles, the tiles
+        are fetched concurrently on up to ``max_workers`` threads.
+
+        Args:
+            lons: Longitudes (WGS84).
+            lats: Latitudes (WGS84).
+            radius_miles: Half-size of the search box around each point.
+            tile_miles: Edge length of the fetch tiles, in miles.
+            max_workers: Threads for multi-tile fetches.
+
+        Returns:
+            One stream order per point (None where no flowline is near).
+        
+        Raises:
+            IncompleteDownloadError: If a tile's flowlines can't be fetched
+                (rather than reporting its points as having no stream).
+        """
+        lon = np.asarray(lons, dtype=float)
+        lat = np.asarray(lats, dtype=float)
+        half_w = radius_miles * DEG_PER_MILE_LON
+        half_h = radius_miles * DEG_PER_MILE_LAT
+        orders: List[Optional[int]] = [None] * lon.size
+
+        def fetch(idx: np.ndarray) -> List[dict]:
+            envelope = {
+                "xmin": float(lon[idx].min()) - half_w,
+                "ymin": float(lat[idx].min()) - half_h,
+                "xmax": float(lon[idx].max()) + half_w,
+                "ymax": float(lat[idx].max()) + half_h,
+                "spatialReference": {"wkid": 4326},
+            }
+            return cls._flowline_layer.query_all(
+                out_fields="StreamOrder", geometry=envelope,
+                geometry_type="esriGeometryEnvelope", out_sr=4326,
+            )
+
+        groups = tile_groups(lon, lat, tile_miles)
+        if len(groups) > 1 and max_workers > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(groups))) as pool:
+                fetched = list(pool.map(fetch, groups))
+        else:
+            fetched = [fetch(idx) for idx in groups]
+
+        for idx, flowlines in zip(groups, fetched):
+            x0, y0, x1, y1, owner = polyline_segments(flowlines)
+            pairs = segments_in_boxes(lon[idx], lat[idx], half_w, half_h,
+                                      x0, y0, x1, y1)
+            best = max_per_point(len(idx), pairs,
+                                 [f.get("StreamOrder") for f in flowlines],
+                                 owner=owner)
+            for i, order in zip(idx.tolist(), best):
+                orders[i] = order
+        return orders
+
     @classmethod
     def waterbodies_near(
         cls,
@@ -2473,6 +2761,7 @@ class USGSStreamStats:
     """
 
     _base = "https://streamstats.usgs.gov/ss-delineate/v1"
+    _cache_ttl = 30 * 86400.0  # basins don't move
 
     @classmethod
     def delineate(
@@ -2500,9 +2789,8 @@ class USGSStreamStats:
         params = {"lat": lat, "lon": lon}
 
         try:
-            resp = requests.get(url, params=params, timeout=120)
-            resp.raise_for_status()
-            data = resp.json()
+            data = get_cache().get_json(url, params=params, ttl=cls._cache_ttl,
+                                        timeout=120)
         except Exception as e:
             logger.warning("StreamStats delineation failed: %s", e)
             return {"drainage_area_sqmi": None, "basin_characteristics": {},
@@ -2558,9 +2846,8 @@ class USGSStreamStats:
         """
         url = f"{cls._base}/delineate/features/{region}"
         try:
-            resp = requests.get(url, params={"lat": lat, "lon": lon}, timeout=60)
-            resp.raise_for_status()
-            return resp.json()
+            return get_cache().get_json(url, params={"lat": lat, "lon": lon},
+                                        ttl=cls._cache_ttl, timeout=60)
         except Exception as e:
             logger.warning("StreamStats feature delineation failed: %s", e)
             return None
@@ -2580,6 +2867,8 @@ class USGSGauge:
     """
 
     _base = "https://waterservices.usgs.gov/nwis"
+    _sites_ttl = 86400.0
+    _values_ttl = 900.0  # instantaneous values update every 15 minutes
 
     @classmethod
     def near(
@@ -2604,7 +2893,7 @@ class USGSGauge:
         bbox = f"{lon - deg_lon},{lat - deg_lat},{lon + deg_lon},{lat + deg_lat}"
 
         try:
-            resp = requests.get(
+            data = get_cache().get_json(
                 f"{cls._base}/site/",
                 params={
                     "format": "json",
@@ -2615,10 +2904,8 @@ class USGSGauge:
                     "parameterCd": "00060",
                     "siteOutput": "expanded",
                 },
-                timeout=30,
+                ttl=cls._sites_ttl,
             )
-            resp.raise_for_status()
-            data = resp.json()
             sites = data.get("value", {}).get("timeSeries", [])
             if not sites:
                 # Try alternative JSON structure
@@ -2642,7 +2929,7 @@ class USGSGauge:
             Dict with discharge_cfs, gage_height_ft, datetime, site_name.
         """
         try:
-            resp = requests.get(
+            data = get_cache().get_json(
                 f"{cls._base}/iv/",
                 params={
                     "format": "json",
@@ -2650,10 +2937,8 @@ class USGSGauge:
                     "parameterCd": "00060,00065",
                     "siteStatus": "active",
                 },
-                timeout=30,
+                ttl=cls._values_ttl,
             )
-            resp.raise_for_status()
-            data = resp.json()
             result: Dict[str, Any] = {"site_no": site_no}
             for ts in data.get("value", {}).get("timeSeries", []):
                 var_code = ts.get("variable", {}).get("variableCode", [{}])[0].get("value")
@@ -2964,6 +3249,20 @@ def _haversine_miles(lat1: float, lon1: float, lat2: float, lon2: float) -> floa
     return R * 2 * math.asin(math.sqrt(a))
 
 
+def _attach_distances(
+    bridges: List[Dict[str, Any]], lon: float, lat: float,
+) -> None:
+    """Set ``distance_miles`` (rounded to 0.01, None without coordinates)
+    on every bridge dict that lacks it, in one vectorized pass."""
+    pending = [b for b in bridges if "distance_miles" not in b]
+    if not pending:
+        return
+    blat = [b.get("LATITUDE_DD") or math.nan for b in pending]
+    blon = [b.get("LONGITUDE_DD") or math.nan for b in pending]
+    for b, d in zip(pending, haversine_miles(lat, lon, blat, blon).tolist()):
+        b["distance_miles"] = None if math.isnan(d) else round(d, 2)
+
+
 class BridgeEngineeringChecks:
     """High-level spatial analysis utilities for bridge engineering.
 
@@ -3007,15 +3306,7 @@ class BridgeEngineeringChecks:
         """
         where = "MAINT_RESP_CD='01'" if only_state else "1=1"
         bridges = TIMSBridge.search_near(lon, lat, radius_miles, where=where)
-        for b in bridges:
-            blat = b.get("LATITUDE_DD")
-            blon = b.get("LONGITUDE_DD")
-            if blat and blon:
-                b["distance_miles"] = round(
-                    _haversine_miles(lat, lon, blat, blon), 2
-                )
-            else:
-                b["distance_miles"] = None
+        _attach_distances(bridges, lon, lat)
         bridges.sort(key=lambda x: x.get("distance_miles") or 999)
         return bridges
 
@@ -3086,12 +3377,23 @@ class BridgeEngineeringChecks:
             lon, lat, radius_miles,
             where="MAINT_RESP_CD='01'",
         )
+        _attach_distances(bridges, lon, lat)
+
+        # NHD stream order at every located bridge, in one batched join
+        located = [b for b in bridges
+                   if b.get("LATITUDE_DD") and b.get("LONGITUDE_DD")]
+        stream_orders = dict(zip(
+            map(id, located),
+            NHDFlowline.max_stream_orders(
+                [b["LONGITUDE_DD"] for b in located],
+                [b["LATITUDE_DD"] for b in located],
+                radius_miles=0.1,
+            ),
+        ))
 
         results = []
         for b in bridges:
             sfn = b.get("SFN", "")
-            blat = b.get("LATITUDE_DD")
-            blon = b.get("LONGITUDE_DD")
             scour_cd = b.get("SCOUR_CRIT_CD")
 
             risk_entry = {
@@ -3103,24 +3405,9 @@ class BridgeEngineeringChecks:
                     if scour_cd else False,
                 "drainage_area": b.get("DRN_AREA"),
                 "stream_velocity": b.get("STREAM_VELOCITY"),
-                "max_stream_order": None,
-                "distance_miles": None,
+                "max_stream_order": stream_orders.get(id(b)),
+                "distance_miles": b["distance_miles"],
             }
-
-            if blat and blon:
-                risk_entry["distance_miles"] = round(
-                    _haversine_miles(lat, lon, blat, blon), 2
-                )
-                # Check NHD stream order at bridge location
-                streams = NHDFlowline.near(blon, blat, radius_miles=0.1)
-                if streams:
-                    orders = [
-                        s.get("StreamOrder") for s in streams
-                        if s.get("StreamOrder") is not None
-                    ]
-                    if orders:
-                        risk_entry["max_stream_order"] = max(orders)
-
             results.append(risk_entry)
 
         # Sort: scour-critical first, then by stream order descending
@@ -0,0 +1,369 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Parallel, resumable, verified downloads of whole ArcGIS layers.
+
+Offset paging (``resultOffset``) fetches pages one after another and a
+failed page silently ends the loop.  :class:`ArcGISDownloader` instead:
+
+1. reads the layer's full object-ID list (``returnIdsOnly``), which the
+   server returns in one response regardless of its record cap;
+2. splits the IDs into pages and fetches them by ``objectIds`` on a
+   bounded thread pool sharing one pooled :class:`requests.Session`;
+3. retries failed pages (network errors, HTTP 429/5xx, ArcGIS error
+   payloads, short pages) with exponential backoff, and raises
+   :class:`IncompleteDownloadError` rather than return partial data;
+4. optionally writes each finished page to a checkpoint directory, so an
+   interrupted pull resumes with only the missing pages.
+
+Example::
+
+    rows = ArcGISDownloader(url, checkpoint_dir="roadway_pull").run()
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+_sessions: Dict[int, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+class IncompleteDownloadError(RuntimeError):
+    """A page could not be fetched completely after all retries."""
+
+
+def pooled_session(pool_size: int = 8) -> requests.Session:
+    """A process-wide :class:`requests.Session` whose connection pool holds
+    ``pool_size`` connections per host (one session per pool size)."""
+    with _sessions_lock:
+        session = _sessions.get(pool_size)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[pool_size] = session
+        return session
+
+
+def backoff_delay(backoff: float, attempt: int) -> float:
+    """Seconds to wait before retry number ``attempt`` (1-based):
+    exponential in ``attempt`` with up to 100% jitter."""
+    return backoff * 2 ** (attempt - 1) * (1.0 + random.random())
+
+
+def send_with_retry(
+    session,
+    method: str,
+    url: str,
+    retries: int = 4,
+    backoff: float = 0.5,
+    timeout: float = 60.0,
+    check: Optional[Callable[[Any], None]] = None,
+    **kwargs,
+):
+    """Send a request, retrying network errors, HTTP 429/5xx and any error
+    raised by ``check(response)`` with exponential backoff and jitter.
+
+    Args:
+        session: Session (or anything with ``get``/``post``) to send on.
+        method: ``"get"`` or ``"post"``.
+        url: Endpoint URL.
+        retries: Retries after the first attempt.
+        backoff: Base delay in seconds (doubles on every retry).
+        timeout: Per-request timeout in seconds.
+        check: Optional validator; raising ``ValueError`` (or a
+            :class:`requests.RequestException`) marks the attempt failed.
+        **kwargs: ``params``/``data``/``headers`` for the request.
+
+    Returns:
+        The successful response.
+
+    Raises:
+        IncompleteDownloadError: If every attempt failed.
+    """
+    last_error: Optional[Exception] = None
+    for attempt in range(retries + 1):
+        if attempt:
+            time.sleep(backoff_delay(backoff, attempt))
+        try:
+            resp = getattr(session, method)(url, timeout=timeout, **kwargs)
+            if resp.status_code in _RETRY_STATUS:
+                raise requests.HTTPError(f"HTTP {resp.status_code}", response=resp)
+            resp.raise_for_status()
+            if check is not None:
+                check(resp)
+            return resp
+        except (requests.RequestException, ValueError) as exc:
+            last_error = exc
+            logger.debug("%s %s failed (attempt %d): %s", method.upper(), url,
+                         attempt + 1, exc)
+    raise IncompleteDownloadError(
+        f"{url} failed after {retries + 1} attempts: {last_error}"
+    )
+
+
+def arcgis_json(resp) -> Dict[str, Any]:
+    """Decode a response body, raising ``ValueError`` for the error payload
+    ArcGIS returns with HTTP 200."""
+    body = resp.json()
+    if isinstance(body, dict) and "error" in body:
+        raise ValueError(f"ArcGIS error: {body['error']}")
+    return body
+
+
+def request_json(
+    session,
+    method: str,
+    url: str,
+    retries: int = 4,
+    backoff: float = 0.5,
+    timeout: float = 60.0,
+    **kwargs,
+) -> Dict[str, Any]:
+    """:func:`send_with_retry` for ArcGIS JSON endpoints: error payloads
+    are retried too, and the decoded body is returned."""
+    bodies: List[Dict[str, Any]] = []
+    send_with_retry(session, method, url, retries=retries, backoff=backoff,
+                    timeout=timeout, check=lambda r: bodies.append(arcgis_json(r)),
+                    **kwargs)
+    return bodies[-1]
+
+
+class ArcGISDownloader:
+    """Download every feature of an ArcGIS layer matching ``where``.
+
+    Args:
+        url: Layer URL (ending in ``/MapServer/N`` or ``/FeatureServer/N``).
+        where: Attribute filter.
+        out_fields: Comma-separated field names or ``"*"``.
+        return_geometry: Keep each feature's geometry under ``_geometry``.
+        extra_params: Further parameters for the object-ID query (e.g. a
+            spatial filter); the pages are fetched by ID.
+        page_size: Largest number of IDs per page; pages never exceed the
+            layer's ``maxRecordCount`` (read from its metadata), which is
+            also the default.
+        max_workers: Pages fetched concurrently.
+        retries: Retries per request.
+        backoff: Base retry delay in seconds.
+        timeout: Per-request timeout in seconds.
+        checkpoint_dir: Directory for finished pages; rerunning with the
+            same directory and query resumes where the last run stopped.
+        session: Session to use (a shared pooled session by default).
+    """
+
+    def __init__(
+        self,
+        url: str,
+        where: str = "1=1",
+        out_fields: str = "*",
+        return_geometry: bool = False,
+        extra_params: Optional[Dict[str, Any]] = None,
+        page_size: Optional[int] = None,
+        max_workers: int = 4,
+        retries: int = 4,
+        backoff: float = 0.5,
+        timeout: float = 60.0,
+        checkpoint_dir: Optional[str] = None,
+        session=None,
+    ):
+        self.url = url.rstrip("/")
+        self.where = where
+        self.out_fields = out_fields
+        self.return_geometry = return_geometry
+        self.extra_params = dict(extra_params or {})
+        self.page_size = page_size
+        self.max_workers = max(1, int(max_workers))
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.checkpoint_dir = checkpoint_dir
+        self.session = session or pooled_session(self.max_workers)
+
+    def _json(self, method: str, url: str, **kwargs) -> Dict[str, Any]:
+        return request_json(self.session, method, url, retries=self.retries,
+                            backoff=self.backoff, timeout=self.timeout, **kwargs)
+
+    def object_ids(self) -> tuple[str, List[int]]:
+        """The layer's object-ID field name and the sorted IDs matching
+        the query."""
+        params = {"where": self.where, "returnIdsOnly": "true", "f": "json",
+                  **self.extra_params}
+        body = self._json("post", f"{self.url}/query", data=params)
+        return body.get("objectIdFieldName", "OBJECTID"), sorted(body.get("objectIds") or [])
+
+    def max_record_count(self) -> int:
+        """The layer's per-request record cap from its metadata."""
+        body = self._json("get", self.url, params={"f": "json"})
+        return int(body.get("maxRecordCount") or 1000)
+
+    def fetch_page(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Attribute dicts for exactly the features with ``ids``.
+
+        Raises:
+            IncompleteDownloadError: If the server keeps returning fewer
+                features than requested.
+        """
+        params = {
+            "objectIds": ",".join(str(i) for i in ids),
+            "outFields": self.out_fields,
+            "returnGeometry": str(self.return_geometry).lower(),
+            "f": "json",
+        }
+        if "outSR" in self.extra_params:
+            params["outSR"] = self.extra_params["outSR"]
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(backoff_delay(self.backoff, attempt))
+            features = self._json("post", f"{self.url}/query", data=params).get(
+                "features", [])
+            if len(features) == len(ids):
+                break
+            logger.debug("page of %d ids returned %d features (attempt %d)",
+                         len(ids), len(features), attempt + 1)
+        else:
+            raise IncompleteDownloadError(
+                f"{self.url}: page starting at id {ids[0]} returned "
+                f"{len(features)} of {len(ids)} features"
+            )
+        rows = []
+        for f in features:
+            rec = dict(f.get("attributes", {}))
+            if self.return_geometry and "geometry" in f:
+                rec["_geometry"] = f["geometry"]
+            rows.append(rec)
+        return rows
+
+    def run(
+        self, progress: Optional[Callable[[int, int], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Download every matching feature, in object-ID order.
+
+        Args:
+            progress: Called as ``progress(pages_done, pages_total)`` after
+                each page (including pages restored from the checkpoint).
+
+        Returns:
+            Attribute dicts, one per feature.
+
+        Raises:
+            IncompleteDownloadError: If any page fails after all retries.
+                Finished pages stay in the checkpoint for the next run.
+        """
+        _, ids = self._resume_or_list_ids()
+        cap = self.max_record_count()
+        # a server returns at most its cap, and fetch_page wants every id back
+        size = min(self.page_size or cap, cap)
+        pages = [ids[i:i + size] for i in range(0, len(ids), size)]
+        results: Dict[int, List[Dict[str, Any]]] = {}
+        for k in range(len(pages)):
+            stored = self._load_page(k, size)
+            if stored is not None:
+                results[k] = stored
+        pending = [k for k in range(len(pages)) if k not in results]
+        if progress and results:
+            progress(len(results), len(pages))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {pool.submit(self.fetch_page, pages[k]): k for k in pending}
+            try:
+                for future in as_completed(futures):
+                    k = futures[future]
+                    results[k] = future.result()
+                    self._save_page(k, size, results[k])
+                    if progress:
+                        progress(len(results), len(pages))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+        return [row for k in range(len(pages)) for row in results[k]]
+
+    # --- checkpoint ---
+
+    def _signature(self) -> Dict[str, Any]:
+        return {"url": self.url, "where": self.where, "out_fields": self.out_fields,
+                "return_geometry": self.return_geometry,
+                "extra_params": self.extra_params}
+
+    def _resume_or_list_ids(self) -> tuple[str, List[int]]:
+        manifest = self._path("manifest.json")
+        if manifest and os.path.exists(manifest):
+            with open(manifest) as fh:
+                saved = json.load(fh)
+            if saved["query"] != self._signature():
+                raise ValueError(
+                    f"checkpoint {self.checkpoint_dir!r} belongs to a different "
+                    f"query; use a new checkpoint_dir"
+                )
+            return saved["id_field"], saved["ids"]
+        id_field, ids = self.object_ids()
+        if manifest:
+            os.makedirs(self.checkpoint_dir, exist_ok=True)
+            _write_json(manifest, {"query": self._signature(), "id_field": id_field,
+                                   "ids": ids})
+        return id_field, ids
+
+    def _path(self, name: str) -> Optional[str]:
+        return os.path.join(self.checkpoint_dir, name) if self.checkpoint_dir else None
+
+    def _page_name(self, k: int, size: int) -> Optional[str]:
+        return self._path(f"page-{size}-{k:06d}.json")
+
+    def _load_page(self, k: int, size: int) -> Optional[List[Dict[str, Any]]]:
+        path = self._page_name(k, size)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path) as fh:
+                return json.load(fh)
+        except ValueError:
+            return None  # torn write from a killed run; refetch
+
+    def _save_page(self, k: int, size: int, rows: List[Dict[str, Any]]) -> None:
+        path = self._page_name(k, size)
+        if path:
+            _write_json(path, rows)
+
+
+def _write_json(path: str, payload: Any) -> None:
+    """Write JSON via a temporary file so a crash never leaves a torn page."""
+    directory = os.path.dirname(path)
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as fh:
+            json.dump(payload, fh)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
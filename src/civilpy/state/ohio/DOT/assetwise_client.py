@@ -23,15 +23,22 @@ with exponential backoff, and exposes both per-asset and batch endpoints plus a
 thread-pooled fan-out helper for the inherently per-asset endpoints (elements,
 inspections, cover images).
 
+:class:`AsyncAssetWiseClient` is the asyncio variant for large syncs: one
+``aiohttp`` connection pool, a concurrency cap, token-bucket rate limiting,
+non-blocking backoff, and a streaming :meth:`~AsyncAssetWiseClient.amap_assets`
+(``aiohttp`` is optional: ``pip install civilpy[async]``).
+
 Importing this module has no side effects and needs no credentials; auth is
 loaded lazily when a client is instantiated.
 """
+import asyncio
 import datetime
+import itertools
 import logging
 import random
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 
 import requests
 from requests.auth import HTTPBasicAuth
@@ -77,6 +84,28 @@ def parse_api_datetime(value):
     return dt.astimezone(datetime.timezone.utc)
 
 
+def _values_lookup(data):
+    """``{fe_id: value}`` from a GetCurrentValuesByAssetId response body."""
+    if not data.get('success'):
+        return {}
+    lookup = {}
+    for item in data.get('data', []):
+        fid = item.get('fe_id')
+        val = item.get('cv_value') or item.get('value') or item.get('va_value')
+        if fid is not None:
+            lookup[fid] = val
+    return lookup
+
+
+def _element_list(data):
+    """Element rows from a GetElements response (wrapped or bare list)."""
+    if isinstance(data, dict):
+        return data.get('value') or data.get('data') or []
+    if isinstance(data, list):
+        return data
+    return []
+
+
 class AssetWiseClient:
     """Reusable, connection-pooled HTTP client for the AssetWise API.
 
@@ -178,16 +207,7 @@ class AssetWiseClient:
             if resp.status_code != 200:
                 logger.warning("CurrentValues returned %d for as_id=%s", resp.status_code, as_id)
                 return {}
-            data = resp.json()
-            if not data.get('success'):
-                return {}
-            lookup = {}
-            for item in data.get('data', []):
-                fid = item.get('fe_id')
-                val = item.get('cv_value') or item.get('value') or item.get('va_value')
-                if fid is not None:
-                    lookup[fid] = val
-            return lookup
+            return _values_lookup(resp.json())
         except Exception as e:
             logger.error("Failed to fetch CurrentValues for as_id=%s: %s", as_id, e)
             return {}
@@ -241,11 +261,7 @@ class AssetWiseClient:
         try:
             resp = self._get_with_retry(url)
             if resp:
-                data = resp.json()
-                if isinstance(data, dict):
-                    return data.get('value') or data.get('data') or []
-                elif isinstance(data, list):
-                    return data
+                return _element_list(resp.json())
         except Exception as e:
             logger.error("Failed to fetch current elements for asset=%s: %s", asset_id, e)
         return []
@@ -256,11 +272,7 @@ class AssetWiseClient:
         try:
             resp = self.session.get(url)
             if resp.status_code == 200:
-                data = resp.json()
-                if isinstance(data, dict):
-                    return data.get('value') or data.get('data') or []
-                elif isinstance(data, list):
-                    return data
+                return _element_list(resp.json())
             else:
                 logger.warning("GetElements returned %d for report=%s asset=%s",
                                resp.status_code, report_id, asset_id)
@@ -414,14 +426,391 @@ class AssetWiseClient:
         ``fn`` is yielded as the result (not raised) so one bad asset can't abort
         the batch — callers decide how to handle it. The shared ``Session`` is
         thread-safe for this read-mostly use.
+
+        ``items`` is consumed lazily: at most ``2 * max_workers`` calls are
+        queued at a time, so a generator over the full inventory is never
+        materialized. See :meth:`AsyncAssetWiseClient.amap_assets` for the
+        asyncio equivalent.
         """
-        items = list(items)
+        items = iter(items)
+        window = 2 * max_workers
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_item = {executor.submit(fn, item): item for item in items}
-            for future in as_completed(future_to_item):
-                item = future_to_item[future]
-                try:
-                    yield item, future.result()
-                except Exception as e:  # surfaced to caller, not raised
-                    logger.error("map_assets: %r failed: %s", item, e)
-                    yield item, e
+            pending = {}
+            for item in itertools.islice(items, window):
+                pending[executor.submit(fn, item)] = item
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    item = pending.pop(future)
+                    for nxt in itertools.islice(items, 1):
+                        pending[executor.submit(fn, nxt)] = nxt
+                    try:
+                        result = future.result()
+                    except Exception as e:  # surfaced to caller, not raised
+                        logger.error("map_assets: %r failed: %s", item, e)
+                        result = e
+                    yield item, result
+
+
+# ----------------------------------------------------------------------
+# asyncio client
+# ----------------------------------------------------------------------
+_RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class AssetWiseRequestError(RuntimeError):
+    """An AssetWise request failed after every retry (or with a 4xx)."""
+
+    def __init__(self, message, status=None):
+        super().__init__(message)
+        self.status = status
+
+
+def _require_aiohttp():
+    try:
+        import aiohttp
+    except ImportError as exc:  # pragma: no cover - exercised only without dep
+        raise ImportError(
+            "aiohttp is required for AsyncAssetWiseClient; install it with "
+            "`pip install civilpy[async]` or `pip install aiohttp`."
+        ) from exc
+    return aiohttp
+
+
+def _transient_errors():
+    """Exception types worth retrying (aiohttp's when it is installed)."""
+    errors = (asyncio.TimeoutError, OSError)
+    try:
+        import aiohttp
+    except ImportError:
+        return errors
+    return errors + (aiohttp.ClientError,)
+
+
+class TokenBucket:
+    """Async token-bucket rate limiter.
+
+    Allows ``rate`` acquisitions per second on average with bursts of up
+    to ``capacity``. Waiters queue on a lock and sleep without blocking the
+    event loop. :meth:`pause` stops all acquisitions for a while, e.g. when
+    the server answers 429 with ``Retry-After``.
+    """
+
+    def __init__(self, rate, capacity=None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate!r}; use rate_limit=None "
+                             f"to disable rate limiting")
+        self.rate = float(rate)
+        self.capacity = float(capacity or max(1.0, self.rate))
+        self._tokens = self.capacity
+        self._updated = None
+        self._paused_until = 0.0
+        self._lock = asyncio.Lock()
+
+    def pause(self, seconds):
+        """Hold every acquisition for ``seconds`` from now."""
+        now = asyncio.get_running_loop().time()
+        self._paused_until = max(self._paused_until, now + seconds)
+
+    async def acquire(self):
+        """Wait for and consume one token."""
+        loop = asyncio.get_running_loop()
+        async with self._lock:
+            while True:
+                now = loop.time()
+                if self._updated is None:
+                    self._updated = now
+                self._tokens = min(self.capacity,
+                                   self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                delay = self._paused_until - now
+                if delay <= 0 and self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep(max(delay, (1.0 - self._tokens) / self.rate))
+
+
+async def _aiterate(items):
+    """Iterate a sync or async iterable asynchronously."""
+    if hasattr(items, '__aiter__'):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class AsyncAssetWiseClient:
+    """asyncio variant of :class:`AssetWiseClient` for large fan-outs.
+
+    All requests share one ``aiohttp`` connection pool, at most
+    ``max_concurrency`` are in flight, and a :class:`TokenBucket` keeps the
+    request rate at ``rate_limit`` per second (with bursts of ``burst``).
+    Transient failures (connection errors, timeouts, HTTP 429/5xx) are
+    retried with exponential backoff via ``asyncio.sleep``; a 429 with
+    ``Retry-After`` pauses the whole bucket, not just the one request.
+
+    Use it as an async context manager::
+
+        async with AsyncAssetWiseClient(rate_limit=20) as client:
+            async for as_id, inspections in client.amap_assets(
+                    client.get_inspections, as_ids):
+                ...
+
+    Args:
+        base_url: API root.
+        max_concurrency: Requests in flight (also the connection pool size).
+        rate_limit: Requests per second, or None for no limit.
+        burst: Token-bucket capacity (defaults to ``rate_limit``).
+        max_retries: Attempts per request, as in :class:`AssetWiseClient`.
+        backoff_factor: Base backoff in seconds (doubles per attempt).
+        timeout: Total per-request timeout in seconds.
+        session: An existing ``aiohttp.ClientSession`` (not closed by the
+            client); one is created on first use otherwise.
+    """
+
+    def __init__(self, base_url=BASE_URL, max_concurrency=16, rate_limit=10.0,
+                 burst=None, max_retries=3, backoff_factor=1.0, timeout=30,
+                 session=None):
+        self.base_url = base_url
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate_limit, burst) if rate_limit else None
+        self.session = session
+        self._owns_session = session is None
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+    @staticmethod
+    def _load_credentials():
+        """``(key_name, api_key)`` for HTTP Basic auth."""
+        return get_assetwise_secrets()
+
+    async def _ensure_session(self):
+        if self.session is None:
+            aiohttp = _require_aiohttp()
+            key_name, api_key = self._load_credentials()
+            self.session = aiohttp.ClientSession(
+                auth=aiohttp.BasicAuth(key_name, api_key),
+                headers={'Accept': 'application/json',
+                         'Content-Type': 'application/json'},
+                connector=aiohttp.TCPConnector(limit=self.max_concurrency),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self.session
+
+    async def aclose(self):
+        """Close the connection pool if this client created it."""
+        if self.session is not None and self._owns_session:
+            await self.session.close()
+            self.session = None
+
+    async def __aenter__(self):
+        await self._ensure_session()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+
+    # ------------------------------------------------------------------
+    # Low-level request helper
+    # ------------------------------------------------------------------
+    def _retry_delay(self, attempt, retry_after=None):
+        if retry_after is not None:
+            try:
+                return max(float(retry_after), 0.0)
+            except ValueError:
+                pass
+        return (self.backoff_factor * (2 ** attempt)
+                + random.uniform(0, self.backoff_factor))
+
+    async def _request(self, method, path, params=None, json=None, headers=None,
+                       read='json', allow_404=False):
+        """Send one request under the semaphore and rate limit, retrying
+        transient failures without blocking the event loop.
+
+        Returns the decoded JSON (``read='json'``) or raw bytes
+        (``read='bytes'``); ``None`` for a 404 when ``allow_404``.
+
+        Raises:
+            AssetWiseRequestError: On a non-retryable status, or when every
+                attempt failed.
+        """
+        session = await self._ensure_session()
+        url = f"{self.base_url}{path}"
+        transient = _transient_errors()
+        for attempt in range(self.max_retries):
+            retry_after = None
+            try:
+                async with self._semaphore:
+                    if self.bucket is not None:
+                        await self.bucket.acquire()
+                    async with session.request(method, url, params=params, json=json,
+                                               headers=headers) as resp:
+                        if resp.status == 404 and allow_404:
+                            return None
+                        if resp.status in _RETRY_STATUS:
+                            retry_after = resp.headers.get('Retry-After')
+                            raise AssetWiseRequestError(
+                                f"HTTP {resp.status} from {url}", status=resp.status)
+                        if resp.status >= 400:
+                            raise AssetWiseRequestError(
+                                f"HTTP {resp.status} from {url}", status=resp.status)
+                        if read == 'bytes':
+                            return await resp.read()
+                        return await resp.json(content_type=None)
+            except AssetWiseRequestError as e:
+                if e.status not in _RETRY_STATUS:
+                    raise
+                error = e
+            except transient as e:
+                error = e
+            logger.warning("Request failed (attempt %d/%d) for %s: %s",
+                           attempt + 1, self.max_retries, url, error)
+            if attempt == self.max_retries - 1:
+                break
+            delay = self._retry_delay(attempt, retry_after)
+            if retry_after is not None and self.bucket is not None:
+                self.bucket.pause(delay)
+            await asyncio.sleep(delay)
+        logger.error("Max retries exceeded for %s.", url)
+        raise AssetWiseRequestError(f"{url} failed after {self.max_retries} attempts: "
+                                    f"{error}")
+
+    # ------------------------------------------------------------------
+    # Endpoints (same results and error handling as AssetWiseClient)
+    # ------------------------------------------------------------------
+    async def get_as_id(self, sfn):
+        """Resolve a bridge SFN to its internal as_id."""
+        try:
+            data = await self._request(
+                'GET', f"/api/Asset/GetAssetByAsCode/{sfn}",
+                params={"IncludeCoordinates": "false", "IncludeParent": "false"})
+            if data.get('success') and data.get('data'):
+                return data['data'].get('as_id')
+        except Exception as e:
+            logger.error("Failed to fetch as_id for SFN %s: %s", sfn, e)
+        return None
+
+    async def get_current_values(self, as_id):
+        """All current field values for one asset as ``{fe_id: value}``."""
+        try:
+            return _values_lookup(await self._request(
+                'GET', f"/api/CurrentValue/GetCurrentValuesByAssetId/{as_id}"))
+        except Exception as e:
+            logger.error("Failed to fetch CurrentValues for as_id=%s: %s", as_id, e)
+            return {}
+
+    async def get_current_values_for_assets(self, as_ids, fe_ids=None):
+        """Batch CurrentValues rows for many assets in one POST."""
+        payload = {"as_ids": list(as_ids)}
+        if fe_ids:
+            payload["fe_ids"] = list(fe_ids)
+        try:
+            data = await self._request(
+                'POST', "/api/CurrentValue/GetCurrentValuesByAssetIds", json=payload)
+            if not data.get('success'):
+                logger.warning("GetCurrentValuesByAssetIds returned success=false "
+                               "for %d assets", len(payload['as_ids']))
+                return []
+            return data.get('data', [])
+        except Exception as e:
+            logger.error("GetCurrentValuesByAssetIds failed for %d assets: %s",
+                         len(payload['as_ids']), e)
+            return []
+
+    async def get_current_elements(self, asset_id):
+        """Current bridge elements via asset_id (ObjectType 0)."""
+        try:
+            return _element_list(await self._request(
+                'GET', f"/api/StructureElement/GetElements/0/{asset_id}/{asset_id}/0/0"))
+        except Exception as e:
+            logger.error("Failed to fetch current elements for asset=%s: %s", asset_id, e)
+            return []
+
+    async def get_structure_elements(self, report_id, asset_id):
+        """Bridge elements for a specific inspection report."""
+        try:
+            return _element_list(await self._request(
+                'GET', f"/api/StructureElement/GetElements/1/{report_id}/{asset_id}"))
+        except Exception as e:
+            logger.error("Failed to fetch elements for report=%s asset=%s: %s",
+                         report_id, asset_id, e)
+            return []
+
+    async def get_inspections(self, asset_id):
+        """All approved inspections for an asset."""
+        try:
+            data = await self._request(
+                'GET', f"/api/InspectionReport/GetAllApproved/{asset_id}")
+            if data.get('success'):
+                return data.get('data', [])
+        except Exception as e:
+            logger.error("Failed to fetch inspections for asset=%s: %s", asset_id, e)
+        return []
+
+    async def get_full_inspection_report(self, ast_id):
+        """Full inspection report values via ast_id."""
+        try:
+            data = await self._request('GET', f"/api/Value/GetValuesForReport/{ast_id}")
+            if data.get('success'):
+                return data.get('data', [])
+        except Exception as e:
+            logger.error("Failed to fetch full report for ast_id=%s: %s", ast_id, e)
+        return []
+
+    async def get_cover_image(self, as_id):
+        """Raw cover-image bytes for an asset, or ``None`` (also on 404)."""
+        try:
+            return await self._request(
+                'GET', f"/api/AssetFile/GetAssetCoverImage/{as_id}",
+                headers={"Accept": "application/octet-stream"},
+                read='bytes', allow_404=True)
+        except Exception as e:
+            logger.error("Failed to fetch cover image for as_id=%s: %s", as_id, e)
+            return None
+
+    # ------------------------------------------------------------------
+    # Streaming fan-out
+    # ------------------------------------------------------------------
+    async def amap_assets(self, fn, items, max_in_flight=None):
+        """Await ``fn(item)`` across ``items``, yielding ``(item, result)``
+        as each finishes.
+
+        ``items`` may be a sync or async iterable and is consumed lazily:
+        only ``max_in_flight`` calls (default ``2 * max_concurrency``) exist
+        at a time, so memory stays flat however long the input is. As in
+        :meth:`AssetWiseClient.map_assets`, an exception from ``fn`` is
+        yielded as the result. Leaving the loop early cancels the calls
+        still pending.
+        """
+        limit = max_in_flight or 2 * self.max_concurrency
+        source = _aiterate(items).__aiter__()
+        pending = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < limit:
+                    try:
+                        item = await source.__anext__()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    pending[asyncio.ensure_future(fn(item))] = item
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = pending.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as e:  # surfaced to caller, not raised
+                        logger.error("amap_assets: %r failed: %s", item, e)
+                        result = e
+                    yield item, result
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,307 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Response cache for the TIMS, NHD and USGS JSON services.
+
+Responses are keyed on method + URL + parameters and stored as JSON text
+(so callers can never mutate a cached body) in a pluggable backend:
+:class:`MemoryCache` (bounded LRU, the default) or :class:`SQLiteCache`
+(survives restarts, shared between processes).  Each call carries a TTL,
+normally the layer's own; once an entry is stale and the server had sent
+an ``ETag`` or ``Last-Modified`` header, the entry is revalidated with a
+conditional request and a ``304 Not Modified`` just renews it.  Hit, miss
+and revalidation counts are kept in :attr:`ResponseCache.stats`.
+
+Example::
+
+    configure_cache("sqlite")            # persist across sessions
+    body = get_cache().get_json(url, params={"f": "json"}, ttl=3600)
+    get_cache().stats.hit_rate
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from civilpy.state.ohio.DOT.arcgis_download import pooled_session, send_with_retry
+
+# (body as JSON text, stored-at epoch seconds, ETag, Last-Modified)
+Entry = Tuple[str, float, Optional[str], Optional[str]]
+
+
+class MemoryCache:
+    """In-process LRU backend holding at most ``max_entries`` responses."""
+
+    def __init__(self, max_entries: int = 2048):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Entry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: Entry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteCache:
+    """On-disk backend; one row per response in a SQLite file
+    (``http_cache.sqlite`` in the civilpy cache directory by default)."""
+
+    def __init__(self, path: Optional[str] = None):
+        if path is None:
+            from civilpy.structural.shape_db import cache_dir
+
+            path = os.path.join(cache_dir(), "http_cache.sqlite")
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._db:
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, "
+                "body TEXT, stored REAL, etag TEXT, last_modified TEXT)"
+            )
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            row = self._db.execute(
+                "SELECT body, stored, etag, last_modified FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def set(self, key: str, entry: Entry) -> None:
+        with self._lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?)", (key, *entry)
+            )
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        self._db.close()
+
+
+@dataclass
+class CacheStats:
+    """Counters for one :class:`ResponseCache`."""
+
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without downloading a body
+        (fresh hits plus ``304`` revalidations)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """JSON response cache in front of :func:`send_with_retry`.
+
+    Args:
+        backend: Storage (:class:`MemoryCache`, :class:`SQLiteCache`, or
+            anything with ``get``/``set``/``clear``); None disables caching.
+        default_ttl: Seconds an entry stays fresh when a call gives no TTL.
+        ttls: Per-service TTLs as ``{url_prefix: seconds}``; the longest
+            matching prefix wins over the caller's TTL, so one service can
+            be tuned without touching code.
+        session: Session to send on (the shared pooled session by default).
+    """
+
+    def __init__(
+        self,
+        backend=None,
+        default_ttl: float = 3600.0,
+        ttls: Optional[Dict[str, float]] = None,
+        session=None,
+    ):
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self.ttls = dict(ttls or {})
+        self.session = session
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(method: str, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Cache key for a request (independent of parameter order)."""
+        canonical = json.dumps([method.lower(), url, params or {}], sort_keys=True,
+                               default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def ttl_for(self, url: str, ttl: Optional[float] = None) -> float:
+        """Freshness lifetime for ``url``: the longest matching ``ttls``
+        prefix, else ``ttl``, else ``default_ttl``."""
+        matches = [p for p in self.ttls if url.startswith(p)]
+        if matches:
+            return self.ttls[max(matches, key=len)]
+        return self.default_ttl if ttl is None else ttl
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            setattr(self.stats, name, getattr(self.stats, name) + 1)
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = CacheStats()
+
+    def clear(self) -> None:
+        """Drop every cached response."""
+        if self.backend is not None:
+            self.backend.clear()
+
+    def get_json(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        ttl: Optional[float] = None,
+        validate: Optional[Callable[[Any], Any]] = None,
+        retries: int = 2,
+        timeout: float = 30.0,
+    ) -> Any:
+        """GET ``url`` and return its decoded JSON, from the cache if fresh.
+
+        Args:
+            url: Endpoint URL.
+            params: Query parameters.
+            ttl: Freshness lifetime in seconds (see :meth:`ttl_for`).
+            validate: Decoder applied to each response (``resp.json`` by
+                default); raising ``ValueError`` retries the request and
+                keeps the body out of the cache.
+            retries: Retries for failed requests.
+            timeout: Per-request timeout in seconds.
+
+        Returns:
+            The decoded JSON body.
+
+        Raises:
+            IncompleteDownloadError: If the request fails after retries.
+        """
+        decode = validate or (lambda r: r.json())
+        session = self.session or pooled_session()
+        if self.backend is None:
+            bodies = []
+            send_with_retry(session, "get", url, retries=retries, timeout=timeout,
+                            check=lambda r: bodies.append(decode(r)), params=params)
+            return bodies[-1]
+
+        key = self.key("get", url, params)
+        entry = self.backend.get(key)
+        now = time.time()
+        if entry is not None and now - entry[1] < self.ttl_for(url, ttl):
+            self._count("hits")
+            return json.loads(entry[0])
+
+        headers = {}
+        if entry is not None and entry[2]:
+            headers["If-None-Match"] = entry[2]
+        if entry is not None and entry[3]:
+            headers["If-Modified-Since"] = entry[3]
+        bodies = []
+
+        def check(resp):
+            if resp.status_code != 304:
+                bodies.append(decode(resp))
+
+        resp = send_with_retry(session, "get", url, retries=retries, timeout=timeout,
+                               check=check, params=params, headers=headers or None)
+        if resp.status_code == 304 and entry is not None:
+            self._count("hits")
+            self._count("revalidated")
+            self.backend.set(key, (entry[0], now, entry[2], entry[3]))
+            return json.loads(entry[0])
+
+        self._count("misses")
+        body = bodies[-1]
+        self.backend.set(key, (json.dumps(body), now, resp.headers.get("ETag"),
+                               resp.headers.get("Last-Modified")))
+        return body
+
+
+_cache = ResponseCache(MemoryCache())
+_cache_lock = threading.Lock()
+
+
+def get_cache() -> ResponseCache:
+    """The process-wide cache used by the TIMS/NHD/USGS helpers."""
+    return _cache
+
+
+def configure_cache(
+    backend: Optional[str] = "memory",
+    path: Optional[str] = None,
+    max_entries: int = 2048,
+    default_ttl: float = 3600.0,
+    ttls: Optional[Dict[str, float]] = None,
+) -> ResponseCache:
+    """Replace the process-wide cache.
+
+    Args:
+        backend: ``"memory"``, ``"sqlite"`` or None (no caching).
+        path: SQLite file (default in the civilpy cache directory).
+        max_entries: LRU size for the memory backend.
+        default_ttl: Seconds an entry stays fresh when a call gives no TTL.
+        ttls: Per-service TTL overrides, ``{url_prefix: seconds}``.
+
+    Returns:
+        The new cache.
+    """
+    global _cache
+    if backend == "memory":
+        store = MemoryCache(max_entries)
+    elif backend == "sqlite":
+        store = SQLiteCache(path)
+    elif backend is None:
+        store = None
+    else:
+        raise ValueError(f"Unknown cache backend {backend!r}; use 'memory', 'sqlite' or None")
+    with _cache_lock:
+        _cache = ResponseCache(store, default_ttl=default_ttl, ttls=ttls)
+    return _cache
@@ -0,0 +1,189 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Local point-to-polyline joins for batched ArcGIS lookups.
+
+``ArcGISLayer.query_by_point`` answers "which features intersect the small
+box around this point?" with one request per point.  The helpers here
+answer the same question for many points at once from features fetched in
+one envelope query: polylines are split into segments, candidate
+(point, segment) pairs come from a k-d tree in box-scaled coordinates, and
+each pair gets an exact segment/box intersection test (Liang-Barsky
+clipping), so the result matches the per-point server query.
+
+Example::
+
+    segments = polyline_segments(flowlines)
+    pairs = segments_in_boxes(lon, lat, half_w, half_h, *segments[:4])
+    orders = max_per_point(len(lon), pairs, [f["StreamOrder"] for f in flowlines],
+                           owner=segments[4])
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Approximate degrees per mile at Ohio latitudes (~40 deg N), as used by
+# ArcGISLayer.query_by_point
+DEG_PER_MILE_LAT = 1.0 / 69.0
+DEG_PER_MILE_LON = 1.0 / 54.6
+
+
+def polyline_segments(
+    features: Sequence[Dict[str, Any]], geometry_key: str = "_geometry",
+) -> Tuple[np.ndarray, ...]:
+    """Split feature geometries into straight segments.
+
+    Polyline ``paths`` give one segment per vertex pair; a single-vertex
+    path or a point geometry (``x``/``y``) becomes a zero-length segment.
+
+    Args:
+        features: Query results carrying ArcGIS JSON geometry.
+        geometry_key: Key holding the geometry in each feature dict.
+
+    Returns:
+        ``(x0, y0, x1, y1, owner)`` arrays, ``owner`` being the index of
+        the feature each segment came from.
+    """
+    starts, ends, owners = [], [], []
+    for k, feature in enumerate(features):
+        geometry = feature.get(geometry_key) or {}
+        paths = geometry.get("paths")
+        if paths is None and "x" in geometry and "y" in geometry:
+            paths = [[[geometry["x"], geometry["y"]]]]
+        for path in paths or ():
+            vertices = np.asarray(path, dtype=float).reshape(-1, np.shape(path)[-1])[:, :2]
+            if len(vertices) == 0:
+                continue
+            if len(vertices) == 1:
+                vertices = np.vstack((vertices, vertices))
+            starts.append(vertices[:-1])
+            ends.append(vertices[1:])
+            owners.append(np.full(len(vertices) - 1, k, dtype=np.intp))
+    if not starts:
+        empty = np.empty(0)
+        return empty, empty, empty, empty, np.empty(0, dtype=np.intp)
+    a, b = np.concatenate(starts), np.concatenate(ends)
+    return a[:, 0], a[:, 1], b[:, 0], b[:, 1], np.concatenate(owners)
+
+
+def segments_in_boxes(
+    px, py, half_w: float, half_h: float, x0, y0, x1, y1,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """All (point, segment) pairs where the segment touches the box
+    ``[px - half_w, px + half_w] x [py - half_h, py + half_h]``.
+
+    Args:
+        px: Point x coordinates (longitude).
+        py: Point y coordinates (latitude).
+        half_w: Box half-width (same units as x).
+        half_h: Box half-height (same units as y).
+        x0, y0, x1, y1: Segment end coordinates.
+
+    Returns:
+        ``(point_index, segment_index)`` arrays, one entry per pair.
+    """
+    from scipy.spatial import cKDTree
+
+    px = np.asarray(px, dtype=float) / half_w
+    py = np.asarray(py, dtype=float) / half_h
+    u0, u1 = np.asarray(x0, dtype=float) / half_w, np.asarray(x1, dtype=float) / half_w
+    v0, v1 = np.asarray(y0, dtype=float) / half_h, np.asarray(y1, dtype=float) / half_h
+    none = np.empty(0, dtype=np.intp)
+    if px.size == 0 or u0.size == 0:
+        return none, none
+
+    # In scaled coordinates every box is the unit Chebyshev ball around its
+    # point, so a touching segment's midpoint lies within 1 + half its
+    # Chebyshev length of the point.
+    reach = 1.0 + 0.5 * np.maximum(np.abs(u1 - u0), np.abs(v1 - v0))
+    mid = np.column_stack(((u0 + u1) / 2.0, (v0 + v1) / 2.0))
+    tree = cKDTree(np.column_stack((px, py)))
+    hits = tree.query_ball_point(mid, reach, p=np.inf)
+    counts = np.fromiter((len(h) for h in hits), dtype=np.intp, count=len(hits))
+    if not counts.sum():
+        return none, none
+    seg = np.repeat(np.arange(len(hits)), counts)
+    pt = np.fromiter((i for h in hits for i in h), dtype=np.intp, count=int(counts.sum()))
+
+    # Liang-Barsky clip of each candidate segment against its point's box
+    du, dv = u1[seg] - u0[seg], v1[seg] - v0[seg]
+    t_lo, t_hi = np.zeros(seg.size), np.ones(seg.size)
+    keep = np.ones(seg.size, dtype=bool)
+    for p, q in ((-du, u0[seg] - (px[pt] - 1.0)), (du, (px[pt] + 1.0) - u0[seg]),
+                 (-dv, v0[seg] - (py[pt] - 1.0)), (dv, (py[pt] + 1.0) - v0[seg])):
+        parallel = p == 0.0
+        keep &= ~(parallel & (q < 0.0))
+        r = np.divide(q, p, out=np.zeros_like(q), where=~parallel)
+        t_lo = np.where(~parallel & (p < 0.0), np.maximum(t_lo, r), t_lo)
+        t_hi = np.where(~parallel & (p > 0.0), np.minimum(t_hi, r), t_hi)
+    keep &= t_lo <= t_hi
+    return pt[keep], seg[keep]
+
+
+def max_per_point(
+    n_points: int,
+    pairs: Tuple[np.ndarray, np.ndarray],
+    values: Sequence[Optional[float]],
+    owner: Optional[np.ndarray] = None,
+) -> List[Optional[float]]:
+    """Largest non-None value among the features joined to each point.
+
+    Args:
+        n_points: Number of points.
+        pairs: ``(point_index, segment_index)`` from :func:`segments_in_boxes`.
+        values: One value per feature (None is ignored).
+        owner: Feature index of each segment (identity if omitted).
+
+    Returns:
+        One value per point, None where no joined feature has a value.
+    """
+    point, segment = pairs
+    feature = segment if owner is None else np.asarray(owner)[segment]
+    vals = np.array([np.nan if v is None else v for v in values], dtype=float)
+    best = np.full(n_points, -np.inf)
+    if feature.size:
+        np.fmax.at(best, point, vals[feature])
+    out: List[Optional[float]] = []
+    for v in best.tolist():
+        out.append(None if v == -np.inf else (int(v) if v.is_integer() else v))
+    return out
+
+
+def tile_groups(lon, lat, tile_miles: float) -> List[np.ndarray]:
+    """Split points into square tiles about ``tile_miles`` on a side.
+
+    Args:
+        lon: Longitudes.
+        lat: Latitudes.
+        tile_miles: Tile edge length in miles.
+
+    Returns:
+        Index arrays, one per occupied tile.
+    """
+    lon, lat = np.asarray(lon, dtype=float), np.asarray(lat, dtype=float)
+    if lon.size == 0:
+        return []
+    keys = np.column_stack((
+        np.floor(lon / (tile_miles * DEG_PER_MILE_LON)),
+        np.floor(lat / (tile_miles * DEG_PER_MILE_LAT)),
+    ))
+    _, tile = np.unique(keys, axis=0, return_inverse=True)
+    tile = tile.reshape(-1)
+    order = np.argsort(tile, kind="stable")
+    return np.split(order, np.flatnonzero(np.diff(tile[order])) + 1)
@@ -0,0 +1,455 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Offline, spatially indexed snapshot of a point layer (TIMS bridges).
+
+A :class:`PointSnapshot` holds every feature of an ArcGIS point layer as
+columns, pulled once through ``ArcGISLayer.download`` and saved to a
+columnar ``.npz`` file.  Positions are indexed with a k-d tree over unit
+vectors on the sphere: the straight-line (chord) distance between unit
+vectors is a monotonic function of great-circle distance, so radius and
+k-nearest queries on the tree are exact haversine queries.  Searches then
+run locally in microseconds instead of one network round-trip each.
+
+Example::
+
+    snap = PointSnapshot.from_layer(TIMSBridge._layer)
+    snap.save("tims_bridges.npz")
+
+    snap = PointSnapshot.load("tims_bridges.npz")
+    snap.near(-82.95, 40.18, radius_miles=5, where="MAINT_RESP_CD='01'")
+    snap.nearest(-82.95, 40.18, k=3)
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+
+EARTH_RADIUS_MILES = 3958.8
+SNAPSHOT_VERSION = 1
+
+_EQUALITY = re.compile(r"^\s*(\w+)\s*=\s*'([^']*)'\s*$")
+
+
+def haversine_miles(lat1, lon1, lat2, lon2) -> np.ndarray:
+    """Great-circle distance in miles, element-wise over broadcast arrays.
+
+    Args:
+        lat1: Latitude(s) of the first point(s), degrees.
+        lon1: Longitude(s) of the first point(s), degrees.
+        lat2: Latitude(s) of the second point(s), degrees.
+        lon2: Longitude(s) of the second point(s), degrees.
+
+    Returns:
+        Distances in miles.
+    """
+    lat1, lon1, lat2, lon2 = (np.radians(np.asarray(v, dtype=float))
+                              for v in (lat1, lon1, lat2, lon2))
+    a = (np.sin((lat2 - lat1) / 2) ** 2
+         + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2)
+    return EARTH_RADIUS_MILES * 2 * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+def parse_where(where: Optional[str]) -> Optional[Dict[str, str]]:
+    """Parse a simple ArcGIS WHERE clause into ``{field: value}``.
+
+    Only ``1=1`` and ``AND``-joined ``FIELD='value'`` equalities are
+    understood, which covers the filters the TIMS helpers send.
+
+    Args:
+        where: SQL-style WHERE clause, or None.
+
+    Returns:
+        The equality filters (empty for no filter), or None if the clause
+        uses anything else and must go to the server.
+    """
+    if where is None or where.strip() in ("", "1=1"):
+        return {}
+    filters = {}
+    for term in re.split(r"\s+AND\s+", where.strip(), flags=re.IGNORECASE):
+        match = _EQUALITY.match(term)
+        if not match:
+            return None
+        filters[match.group(1)] = match.group(2)
+    return filters
+
+
+def _unit_vectors(lat, lon) -> np.ndarray:
+    lat, lon = np.radians(lat), np.radians(lon)
+    return np.column_stack((np.cos(lat) * np.cos(lon),
+                            np.cos(lat) * np.sin(lon),
+                            np.sin(lat)))
+
+
+def _chord(miles) -> np.ndarray:
+    return 2.0 * np.sin(np.asarray(miles, dtype=float) / (2.0 * EARTH_RADIUS_MILES))
+
+
+class PointSnapshot:
+    """Columnar copy of a point layer with a spherical k-d tree index.
+
+    Args:
+        columns: Attribute columns, ``{field: list of values}``, all the
+            same length.
+        lat_field: Column holding latitude in decimal degrees.
+        lon_field: Column holding longitude in decimal degrees.
+        meta: Free-form provenance (source URL, pull time, filter).
+
+    Features without usable coordinates are kept (they still answer
+    attribute filters) but never match a spatial query.
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, List[Any]],
+        lat_field: str = "LATITUDE_DD",
+        lon_field: str = "LONGITUDE_DD",
+        meta: Optional[Dict[str, Any]] = None,
+    ):
+        lengths = {len(v) for v in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"snapshot columns differ in length: {sorted(lengths)}")
+        self.columns = columns
+        self.fields = list(columns)
+        self.lat_field = lat_field
+        self.lon_field = lon_field
+        self.meta = dict(meta or {})
+        self._n = lengths.pop() if lengths else 0
+        self.lat = self._coordinate(lat_field)
+        self.lon = self._coordinate(lon_field)
+        located = np.isfinite(self.lat) & np.isfinite(self.lon)
+        located &= (self.lat != 0.0) | (self.lon != 0.0)
+        self._located = np.flatnonzero(located)
+        self._tree = None
+        self._masks: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]], **kwargs) -> "PointSnapshot":
+        """Build a snapshot from attribute dicts (e.g. query results)."""
+        records = list(records)
+        fields = list(dict.fromkeys(k for r in records for k in r if k != "_geometry"))
+        columns = {f: [r.get(f) for r in records] for f in fields}
+        return cls(columns, **kwargs)
+
+    @classmethod
+    def from_layer(
+        cls,
+        layer,
+        where: str = "1=1",
+        out_fields: str = "*",
+        max_workers: int = 4,
+        checkpoint_dir: Optional[str] = None,
+        **kwargs,
+    ) -> "PointSnapshot":
+        """Pull every feature of ``layer`` (an ``ArcGISLayer``) once.
+
+        The pull goes through ``ArcGISLayer.download``, which fetches pages
+        by object ID and checks each one, so a failed or short page raises
+        ``IncompleteDownloadError`` instead of leaving a truncated snapshot.
+
+        Args:
+            layer: Object with an ``ArcGISLayer.download``-compatible method.
+            where: Attribute filter for the pull.
+            out_fields: Fields to keep.
+            max_workers: Pages fetched concurrently.
+            checkpoint_dir: Directory that keeps finished pages so an
+                interrupted pull resumes where it stopped.
+
+        Returns:
+            The snapshot, with the pull recorded in ``meta``.
+
+        Raises:
+            ValueError: If the layer returns no features for ``where``.
+        """
+        records = layer.download(where=where, out_fields=out_fields,
+                                 return_geometry=False, max_workers=max_workers,
+                                 checkpoint_dir=checkpoint_dir)
+        if not records:
+            raise ValueError(
+                f"layer {getattr(layer, '_url', layer)!r} returned no features "
+                f"for where={where!r}; refusing to build an empty snapshot"
+            )
+        meta = {"source": getattr(layer, "_url", None), "where": where,
+                "pulled": time.time()}
+        return cls.from_records(records, meta=meta, **kwargs)
+
+    # --- persistence ---
+
+    def save(self, path: str) -> None:
+        """Write the snapshot to a columnar ``.npz`` file (atomically)."""
+        payload = json.dumps({
+            "version": SNAPSHOT_VERSION,
+            "lat_field": self.lat_field,
+            "lon_field": self.lon_field,
+            "meta": self.meta,
+            "columns": self.columns,
+        }).encode()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as fh:
+                np.savez_compressed(fh, lat=self.lat, lon=self.lon,
+                                    columns=np.frombuffer(payload, dtype=np.uint8))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path: str) -> "PointSnapshot":
+        """Read a snapshot written by :meth:`save`."""
+        with np.load(path) as data:
+            payload = json.loads(data["columns"].tobytes())
+        if payload.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(
+                f"snapshot {path!r} has version {payload.get('version')!r}; "
+                f"rebuild it with PointSnapshot.from_layer"
+            )
+        return cls(payload["columns"], lat_field=payload["lat_field"],
+                   lon_field=payload["lon_field"], meta=payload["meta"])
+
+    @property
+    def age_days(self) -> Optional[float]:
+        """Days since the snapshot was pulled, if recorded."""
+        pulled = self.meta.get("pulled")
+        return None if pulled is None else (time.time() - pulled) / 86400.0
+
+    # --- records ---
+
+    def __len__(self) -> int:
+        return self._n
+
+    def __repr__(self) -> str:
+        return f"PointSnapshot({self._n} features, {len(self.fields)} fields)"
+
+    def record(self, i: int) -> Dict[str, Any]:
+        """Feature ``i`` as an attribute dict (a fresh copy)."""
+        return {f: self.columns[f][i] for f in self.fields}
+
+    def records(self, positions: Iterable[int]) -> List[Dict[str, Any]]:
+        """Features at ``positions`` as attribute dicts."""
+        return [self.record(int(i)) for i in positions]
+
+    def select(self, where: Optional[str] = None, **equals) -> np.ndarray:
+        """Positions of the features matching the filters.
+
+        Args:
+            where: Simple WHERE clause (see :func:`parse_where`).
+            **equals: Extra ``field=value`` equality filters.
+
+        Returns:
+            Sorted feature positions.
+        """
+        return np.flatnonzero(self._mask(where, equals))
+
+    def _mask(self, where: Optional[str], equals: Dict[str, Any]) -> np.ndarray:
+        filters = parse_where(where) if isinstance(where, str) or where is None else None
+        if filters is None:
+            raise ValueError(
+                f"cannot evaluate WHERE clause {where!r} offline; use "
+                f"FIELD='value' terms joined by AND"
+            )
+        filters.update(equals)
+        mask = np.ones(self._n, dtype=bool)
+        for field, value in filters.items():
+            mask &= self._equals(field, value)
+        return mask
+
+    def _equals(self, field: str, value: Any) -> np.ndarray:
+        key = (field, value)
+        if key not in self._masks:
+            column = self.columns.get(field)
+            if column is None:
+                raise KeyError(f"snapshot has no field {field!r}")
+            # WHERE values arrive as text; compare codes as strings
+            target = str(value)
+            self._masks[key] = np.fromiter(
+                (v is not None and str(v) == target for v in column),
+                dtype=bool, count=self._n,
+            )
+        return self._masks[key]
+
+    def _coordinate(self, field: str) -> np.ndarray:
+        column = self.columns.get(field, [None] * self._n)
+        return np.array([np.nan if v is None else v for v in column], dtype=float)
+
+    # --- spatial queries ---
+
+    @property
+    def tree(self):
+        """k-d tree over the located features' unit vectors (built on
+        first use)."""
+        if self._tree is None:
+            from scipy.spatial import cKDTree
+
+            self._tree = cKDTree(_unit_vectors(self.lat[self._located],
+                                               self.lon[self._located]))
+        return self._tree
+
+    def distances(self, lon: float, lat: float) -> np.ndarray:
+        """Great-circle distance (miles) from a point to every feature
+        (NaN where a feature has no coordinates)."""
+        return haversine_miles(lat, lon, self.lat, self.lon)
+
+    def near(
+        self,
+        lon: float,
+        lat: float,
+        radius_miles: float = 5.0,
+        where: Optional[str] = None,
+        **equals,
+    ) -> List[Dict[str, Any]]:
+        """Features within ``radius_miles`` of a point, nearest first.
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            radius_miles: Search radius in miles (great-circle).
+            where: Simple WHERE clause filter.
+            **equals: Extra ``field=value`` equality filters.
+
+        Returns:
+            Attribute dicts, each with ``distance_miles`` (rounded to 0.01).
+        """
+        if self._located.size == 0:
+            return []
+        hits = self.tree.query_ball_point(_unit_vectors(lat, lon)[0],
+                                          float(_chord(radius_miles)))
+        positions = self._located[np.asarray(hits, dtype=np.intp)]
+        if where is not None or equals:
+            positions = positions[self._mask(where, equals)[positions]]
+        return self._with_distance(lon, lat, positions)
+
+    def within_bbox(
+        self,
+        xmin: float,
+        ymin: float,
+        xmax: float,
+        ymax: float,
+        where: Optional[str] = None,
+        **equals,
+    ) -> List[Dict[str, Any]]:
+        """Features inside a WGS84 bounding box, in snapshot order.
+
+        Args:
+            xmin: West longitude.
+            ymin: South latitude.
+            xmax: East longitude.
+            ymax: North latitude.
+            where: Simple WHERE clause filter.
+            **equals: Extra ``field=value`` equality filters.
+
+        Returns:
+            Attribute dicts.
+        """
+        with np.errstate(invalid="ignore"):
+            mask = ((self.lon >= xmin) & (self.lon <= xmax)
+                    & (self.lat >= ymin) & (self.lat <= ymax))
+        if where is not None or equals:
+            mask &= self._mask(where, equals)
+        return self.records(np.flatnonzero(mask))
+
+    def nearest(
+        self,
+        lon: float,
+        lat: float,
+        k: int = 1,
+        where: Optional[str] = None,
+        **equals,
+    ) -> List[Dict[str, Any]]:
+        """The ``k`` features nearest a point, nearest first.
+
+        Args:
+            lon: Longitude.
+            lat: Latitude.
+            k: Number of features.
+            where: Simple WHERE clause filter.
+            **equals: Extra ``field=value`` equality filters.
+
+        Returns:
+            Up to ``k`` attribute dicts, each with ``distance_miles``.
+        """
+        if where is None and not equals:
+            k_tree = min(k, self._located.size)
+            if k_tree == 0:
+                return []
+            _, hits = self.tree.query(_unit_vectors(lat, lon)[0], k=k_tree)
+            return self._with_distance(lon, lat, self._located[np.atleast_1d(hits)])
+        candidates = self._located[self._mask(where, equals)[self._located]]
+        d = self.distances(lon, lat)[candidates]
+        order = np.argsort(d, kind="stable")[:k]
+        return self._with_distance(lon, lat, candidates[order])
+
+    def _with_distance(self, lon: float, lat: float, positions: np.ndarray) -> List[Dict[str, Any]]:
+        d = haversine_miles(lat, lon, self.lat[positions], self.lon[positions])
+        order = np.argsort(d, kind="stable")
+        out = []
+        for i, dist in zip(positions[order].tolist(), d[order].tolist()):
+            rec = self.record(i)
+            rec["distance_miles"] = round(dist, 2)
+            out.append(rec)
+        return out
+
+
+def snapshot_path(name: str) -> str:
+    """Default on-disk location for a named snapshot, in the civilpy cache
+    directory (``$CIVILPY_CACHE_DIR`` or ``~/.cache/civilpy``)."""
+    from civilpy.structural.shape_db import cache_dir
+
+    return os.path.join(cache_dir(), f"{name}.npz")
+
+
+def load_or_pull(
+    name: str,
+    pull: Callable[[], PointSnapshot],
+    path: Optional[str] = None,
+    max_age_days: Optional[float] = None,
+    refresh: bool = False,
+) -> PointSnapshot:
+    """Load the snapshot at ``path`` or pull and save a fresh one.
+
+    Args:
+        name: Snapshot name, used for the default path.
+        pull: Builds a fresh snapshot (typically ``from_layer``); if it
+            raises, nothing is saved and a file already at ``path`` is kept.
+        path: File to use (defaults to :func:`snapshot_path`).
+        max_age_days: Re-pull when the saved snapshot is older than this.
+        refresh: Always re-pull.
+
+    Returns:
+        The snapshot.
+    """
+    path = path or snapshot_path(name)
+    if not refresh and os.path.exists(path):
+        try:
+            snap = PointSnapshot.load(path)
+        except (OSError, ValueError, KeyError):
+            snap = None  # unreadable or stale format; pull below
+        if snap is not None and (
+            max_age_days is None or (snap.age_days or 0.0) <= max_age_days
+        ):
+            return snap
+    snap = pull()
+    snap.save(path)
+    return snap
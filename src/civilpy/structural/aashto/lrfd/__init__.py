@@ -27,7 +27,13 @@ software or hand calculations.
 <function flange_local_buckling_resistance at ...>
 """
 
-from civilpy.structural.aashto.lrfd.core import ARTICLES, CheckResult, article
+from civilpy._lazy import lazy_exports
+from civilpy.structural.aashto.lrfd.core import (
+    ARTICLES,
+    CheckResult,
+    CheckResultBatch,
+    article,
+)
 from civilpy.structural.aashto.lrfd.editions import LRFD_EDITIONS, lrfd_edition
 from civilpy.structural.aashto.lrfd.steel import (
     flange_local_buckling_resistance,
@@ -157,7 +163,6 @@ from civilpy.structural.aashto.lrfd.stm import (
     stm_crack_control_reinforcement,
     NODE_EFFICIENCY,
 )
-from civilpy.structural.aashto.lrfd.plots import plot_pm_interaction
 from civilpy.structural.aashto.lrfd.lrfr import (
     rating_factor,
     legal_load_factor,
@@ -175,6 +180,8 @@ from civilpy.structural.aashto.lrfd.columns import (
     moment_magnification,
     RebarLayer,
     PMPoint,
+    PMDiagram,
+    rc_pm_diagram,
     rc_pm_interaction_diagram,
     rc_pm_capacity_check,
     rc_biaxial_check,
@@ -213,9 +220,13 @@ from civilpy.structural.aashto.lrfd.creep_shrinkage import (
     factor_time_development,
 )
 
+# The plotting helpers pull in matplotlib; load them only when used.
+__getattr__, __dir__ = lazy_exports(__name__, {"plots": ("plot_pm_interaction",)})
+
 __all__ = [
     "ARTICLES",
     "CheckResult",
+    "CheckResultBatch",
     "article",
     "flange_local_buckling_resistance",
     "lateral_torsional_buckling_resistance",
@@ -251,6 +262,8 @@ __all__ = [
     "moment_magnification",
     "RebarLayer",
     "PMPoint",
+    "PMDiagram",
+    "rc_pm_diagram",
     "rc_pm_interaction_diagram",
     "rc_pm_capacity_check",
     "rc_biaxial_check",
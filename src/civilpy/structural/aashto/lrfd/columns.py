@@ -19,12 +19,30 @@
 Axial resistance, reinforcement limits, spiral steel, strain-compatibility
 P-M interaction (uniaxial and Bresler biaxial), and the approximate
 moment-magnification treatment of slenderness.  Units: kip, inch, ksi.
+
+Interaction diagrams are computed for the whole neutral-axis sweep at once
+and cached per section, so many demands check against one diagram:
+
+>>> from civilpy.structural.aashto.lrfd.columns import RebarLayer, rc_pm_diagram
+>>> layers = [RebarLayer(4.0, 2.5), RebarLayer(2.0, 12.0), RebarLayer(4.0, 21.5)]
+>>> diagram = rc_pm_diagram(layers, f_c=4.0, f_y=60.0, b=16.0, h=24.0)
+>>> diagram.contains(p_u=[500.0, 500.0, 2000.0], m_u=[2000.0, 9000.0, 0.0])
+array([ True, False, False])
 """
 
+import functools
 import math
 from dataclasses import dataclass
 
-from civilpy.structural.aashto.lrfd.core import CheckResult, article
+import numpy as np
+
+from civilpy.structural.aashto.lrfd.core import (
+    CheckResult,
+    CheckResultBatch,
+    article,
+    batch_arrays,
+    vectorized,
+)
 from civilpy.structural.aashto.lrfd.concrete import beta1, phi_flexure
 
 PHI_COMPRESSION = 0.75  # compression-controlled sections (5.5.4.2)
@@ -77,63 +95,144 @@ class PMPoint:
         return self.phi * self.m_n
 
 
-def _pm_point(
-    c: float,
+def _circular_segments(radius: float, depth: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """:func:`_circular_segment` over an array of segment depths."""
+    depth = np.clip(depth, 0.0, 2.0 * radius)
+    theta = np.arccos((radius - depth) / radius)
+    sin, cos = np.sin(theta), np.cos(theta)
+    wedge = theta - sin * cos
+    area = radius**2 * wedge
+    solid = area > 0.0
+    y_bar = np.zeros_like(area)
+    np.divide(2.0 * radius * sin**3, 3.0 * wedge, out=y_bar, where=solid)
+    return np.where(solid, area, 0.0), np.where(solid, radius - y_bar, 0.0)
+
+
+def _pm_sweep(
+    c: np.ndarray,
     layers: list[RebarLayer],
     f_c: float,
     f_y: float,
     h: float,
     b: float | None,
     diameter: float | None,
-) -> PMPoint:
-    """Strain-compatibility forces for one neutral-axis depth ``c``:
-    Whitney block concrete force plus elastic-perfectly-plastic steel,
-    moments about the section mid-depth (compression positive)."""
-    b1 = beta1(f_c)
-    a = min(b1 * c, h)
+) -> tuple[np.ndarray, ...]:
+    """Strain compatibility for every neutral-axis depth in ``c`` at once:
+    Whitney block concrete force plus elastic-perfectly-plastic steel, with
+    moments about the section mid-depth (compression positive).  Returns
+    ``(p_n, m_n, eps_t, phi)`` arrays; the steel is one (c x layer) strain
+    matrix."""
+    depths = np.array([layer.depth for layer in layers], dtype=float)
+    areas = np.array([layer.area for layer in layers], dtype=float)
+    a = np.minimum(beta1(f_c) * c, h)
     if diameter is not None:
-        r = diameter / 2.0
-        area_c, y_c = _circular_segment(r, a)
+        area_c, y_c = _circular_segments(diameter / 2.0, a)
     else:
         area_c, y_c = a * b, a / 2.0
     p = 0.85 * f_c * area_c
     m = p * (h / 2.0 - y_c)
 
-    d_t = max(layer.depth for layer in layers)
-    for layer in layers:
-        eps = EPS_CU * (c - layer.depth) / c
-        f_s = min(max(eps * E_REBAR, -f_y), f_y)
-        if eps > 0:
-            f_s -= 0.85 * f_c  # bar displaces stressed concrete
-        force = f_s * layer.area
-        p += force
-        m += force * (h / 2.0 - layer.depth)
+    eps = EPS_CU * (c[:, None] - depths) / c[:, None]
+    f_s = np.clip(eps * E_REBAR, -f_y, f_y)
+    f_s -= np.where(eps > 0, 0.85 * f_c, 0.0)  # bar displaces stressed concrete
+    force = f_s * areas
+    p = p + force.sum(axis=1)
+    m = m + force @ (h / 2.0 - depths)
 
-    eps_t = EPS_CU * (d_t - c) / c  # tension positive at extreme steel
-    phi = phi_flexure(eps_t)  # clamps to 0.75 when compression-controlled
-    return PMPoint(p_n=p, m_n=m, eps_t=eps_t, phi=phi, c=c)
+    eps_t = EPS_CU * (depths.max() - c) / c  # tension positive at extreme steel
+    phi = phi_flexure(eps_t)  # 0.75 when compression-controlled
+    return p, m, eps_t, phi
 
 
-@article("5.6.4.5 P-M", "Column P-M Interaction Diagram")
-def rc_pm_interaction_diagram(
+def _pm_point(
+    c: float,
     layers: list[RebarLayer],
     f_c: float,
     f_y: float,
-    h: float | None = None,
-    b: float | None = None,
-    diameter: float | None = None,
-    spiral: bool = False,
-    n_points: int = 60,
-) -> list[PMPoint]:
-    """Nominal P-M interaction diagram for a rectangular (``b`` x ``h``) or
-    circular (``diameter``) reinforced section by strain compatibility,
-    sweeping the neutral axis from pure tension to pure compression.
-
-    Returns points ordered from pure tension (negative Pn) to the maximum
-    axial point, with phi per 5.5.4.2 attached; Pn is capped at the
-    5.6.4.4 tied/spiral maximum.  Moments are about the section mid-depth
-    (symmetric sections assumed for the axial-load point of application).
+    h: float,
+    b: float | None,
+    diameter: float | None,
+) -> PMPoint:
+    """:func:`_pm_sweep` for a single neutral-axis depth ``c``."""
+    p, m, eps_t, phi = _pm_sweep(np.array([c], dtype=float), layers, f_c, f_y,
+                                 h, b, diameter)
+    return PMPoint(p_n=float(p[0]), m_n=float(m[0]), eps_t=float(eps_t[0]),
+                   phi=float(phi[0]), c=c)
+
+
+@dataclass(frozen=True, eq=False)
+class PMDiagram:
+    """A whole interaction diagram as read-only arrays, one entry per
+    point in :func:`rc_pm_interaction_diagram` order (pure tension first).
+
+    Iterating or indexing gives :class:`PMPoint` objects.  The factored
+    curve answers many demands at once: :meth:`moment_capacity` is the
+    interpolated phi*Mn at each Pu, and :meth:`contains` tests (Pu, Mu)
+    pairs against the closed factored diagram.
     """
+
+    p_n: np.ndarray
+    m_n: np.ndarray
+    eps_t: np.ndarray
+    phi: np.ndarray
+    c: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.p_n)
+
+    def __getitem__(self, i: int) -> PMPoint:
+        return PMPoint(p_n=float(self.p_n[i]), m_n=float(self.m_n[i]),
+                       eps_t=float(self.eps_t[i]), phi=float(self.phi[i]),
+                       c=float(self.c[i]))
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @property
+    def phi_pn(self) -> np.ndarray:
+        return self.phi * self.p_n
+
+    @property
+    def phi_mn(self) -> np.ndarray:
+        return self.phi * self.m_n
+
+    def moment_capacity(self, p_u) -> np.ndarray:
+        """Factored moment resistance at each factored axial load ``p_u``
+        (kip, compression positive), interpolated on the first diagram
+        segment that brackets it; 0 where ``p_u`` is off the diagram."""
+        p_u = np.asarray(p_u, dtype=float)
+        flat = p_u.reshape(-1, 1)
+        pn, mn = self.phi_pn, self.phi_mn
+        low, high = pn[:-1], pn[1:]
+        bracket = (low <= flat) & (flat <= high)
+        seg = bracket.argmax(axis=1)
+        rise = high[seg] - low[seg]
+        frac = np.zeros(flat.shape[0])
+        np.divide(flat[:, 0] - low[seg], rise, out=frac, where=rise != 0.0)
+        m_r = mn[seg] + frac * (mn[seg + 1] - mn[seg])
+        return np.where(bracket.any(axis=1), m_r, 0.0).reshape(p_u.shape)
+
+    def contains(self, p_u, m_u) -> np.ndarray:
+        """Whether each factored demand (``p_u``, ``m_u``) lies inside the
+        factored diagram, by an even-odd point-in-polygon test.  The polygon
+        is the phi-reduced curve closed along the Mn = 0 axis; moments are
+        taken as ``abs(m_u)`` (symmetric section).  Demands exactly on the
+        boundary may fall either way."""
+        p_u, m_u = np.broadcast_arrays(np.asarray(p_u, dtype=float),
+                                       np.abs(np.asarray(m_u, dtype=float)))
+        x1 = np.append(self.phi_mn, 0.0)
+        y1 = np.append(self.phi_pn, self.phi_pn[-1])
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        px, py = m_u.reshape(-1, 1), p_u.reshape(-1, 1)
+        spans = (y1 > py) != (y2 > py)
+        dy = np.where(y2 != y1, y2 - y1, 1.0)
+        x_cross = x1 + (py - y1) * (x2 - x1) / dy
+        crossings = np.count_nonzero(spans & (px < x_cross), axis=1)
+        return (crossings % 2 == 1).reshape(p_u.shape)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_diagram(layers, f_c, f_y, h, b, diameter, spiral, n_points) -> PMDiagram:
     if diameter is not None:
         h = diameter
         a_g = math.pi * diameter**2 / 4.0
@@ -148,20 +247,66 @@ def rc_pm_interaction_diagram(
     p_o = 0.85 * f_c * (a_g - a_st) + f_y * a_st
     p_n_max = (0.85 if spiral else 0.80) * p_o
 
-    points: list[PMPoint] = []
-    # pure tension anchor
-    p_t = -f_y * a_st
-    points.append(PMPoint(p_n=p_t, m_n=0.0, eps_t=10.0 * EPS_CU,
-                          phi=phi_flexure(0.005), c=0.0))
     # sweep c geometrically from very shallow to beyond the section
     c_values = [d_t * (i + 1) / n_points * 1.5 for i in range(n_points)]
     c_values += [h * 1.5, h * 2.5, h * 10.0]
-    for c in sorted(set(c_values)):
-        pt = _pm_point(c, layers, f_c, f_y, h, b, diameter)
-        pt = PMPoint(p_n=min(pt.p_n, p_n_max), m_n=pt.m_n,
-                     eps_t=pt.eps_t, phi=pt.phi, c=pt.c)
-        points.append(pt)
-    return points
+    c = np.array(sorted(set(c_values)), dtype=float)
+    p, m, eps_t, phi = _pm_sweep(c, layers, f_c, f_y, h, b, diameter)
+
+    # pure tension anchor first
+    columns = (
+        np.concatenate(([-f_y * a_st], np.minimum(p, p_n_max))),
+        np.concatenate(([0.0], m)),
+        np.concatenate(([10.0 * EPS_CU], eps_t)),
+        np.concatenate(([phi_flexure(0.005)], phi)),
+        np.concatenate(([0.0], c)),
+    )
+    for column in columns:
+        column.flags.writeable = False
+    return PMDiagram(*columns)
+
+
+def rc_pm_diagram(
+    layers: list[RebarLayer],
+    f_c: float,
+    f_y: float,
+    h: float | None = None,
+    b: float | None = None,
+    diameter: float | None = None,
+    spiral: bool = False,
+    n_points: int = 60,
+) -> PMDiagram:
+    """:func:`rc_pm_interaction_diagram` as a :class:`PMDiagram`.  Diagrams
+    are cached by section signature (layers, materials, geometry, spiral,
+    resolution), so checking the same column under every load combination
+    builds its diagram once."""
+    return _cached_diagram(tuple(layers), f_c, f_y, h, b, diameter, spiral,
+                           n_points)
+
+
+@article("5.6.4.5 P-M", "Column P-M Interaction Diagram")
+def rc_pm_interaction_diagram(
+    layers: list[RebarLayer],
+    f_c: float,
+    f_y: float,
+    h: float | None = None,
+    b: float | None = None,
+    diameter: float | None = None,
+    spiral: bool = False,
+    n_points: int = 60,
+) -> list[PMPoint]:
+    """Nominal P-M interaction diagram for a rectangular (``b`` x ``h``) or
+    circular (``diameter``) reinforced section by strain compatibility,
+    sweeping the neutral axis from pure tension to pure compression.
+
+    Returns points ordered from pure tension (negative Pn) to the maximum
+    axial point, with phi per 5.5.4.2 attached; Pn is capped at the
+    5.6.4.4 tied/spiral maximum.  Moments are about the section mid-depth
+    (symmetric sections assumed for the axial-load point of application).
+    See :func:`rc_pm_diagram` for the cached array form.
+    """
+    return list(rc_pm_diagram(layers, f_c, f_y, h=h, b=b, diameter=diameter,
+                              spiral=spiral, n_points=n_points))
 
 
 @article("5.6.4.5 check", "Column P-M Capacity Check")
@@ -183,31 +328,39 @@ def rc_pm_capacity_check(
     ``capacity`` holds the factored moment resistance at Pu; ``phi`` on
     the result is 1.0 because phi is baked into the diagram point by
     point (it varies with eps_t along the curve)."""
-    diagram = rc_pm_interaction_diagram(
-        layers=layers, f_c=f_c, f_y=f_y, h=h, b=b, diameter=diameter,
-        spiral=spiral,
-    )
-    # walk the curve (phi_pn is monotonically increasing along the sweep)
-    m_r = None
-    for low, high in zip(diagram, diagram[1:]):
-        if low.phi_pn <= p_u <= high.phi_pn:
-            frac = ((p_u - low.phi_pn) / (high.phi_pn - low.phi_pn)
-                    if high.phi_pn != low.phi_pn else 0.0)
-            m_r = low.phi_mn + frac * (high.phi_mn - low.phi_mn)
-            break
-    if m_r is None:
-        m_r = 0.0  # Pu outside the diagram: no moment capacity remains
+    diagram = rc_pm_diagram(layers, f_c, f_y, h=h, b=b, diameter=diameter,
+                            spiral=spiral)
+    m_r = float(diagram.moment_capacity(p_u))
     return CheckResult(
         article="5.6.4.5 check",
         name="Column P-M Capacity Check",
         capacity=m_r,
         demand=m_u,
         details={"Pu": p_u,
-                 "phi_Pn_max": max(pt.phi_pn for pt in diagram),
+                 "phi_Pn_max": float(diagram.phi_pn.max()),
                  "within_axial_range": m_r > 0.0 or m_u == 0.0},
     )
 
 
+@vectorized(rc_pm_capacity_check, fixed=("layers",))
+def _rc_pm_capacity_batch(
+    p_u, m_u, layers, f_c, f_y, h=None, b=None, diameter=None, spiral=False,
+) -> CheckResultBatch:
+    """Array mode of :func:`rc_pm_capacity_check`: many (``p_u``, ``m_u``)
+    demands against one section, whose diagram is built (or fetched from
+    the cache) once."""
+    p_u, m_u = batch_arrays(p_u, m_u)
+    diagram = rc_pm_diagram(layers, f_c, f_y, h=h, b=b, diameter=diameter,
+                            spiral=spiral)
+    m_r = diagram.moment_capacity(p_u)
+    return CheckResultBatch(
+        "5.6.4.5 check", "Column P-M Capacity Check", m_r, demand=m_u,
+        details={"Pu": p_u,
+                 "phi_Pn_max": float(diagram.phi_pn.max()),
+                 "within_axial_range": (m_r > 0.0) | (m_u == 0.0)},
+    )
+
+
 @article("5.6.4.5", "Biaxial Flexure")
 def rc_biaxial_check(
     p_u: float,
@@ -23,7 +23,15 @@ Article numbers follow the 8th Edition reorganization (5.6.3.2 flexure,
 import math
 from dataclasses import dataclass
 
-from civilpy.structural.aashto.lrfd.core import CheckResult, article
+import numpy as np
+
+from civilpy.structural.aashto.lrfd.core import (
+    CheckResult,
+    CheckResultBatch,
+    article,
+    batch_arrays,
+    vectorized,
+)
 
 
 def beta1(f_c: float) -> float:
@@ -36,13 +44,18 @@ def modulus_of_rupture(f_c: float) -> float:
     return 0.24 * math.sqrt(f_c)
 
 
-def phi_flexure(eps_t: float, eps_cl: float = 0.002, eps_tl: float = 0.005) -> float:
+def phi_flexure(
+    eps_t: float | np.ndarray, eps_cl: float = 0.002, eps_tl: float = 0.005,
+) -> float | np.ndarray:
     """Resistance factor for flexure from net tensile strain (5.5.4.2).
 
     Varies linearly from 0.75 (compression-controlled, eps_t <= eps_cl) to
     0.90 (tension-controlled, eps_t >= eps_tl) for nonprestressed sections.
+    An array of strains gives an array of factors.
     """
-    return min(max(0.75 + 0.15 * (eps_t - eps_cl) / (eps_tl - eps_cl), 0.75), 0.90)
+    eps_t = np.asarray(eps_t, dtype=float)
+    phi = np.clip(0.75 + 0.15 * (eps_t - eps_cl) / (eps_tl - eps_cl), 0.75, 0.90)
+    return float(phi) if phi.ndim == 0 else phi
 
 
 @article("5.6.3.2", "Flexural Resistance (Reinforced Concrete)")
@@ -545,6 +558,29 @@ def rc_shear_resistance(
     )
 
 
+@vectorized(rc_shear_resistance)
+def _rc_shear_batch(
+    b_v, d_v, f_c, v_u=None, a_v=0.0, s=1.0, f_y=60.0, beta=2.0,
+    theta_deg=45.0, v_p=0.0, lam=1.0,
+) -> CheckResultBatch:
+    """Array mode of :func:`rc_shear_resistance`."""
+    b_v, d_v, f_c, v_u, a_v, s, f_y, beta, theta_deg, v_p, lam = batch_arrays(
+        b_v, d_v, f_c, v_u, a_v, s, f_y, beta, theta_deg, v_p, lam
+    )
+    v_c = 0.0316 * lam * beta * np.sqrt(f_c) * b_v * d_v
+    v_s = a_v * f_y * d_v / (s * np.tan(np.radians(theta_deg)))
+    upper = 0.25 * f_c * b_v * d_v + v_p
+    return CheckResultBatch(
+        article="5.7.3.3",
+        name="Shear Resistance (Reinforced Concrete)",
+        capacity=np.minimum(v_c + v_s + v_p, upper),
+        demand=v_u,
+        phi=0.9,
+        details={"Vc": v_c, "Vs": v_s, "Vp": v_p, "upper_limit": upper,
+                 "beta": beta, "theta_deg": theta_deg},
+    )
+
+
 @article("5.12.7.3", "Shear in Slabs of Box Culverts")
 def box_culvert_slab_shear(
     b: float,
@@ -20,10 +20,31 @@ Units convention for the whole package: kip, inch, ksi (US customary,
 matching the dimensional form of the LRFD equations).  All checks are pure
 functions — no I/O, no global state — so they can be vectorized or looped
 over candidate member sizes.
+
+Every registered check also has an array mode, ``check.batch(...)``: pass
+NumPy arrays (anything broadcastable) for the member properties and get
+back one :class:`CheckResultBatch` holding capacity, demand, phi and
+ratio as columns.  Checks with a NumPy implementation evaluate all rows at
+once; the rest fall back to looping the scalar function.
+
+>>> import numpy as np
+>>> from civilpy.structural.aashto import lrfd
+>>> batch = lrfd.flange_local_buckling_resistance.batch(
+...     b_fc=np.array([16.0, 20.0]), t_fc=np.array([1.0, 0.875]),
+...     f_yc=50.0, f_yw=50.0, f_bu=45.0)
+>>> batch.capacity.round(2).tolist(), batch.ok.tolist()
+([50.0, 45.1], [True, True])
+>>> batch[1].details["compact"]
+False
 """
 
+import functools
+import inspect
+import sys
 from dataclasses import dataclass, field
 
+import numpy as np
+
 # Registry of check functions keyed by LRFD article number, populated by the
 # @article decorator as check modules are imported.
 ARTICLES: dict[str, callable] = {}
@@ -66,12 +87,516 @@ class CheckResult:
         return self.ratio >= 1.0
 
 
+class CheckResultBatch:
+    """Columnar outcome of one check (or several) over many members.
+
+    ``capacity``, ``demand`` and ``phi`` are contiguous float arrays;
+    ``demand`` is None when no demand was given at all, and NaN marks
+    individual rows without one.  Article and name strings are interned
+    once per distinct check and stored per row as small integer codes, so
+    a batch costs a few arrays rather than one object per member.
+
+    ``details`` may be a dict of hand-calc columns (or scalars shared by
+    every row) or a callable ``rows -> dict`` that recomputes them for the
+    requested rows only; batches from ``check.batch`` use the latter, so
+    details exist only for the rows read through :meth:`details_for`,
+    :meth:`failures` or indexing.  Indexing returns the equivalent scalar
+    :class:`CheckResult`.
+    """
+
+    __slots__ = ("_labels", "_codes", "capacity", "demand", "phi",
+                 "_details", "_source", "_ratio")
+
+    def __init__(self, article, name, capacity, demand=None, phi=1.0,
+                 details=None):
+        self.capacity = np.ascontiguousarray(capacity, dtype=float).reshape(-1)
+        n = self.capacity.shape[0]
+        if isinstance(article, str):
+            self._labels = ((sys.intern(article), sys.intern(name)),)
+            self._codes = None
+        else:
+            self._labels, self._codes = _factorize_labels(article, name)
+        self.phi = np.broadcast_to(np.asarray(phi, dtype=float), (n,))
+        if demand is not None:
+            demand = np.broadcast_to(np.asarray(demand, dtype=float), (n,))
+        self.demand = demand
+        self._details = None if callable(details) else dict(details or {})
+        self._source = details if callable(details) else None
+        self._ratio = None
+
+    def __len__(self) -> int:
+        return self.capacity.shape[0]
+
+    def __repr__(self) -> str:
+        checks = ", ".join(a for a, _ in self._labels)
+        return f"CheckResultBatch({len(self)} rows; {checks})"
+
+    def __getitem__(self, i: int) -> CheckResult:
+        i = range(len(self))[i]
+        return next(self._rows(np.array([i])))
+
+    def __iter__(self):
+        return self._rows(np.arange(len(self)))
+
+    @property
+    def article(self) -> str | np.ndarray:
+        """The article number, or a per-row array for a mixed batch."""
+        return self._label_column(0)
+
+    @property
+    def name(self) -> str | np.ndarray:
+        return self._label_column(1)
+
+    @property
+    def factored_capacity(self) -> np.ndarray:
+        return self.phi * self.capacity
+
+    @property
+    def ratio(self) -> np.ndarray | None:
+        """Capacity/demand ratios (inf at zero demand, NaN where a row has
+        no demand); None when no demand was given.  Computed once."""
+        if self.demand is None:
+            return None
+        if self._ratio is None:
+            with np.errstate(divide="ignore", invalid="ignore"):
+                ratio = self.factored_capacity / self.demand
+            self._ratio = np.where(self.demand == 0, np.inf, ratio)
+        return self._ratio
+
+    @property
+    def ok(self) -> np.ndarray | None:
+        """Pass/fail per row (False where a row has no demand)."""
+        if self.demand is None:
+            return None
+        return self.ratio >= 1.0
+
+    @property
+    def details(self) -> dict:
+        """Hand-calc columns for every row (materialized on first use)."""
+        if self._details is None:
+            self._details = self._source(np.arange(len(self)))
+        return self._details
+
+    def details_for(self, rows) -> dict:
+        """Hand-calc columns for ``rows`` (indices or a boolean mask) only."""
+        rows = np.asarray(rows)
+        if rows.dtype == bool:
+            rows = np.flatnonzero(rows)
+        if self._details is None:
+            return self._source(rows)
+        return {k: v[rows] if isinstance(v, np.ndarray) and v.ndim else v
+                for k, v in self._details.items()}
+
+    def failing(self) -> np.ndarray:
+        """Indices of rows with a demand that exceeds the factored capacity."""
+        if self.demand is None:
+            return np.array([], dtype=np.intp)
+        return np.flatnonzero(~self.ok & ~np.isnan(self.demand))
+
+    def failures(self) -> list[CheckResult]:
+        """Full :class:`CheckResult` objects, details included, for the
+        failing rows."""
+        return list(self._rows(self.failing()))
+
+    def _label_column(self, part: int):
+        if self._codes is None:
+            return self._labels[0][part]
+        values = np.empty(len(self._labels), dtype=object)
+        values[:] = [label[part] for label in self._labels]
+        return values[self._codes]
+
+    def _rows(self, rows: np.ndarray):
+        details = self.details_for(rows)
+        for j, i in enumerate(rows):
+            label = self._labels[0 if self._codes is None else self._codes[i]]
+            demand = None
+            if self.demand is not None and not np.isnan(self.demand[i]):
+                demand = float(self.demand[i])
+            yield CheckResult(
+                article=label[0],
+                name=label[1],
+                capacity=float(self.capacity[i]),
+                demand=demand,
+                phi=float(self.phi[i]),
+                details=_row_details(details, j),
+            )
+
+    @classmethod
+    def from_results(cls, results) -> "CheckResultBatch":
+        """Collect scalar :class:`CheckResult` objects into a batch (details
+        with a differing key set are dropped)."""
+        results = list(results)
+        if not results:
+            raise ValueError("from_results needs at least one CheckResult")
+        demands = [r.demand for r in results]
+        keys = set(results[0].details)
+        for r in results[1:]:
+            keys &= set(r.details)
+        single = len({(r.article, r.name) for r in results}) == 1
+        return cls(
+            article=results[0].article if single else [r.article for r in results],
+            name=results[0].name if single else [r.name for r in results],
+            capacity=[r.capacity for r in results],
+            demand=None if all(d is None for d in demands) else
+            [np.nan if d is None else d for d in demands],
+            phi=[r.phi for r in results],
+            details={
+                k: _column([r.details[k] for r in results])
+                for k in results[0].details if k in keys
+            },
+        )
+
+    @classmethod
+    def concat(cls, batches) -> "CheckResultBatch":
+        """Stack batches (typically of different checks) into one table.
+
+        Details stay lazy: reading them for a row asks the batch it came
+        from."""
+        batches = list(batches)
+        if not batches:
+            raise ValueError("concat needs at least one CheckResultBatch")
+        labels, codes = [], []
+        for b in batches:
+            own = np.array([_intern_label(labels, label) for label in b._labels],
+                           dtype=np.int32)
+            codes.append(np.full(len(b), own[0], dtype=np.int32)
+                         if b._codes is None else own[b._codes])
+        demand = None
+        if any(b.demand is not None for b in batches):
+            demand = np.concatenate([
+                np.full(len(b), np.nan) if b.demand is None else b.demand
+                for b in batches
+            ])
+        out = cls.__new__(cls)
+        out._labels = tuple(labels)
+        out._codes = np.concatenate(codes)
+        out.capacity = np.concatenate([b.capacity for b in batches])
+        out.demand = demand
+        out.phi = np.concatenate([b.phi for b in batches])
+        out._details = None
+        out._source = _ConcatSource(batches)
+        out._ratio = None
+        if len(labels) == 1:
+            out._codes = None
+        return out
+
+    def to_dataframe(self, details: bool = False):
+        """pandas DataFrame with categorical ``article``/``name`` columns and
+        capacity, demand, phi, ratio and ok columns (``details=True`` appends
+        the hand-calc columns, materializing them for every row)."""
+        import pandas as pd
+
+        data = {"article": self._categorical(0, pd),
+                "name": self._categorical(1, pd),
+                "capacity": self.capacity,
+                "demand": (np.full(len(self), np.nan) if self.demand is None
+                           else self.demand),
+                "phi": self.phi}
+        if self.demand is not None:
+            data["ratio"] = self.ratio
+            data["ok"] = self.ok
+        if details:
+            data.update({k: np.broadcast_to(v, (len(self),)) if np.ndim(v) == 0
+                         else v for k, v in self.details.items()})
+        return pd.DataFrame(data)
+
+    @classmethod
+    def from_dataframe(cls, frame) -> "CheckResultBatch":
+        """Inverse of :meth:`to_dataframe`; any column other than the core
+        ones (and the derived ratio/ok) becomes a detail column.  A demand
+        column that is entirely NaN reads back as no demand."""
+        import pandas as pd
+
+        article_codes, articles = pd.factorize(frame["article"])
+        name_codes, names = pd.factorize(frame["name"])
+        return cls._from_columns(
+            article_codes, np.asarray(articles, dtype=object),
+            name_codes, np.asarray(names, dtype=object),
+            {k: frame[k].to_numpy() for k in frame.columns
+             if k not in ("article", "name")},
+        )
+
+    def to_arrow(self, details: bool = False):
+        """pyarrow Table with dictionary-encoded ``article``/``name`` columns;
+        missing demands become nulls."""
+        pa = _require_pyarrow()
+        columns = {}
+        for part, key in enumerate(("article", "name")):
+            uniques, codes = self._label_codes(part)
+            columns[key] = pa.DictionaryArray.from_arrays(
+                pa.array(codes), pa.array(uniques.tolist(), pa.string())
+            )
+        columns["capacity"] = pa.array(self.capacity)
+        columns["demand"] = pa.array(
+            np.full(len(self), np.nan) if self.demand is None else self.demand,
+            from_pandas=True,
+        )
+        columns["phi"] = pa.array(np.ascontiguousarray(self.phi))
+        if self.demand is not None:
+            columns["ratio"] = pa.array(self.ratio, from_pandas=True)
+            columns["ok"] = pa.array(self.ok)
+        if details:
+            for k, v in self.details.items():
+                v = np.ascontiguousarray(np.broadcast_to(v, (len(self),)))
+                columns[k] = pa.array(v.tolist() if v.dtype == object else v)
+        return pa.table(columns)
+
+    @classmethod
+    def from_arrow(cls, table) -> "CheckResultBatch":
+        """Inverse of :meth:`to_arrow`."""
+        pa = _require_pyarrow()
+        labels = []
+        for key in ("article", "name"):
+            column = table.column(key).combine_chunks()
+            if not pa.types.is_dictionary(column.type):
+                column = column.dictionary_encode()
+            labels += [column.indices.to_numpy(zero_copy_only=False),
+                       np.asarray(column.dictionary.to_pylist(), dtype=object)]
+        columns = {}
+        for key in table.column_names:
+            if key not in ("article", "name"):
+                column = table.column(key)
+                if pa.types.is_floating(column.type):
+                    column = column.fill_null(np.nan)
+                columns[key] = column.to_numpy()
+        return cls._from_columns(*labels, columns)
+
+    @classmethod
+    def _from_columns(cls, article_codes, articles, name_codes, names,
+                      columns: dict) -> "CheckResultBatch":
+        labels, codes = _pair_labels(article_codes, articles, name_codes, names)
+        demand = columns.pop("demand", None)
+        if demand is not None:
+            demand = np.asarray(demand, dtype=float)
+            if np.isnan(demand).all():
+                demand = None
+        out = cls(labels[0][0], labels[0][1], columns.pop("capacity"),
+                  demand=demand, phi=columns.pop("phi", 1.0),
+                  details={k: v for k, v in columns.items()
+                           if k not in ("ratio", "ok")})
+        if len(labels) > 1:
+            out._labels, out._codes = labels, codes
+        return out
+
+    def _label_codes(self, part: int):
+        values = np.array([label[part] for label in self._labels], dtype=object)
+        uniques, inverse = np.unique(values, return_inverse=True)
+        codes = (np.zeros(len(self), dtype=np.int32) if self._codes is None
+                 else inverse[self._codes].astype(np.int32))
+        return uniques, codes
+
+    def _categorical(self, part: int, pd):
+        uniques, codes = self._label_codes(part)
+        return pd.Categorical.from_codes(codes, categories=uniques)
+
+
+# Marks a detail a row of a mixed batch does not have (its check never
+# computed that symbol).
+_MISSING = object()
+
+
+def _intern_label(labels: list, label: tuple) -> int:
+    if label not in labels:
+        labels.append((sys.intern(label[0]), sys.intern(label[1])))
+    return labels.index(label)
+
+
+def _factorize_labels(article, name):
+    """Distinct (article, name) pairs of per-row label columns, interned,
+    and each row's code into them."""
+    articles, article_codes = np.unique(np.asarray(article, dtype=object),
+                                        return_inverse=True)
+    names, name_codes = np.unique(np.asarray(name, dtype=object),
+                                  return_inverse=True)
+    return _pair_labels(article_codes, articles, name_codes, names)
+
+
+def _pair_labels(article_codes, articles, name_codes, names):
+    pairs = np.asarray(article_codes, np.int64) * len(names) + name_codes
+    unique_pairs, codes = np.unique(pairs, return_inverse=True)
+    labels = tuple((sys.intern(str(articles[p // len(names)])),
+                    sys.intern(str(names[p % len(names)])))
+                   for p in unique_pairs)
+    return labels, codes.astype(np.int32)
+
+
+def _row_details(details: dict, j: int) -> dict:
+    row = {}
+    for k, v in details.items():
+        value = _element(v, j)
+        if value is not _MISSING:
+            row[k] = value
+    return row
+
+
+class _ConcatSource:
+    """Detail source of a concatenated batch: each row's details come from
+    the batch it was stacked from."""
+
+    def __init__(self, batches):
+        self.batches = batches
+        self.offsets = np.cumsum([0] + [len(b) for b in batches])
+
+    def __call__(self, rows: np.ndarray) -> dict:
+        part = np.searchsorted(self.offsets, rows, side="right") - 1
+        out = {}
+        for p in np.unique(part):
+            mask = part == p
+            local = self.batches[p].details_for(rows[mask] - self.offsets[p])
+            for k, v in local.items():
+                column = out.setdefault(k, np.full(rows.shape[0], _MISSING))
+                column[mask] = (v if isinstance(v, np.ndarray) and v.ndim
+                                else [v] * int(mask.sum()))
+        for k, column in out.items():
+            if not any(v is _MISSING for v in column):
+                out[k] = _column(list(column))
+        return out
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as exc:  # pragma: no cover - exercised only without dep
+        raise ImportError(
+            "pyarrow is required for Arrow conversion; install it with "
+            "`pip install pyarrow`."
+        ) from exc
+    return pyarrow
+
+
+def _element(value, i):
+    """Row ``i`` of a detail column as a plain Python value."""
+    if isinstance(value, np.ndarray) and value.ndim:
+        value = value[i]
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _column(values: list) -> np.ndarray:
+    try:
+        column = np.asarray(values)
+    except ValueError:
+        column = None
+    if column is None or column.ndim != 1:
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+    return column
+
+
+def batch_arrays(*args) -> list[np.ndarray]:
+    """Broadcast check inputs to common 1-D float arrays (None passes
+    through) — the argument preamble of every array-mode check."""
+    present = [np.asarray(a, dtype=float) for a in args if a is not None]
+    shaped = iter(np.broadcast_arrays(*(np.atleast_1d(a) for a in present)))
+    return [None if a is None else next(shaped).ravel() for a in args]
+
+
+def _is_column(value) -> bool:
+    return not isinstance(value, (str, bytes, dict)) and np.ndim(value) > 0
+
+
+def _row_arguments(arguments: dict, rows: np.ndarray, fixed: tuple = ()) -> dict:
+    """The subset ``rows`` (of the flattened broadcast) of each array
+    argument; scalar and ``fixed`` arguments pass through."""
+    columns = [k for k, v in arguments.items() if k not in fixed and _is_column(v)]
+    shape = np.broadcast_shapes(*(np.shape(arguments[k]) for k in columns))
+    index = np.unravel_index(rows, shape)
+    return {k: np.broadcast_to(v, shape)[index] if k in columns else v
+            for k, v in arguments.items()}
+
+
+def _detail_source(func, arguments: dict, scalar: bool, fixed: tuple = ()):
+    """Recompute details for selected rows by re-running the check on just
+    those rows' inputs (which the batch keeps by reference)."""
+
+    def source(rows: np.ndarray) -> dict:
+        subset = _row_arguments(arguments, rows, fixed)
+        if not scalar:
+            return func(**subset).details
+        columns = [k for k, v in subset.items() if _is_column(v)]
+        results = []
+        for j in range(rows.shape[0]):
+            row = dict(subset)
+            row.update({k: _element(subset[k], j) for k in columns})
+            results.append(func(**row))
+        if not results:
+            return {}
+        return CheckResultBatch.from_results(results).details_for(
+            np.arange(len(results))
+        )
+
+    return source
+
+
+def _looped_batch(func):
+    """Array mode for a check with no NumPy implementation: broadcast the
+    array arguments and call the scalar check row by row, keeping only
+    capacity, demand and phi."""
+    signature = inspect.signature(func)
+
+    def batch(*args, **kwargs) -> CheckResultBatch:
+        arguments = signature.bind(*args, **kwargs).arguments
+        if not any(_is_column(v) for v in arguments.values()):
+            return CheckResultBatch.from_results([func(**arguments)])
+        n = int(np.prod(np.broadcast_shapes(
+            *(np.shape(v) for v in arguments.values() if _is_column(v))
+        )))
+        capacity, demand, phi = np.empty(n), np.full(n, np.nan), np.empty(n)
+        any_demand = False
+        subset = _row_arguments(arguments, np.arange(n))
+        columns = [k for k, v in subset.items() if _is_column(v)]
+        for i in range(n):
+            row = dict(subset)
+            row.update({k: _element(subset[k], i) for k in columns})
+            r = func(**row)
+            capacity[i], phi[i] = r.capacity, r.phi
+            if r.demand is not None:
+                demand[i], any_demand = r.demand, True
+        return CheckResultBatch(
+            func.article_number, func.article_name, capacity,
+            demand=demand if any_demand else None, phi=phi,
+            details=_detail_source(func, arguments, scalar=True),
+        )
+
+    batch.__doc__ = f"Array mode of :func:`{func.__name__}` (row loop)."
+    return batch
+
+
+def vectorized(check, fixed: tuple = ()):
+    """Install the decorated NumPy implementation as ``check.batch``.
+
+    The implementation takes the same arguments as the scalar check, each
+    a scalar or an array, and returns a :class:`CheckResultBatch`.  The
+    installed ``check.batch`` drops the implementation's detail columns and
+    recomputes them on demand for just the rows asked for.  Arguments named
+    in ``fixed`` (e.g. a list of rebar layers) are passed whole rather than
+    taken as per-row columns."""
+
+    def decorator(func):
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def batch(*args, **kwargs) -> CheckResultBatch:
+            result = func(*args, **kwargs)
+            arguments = signature.bind(*args, **kwargs).arguments
+            if any(_is_column(v) for k, v in arguments.items() if k not in fixed):
+                result._details = None
+                result._source = _detail_source(func, arguments, scalar=False,
+                                                fixed=fixed)
+            return result
+
+        check.batch = batch
+        return func
+
+    return decorator
+
+
 def article(number: str, name: str):
     """Register a check function under its LRFD article number."""
 
     def decorator(func):
         func.article_number = number
         func.article_name = name
+        func.batch = _looped_batch(func)
         ARTICLES[number] = func
         return func
 
@@ -22,7 +22,15 @@ Edition for these checks).  Units: kip, inch, ksi.
 
 import math
 
-from civilpy.structural.aashto.lrfd.core import CheckResult, article
+import numpy as np
+
+from civilpy.structural.aashto.lrfd.core import (
+    CheckResult,
+    CheckResultBatch,
+    article,
+    batch_arrays,
+    vectorized,
+)
 
 E_STEEL = 29000.0  # ksi, modulus of elasticity (6.4.1)
 PHI_F = 1.0  # resistance factor for flexure (6.5.4.2)
@@ -776,3 +784,225 @@ def web_shear_resistance(
         phi=PHI_V,
         details=details,
     )
+
+
+# ── Array mode ────────────────────────────────────────────────────────────────
+# NumPy twins of the checks above, installed as ``check.batch``.  Each takes
+# the scalar check's arguments as arrays and mirrors its equations branch for
+# branch with np.where, so rows agree with the scalar results.
+
+
+def _fyr_array(f_yc: np.ndarray, f_yw: np.ndarray) -> np.ndarray:
+    return np.maximum(np.minimum(0.7 * f_yc, f_yw), 0.5 * f_yc)
+
+
+@vectorized(flange_local_buckling_resistance)
+def _flange_local_buckling_batch(
+    b_fc, t_fc, f_yc, f_yw, f_bu=None, r_b=1.0, r_h=1.0
+) -> CheckResultBatch:
+    b_fc, t_fc, f_yc, f_yw, f_bu, r_b, r_h = batch_arrays(
+        b_fc, t_fc, f_yc, f_yw, f_bu, r_b, r_h
+    )
+    lam_f = b_fc / (2.0 * t_fc)
+    lam_pf = 0.38 * np.sqrt(E_STEEL / f_yc)
+    f_yr = _fyr_array(f_yc, f_yw)
+    lam_rf = 0.56 * np.sqrt(E_STEEL / f_yr)
+    compact = lam_f <= lam_pf
+    f_nc = np.where(
+        compact,
+        1.0,
+        1.0 - (1.0 - f_yr / (r_h * f_yc)) * (lam_f - lam_pf) / (lam_rf - lam_pf),
+    ) * r_b * r_h * f_yc
+    return CheckResultBatch(
+        article="6.10.8.2.2",
+        name="Local Buckling Resistance",
+        capacity=f_nc,
+        demand=f_bu,
+        phi=PHI_F,
+        details={"lambda_f": lam_f, "lambda_pf": lam_pf, "lambda_rf": lam_rf,
+                 "Fyr": f_yr, "compact": compact},
+    )
+
+
+@vectorized(lateral_torsional_buckling_resistance)
+def _lateral_torsional_buckling_batch(
+    l_b, b_fc, t_fc, d_c, t_w, f_yc, f_yw, c_b=1.0, f_bu=None, r_b=1.0, r_h=1.0
+) -> CheckResultBatch:
+    l_b, b_fc, t_fc, d_c, t_w, f_yc, f_yw, c_b, f_bu, r_b, r_h = batch_arrays(
+        l_b, b_fc, t_fc, d_c, t_w, f_yc, f_yw, c_b, f_bu, r_b, r_h
+    )
+    r_t = b_fc / np.sqrt(12.0 * (1.0 + d_c * t_w / (3.0 * b_fc * t_fc)))
+    l_p = r_t * np.sqrt(E_STEEL / f_yc)
+    f_yr = _fyr_array(f_yc, f_yw)
+    l_r = np.pi * r_t * np.sqrt(E_STEEL / f_yr)
+    f_max = r_b * r_h * f_yc
+    plateau = l_b <= l_p
+    inelastic = ~plateau & (l_b <= l_r)
+    f_inelastic = (
+        c_b * (1.0 - (1.0 - f_yr / (r_h * f_yc)) * (l_b - l_p) / (l_r - l_p))
+        * f_max
+    )
+    f_cr = c_b * r_b * np.pi**2 * E_STEEL / (l_b / r_t) ** 2
+    f_nc = np.minimum(np.where(inelastic, f_inelastic, f_cr), f_max)
+    f_nc = np.where(plateau, f_max, f_nc)
+    regime = np.where(
+        plateau, "inelastic-plateau", np.where(inelastic, "inelastic", "elastic")
+    )
+    return CheckResultBatch(
+        article="6.10.8.2.3",
+        name="Lateral Torsional Buckling Resistance",
+        capacity=f_nc,
+        demand=f_bu,
+        phi=PHI_F,
+        details={"rt": r_t, "Lp": l_p, "Lr": l_r, "Fyr": f_yr, "Cb": c_b,
+                 "regime": regime},
+    )
+
+
+@vectorized(tension_flange_resistance)
+def _tension_flange_batch(f_yt, f_bu=None, f_l=0.0, r_h=1.0) -> CheckResultBatch:
+    f_yt, f_bu, f_l, r_h = batch_arrays(f_yt, f_bu, f_l, r_h)
+    return CheckResultBatch(
+        article="6.10.8.1.2",
+        name="Discretely Braced Flanges in Tension",
+        capacity=r_h * f_yt,
+        demand=None if f_bu is None else f_bu + f_l / 3.0,
+        phi=PHI_F,
+        details={"fl": f_l},
+    )
+
+
+@vectorized(hybrid_factor)
+def _hybrid_factor_batch(d_n, t_w, a_fn, f_yw, f_n) -> CheckResultBatch:
+    d_n, t_w, a_fn, f_yw, f_n = batch_arrays(d_n, t_w, a_fn, f_yw, f_n)
+    rho = np.minimum(f_yw / f_n, 1.0)
+    beta = 2.0 * d_n * t_w / a_fn
+    return CheckResultBatch(
+        article="6.10.1.10.1",
+        name="Hybrid Factor Rh",
+        capacity=(12.0 + beta * (3.0 * rho - rho**3)) / (12.0 + 2.0 * beta),
+        details={"rho": rho, "beta": beta},
+    )
+
+
+@vectorized(web_load_shedding_factor)
+def _web_load_shedding_batch(d_c, t_w, b_fc, t_fc, f_yc) -> CheckResultBatch:
+    d_c, t_w, b_fc, t_fc, f_yc = batch_arrays(d_c, t_w, b_fc, t_fc, f_yc)
+    lam_rw = 5.7 * np.sqrt(E_STEEL / f_yc)
+    slenderness = 2.0 * d_c / t_w
+    a_wc = 2.0 * d_c * t_w / (b_fc * t_fc)
+    slender = slenderness > lam_rw
+    r_b = np.where(
+        slender,
+        np.minimum(1.0 - a_wc / (1200.0 + 300.0 * a_wc) * (slenderness - lam_rw),
+                   1.0),
+        1.0,
+    )
+    return CheckResultBatch(
+        article="6.10.1.10.2",
+        name="Web Load-Shedding Factor Rb",
+        capacity=r_b,
+        details={"lambda_rw": lam_rw, "2Dc/tw": slenderness, "awc": a_wc,
+                 "slender_web": slender},
+    )
+
+
+@vectorized(tension_member_resistance)
+def _tension_member_batch(
+    a_g, f_y, a_n=None, f_u=None, u_shear_lag=1.0, p_u=None
+) -> CheckResultBatch:
+    a_g, f_y, a_n, f_u, u_shear_lag, p_u = batch_arrays(
+        a_g, f_y, a_n, f_u, u_shear_lag, p_u
+    )
+    cases = {"yield": 0.95 * f_y * a_g}
+    governing = np.full(a_g.shape, "yield")
+    capacity = cases["yield"]
+    if a_n is not None and f_u is not None:
+        cases["rupture"] = 0.80 * f_u * a_n * u_shear_lag
+        ruptures = cases["rupture"] < capacity
+        governing = np.where(ruptures, "rupture", governing)
+        capacity = np.where(ruptures, cases["rupture"], capacity)
+    return CheckResultBatch(
+        article="6.8.2.1",
+        name="Tension Member Resistance",
+        capacity=capacity,
+        demand=p_u,
+        details={**cases, "governing": governing},
+    )
+
+
+@vectorized(compression_member_resistance)
+def _compression_member_batch(
+    a_g, f_y, kl_over_r, p_u=None, q_slender=1.0, design_year=None
+) -> CheckResultBatch:
+    a_g, f_y, kl_over_r, p_u, q_slender, design_year = batch_arrays(
+        a_g, f_y, kl_over_r, p_u, q_slender, design_year
+    )
+    p_o = q_slender * f_y * a_g
+    p_e = np.pi**2 * E_STEEL / kl_over_r**2 * a_g
+    inelastic = p_e >= 0.44 * p_o
+    p_n = np.where(inelastic, 0.658 ** (p_o / p_e) * p_o, 0.877 * p_e)
+    phi_c = 0.95 if design_year is None else np.where(design_year < 2015, 0.90, 0.95)
+    return CheckResultBatch(
+        article="6.9.4.1.1",
+        name="Compression Member Nominal Resistance",
+        capacity=p_n,
+        demand=p_u,
+        phi=phi_c,
+        details={"Pe": p_e, "Po": p_o,
+                 "mode": np.where(inelastic, "inelastic", "elastic"),
+                 "KL/r": kl_over_r},
+    )
+
+
+@vectorized(web_shear_resistance)
+def _web_shear_batch(
+    d_web, t_w, f_yw, v_u=None, d_o=None, tension_field=False,
+    b_fc=None, t_fc=None, b_ft=None, t_ft=None,
+) -> CheckResultBatch:
+    """``d_o`` may hold NaN for unstiffened rows; ``tension_field`` may be a
+    boolean array."""
+    d_web, t_w, f_yw, v_u, d_o, tension_field = batch_arrays(
+        d_web, t_w, f_yw, v_u, d_o, tension_field
+    )
+    v_p = 0.58 * f_yw * d_web * t_w
+    stiffened = np.zeros(d_web.shape, bool) if d_o is None else ~np.isnan(d_o)
+    aspect = np.where(stiffened, d_o if d_o is not None else 0.0, 0.0) / d_web
+    with np.errstate(divide="ignore"):
+        k = np.where(stiffened, 5.0 + 5.0 / aspect**2, 5.0)
+    slenderness = d_web / t_w
+    ek_fyw = np.sqrt(E_STEEL * k / f_yw)
+    c = np.where(
+        slenderness <= 1.12 * ek_fyw,
+        1.0,
+        np.where(slenderness <= 1.40 * ek_fyw,
+                 1.12 / slenderness * ek_fyw,
+                 1.57 / slenderness**2 * (E_STEEL * k / f_yw)),
+    )
+    v_n = c * v_p
+    equation = np.where(stiffened, "6.10.9.3.2-1", "6.10.9.2-1")
+    tfa = stiffened & (tension_field != 0)
+    if tfa.any():
+        if any(a is None for a in (b_fc, t_fc, b_ft, t_ft)):
+            raise ValueError(
+                "tension_field=True requires flange dimensions "
+                "b_fc, t_fc, b_ft, t_ft for the 6.10.9.3.2 proportion check"
+            )
+        b_fc, t_fc, b_ft, t_ft, _ = batch_arrays(b_fc, t_fc, b_ft, t_ft, d_web)
+        post_buckling = 0.87 * (1.0 - c)
+        root = np.sqrt(1.0 + aspect**2)
+        proportioned = 2.0 * d_web * t_w / (b_fc * t_fc + b_ft * t_ft) <= 2.5
+        v_tfa = v_p * (c + post_buckling / np.where(proportioned, root,
+                                                    root + aspect))
+        v_n = np.where(tfa, v_tfa, v_n)
+        equation = np.where(
+            tfa, np.where(proportioned, "6.10.9.3.2-2", "6.10.9.3.2-8"), equation
+        )
+    return CheckResultBatch(
+        article="6.10.9",
+        name="Web Shear Resistance",
+        capacity=v_n,
+        demand=v_u,
+        phi=PHI_V,
+        details={"Vp": v_p, "C": c, "k": k, "equation": equation},
+    )
@@ -69,6 +69,18 @@ from sympy.abc import x
 # plt.rc('text', usetex=True)  # This makes the plot text prettier... but SLOWER
 
 
+def _compile(sym_func):
+    """Lambdify a function of ``x`` into a NumPy callable that always returns a
+    float array shaped like its input (constant expressions are broadcast)."""
+    func = lambdify(x, sym_func, "numpy")
+
+    def evaluate(x_vals):
+        x_vals = np.asarray(x_vals, dtype=float)
+        return np.array(np.broadcast_to(func(x_vals), x_vals.shape), dtype=float)
+
+    return evaluate
+
+
 class PointLoadV(namedtuple("PointLoadV", "force, coord")):
     """Vertical point load: (force in kips, coord in ft). Positive = downward.
 
@@ -162,6 +174,9 @@ class Beam:
         self._normal_forces = []
         self._shear_forces = []
         self._bending_moments = []
+        self._influence_operators = {}
+        self._compiled_cache = {}
+        self._compiled_signature = None
 
     @property
     def length(self):
@@ -172,6 +187,7 @@ class Beam:
     def length(self, length: float):
         if length > 0:
             self._x1 = self._x0 + length
+            self._invalidate_cache()
         else:
             raise ValueError("The provided length must be positive.")
 
@@ -185,6 +201,7 @@ class Beam:
     def pinned_support(self, x_coord: float):
         if self._x0 <= x_coord <= self._x1:
             self._pinned_support = x_coord
+            self._invalidate_cache()
         else:
             raise ValueError("The pinned support must be located within the beam span.")
 
@@ -198,6 +215,7 @@ class Beam:
     def rolling_support(self, x_coord: float):
         if self._x0 <= x_coord <= self._x1:
             self._rolling_support = x_coord
+            self._invalidate_cache()
         else:
             raise ValueError("The rolling support must be located within the beam span.")
 
@@ -232,6 +250,7 @@ class Beam:
             else:
                 raise TypeError(
                     "The provided loads must be one of the supported types: {0}".format(supported_load_types))
+        self._invalidate_cache()
         self._update_loads()
 
     def get_reaction_forces(self):
@@ -319,8 +338,7 @@ class Beam:
         ax.set_title("Loaded beam diagram")
 
         # Negate the distributed forces here so it plots upright and positive
-        dist_forces = sum(self._distributed_forces_y) if self._distributed_forces_y else sympify(0)
-        self._plot_analytical(ax, -1 * dist_forces, **plot01_params)
+        self._plot_analytical(ax, self._cached("load", self._load_function), **plot01_params)
 
         self._draw_beam_schematic(ax)
         return ax.get_figure()
@@ -332,7 +350,7 @@ class Beam:
                          'color': "b"}
         if ax is None:
             ax = plt.figure(figsize=(6, 2.5)).add_subplot(1, 1, 1)
-        self._plot_analytical(ax, sum(self._normal_forces), **plot02_params)
+        self._plot_analytical(ax, self._cached("normal", lambda: sum(self._normal_forces)), **plot02_params)
         return ax.get_figure()
 
     def plot_shear_force(self, ax=None):
@@ -342,7 +360,7 @@ class Beam:
                          'color': "r"}
         if ax is None:
             ax = plt.figure(figsize=(6, 2.5)).add_subplot(1, 1, 1)
-        self._plot_analytical(ax, sum(self._shear_forces), **plot03_params)
+        self._plot_analytical(ax, self.get_shear_function(), **plot03_params)
         return ax.get_figure()
 
     def plot_bending_moment(self, ax=None):
@@ -353,7 +371,7 @@ class Beam:
                          'color': "y"}
         if ax is None:
             ax = plt.figure(figsize=(6, 2.5)).add_subplot(1, 1, 1)
-        self._plot_analytical(ax, sum(self._bending_moments), **plot04_params)
+        self._plot_analytical(ax, self.get_moment_function(), **plot04_params)
         return ax.get_figure()
 
     def _plot_analytical(self, ax: plt.axes, sym_func, title: str = "", maxmin_hline: bool = True, xunits: str = "",
@@ -362,8 +380,7 @@ class Beam:
         Auxiliary function for plotting a sympy.Piecewise analytical function.
         """
         x_vec = np.linspace(self._x0, self._x1, int(min(self.length * 1000 + 1, 1e4)))
-        y_lam = lambdify(x, sym_func, "numpy")
-        y_vec = np.array([y_lam(t) for t in x_vec])
+        y_vec = self._cached(("compiled", sym_func), lambda: _compile(sym_func))(x_vec)
 
         if inverted:
             y_vec *= -1
@@ -614,14 +631,86 @@ class Beam:
             if isinstance(f, PointTorque):
                 yield f
 
+    def _load_function(self):
+        """Distributed vertical load as plotted (positive downward)."""
+        dist_forces = sum(self._distributed_forces_y) if self._distributed_forces_y else sympify(0)
+        return -1 * dist_forces
+
+    def _cached(self, key, build):
+        """Return ``build()`` memoized under ``key`` for the current loads and supports.
+
+        The cache is keyed on the load set and support layout, so it is dropped
+        whenever either changes (``add_loads``, the ``length`` setter or a support
+        setter also clear it explicitly).
+        """
+        signature = (tuple(self._loads), self._x0, self._x1,
+                     *(tuple(pts) for pts in self._support_conditions()))
+        if signature != self._compiled_signature:
+            self._compiled_cache = {}
+            self._compiled_signature = signature
+        if key not in self._compiled_cache:
+            self._compiled_cache[key] = build()
+        return self._compiled_cache[key]
+
+    def _invalidate_cache(self):
+        self._compiled_cache = {}
+        self._compiled_signature = None
+
+    def get_shear_function(self):
+        """Returns the symbolic shear function V(x) in kips."""
+        return self._cached("shear", lambda: sum(self._shear_forces))
+
     def get_moment_function(self):
-        return sum(self._bending_moments)
+        return self._cached("moment", lambda: sum(self._bending_moments))
+
+    def get_compiled_function(self, kind: str, E_ksi=None, I_in4=None):
+        """Returns a NumPy callable for one of the beam's diagrams.
+
+        The SymPy expression is summed and lambdified once and cached on the beam
+        until its loads or supports change, so evaluating the same beam at many
+        stations only pays the SymPy cost on the first call.
+
+        Parameters
+        ----------
+        kind : {"normal", "shear", "moment", "deflection"}
+            Diagram to compile.
+        E_ksi, I_in4 : float, optional
+            Required for ``"deflection"``; see :meth:`get_deflection_function`.
+
+        Returns
+        -------
+        callable
+            ``f(x_vals) -> ndarray`` evaluated at x in ft, same shape as ``x_vals``.
+
+        Examples
+        --------
+        >>> b = Beam(10)
+        >>> b.pinned_support, b.rolling_support = 0, 10
+        >>> b.add_loads([PointLoadV(10, 5)])
+        >>> b.get_compiled_function("moment")([2.5, 5.0]).tolist()
+        [12.5, 25.0]
+        """
+        if kind == "deflection":
+            if E_ksi is None or I_in4 is None:
+                raise ValueError("E_ksi and I_in4 are required for the deflection function.")
+            sym_func = self.get_deflection_function(E_ksi, I_in4)
+        elif kind == "normal":
+            sym_func = self._cached("normal", lambda: sum(self._normal_forces))
+        elif kind == "shear":
+            sym_func = self.get_shear_function()
+        elif kind == "moment":
+            sym_func = self.get_moment_function()
+        else:
+            raise ValueError(
+                f"Unknown function kind {kind!r}; use 'normal', 'shear', 'moment' or 'deflection'."
+            )
+        return self._cached(("compiled", sym_func), lambda: _compile(sym_func))
 
     def get_bending_moment(self):
         """Alias for get_moment_function to maintain compatibility with older notebook cells."""
         return self.get_moment_function()
 
-    def get_envelope(self, loads: list, step_size: float = 0.5):
+    def get_envelope(self, loads: list, step_size: float = 0.5, method: str = "influence"):
         """
         Calculates the shear and moment envelope for a moving load or set of loads.
 
@@ -632,6 +721,12 @@ class Beam:
             The coordinates of these loads should be relative to the first load (at 0).
         step_size : float
             The distance to move the load at each step.
+        method : {"influence", "symbolic"}
+            ``"influence"`` (default) builds unit-load shear and moment influence
+            matrices once (see :meth:`get_influence_matrices`) and evaluates every
+            truck position as a single matrix product.  ``"symbolic"`` re-solves
+            the beam with SymPy at every truck position; it is kept as a reference
+            implementation and is much slower.
 
         Returns
         -------
@@ -646,6 +741,137 @@ class Beam:
         min_moment : ndarray
             Minimum moment at each x.
         """
+        if method == "symbolic":
+            return self._get_envelope_symbolic(loads, step_size)
+        if method != "influence":
+            raise ValueError(f"Unknown envelope method {method!r}; use 'influence' or 'symbolic'.")
+
+        x_vec = np.linspace(self._x0, self._x1, int(min(self.length * 100 + 1, 5000)))
+        offsets = np.array([float(load.coord) for load in loads])
+        forces = np.array([float(load.force) for load in loads])
+
+        # Same range of motion as the symbolic method: leading edge at x=0 through
+        # trailing edge at x=L.
+        start_pos = -offsets.max()
+        end_pos = self.length - offsets.min()
+        n_steps = int(np.floor((end_pos - start_pos + 1e-9) / step_size)) + 1
+        positions = (start_pos + step_size * np.arange(n_steps))[:, None] + offsets[None, :]
+
+        # Only axles on the beam contribute; positions with nothing on the beam are skipped
+        on_beam = (positions >= 0) & (positions <= self.length)
+        active = on_beam.any(axis=1)
+        positions, on_beam = positions[active], on_beam[active]
+
+        # One column per truck position, one row per distinct axle location
+        step_idx, axle_idx = np.nonzero(on_beam)
+        unique_pos, pos_idx = np.unique(positions[step_idx, axle_idx], return_inverse=True)
+        weights = np.zeros((unique_pos.size, positions.shape[0]))
+        np.add.at(weights, (pos_idx, step_idx), forces[axle_idx])
+
+        shear_il, moment_il = self.get_influence_matrices(x_vec, unique_pos)
+        shear = shear_il @ weights
+        moment = moment_il @ weights
+        return x_vec, shear.max(axis=1), shear.min(axis=1), moment.max(axis=1), moment.min(axis=1)
+
+    def get_influence_matrices(self, x_vec, positions):
+        """Unit-load shear and moment influence matrices.
+
+        Entry ``[i, j]`` is the shear (kips) or moment (kip·ft) at station
+        ``x_vec[i]`` due to a 1 kip downward load at ``positions[j]``, using the
+        same sign conventions as the shear and moment diagrams.  The load-to-reaction
+        operator is solved once per support layout and cached, so repeated calls
+        (e.g. one per vehicle) only pay for the NumPy evaluation.
+
+        Parameters
+        ----------
+        x_vec : array_like
+            Stations along the beam, ft.
+        positions : array_like
+            Unit-load positions, ft.
+
+        Returns
+        -------
+        tuple of ndarray
+            ``(shear, moment)``, each of shape ``(len(x_vec), len(positions))``.
+        """
+        x_vec = np.asarray(x_vec, dtype=float)
+        positions = np.asarray(positions, dtype=float)
+        force_pts, moment_pts = self._support_conditions()
+        a = np.array(force_pts, dtype=float)
+        b = np.array(moment_pts, dtype=float)
+
+        reactions = self._unit_load_reactions(positions)
+        r_force, r_moment = reactions[:a.size], reactions[a.size:a.size + b.size]
+
+        dx_a = x_vec[:, None] - a[None, :]
+        dx_p = x_vec[:, None] - positions[None, :]
+        step_p = (dx_p >= 0).astype(float)
+        shear = (dx_a >= 0).astype(float) @ r_force - step_p
+        moment = np.maximum(dx_a, 0) @ r_force - dx_p * step_p
+        if b.size:
+            moment += (x_vec[:, None] >= b[None, :]).astype(float) @ r_moment
+        return shear, moment
+
+    def _support_conditions(self):
+        """Support locations as (zero-deflection points, zero-slope points).
+
+        Each zero-deflection point carries a vertical reaction and each zero-slope
+        point a reaction moment; subclasses with fixed ends override this.
+        """
+        return [self._pinned_support, self._rolling_support], []
+
+    def _unit_load_reactions(self, positions):
+        """Support reactions for a 1 kip downward load at each of ``positions``.
+
+        Solves equilibrium plus the support compatibility conditions (Macaulay
+        double integration of EI·v'' = M) for every position at once.  The
+        system matrix only depends on the support layout, so its inverse is
+        cached per layout.
+
+        Returns
+        -------
+        ndarray
+            Shape ``(n_force + n_moment + 2, len(positions))``: vertical reactions
+            (positive upward), reaction moments, then the two integration constants.
+        """
+        force_pts, moment_pts = self._support_conditions()
+        x0, x1 = self._x0, self._x1
+        a = np.array(force_pts, dtype=float) - x0
+        b = np.array(moment_pts, dtype=float) - x0
+        p = np.asarray(positions, dtype=float) - x0
+        L = x1 - x0
+
+        key = (x0, x1, tuple(a), tuple(b))
+        cache = self._influence_operators
+        if key not in cache:
+            n_a, n_b = a.size, b.size
+            A = np.zeros((n_a + n_b + 2, n_a + n_b + 2))
+            # Equilibrium: shear and moment vanish just beyond the right end
+            A[0, :n_a] = 1.0
+            A[1, :n_a] = L - a
+            A[1, n_a:n_a + n_b] = 1.0
+            # Zero deflection at each force support
+            for i, ai in enumerate(a):
+                A[2 + i, :n_a] = np.maximum(ai - a, 0) ** 3 / 6
+                A[2 + i, n_a:n_a + n_b] = np.maximum(ai - b, 0) ** 2 / 2
+                A[2 + i, -2:] = ai, 1.0
+            # Zero slope at each moment support
+            for i, bi in enumerate(b):
+                A[2 + n_a + i, :n_a] = np.maximum(bi - a, 0) ** 2 / 2
+                A[2 + n_a + i, n_a:n_a + n_b] = np.maximum(bi - b, 0)
+                A[2 + n_a + i, -2] = 1.0
+            cache[key] = np.linalg.inv(A)
+
+        rhs = np.empty((a.size + b.size + 2, p.size))
+        rhs[0] = 1.0
+        rhs[1] = L - p
+        rhs[2:2 + a.size] = np.maximum(a[:, None] - p[None, :], 0) ** 3 / 6
+        rhs[2 + a.size:] = np.maximum(b[:, None] - p[None, :], 0) ** 2 / 2
+        return cache[key] @ rhs
+
+    def _get_envelope_symbolic(self, loads: list, step_size: float = 0.5):
+        """Reference implementation of :meth:`get_envelope` that re-solves the
+        beam symbolically at every truck position."""
         x_vec = np.linspace(self._x0, self._x1, int(min(self.length * 100 + 1, 5000)))
         max_shear = np.full_like(x_vec, -np.inf)
         min_shear = np.full_like(x_vec, np.inf)
@@ -754,6 +980,8 @@ class Beam:
     def get_deflection_function(self, E_ksi, I_in4):
         """Returns the symbolic deflection function δ(x) in inches.
 
+        The result is cached per (E, I) until the beam's loads or supports change.
+
         Parameters
         ----------
         E_ksi : float
@@ -761,6 +989,15 @@ class Beam:
         I_in4 : float
             Moment of inertia in in⁴. Can be a Pint quantity — magnitude is used.
         """
+        try:
+            I_in4 = float(I_in4.magnitude)
+        except AttributeError:
+            I_in4 = float(I_in4)
+        E_ksi = float(E_ksi)
+        return self._cached(("deflection", E_ksi, I_in4), lambda: self._deflection_function(E_ksi, I_in4))
+
+    def _deflection_function(self, E_ksi, I_in4):
+        """Deflection δ(x) in inches with δ = 0 at both supports."""
         try:
             I_in4 = float(I_in4.magnitude)
         except AttributeError:
@@ -842,6 +1079,9 @@ class CantileverBeam(Beam):
         self._normal_forces = []
         self._shear_forces = []
         self._bending_moments = []
+        self._influence_operators = {}
+        self._compiled_cache = {}
+        self._compiled_signature = None
 
     def get_reaction_forces(self):
         """Calculates the reaction forces (V_A, M_A) for a cantilever beam.
@@ -880,7 +1120,10 @@ class CantileverBeam(Beam):
         self._bending_moments.extend(self._effort_from_pointload(f) for f in self._point_torques())
         self._bending_moments.append(self._effort_from_pointload(fixed_moment))
 
-    def get_deflection_function(self, E_ksi, I_in4):
+    def _support_conditions(self):
+        return [self._fixed_support], [self._fixed_support]
+
+    def _deflection_function(self, E_ksi, I_in4):
         """Returns the symbolic deflection function δ(x) in inches.
 
         Boundary conditions: δ(0) = 0, δ'(0) = 0 (fixed end).
@@ -907,8 +1150,7 @@ class CantileverBeam(Beam):
         ax.set_title("Loaded beam diagram (Cantilever)")
 
         # Negate the distributed forces here so it plots upright and positive
-        dist_forces = sum(self._distributed_forces_y) if self._distributed_forces_y else sympify(0)
-        self._plot_analytical(ax, -1 * dist_forces, **plot01_params)
+        self._plot_analytical(ax, self._cached("load", self._load_function), **plot01_params)
 
         self._draw_cantilever_schematic(ax)
         return ax.get_figure()
@@ -1090,7 +1332,10 @@ class ProppedCantileverBeam(Beam):
         fixed_moment_load = PointTorque(-self._fixed_end_moment, self._pinned_support)
         self._bending_moments.append(self._effort_from_pointload(fixed_moment_load))
 
-    def get_deflection_function(self, E_ksi, I_in4):
+    def _support_conditions(self):
+        return [self._x0, self._rolling_support], [self._x0]
+
+    def _deflection_function(self, E_ksi, I_in4):
         """Returns the symbolic deflection function δ(x) in inches.
         Boundary conditions: δ(0) = 0, δ'(0) = 0.
         """
@@ -1305,6 +1550,9 @@ class ContinuousBeam(Beam):
             self._shear_forces.append(self._effort_from_pointload(load))
             self._bending_moments.append(integrate(self._effort_from_pointload(load), (x, self._x0, x)))
 
+    def _support_conditions(self):
+        return [self._pinned_support, self._rolling_support, *self._intermediate_supports], []
+
     def _draw_beam_schematic(self, ax):
         super()._draw_beam_schematic(ax)
         # Draw intermediate supports
@@ -1412,7 +1660,11 @@ class FixedFixedBeam(Beam):
         self._bending_moments.append(self._effort_from_pointload(ma_load))
         self._bending_moments.append(self._effort_from_pointload(mb_load))
 
-    def get_deflection_function(self, E_ksi, I_in4):
+    def _support_conditions(self):
+        return [self._x0, self._x1], [self._x0, self._x1]
+
+    def _deflection_function(self, E_ksi, I_in4):
+        """Deflection δ(x) in inches with δ = δ' = 0 at x = 0."""
         try:
             I_in4 = float(I_in4.magnitude)
         except AttributeError:
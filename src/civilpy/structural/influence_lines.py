@@ -17,6 +17,11 @@ Examples
 160.0
 >>> round(il.uniform_load_effect(0.64), 1)           # 0.64 klf lane load
 32.0
+
+For many lines and vehicles at once (e.g. every 0.1L point of a continuous
+unit against HL-93 and the legal loads), :func:`batch_axle_train_effects`
+samples each line once and sweeps every train as a vectorized sliding-window
+sum, returning a :class:`TrainEffectTable`.
 """
 
 #  CivilPy
@@ -71,7 +76,8 @@ def influence_line_from_ordinates(positions, etas, length=None, label=""):
     span = float(length) if length is not None else float(pos[-1])
     # Off-span positions contribute nothing (left/right fill values = 0.0).
     return InfluenceLine(lambda x: np.interp(x, pos, eta, left=0.0, right=0.0),
-                         length=span, label=label)
+                         length=span, label=label, vectorized=True,
+                         breakpoints=pos)
 
 
 def influence_line_from_midas(midas, element, cases, *, component="Moment-y",
@@ -134,16 +140,93 @@ class TrainResult:
     reversed_train: bool
 
 
+@dataclass
+class TrainEffectTable:
+    """Extreme effects of a library of axle trains on a stack of influence
+    lines, from :func:`batch_axle_train_effects`.  Arrays are indexed
+    ``[line, train]``; positions locate the train's first axle (ft), as in
+    :class:`TrainResult`."""
+
+    labels: list
+    trains: list
+    max_value: np.ndarray
+    max_position: np.ndarray
+    max_reversed: np.ndarray
+    min_value: np.ndarray
+    min_position: np.ndarray
+    min_reversed: np.ndarray
+
+    def result(self, line: int, train, sign: float = 1.0) -> TrainResult:
+        """:class:`TrainResult` for one line (index) and train (name or
+        index); ``sign=-1`` returns the most negative effect."""
+        j = self.trains.index(train) if not isinstance(train, (int, np.integer)) else train
+        if sign > 0:
+            return TrainResult(float(self.max_value[line, j]),
+                               float(self.max_position[line, j]),
+                               bool(self.max_reversed[line, j]))
+        return TrainResult(float(self.min_value[line, j]),
+                           float(self.min_position[line, j]),
+                           bool(self.min_reversed[line, j]))
+
+    def governing(self, sign: float = 1.0) -> list:
+        """One row per line for the train giving the largest effect
+        (``sign=-1``: the most negative), as dicts with ``line``, ``train``,
+        ``value``, ``position`` and ``reversed_train``."""
+        if sign > 0:
+            values, pos, rev = self.max_value, self.max_position, self.max_reversed
+            pick = np.argmax(values, axis=1)
+        else:
+            values, pos, rev = self.min_value, self.min_position, self.min_reversed
+            pick = np.argmin(values, axis=1)
+        return [
+            {"line": self.labels[i], "train": self.trains[j],
+             "value": float(values[i, j]), "position": float(pos[i, j]),
+             "reversed_train": bool(rev[i, j])}
+            for i, j in enumerate(pick)
+        ]
+
+    def to_dataframe(self):
+        """Long-format :class:`pandas.DataFrame`, one row per (line, train)."""
+        import pandas as pd
+
+        n_lines, n_trains = self.max_value.shape
+        return pd.DataFrame({
+            "line": np.repeat(np.asarray(self.labels, dtype=object), n_trains),
+            "train": np.tile(np.asarray(self.trains, dtype=object), n_lines),
+            "max_value": self.max_value.ravel(),
+            "max_position": self.max_position.ravel(),
+            "max_reversed": self.max_reversed.ravel(),
+            "min_value": self.min_value.ravel(),
+            "min_position": self.min_position.ravel(),
+            "min_reversed": self.min_reversed.ravel(),
+        })
+
+
 class InfluenceLine:
     """Influence line for one effect (reaction, shear, or moment at a
     section) on a beam with a pin at ``support_a`` and roller at
     ``support_b``; the beam runs from 0 to ``length`` (defaults to
     ``support_b``), so overhangs come from supports inside the ends."""
 
-    def __init__(self, eta, length: float, label: str = ""):
-        self._eta = np.vectorize(eta, otypes=[float])
+    def __init__(self, eta, length: float, label: str = "",
+                 vectorized: bool = False, breakpoints=None):
+        """``eta`` maps a unit-load position to the ordinate.  Pass
+        ``vectorized=True`` when it already accepts NumPy arrays, so whole
+        sample grids are evaluated in one call instead of point by point.
+        ``breakpoints`` (ft) declares the line piecewise linear between
+        those positions (kinks and jumps), enabling the exact axle-train
+        search in :meth:`maximize_axle_train`; the beam ends are added
+        automatically.  Leave it ``None`` for curved lines."""
+        if vectorized:
+            self._eta = lambda x: np.asarray(eta(np.asarray(x, dtype=float)), dtype=float)
+        else:
+            self._eta = np.vectorize(eta, otypes=[float])
         self.length = float(length)
         self.label = label
+        self.breakpoints = None
+        if breakpoints is not None:
+            self.breakpoints = np.unique(np.concatenate(
+                [[0.0, self.length], np.asarray(breakpoints, dtype=float)]))
 
     def eta(self, x):
         """Ordinate(s) at unit-load position(s) ``x``: a float for scalar
@@ -166,7 +249,8 @@ class InfluenceLine:
             r_a = (b - x) / (b - a)
             return r_a if support.upper() == "A" else 1.0 - r_a
 
-        return cls(eta, total, f"Reaction {support.upper()}")
+        return cls(eta, total, f"Reaction {support.upper()}", vectorized=True,
+                   breakpoints=[])
 
     @classmethod
     def shear(cls, span: float, section: float,
@@ -179,10 +263,11 @@ class InfluenceLine:
 
         def eta(x):
             r_a = (b - x) / (b - a)
-            v = (r_a if a < c else 0.0) - (1.0 if x < c else 0.0)
+            v = (r_a if a < c else 0.0) - np.where(x < c, 1.0, 0.0)
             return v
 
-        return cls(eta, total, f"Shear at x={section:g}")
+        return cls(eta, total, f"Shear at x={section:g}", vectorized=True,
+                   breakpoints=[c])
 
     @classmethod
     def moment(cls, span: float, section: float,
@@ -195,10 +280,11 @@ class InfluenceLine:
 
         def eta(x):
             r_a = (b - x) / (b - a)
-            m = r_a * (c - a) - (c - x if x < c else 0.0)
+            m = r_a * (c - a) - np.where(x < c, c - x, 0.0)
             return m
 
-        return cls(eta, total, f"Moment at x={section:g}")
+        return cls(eta, total, f"Moment at x={section:g}", vectorized=True,
+                   breakpoints=[c])
 
     # ── Two-span continuous beams (Müller-Breslau) ───────────────────────
 
@@ -302,13 +388,40 @@ class InfluenceLine:
             y = np.clip(y, 0.0, None)
         return w * float(np.trapezoid(y, x))
 
+    def _critical_starts(self, offsets):
+        """First-axle positions at which some axle sits on a breakpoint,
+        plus a hair either side so jumps are seen from both sides."""
+        starts = (self.breakpoints[:, None] - offsets[None, :]).ravel()
+        eps = 1e-9 * max(1.0, self.length)
+        starts = np.concatenate([starts - eps, starts, starts + eps])
+        keep = (starts >= -offsets.max() - eps) & (starts <= self.length + eps)
+        return np.unique(starts[keep])
+
     def maximize_axle_train(self, loads, positions, step: float = 0.05,
                             both_directions: bool = True,
-                            sign: float = 1.0) -> TrainResult:
-        """Step an axle train across the beam and return the extreme
+                            sign: float = 1.0,
+                            method: str = "auto") -> TrainResult:
+        """Move an axle train across the beam and return the extreme
         effect.  ``loads`` (kips) sit at ``positions`` (ft, from the first
         axle); axles off the beam contribute nothing.  ``sign=-1`` finds
-        the most negative effect instead."""
+        the most negative effect instead.
+
+        ``method="exact"`` tests only the train positions where an axle sits
+        on a breakpoint of a piecewise-linear line: the total effect is then
+        piecewise linear in the train position with kinks only there, so
+        the O(axles × breakpoints) candidates contain the true extreme.
+        ``method="step"`` steps the train at ``step`` ft and works for any
+        line.  ``"auto"`` (default) picks ``"exact"`` when the line has
+        breakpoints (sampled lines and the closed-form reaction, shear and
+        moment constructors) and ``"step"`` otherwise."""
+        if method == "auto":
+            method = "step" if self.breakpoints is None else "exact"
+        if method not in ("exact", "step"):
+            raise ValueError(f"Unknown method {method!r}; use 'auto', 'exact' or 'step'.")
+        if method == "exact" and self.breakpoints is None:
+            raise ValueError("Exact search needs a piecewise-linear line with "
+                             "breakpoints; use method='step'.")
+
         loads = np.asarray(loads, dtype=float)
         offsets = np.asarray(positions, dtype=float)
         candidates = [(offsets, False)]
@@ -316,6 +429,21 @@ class InfluenceLine:
             candidates.append((offsets.max() - offsets[::-1], True))
 
         best = TrainResult(value=-np.inf, position=0.0, reversed_train=False)
+        if method == "exact":
+            for offs, rev in candidates:
+                ld = loads[::-1] if rev else loads
+                starts = self._critical_starts(offs)
+                xs = starts[:, None] + offs[None, :]
+                mask = (xs >= 0.0) & (xs <= self.length)
+                contrib = np.zeros(xs.shape)
+                contrib[mask] = np.broadcast_to(ld, xs.shape)[mask] * self.eta(xs[mask])
+                effects = np.where(mask.any(axis=1), sign * contrib.sum(axis=1), -np.inf)
+                i = int(np.argmax(effects))
+                if effects[i] > best.value:
+                    best = TrainResult(float(effects[i]), float(starts[i]), rev)
+            return TrainResult(sign * best.value, best.position,
+                               best.reversed_train)
+
         starts = np.arange(-offsets.max(), self.length + step, step)
         for offs, rev in candidates:
             ld = loads[::-1] if rev else loads
@@ -387,3 +515,136 @@ class InfluenceLine:
         ax.set_title(f"Influence line — {self.label}")
         ax.grid(True, alpha=0.3)
         return ax.get_figure()
+
+
+# ── Batch evaluation ──────────────────────────────────────────────────────
+
+
+def hl93_trains(rear_spacings=(14.0, 30.0)) -> dict:
+    """HL-93 design truck (one entry per rear-axle spacing) and design
+    tandem as an axle-train library for :func:`batch_axle_train_effects`:
+    ``{name: (loads_kip, positions_ft)}``."""
+    trains = {
+        f"HL-93 truck ({s:g} ft)": ([8.0, 32.0, 32.0], [0.0, 14.0, 14.0 + s])
+        for s in rear_spacings
+    }
+    trains["HL-93 tandem"] = ([25.0, 25.0], [0.0, 4.0])
+    return trains
+
+
+def _sliding_train_effect(etas, loads, index_offsets):
+    """Effect of one axle train at every start position on a uniform grid.
+
+    ``etas`` is ``(n_lines, n_points)`` sampled on the grid; axle ``k`` sits
+    ``index_offsets[k]`` grid steps behind the first.  Returns
+    ``(n_lines, n_points + max_offset)`` effects for first-axle grid indices
+    ``-max_offset .. n_points - 1``; axles off the grid contribute nothing.
+    """
+    k_max = int(index_offsets.max())
+    n_starts = etas.shape[1] + k_max
+    padded = np.pad(etas, ((0, 0), (k_max, k_max)))
+    out = np.zeros((etas.shape[0], n_starts))
+    for p, k in zip(loads, index_offsets):
+        out += p * padded[:, k:k + n_starts]
+    return out
+
+
+def batch_axle_train_effects(lines, trains, step: float = 0.05,
+                             both_directions: bool = True) -> TrainEffectTable:
+    """Extreme effects of every axle train in ``trains`` on every influence
+    line in ``lines``.
+
+    Each line is sampled once on a grid of spacing ``step`` (ft) from 0 to
+    its length, and each train is swept across it as a sliding-window sum
+    over its axles — one vectorized pass per (line group, train) rather than
+    a Python loop over start positions.  Lines of equal grid length are
+    stacked and processed together.  Axle spacings are rounded to the grid,
+    which is exact for spacings that are multiples of ``step`` (all standard
+    design and legal vehicles at the default 0.05 ft); otherwise the results
+    match :meth:`InfluenceLine.maximize_axle_train` to within one step.
+
+    Parameters
+    ----------
+    lines : sequence of InfluenceLine
+        E.g. moment at 0.1L points on every span of a continuous unit.
+    trains : dict
+        ``{name: (loads_kip, positions_ft)}``; see :func:`hl93_trains`.
+    step : float
+        Grid spacing and train stepping increment, ft.
+    both_directions : bool
+        Also run each train reversed.
+
+    Returns
+    -------
+    TrainEffectTable
+        Max and min effect (with governing position and direction) for
+        every (line, train) pair.
+    """
+    lines = list(lines)
+    names = list(trains)
+    shape = (len(lines), len(names))
+    table = TrainEffectTable(
+        labels=[il.label for il in lines], trains=names,
+        max_value=np.full(shape, -np.inf), max_position=np.zeros(shape),
+        max_reversed=np.zeros(shape, dtype=bool),
+        min_value=np.full(shape, np.inf), min_position=np.zeros(shape),
+        min_reversed=np.zeros(shape, dtype=bool),
+    )
+
+    groups = {}
+    for i, il in enumerate(lines):
+        n_points = int(np.floor(il.length / step + 1e-9)) + 1
+        groups.setdefault(n_points, []).append(i)
+
+    for n_points, rows in groups.items():
+        grid = step * np.arange(n_points)
+        etas = np.vstack([lines[i].eta(grid) for i in rows])
+        for j, name in enumerate(names):
+            loads, positions = trains[name]
+            loads = np.asarray(loads, dtype=float)
+            k = np.rint(np.asarray(positions, dtype=float) / step).astype(int)
+            k -= k.min()
+            candidates = [(loads, k, False)]
+            if both_directions:
+                candidates.append((loads[::-1], k.max() - k[::-1], True))
+            for ld, offs, rev in candidates:
+                effects = _sliding_train_effect(etas, ld, offs)
+                starts = step * (np.arange(effects.shape[1]) - offs.max())
+                i_max = effects.argmax(axis=1)
+                i_min = effects.argmin(axis=1)
+                v_max = effects[np.arange(len(rows)), i_max]
+                v_min = effects[np.arange(len(rows)), i_min]
+                for r, line in enumerate(rows):
+                    if v_max[r] > table.max_value[line, j]:
+                        table.max_value[line, j] = v_max[r]
+                        table.max_position[line, j] = starts[i_max[r]]
+                        table.max_reversed[line, j] = rev
+                    if v_min[r] < table.min_value[line, j]:
+                        table.min_value[line, j] = v_min[r]
+                        table.min_position[line, j] = starts[i_min[r]]
+                        table.min_reversed[line, j] = rev
+    return table
+
+
+def hl93_effects(lines, im: float = 0.33, lane_klf: float = 0.64,
+                 rear_spacings=(14.0, 30.0), step: float = 0.05) -> list:
+    """Batch form of :meth:`InfluenceLine.hl93_effect`: one dict per line
+    with the same keys, with every truck spacing and the tandem evaluated
+    by :func:`batch_axle_train_effects`."""
+    lines = list(lines)
+    trains = hl93_trains(rear_spacings)
+    table = batch_axle_train_effects(lines, trains, step=step)
+    tandem = list(trains).index("HL-93 tandem")
+    out = []
+    for i, il in enumerate(lines):
+        j = int(np.argmax(table.max_value[i]))
+        truck = table.max_value[i, j]
+        lane = il.uniform_load_effect(lane_klf)
+        out.append({
+            "truck": float(truck),
+            "tandem_governs": j == tandem,
+            "lane": lane,
+            "total": float(truck) * (1.0 + im) + lane,
+            "position": float(table.max_position[i, j]),
+        })
+    return out
@@ -54,76 +54,88 @@ Sub-modules:
     (HW-2.1).
 """
 
-from civilpy.structural.odot.bridge_railing import (
-    BRIDGE_RAILINGS,
-    BridgeRailing,
-    railing,
-    railings_for_test_level,
-)
-from civilpy.structural.odot.guardrail import (
-    MGS,
-    MGS_DRAWINGS,
-    MGS_POST_SPACINGS,
-    MGS_STEEL_POSTS,
-    MGSDrawing,
-    MGSStandard,
-    PostSpacing,
-    SteelPost,
-    bridge_terminal_assemblies,
-    mgs_drawing,
-    terminals_for_railing,
-)
-from civilpy.structural.odot.box_beam import (
-    ANCHOR_DOWEL,
-    BEARING_DESIGN_DATA,
-    BEARING_PADS,
-    BOX_BEAM_DEPTHS,
-    DESIGN_DATA_SHEET,
-    DESIGN_SPEC,
-    SHEAR_KEY,
-    TIE_ROD,
-    AnchorDowelDetail,
-    BearingDesignData,
-    BearingPad,
-    BoxBeamDesignSpec,
-    ShearKeyDetail,
-    TieRodDetail,
-    bearing_pad,
-    diaphragm_count,
-    diaphragm_end_offset,
-    BEVELED_LOAD_PLATE,
-    BeveledLoadPlate,
-    load_plate_bevel,
-)
-from civilpy.structural.odot.rocker_bolster import (
-    MAX_MOVEMENT,
-    ROCKER_BOLSTERS,
-    RockerBolster,
-    rocker_bolster,
-    smallest_for_load,
-)
-from civilpy.structural.odot.headwall import (
-    HEADWALLS_BY_DIAMETER,
-    HEADWALLS_CIRCULAR,
-    HEADWALLS_CONCRETE_BY_DIAMETER,
-    HEADWALLS_CONCRETE_CIRCULAR,
-    HEADWALLS_CONCRETE_ELLIPTICAL,
-    EllipticalHeadwall,
-    Headwall,
-    elliptical_headwall_for_rise,
-    headwall_for_diameter,
-)
-from civilpy.structural.odot.box_beam_design import (
-    BOX_BEAM_DESIGNS,
-    BOX_BEAM_RATINGS,
-    BOX_DESIGNATIONS,
-    RATING_VEHICLES,
-    BoxBeamDesign,
-    BoxBeamRating,
-    box_beam_design,
-    box_beam_rating,
-    designs_for_box,
-)
+from civilpy._lazy import lazy_exports
+
+# Each submodule (and the drawing data it loads) is imported the first time
+# one of its names is used.
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "bridge_railing": (
+        "BRIDGE_RAILINGS",
+        "BridgeRailing",
+        "railing",
+        "railings_for_test_level",
+    ),
+    "guardrail": (
+        "MGS",
+        "MGS_DRAWINGS",
+        "MGS_POST_SPACINGS",
+        "MGS_STEEL_POSTS",
+        "MGSDrawing",
+        "MGSStandard",
+        "PostSpacing",
+        "SteelPost",
+        "bridge_terminal_assemblies",
+        "mgs_drawing",
+        "terminals_for_railing",
+    ),
+    "box_beam": (
+        "ANCHOR_DOWEL",
+        "BEARING_DESIGN_DATA",
+        "BEARING_PADS",
+        "BOX_BEAM_DEPTHS",
+        "DESIGN_DATA_SHEET",
+        "DESIGN_SPEC",
+        "SHEAR_KEY",
+        "TIE_ROD",
+        "AnchorDowelDetail",
+        "BearingDesignData",
+        "BearingPad",
+        "BoxBeamDesignSpec",
+        "ShearKeyDetail",
+        "TieRodDetail",
+        "bearing_pad",
+        "diaphragm_count",
+        "diaphragm_end_offset",
+        "BEVELED_LOAD_PLATE",
+        "BeveledLoadPlate",
+        "load_plate_bevel",
+    ),
+    "rocker_bolster": (
+        "MAX_MOVEMENT",
+        "ROCKER_BOLSTERS",
+        "RockerBolster",
+        "rocker_bolster",
+        "smallest_for_load",
+        "smallest_for_loads",
+    ),
+    "headwall": (
+        "HEADWALLS_BY_DIAMETER",
+        "HEADWALLS_CIRCULAR",
+        "HEADWALLS_CONCRETE_BY_DIAMETER",
+        "HEADWALLS_CONCRETE_CIRCULAR",
+        "HEADWALLS_CONCRETE_ELLIPTICAL",
+        "EllipticalHeadwall",
+        "Headwall",
+        "elliptical_headwall_for_rise",
+        "headwall_for_diameter",
+        "headwalls_for_diameters",
+        "smallest_headwall_for_diameter",
+    ),
+    "box_beam_design": (
+        "BOX_BEAM_DESIGNS",
+        "BOX_BEAM_RATINGS",
+        "BOX_DESIGNATIONS",
+        "RATING_VEHICLES",
+        "BoxBeamDesign",
+        "BoxBeamRating",
+        "box_beam_design",
+        "box_beam_rating",
+        "designs_for_box",
+        "box_beam_designs",
+        "box_beam_rating_factors",
+        "shortest_design_for_span",
+    ),
+})
 
 __all__ = [
     "BridgeRailing",
@@ -166,10 +178,13 @@ __all__ = [
     "MAX_MOVEMENT",
     "rocker_bolster",
     "smallest_for_load",
+    "smallest_for_loads",
     "Headwall",
     "HEADWALLS_CIRCULAR",
     "HEADWALLS_BY_DIAMETER",
     "headwall_for_diameter",
+    "smallest_headwall_for_diameter",
+    "headwalls_for_diameters",
     "EllipticalHeadwall",
     "HEADWALLS_CONCRETE_CIRCULAR",
     "HEADWALLS_CONCRETE_BY_DIAMETER",
@@ -184,4 +199,7 @@ __all__ = [
     "box_beam_design",
     "designs_for_box",
     "box_beam_rating",
+    "shortest_design_for_span",
+    "box_beam_designs",
+    "box_beam_rating_factors",
 ]
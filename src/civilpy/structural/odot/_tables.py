@@ -0,0 +1,213 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lazily loaded, indexed record tables for the ODOT standard drawings.
+
+A :class:`RecordTable` holds the rows of one standard-drawing table as
+dataclass records.  The loader runs on first use, and each lookup goes
+through an index built once per field set:
+
+* exact lookups (:meth:`RecordTable.get`, :meth:`RecordTable.select`) are a
+  dict hit on the field value or tuple of values;
+* "smallest that satisfies" lookups (:meth:`RecordTable.at_least`) bisect
+  the records sorted on one numeric field;
+* the batch forms (:meth:`RecordTable.positions`,
+  :meth:`RecordTable.at_least_positions`) answer whole arrays of queries
+  with :func:`numpy.searchsorted` and return record positions, ``-1`` where
+  nothing matches.
+
+>>> from dataclasses import dataclass
+>>> from civilpy.structural.odot._tables import RecordTable
+>>> @dataclass(frozen=True)
+... class Pad:
+...     size: str
+...     capacity: float
+>>> pads = RecordTable(lambda: [Pad("S", 10.0), Pad("M", 25.0), Pad("L", 40.0)])
+>>> pads.loaded
+False
+>>> pads.get(size="M")
+Pad(size='M', capacity=25.0)
+>>> pads.at_least("capacity", 12.0)
+Pad(size='M', capacity=25.0)
+>>> pads.at_least_positions("capacity", [5.0, 30.0, 50.0, float("nan")])
+array([ 0,  2, -1, -1])
+>>> pads.at_least("capacity", float("nan")) is None
+True
+"""
+
+import bisect
+import threading
+
+import numpy as np
+
+
+class RecordTable:
+    """Records returned by ``loader()``, loaded on first use.
+
+    ``records`` keeps the loader's order; every query that can match more
+    than one record returns them in that order.
+    """
+
+    def __init__(self, loader):
+        self._loader = loader
+        self._records = None
+        self._indexes = {}
+        self._sorted = {}
+        self._codes = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        state = f"{len(self._records)} records" if self.loaded else "not loaded"
+        return f"RecordTable({state})"
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __iter__(self):
+        return iter(self.records)
+
+    @property
+    def loaded(self) -> bool:
+        return self._records is not None
+
+    @property
+    def records(self) -> list:
+        """All records, in table order (loaded on first access)."""
+        if self._records is None:
+            with self._lock:
+                if self._records is None:
+                    self._records = list(self._loader())
+        return self._records
+
+    # ---- exact lookups ---------------------------------------------------
+
+    def index(self, *fields: str) -> dict:
+        """Hash index ``value (or tuple of values) -> tuple of positions``."""
+        if fields not in self._indexes:
+            groups = {}
+            for i, r in enumerate(self.records):
+                key = tuple(getattr(r, f) for f in fields)
+                groups.setdefault(key if len(fields) > 1 else key[0], []).append(i)
+            self._indexes[fields] = {k: tuple(v) for k, v in groups.items()}
+        return self._indexes[fields]
+
+    def get(self, **criteria):
+        """The first record matching every ``field=value`` criterion, or
+        ``None``."""
+        found = self._matches(criteria)
+        return self.records[found[0]] if found else None
+
+    def select(self, **criteria) -> list:
+        """Every record matching every ``field=value`` criterion."""
+        records = self.records
+        return [records[i] for i in self._matches(criteria)]
+
+    def _matches(self, criteria: dict) -> tuple:
+        if not criteria:
+            raise ValueError("lookup needs at least one field=value criterion")
+        fields = tuple(criteria)
+        key = tuple(criteria.values()) if len(fields) > 1 else criteria[fields[0]]
+        try:
+            return self.index(*fields).get(key, ())
+        except TypeError:  # unhashable query value
+            return ()
+
+    # ---- "smallest that satisfies" ---------------------------------------
+
+    def sorted_by(self, field: str, **criteria) -> tuple[list, list]:
+        """``(values, positions)`` of the records matching ``criteria``,
+        ordered by ``field`` (ties keep table order)."""
+        key = (field, tuple(criteria.items()))
+        if key not in self._sorted:
+            positions = (
+                self._matches(criteria) if criteria else range(len(self.records))
+            )
+            pairs = sorted(
+                ((getattr(self.records[i], field), i) for i in positions),
+                key=lambda p: p[0],
+            )
+            self._sorted[key] = ([v for v, _ in pairs], [i for _, i in pairs])
+        return self._sorted[key]
+
+    def at_least(self, field: str, value, **criteria):
+        """The record with the smallest ``field >= value`` among those
+        matching ``criteria``, or ``None`` if every one is smaller.  A NaN
+        ``value`` matches nothing, as in :meth:`at_least_positions`."""
+        if value != value:  # NaN; bisect would place it first
+            return None
+        values, positions = self.sorted_by(field, **criteria)
+        k = bisect.bisect_left(values, value)
+        return self.records[positions[k]] if k < len(values) else None
+
+    # ---- batch lookups ---------------------------------------------------
+
+    def positions(self, **columns) -> np.ndarray:
+        """Vectorized :meth:`get`: the position of the first record matching
+        each row of the broadcast ``field=array`` columns, ``-1`` where none
+        does."""
+        if not columns:
+            raise ValueError("lookup needs at least one field=array column")
+        fields = tuple(columns)
+        table_keys, table_positions, codes = self._coded(fields)
+        arrays = np.broadcast_arrays(*(np.asarray(a) for a in columns.values()))
+        query = np.zeros(arrays[0].shape, dtype=np.int64)
+        missing = np.zeros(arrays[0].shape, dtype=bool)
+        if not len(table_keys):
+            return np.full(query.shape, -1, dtype=np.intp)
+        for arr, mapping in zip(arrays, codes):
+            distinct, inverse = np.unique(arr, return_inverse=True)
+            code = np.array([mapping.get(v, -1) for v in distinct.tolist()],
+                            dtype=np.int64)[inverse.reshape(arr.shape)]
+            missing |= code < 0
+            query = query * (len(mapping) + 1) + code
+        k = np.searchsorted(table_keys, query)
+        k = np.minimum(k, len(table_keys) - 1)
+        hit = ~missing & (table_keys[k] == query)
+        return np.where(hit, table_positions[k], -1)
+
+    def _coded(self, fields: tuple) -> tuple:
+        """Sorted mixed-radix keys of every distinct ``fields`` combination,
+        the position of its first record, and the per-field value codes."""
+        if fields not in self._codes:
+            codes = []
+            for f in fields:
+                distinct = dict.fromkeys(getattr(r, f) for r in self.records)
+                codes.append({v: i for i, v in enumerate(distinct)})
+            first = {}
+            for i, r in enumerate(self.records):
+                key = 0
+                for f, mapping in zip(fields, codes):
+                    key = key * (len(mapping) + 1) + mapping[getattr(r, f)]
+                first.setdefault(key, i)
+            keys = np.array(sorted(first), dtype=np.int64)
+            positions = np.array([first[k] for k in keys.tolist()], dtype=np.intp)
+            self._codes[fields] = (keys, positions, codes)
+        return self._codes[fields]
+
+    def at_least_positions(self, field: str, values, **criteria) -> np.ndarray:
+        """Vectorized :meth:`at_least`: record positions (``-1`` where every
+        matching record is smaller, or the value is NaN) for an array of
+        ``values``."""
+        keys, positions = self.sorted_by(field, **criteria)
+        keys = np.asarray(keys, dtype=float)
+        positions = np.append(np.asarray(positions, dtype=np.intp), -1)
+        return positions[np.searchsorted(keys, np.asarray(values, dtype=float))]
+
+    def take(self, positions) -> list:
+        """Records at ``positions`` (``None`` for ``-1``), flattened."""
+        records = self.records
+        return [records[i] if i >= 0 else None
+                for i in np.asarray(positions).ravel().tolist()]
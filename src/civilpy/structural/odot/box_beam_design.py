@@ -45,7 +45,9 @@ depths (17, 21, 27, 33, 42 in).  Two tables are carried here:
 Lengths in inches, spans in feet.  The values were extracted from the
 drawing's text layer and validated (strand placement sums to the strand
 count; operating exceeds inventory on every line); the drawing remains the
-controlling document.
+controlling document.  The CSVs are read on first use and indexed, so a
+lookup is a dict hit; the ``box_beam_designs`` / ``box_beam_rating_factors``
+forms answer whole arrays of spans and widths at once.
 
 Design assumptions (per the sheet's design notes): AASHTO LRFD BDS 10th Ed.
 (2024) + ODOT BDM, HL-93, skew <= 30 deg, roadway width 24-32 ft,
@@ -57,6 +59,10 @@ import csv
 import os
 from dataclasses import dataclass, field
 
+import numpy as np
+
+from civilpy.structural.odot._tables import RecordTable
+
 _RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "res")
 _DESIGN_CSV = os.path.join(_RES_DIR, "psbdd_1_25_design.csv")
 _RATING_CSV = os.path.join(_RES_DIR, "psbdd_1_25_load_rating.csv")
@@ -179,36 +185,81 @@ def _load_ratings() -> list[BoxBeamRating]:
     return out
 
 
-#: All standard box-beam designs (PSBDD-1-25 sheets 1 & 3).
-BOX_BEAM_DESIGNS: list[BoxBeamDesign] = _load_design()
+_DESIGNS = RecordTable(_load_design)
+_RATINGS = RecordTable(_load_ratings)
+_RATING_FACTOR_ARRAYS: dict[str, np.ndarray] = {}
 
-#: All box-beam load ratings (PSBDD-1-25 sheets 2 & 4).
-BOX_BEAM_RATINGS: list[BoxBeamRating] = _load_ratings()
+# BOX_BEAM_DESIGNS (all standard designs, PSBDD-1-25 sheets 1 & 3),
+# BOX_BEAM_RATINGS (all load ratings, sheets 2 & 4) and BOX_DESIGNATIONS
+# (the standard box designations, e.g. "CB27-48", "B27-48") are read from
+# the CSVs on first access; see ``__getattr__``.
 
-#: Standard box designations (e.g. ``"CB27-48"``, ``"B27-48"``).
-BOX_DESIGNATIONS: tuple[str, ...] = tuple(
-    dict.fromkeys(d.box for d in BOX_BEAM_DESIGNS)
-)
+
+def __getattr__(name: str):
+    if name == "BOX_BEAM_DESIGNS":
+        return _DESIGNS.records
+    if name == "BOX_BEAM_RATINGS":
+        return _RATINGS.records
+    if name == "BOX_DESIGNATIONS":
+        return tuple(_DESIGNS.index("box"))
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def box_beam_design(box: str, span: int) -> BoxBeamDesign:
     """The design line for a box designation and span in feet."""
-    for d in BOX_BEAM_DESIGNS:
-        if d.box == box and d.span == span:
-            return d
-    raise KeyError(f"no PSBDD-1-25 design for {box} at span {span} ft")
+    d = _DESIGNS.get(box=box, span=span)
+    if d is None:
+        raise KeyError(f"no PSBDD-1-25 design for {box} at span {span} ft")
+    return d
 
 
 def designs_for_box(box: str) -> list[BoxBeamDesign]:
     """All span designs for one box designation, shortest span first."""
-    return [d for d in BOX_BEAM_DESIGNS if d.box == box]
+    return _DESIGNS.select(box=box)
 
 
 def box_beam_rating(box: str, span: int, width_ft: int) -> BoxBeamRating:
     """The load rating for a box, span (ft), and bridge width (24/28/32 ft)."""
-    for r in BOX_BEAM_RATINGS:
-        if r.box == box and r.span == span and r.width_ft == width_ft:
-            return r
-    raise KeyError(
-        f"no PSBDD-1-25 rating for {box} at span {span} ft, width {width_ft} ft"
-    )
+    r = _RATINGS.get(box=box, span=span, width_ft=width_ft)
+    if r is None:
+        raise KeyError(
+            f"no PSBDD-1-25 rating for {box} at span {span} ft, width {width_ft} ft"
+        )
+    return r
+
+
+def shortest_design_for_span(box: str, span: float) -> BoxBeamDesign:
+    """The design line for ``box`` at the shortest tabulated span that is at
+    least ``span`` ft; raises ``KeyError`` if ``span`` exceeds the longest."""
+    d = _DESIGNS.at_least("span", span, box=box)
+    if d is None:
+        raise KeyError(f"no PSBDD-1-25 design for {box} covering span {span} ft")
+    return d
+
+
+def box_beam_designs(box, spans) -> list[BoxBeamDesign | None]:
+    """:func:`box_beam_design` over arrays: one design line (or ``None``
+    where none is tabulated) per element of the broadcast ``box`` and
+    ``spans``, flattened in C order."""
+    return _DESIGNS.take(_DESIGNS.positions(box=box, span=spans))
+
+
+def box_beam_rating_factors(box, spans, widths_ft, vehicle: str = "inv") -> np.ndarray:
+    """Rating factors for ``vehicle`` (one of :data:`RATING_VEHICLES`) over
+    the broadcast ``box``, ``spans`` and ``widths_ft`` arrays; NaN where
+    PSBDD-1-25 has no rating line.
+
+    >>> box_beam_rating_factors("CB17-48", [20, 25, 999], 24)
+    array([2.3 , 2.06,  nan])
+    """
+    if vehicle not in RATING_VEHICLES:
+        raise ValueError(
+            f"unknown rating vehicle {vehicle!r}; use one of {RATING_VEHICLES}"
+        )
+    if vehicle not in _RATING_FACTOR_ARRAYS:
+        _RATING_FACTOR_ARRAYS[vehicle] = np.array(
+            [r.rating_factors[vehicle] for r in _RATINGS.records] + [np.nan]
+        )
+    return _RATING_FACTOR_ARRAYS[vehicle][
+        _RATINGS.positions(box=box, span=spans, width_ft=widths_ft)
+    ]
@@ -48,6 +48,7 @@ from civilpy.structural.aashto.lrfd.railing import (
     TEST_LEVEL_LOADS,
     TestLevelLoad,
 )
+from civilpy.structural.odot._tables import RecordTable
 
 
 @dataclass(frozen=True)
@@ -469,6 +470,8 @@ _CATALOG: list[BridgeRailing] = [
 #: Catalog keyed by ``designation``.
 BRIDGE_RAILINGS: dict[str, BridgeRailing] = {r.designation: r for r in _CATALOG}
 
+_TABLE = RecordTable(lambda: _CATALOG)
+
 
 def railing(designation: str) -> BridgeRailing:
     """Look up a railing by its ``designation`` (e.g. ``"BR-1 (36 in)"``)."""
@@ -477,4 +480,4 @@ def railing(designation: str) -> BridgeRailing:
 
 def railings_for_test_level(test_level: str) -> list[BridgeRailing]:
     """All cataloged railings rated for ``test_level`` (e.g. ``"TL-4"``)."""
-    return [r for r in _CATALOG if r.test_level == test_level]
+    return _TABLE.select(test_level=test_level)
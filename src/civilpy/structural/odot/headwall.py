@@ -29,7 +29,7 @@ by circular-pipe diameter ``D`` (the corrugated-metal/plastic primary
 table; its pipe-arch tables are not transcribed here).  HW-2.2 carries both
 a circular table (by diameter) and an elliptical table (by rise and span).
 
-The data lives in the ``res/hw_2_*.csv`` files and is loaded once at import.
+The data lives in the ``res/hw_2_*.csv`` files and is read on first use.
 All dimensions are inches; concrete quantity is cubic yards.  Spot-checked
 against the drawings in the test suite.
 """
@@ -38,6 +38,10 @@ import csv
 import os
 from dataclasses import dataclass
 
+import numpy as np
+
+from civilpy.structural.odot._tables import RecordTable
+
 _RES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "res")
 _CSV_PATH = os.path.join(_RES_DIR, "hw_2_1_circular.csv")
 _CSV_22_CIRC = os.path.join(_RES_DIR, "hw_2_2_circular.csv")
@@ -113,28 +117,40 @@ def _load_elliptical(path: str) -> list[EllipticalHeadwall]:
     return rows
 
 
-# ---- HW-2.1 (corrugated metal / plastic pipe), circular -----------------
-#: HW-2.1 circular-pipe headwalls, ordered by pipe diameter.
-HEADWALLS_CIRCULAR: list[Headwall] = _load_circular(_CSV_PATH)
-
-#: Circular headwalls keyed by pipe diameter (inches).
-HEADWALLS_BY_DIAMETER: dict[float, Headwall] = {
-    h.diameter: h for h in HEADWALLS_CIRCULAR
+# HW-2.1 (corrugated metal / plastic pipe) circular, and HW-2.2 (concrete
+# pipe) circular and elliptical tables, each ordered by diameter / rise and
+# read on first use.
+_CIRCULAR = RecordTable(lambda: _load_circular(_CSV_PATH))
+_CONCRETE_CIRCULAR = RecordTable(lambda: _load_circular(_CSV_22_CIRC))
+_CONCRETE_ELLIPTICAL = RecordTable(lambda: _load_elliptical(_CSV_22_ELLIP))
+
+# Public tables, resolved lazily by ``__getattr__``:
+#   HEADWALLS_CIRCULAR             HW-2.1 circular headwalls (list)
+#   HEADWALLS_BY_DIAMETER          the same keyed by pipe diameter (in)
+#   HEADWALLS_CONCRETE_CIRCULAR    HW-2.2 concrete circular headwalls (list)
+#   HEADWALLS_CONCRETE_BY_DIAMETER the same keyed by pipe diameter (in)
+#   HEADWALLS_CONCRETE_ELLIPTICAL  HW-2.2 concrete elliptical headwalls (list)
+_LAZY_TABLES = {
+    "HEADWALLS_CIRCULAR": lambda: _CIRCULAR.records,
+    "HEADWALLS_BY_DIAMETER": lambda: {h.diameter: h for h in _CIRCULAR},
+    "HEADWALLS_CONCRETE_CIRCULAR": lambda: _CONCRETE_CIRCULAR.records,
+    "HEADWALLS_CONCRETE_BY_DIAMETER": lambda: {
+        h.diameter: h for h in _CONCRETE_CIRCULAR
+    },
+    "HEADWALLS_CONCRETE_ELLIPTICAL": lambda: _CONCRETE_ELLIPTICAL.records,
 }
 
-# ---- HW-2.2 (concrete pipe), circular and elliptical --------------------
-#: HW-2.2 concrete-pipe circular headwalls, ordered by diameter.
-HEADWALLS_CONCRETE_CIRCULAR: list[Headwall] = _load_circular(_CSV_22_CIRC)
 
-#: HW-2.2 concrete circular headwalls keyed by pipe diameter (inches).
-HEADWALLS_CONCRETE_BY_DIAMETER: dict[float, Headwall] = {
-    h.diameter: h for h in HEADWALLS_CONCRETE_CIRCULAR
-}
+def __getattr__(name: str):
+    if name in _LAZY_TABLES:
+        value = _LAZY_TABLES[name]()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-#: HW-2.2 concrete-pipe elliptical headwalls, ordered by rise.
-HEADWALLS_CONCRETE_ELLIPTICAL: list[EllipticalHeadwall] = _load_elliptical(
-    _CSV_22_ELLIP
-)
+def _circular(concrete: bool) -> RecordTable:
+    return _CONCRETE_CIRCULAR if concrete else _CIRCULAR
 
 
 def headwall_for_diameter(diameter: float, concrete: bool = False) -> Headwall:
@@ -143,15 +159,42 @@ def headwall_for_diameter(diameter: float, concrete: bool = False) -> Headwall:
     ``concrete=False`` uses the HW-2.1 corrugated-metal/plastic table;
     ``concrete=True`` uses the HW-2.2 concrete-pipe table.  Raises
     ``KeyError`` if the diameter is not a tabulated size."""
-    table = (
-        HEADWALLS_CONCRETE_BY_DIAMETER if concrete else HEADWALLS_BY_DIAMETER
-    )
-    return table[diameter]
+    h = _circular(concrete).get(diameter=diameter)
+    if h is None:
+        raise KeyError(diameter)
+    return h
+
+
+def smallest_headwall_for_diameter(
+    diameter: float, concrete: bool = False
+) -> Headwall:
+    """The headwall for the smallest tabulated pipe size of at least
+    ``diameter`` inches (tables as in :func:`headwall_for_diameter`); raises
+    ``ValueError`` if the pipe is larger than the largest tabulated size."""
+    h = _circular(concrete).at_least("diameter", diameter)
+    if h is None:
+        sheet = "HW-2.2" if concrete else "HW-2.1"
+        raise ValueError(f"pipe diameter {diameter} in exceeds the largest {sheet} size")
+    return h
+
+
+def headwalls_for_diameters(
+    diameters, concrete: bool = False, exact: bool = True
+) -> list[Headwall | None]:
+    """Headwalls for an array of pipe diameters (inches), flattened in C
+    order.  ``exact=True`` matches tabulated sizes only
+    (:func:`headwall_for_diameter`); ``exact=False`` takes the smallest
+    tabulated size that fits (:func:`smallest_headwall_for_diameter`).
+    ``None`` marks a diameter with no headwall."""
+    table = _circular(concrete)
+    if exact:
+        return table.take(table.positions(diameter=np.asarray(diameters, dtype=float)))
+    return table.take(table.at_least_positions("diameter", diameters))
 
 
 def elliptical_headwall_for_rise(rise: float) -> EllipticalHeadwall:
     """Look up the HW-2.2 concrete elliptical headwall by pipe rise (inches)."""
-    for h in HEADWALLS_CONCRETE_ELLIPTICAL:
-        if h.rise == rise:
-            return h
-    raise KeyError(f"no HW-2.2 elliptical headwall for rise {rise} in")
+    h = _CONCRETE_ELLIPTICAL.get(rise=rise)
+    if h is None:
+        raise KeyError(f"no HW-2.2 elliptical headwall for rise {rise} in")
+    return h
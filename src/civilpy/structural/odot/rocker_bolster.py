@@ -30,8 +30,13 @@ Dimensions in inches, weights in pounds, load in pounds.  Spot-checked
 against the drawing in the test suite.
 """
 
+import math
 from dataclasses import dataclass
 
+import numpy as np
+
+from civilpy.structural.odot._tables import RecordTable
+
 #: Dimension letters in RB-1-55 table column order.
 DIM_LETTERS: tuple[str, ...] = (
     "A", "B", "C", "D", "F", "G", "H", "K", "L", "M", "R", "T", "Y",
@@ -114,10 +119,30 @@ def rocker_bolster(capacity_kips: int) -> RockerBolster:
     return ROCKER_BOLSTERS[capacity_kips]
 
 
+_TABLE = RecordTable(lambda: _CATALOG)
+
+
 def smallest_for_load(load_lb: float) -> RockerBolster:
     """The lightest standard rocker/bolster whose maximum load covers
-    ``load_lb``; raises ``ValueError`` if the load exceeds the 300-kip line."""
-    for r in _CATALOG:
-        if r.max_load_lb >= load_lb:
-            return r
-    raise ValueError(f"load {load_lb} lb exceeds the largest RB-1-55 line")
+    ``load_lb``; raises ``ValueError`` if the load is not finite or exceeds
+    the 300-kip line."""
+    if not math.isfinite(load_lb):
+        raise ValueError(f"load {load_lb} lb is not a finite number")
+    r = _TABLE.at_least("max_load_lb", load_lb)
+    if r is None:
+        raise ValueError(f"load {load_lb} lb exceeds the largest RB-1-55 line")
+    return r
+
+
+def smallest_for_loads(loads_lb) -> np.ndarray:
+    """Vectorized :func:`smallest_for_load`: the capacity in kips of the
+    lightest line covering each load, ``-1`` where a load is not finite or
+    exceeds the 300-kip line.
+
+    >>> smallest_for_loads([60_000, 100_000, 100_001, 350_000, float("nan")])
+    array([ 75, 100, 125,  -1,  -1])
+    """
+    loads_lb = np.asarray(loads_lb, dtype=float)
+    capacities = np.array([r.capacity_kips for r in _CATALOG] + [-1])
+    picks = capacities[_TABLE.at_least_positions("max_load_lb", loads_lb)]
+    return np.where(np.isfinite(loads_lb), picks, -1)
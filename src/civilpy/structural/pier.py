@@ -40,6 +40,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 
 import numpy as np
+from scipy.linalg import solve_banded
 
 from civilpy.structural.aashto.lrfd.columns import (
     RebarLayer,
@@ -73,6 +74,74 @@ def _beam_element_stiffness(ei: float, h: float) -> np.ndarray:
     ])
 
 
+def _beam_element_stiffnesses(ei: float, h: np.ndarray) -> np.ndarray:
+    """:func:`_beam_element_stiffness` for every element length in ``h`` at
+    once, shape ``(len(h), 4, 4)``."""
+    h = np.asarray(h, dtype=float)
+    one = np.ones_like(h)
+    h2 = h * h
+    ke = np.stack([
+        np.stack([12.0 * one, 6.0 * h, -12.0 * one, 6.0 * h], axis=-1),
+        np.stack([6.0 * h, 4.0 * h2, -6.0 * h, 2.0 * h2], axis=-1),
+        np.stack([-12.0 * one, -6.0 * h, 12.0 * one, -6.0 * h], axis=-1),
+        np.stack([6.0 * h, 2.0 * h2, -6.0 * h, 4.0 * h2], axis=-1),
+    ], axis=-2)
+    return ke * (ei / (h2 * h))[:, None, None]
+
+
+# Nodal DOFs are ordered [v_0, th_0, v_1, th_1, ...], so an element couples
+# DOFs 2e..2e+3 and the global stiffness has a half-bandwidth of 3.
+_BANDWIDTH = 3
+
+# Breakpoints closer than this fraction of the element size are merged.
+_MERGE_FRACTION = 0.05
+
+
+def _assemble_banded(ke: np.ndarray) -> np.ndarray:
+    """Upper banded storage (``scipy.linalg.solveh_banded`` layout) of the
+    global stiffness assembled from element matrices ``ke`` (m, 4, 4)."""
+    m = len(ke)
+    ab = np.zeros((_BANDWIDTH + 1, 2 * (m + 1)))
+    first = 2 * np.arange(m)
+    for a in range(4):
+        for b in range(a, 4):
+            # one (a, b) entry of every element: distinct columns, no clashes
+            ab[_BANDWIDTH + a - b, first + b] += ke[:, a, b]
+    return ab
+
+
+def _constrain_banded(ab: np.ndarray, dofs: np.ndarray) -> None:
+    """Fix ``dofs`` at zero in place: clear their rows/columns within the
+    band and put the largest stiffness on the diagonal, so the constrained
+    rows are on the same scale as the rest of the matrix."""
+    ndof = ab.shape[1]
+    scale = np.max(np.abs(ab[_BANDWIDTH]))
+    ab[:, dofs] = 0.0
+    for k in range(1, _BANDWIDTH + 1):
+        cols = dofs + k
+        ab[_BANDWIDTH - k, cols[cols < ndof]] = 0.0
+    ab[_BANDWIDTH, dofs] = scale
+
+
+def _full_band(ab: np.ndarray) -> np.ndarray:
+    """Symmetric upper banded storage to the ``(l, u) = (3, 3)`` general
+    band layout of ``scipy.linalg.solve_banded``."""
+    full = np.zeros((2 * _BANDWIDTH + 1, ab.shape[1]))
+    full[:_BANDWIDTH + 1] = ab
+    for k in range(1, _BANDWIDTH + 1):
+        full[_BANDWIDTH + k, :-k] = ab[_BANDWIDTH - k, k:]
+    return full
+
+
+def _nearest_node(nodes: np.ndarray, x) -> np.ndarray:
+    """Index of the node nearest each ``x`` (ties go to the lower node)."""
+    x = np.asarray(x, dtype=float)
+    right = np.clip(np.searchsorted(nodes, x), 1, len(nodes) - 1)
+    left = right - 1
+    take_left = np.abs(x - nodes[left]) <= np.abs(nodes[right] - x)
+    return np.where(take_left, left, right)
+
+
 @dataclass
 class BeamSolution:
     """Continuous-beam results: nodal coordinates and the moment / shear
@@ -105,9 +174,15 @@ def solve_continuous_beam(
     downward ``point_loads`` (kip) and a uniform load ``udl`` (kip/in).
 
     The beam is discretized between breakpoints (supports, load points,
-    ends), every segment subdivided into ``n_per_span`` elements so nodal
-    moments capture the in-span peaks.  Returns the moment / shear diagrams
-    and the support reactions."""
+    ends), the longest segment subdivided into ``n_per_span`` elements and
+    the others into elements no longer than those, so nodal moments capture
+    the in-span peaks.  Breakpoints within 1/20 of an element of each other
+    are merged.  Returns the moment / shear diagrams
+    and the support reactions.
+
+    Assembly, the banded (half-bandwidth 3) LU solve and the force
+    recovery are all linear in the node count, so ``n_per_span`` in the
+    hundreds on a long multi-column cap is cheap."""
     if length <= 0 or ei <= 0:
         raise ValueError("length and ei must be positive")
     if not supports:
@@ -117,61 +192,83 @@ def solve_continuous_beam(
     breaks = {0.0, length}
     breaks.update(supports)
     breaks.update(pl.x for pl in point_loads)
-    breaks = sorted(b for b in breaks if 0.0 <= b <= length)
-
-    nodes = []
-    for a, b in zip(breaks, breaks[1:]):
-        seg = np.linspace(a, b, n_per_span + 1)
-        nodes.extend(seg[:-1])
-    nodes.append(breaks[-1])
-    nodes = np.array(sorted(set(np.round(nodes, 6))))
+    breaks = np.array(sorted(b for b in breaks if 0.0 <= b <= length))
+
+    # Elements are no longer than the longest segment's 1/n_per_span, and
+    # breakpoints much closer than that are merged (loads and supports then
+    # snap to the nearest node): a tiny element next to normal ones is a
+    # near-rigid link that makes the stiffness matrix numerically singular.
+    h_max = np.diff(breaks).max() / n_per_span
+    merged = [breaks[0]]
+    for b in breaks[1:]:
+        if b - merged[-1] >= _MERGE_FRACTION * h_max:
+            merged.append(b)
+    merged[-1] = length
+    breaks = np.array(merged)
+    seg = np.diff(breaks)
+    counts = np.clip(np.ceil(seg / h_max - 1e-9), 1, n_per_span).astype(int)
+    nodes = np.concatenate([
+        b + s * np.arange(k) / k for b, s, k in zip(breaks[:-1], seg, counts)
+    ])
+    nodes = np.unique(np.round(np.append(nodes, length), 6))
     n = len(nodes)
     ndof = 2 * n
 
-    k = np.zeros((ndof, ndof))
+    h = np.diff(nodes)
+    ke = _beam_element_stiffnesses(ei, h)
+    element_dofs = 2 * np.arange(n - 1)[:, None] + np.arange(4)
+    # consistent nodal loads from the UDL on each element
+    fe_udl = udl * np.stack([h / 2.0, h * h / 12.0, h / 2.0, -h * h / 12.0], axis=-1)
     f = np.zeros(ndof)
-    for e in range(n - 1):
-        h = nodes[e + 1] - nodes[e]
-        idx = [2 * e, 2 * e + 1, 2 * e + 2, 2 * e + 3]
-        k[np.ix_(idx, idx)] += _beam_element_stiffness(ei, h)
-        # consistent nodal loads from the UDL on this element
-        f[idx] += udl * np.array([h / 2.0, h * h / 12.0, h / 2.0, -h * h / 12.0])
-
-    def node_of(x):
-        return int(np.argmin(np.abs(nodes - x)))
+    np.add.at(f, element_dofs, fe_udl)
+
+    if point_loads:
+        load_nodes = _nearest_node(nodes, [pl.x for pl in point_loads])
+        np.add.at(f, 2 * load_nodes, [pl.p for pl in point_loads])
+
+    support_nodes = _nearest_node(nodes, supports)
+    support_dofs = 2 * support_nodes
+    if len(np.unique(support_nodes)) < 2:
+        raise ValueError(
+            f"supports {supports!r} leave the beam free to rotate as a "
+            f"mechanism; give at least two distinct support positions"
+        )
 
-    for pl in point_loads:
-        f[2 * node_of(pl.x)] += pl.p
+    # Supports are imposed on the banded matrix itself (zero row/column,
+    # scaled diagonal, zero load) so the solve stays O(n).  LU with partial
+    # pivoting rather than Cholesky: very short elements (a load next to a
+    # free end) make the stiffness too ill-conditioned for Cholesky.
+    ab = _assemble_banded(ke)
+    _constrain_banded(ab, np.unique(support_dofs))
+    f_free = f.copy()
+    f_free[support_dofs] = 0.0
+    u = solve_banded((_BANDWIDTH, _BANDWIDTH), _full_band(ab), f_free)
 
-    support_dofs = [2 * node_of(sx) for sx in supports]
-    free = [d for d in range(ndof) if d not in support_dofs]
-    u = np.zeros(ndof)
-    u[free] = np.linalg.solve(k[np.ix_(free, free)], f[free])
+    # Element-end forces [V_i, M_i, V_j, M_j] for every element at once.
+    fe = np.einsum("eij,ej->ei", ke, u[element_dofs])
 
     # Reactions at the constrained vertical DOFs.  Reported as the upward
     # support force (= downward load carried), so a column sees positive
     # compression under gravity load.
-    full_force = k @ u
-    reactions = {}
-    for sx, sd in zip(supports, support_dofs):
-        reactions[sx] = float(f[sd] - full_force[sd])
-
-    # Recover element-end moments and shears.
+    internal = np.zeros(n)
+    internal[:-1] += fe[:, 0]
+    internal[1:] += fe[:, 2]
+    reactions = {
+        sx: float(f[sd] - internal[sn])
+        for sx, sd, sn in zip(supports, support_dofs, support_nodes)
+    }
+
+    # Nodal moments and shears, averaged where two elements meet.
     moment = np.zeros(n)
     shear = np.zeros(n)
-    counts = np.zeros(n)
-    for e in range(n - 1):
-        h = nodes[e + 1] - nodes[e]
-        ue = u[[2 * e, 2 * e + 1, 2 * e + 2, 2 * e + 3]]
-        fe = _beam_element_stiffness(ei, h) @ ue
-        moment[e] += -fe[1]
-        moment[e + 1] += fe[3]
-        shear[e] += fe[0]
-        shear[e + 1] += -fe[2]
-        counts[e] += 1
-        counts[e + 1] += 1
-    moment /= np.maximum(counts, 1.0)
-    shear /= np.maximum(counts, 1.0)
+    moment[:-1] -= fe[:, 1]
+    moment[1:] += fe[:, 3]
+    shear[:-1] += fe[:, 0]
+    shear[1:] -= fe[:, 2]
+    counts = np.full(n, 2.0)
+    counts[[0, -1]] = 1.0
+    moment /= counts
+    shear /= counts
     return BeamSolution(x=nodes, moment=moment, shear=shear, reactions=reactions)
 
 
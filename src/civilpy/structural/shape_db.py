@@ -0,0 +1,239 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Lazily loaded, indexed shape tables backed by a binary cache.
+
+A :class:`ShapeTable` wraps one of the packaged CSV shape databases.
+Nothing is read until the table is first used; the first read parses the
+CSV and writes the parsed columns to a binary ``.npz`` cache keyed by the
+CSV's SHA-256, so later processes load the cache instead of parsing
+(and a CSV edit is picked up automatically).  Lookups go through hash
+indexes built once per key column, so finding a shape is O(1) instead of a
+full-table scan.
+
+The cache lives in ``$CIVILPY_CACHE_DIR`` (default ``~/.cache/civilpy``);
+an unwritable cache directory just means every process parses the CSV.
+The cache is plain arrays read with ``allow_pickle=False`` (numeric columns
+as-is, the rest as JSON text), so a tampered cache file can't run code.
+
+>>> import os
+>>> from civilpy.structural.shape_db import ShapeTable
+>>> from civilpy.structural.res import __file__ as res_init
+>>> shapes = ShapeTable(os.path.join(os.path.dirname(res_init), "steel_shapes.csv"))
+>>> shapes.loaded
+False
+>>> shapes.lookup(EDI_Std_Nomenclature="W36X150")["Ix"].values[0]
+np.float64(9040.0)
+>>> shapes.loaded
+True
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+CACHE_VERSION = 2
+
+
+def cache_dir() -> str:
+    """Directory for compiled table caches (``$CIVILPY_CACHE_DIR`` or
+    ``~/.cache/civilpy``)."""
+    return os.environ.get("CIVILPY_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "civilpy"
+    )
+
+
+class ShapeTable:
+    """One CSV shape database, loaded on first use.
+
+    ``read_csv`` holds extra :func:`pandas.read_csv` arguments.  ``frame``
+    is the full DataFrame; :meth:`lookup` returns the matching rows (a
+    DataFrame, possibly empty) for equality criteria on one or more
+    columns, using an index built on first lookup of that column set.
+    """
+
+    def __init__(self, csv_path: str, read_csv: dict | None = None):
+        self.csv_path = csv_path
+        self.read_csv = dict(read_csv or {})
+        self._frame = None
+        self._indexes = {}
+        self._numeric = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        state = "loaded" if self.loaded else "not loaded"
+        return f"ShapeTable({os.path.basename(self.csv_path)!r}, {state})"
+
+    @property
+    def loaded(self) -> bool:
+        return self._frame is not None
+
+    @property
+    def frame(self):
+        """The full table as a DataFrame (read on first access)."""
+        if self._frame is None:
+            with self._lock:
+                if self._frame is None:
+                    self._frame = self._load()
+        return self._frame
+
+    def index(self, *columns: str) -> dict:
+        """Hash index ``value (or tuple of values) -> row positions``."""
+        if columns not in self._indexes:
+            groups = self.frame.groupby(list(columns), sort=False, dropna=False)
+            self._indexes[columns] = {
+                key[0] if len(columns) == 1 and isinstance(key, tuple) else key:
+                    positions
+                for key, positions in groups.indices.items()
+            }
+        return self._indexes[columns]
+
+    def positions(self, **criteria) -> np.ndarray:
+        """Row positions matching every ``column=value`` criterion."""
+        if not criteria:
+            raise ValueError("lookup needs at least one column=value criterion")
+        columns = tuple(criteria)
+        key = tuple(criteria.values()) if len(columns) > 1 else criteria[columns[0]]
+        return self.index(*columns).get(key, np.array([], dtype=np.intp))
+
+    def lookup(self, **criteria):
+        """Rows matching every ``column=value`` criterion, as a DataFrame."""
+        positions = self.positions(**criteria)
+        if len(positions) and positions[-1] - positions[0] == len(positions) - 1:
+            return self.frame.iloc[positions[0]:positions[-1] + 1]
+        return self.frame.iloc[positions]
+
+    def numeric(self, column: str) -> np.ndarray:
+        """``column`` as a read-only float array (placeholders such as "–"
+        become NaN), converted once and cached."""
+        if column not in self._numeric:
+            import pandas as pd
+
+            values = pd.to_numeric(self.frame[column], errors="coerce")
+            values = values.to_numpy(dtype=float, na_value=np.nan)
+            values.flags.writeable = False
+            self._numeric[column] = values
+        return self._numeric[column]
+
+    def cache_path(self) -> str:
+        """Cache file for the current CSV contents and pandas version."""
+        import pandas as pd
+
+        with open(self.csv_path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()[:16]
+        stem = os.path.splitext(os.path.basename(self.csv_path))[0]
+        name = f"{stem}-{digest}-v{CACHE_VERSION}-pandas{pd.__version__}.npz"
+        return os.path.join(cache_dir(), name)
+
+    def _load(self):
+        import pandas as pd
+
+        path = self.cache_path()
+        if os.path.exists(path):
+            try:
+                return _read_columns(path)
+            except Exception:
+                pass  # truncated or unreadable; rebuild below
+        frame = pd.read_csv(self.csv_path, **self.read_csv)
+        try:
+            _write_atomic(frame, path)
+        except (OSError, TypeError, ValueError):
+            pass  # unwritable directory or a column we can't store
+        return frame
+
+
+def _json_bytes(payload) -> np.ndarray:
+    return np.frombuffer(json.dumps(payload).encode(), dtype=np.uint8)
+
+
+def _write_atomic(frame, path: str) -> None:
+    """Write ``frame`` to an ``.npz`` at ``path`` via a temporary file so
+    concurrent workers never read a half-written cache.
+
+    Columns are grouped by dtype: numeric/boolean groups become one 2-D
+    array each, all-string groups a 2-D unicode array plus a missing-value
+    mask, and anything else (mixed object columns) a JSON list.
+    """
+    import pandas as pd
+
+    if not (isinstance(frame.index, pd.RangeIndex) and frame.index.start == 0
+            and frame.index.step == 1):
+        raise ValueError("only frames with a default index are cached")
+    numeric, strings, other = {}, {}, {}
+    for k in range(frame.shape[1]):
+        series = frame.iloc[:, k]
+        dtype = series.dtype.name
+        if series.dtype.kind in "biuf":
+            numeric.setdefault(dtype, []).append(k)
+            continue
+        values = series.astype(object).where(series.notna(), None).tolist()
+        if all(v is None or isinstance(v, str) for v in values):
+            strings.setdefault(dtype, []).append(k)
+        else:
+            other[str(k)] = (dtype, values)
+    arrays = {f"num_{dtype}": frame.iloc[:, cols].to_numpy(dtype=dtype).T
+              for dtype, cols in numeric.items()}
+    for dtype, cols in strings.items():
+        block = frame.iloc[:, cols]
+        arrays[f"str_{dtype}"] = block.fillna("").to_numpy(dtype=str).T
+        arrays[f"na_{dtype}"] = block.isna().to_numpy().T
+    arrays["meta"] = _json_bytes({
+        "columns": list(frame.columns),
+        "numeric": numeric,
+        "strings": strings,
+        "other": other,
+    })
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            np.savez(fh, **arrays)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def _read_columns(path: str):
+    """Rebuild the DataFrame written by :func:`_write_atomic`."""
+    import pandas as pd
+
+    blocks, order = [], []
+    with np.load(path, allow_pickle=False) as data:
+        meta = json.loads(data["meta"].tobytes())
+        for dtype, cols in meta["numeric"].items():
+            blocks.append(pd.DataFrame(data[f"num_{dtype}"].T))
+            order.extend(cols)
+        for dtype, cols in meta["strings"].items():
+            values = data[f"str_{dtype}"].astype(object)
+            values[data[f"na_{dtype}"]] = np.nan
+            blocks.append(pd.DataFrame(values.T, dtype=dtype))
+            order.extend(cols)
+    for k, (dtype, values) in meta["other"].items():
+        values = [np.nan if v is None else v for v in values]
+        blocks.append(pd.DataFrame({0: pd.Series(values, dtype=dtype)}))
+        order.append(int(k))
+    n_rows = max((len(b) for b in blocks), default=0)
+    frame = pd.concat(blocks, axis=1, ignore_index=True) if blocks else (
+        pd.DataFrame(index=pd.RangeIndex(n_rows)))
+    frame = frame.iloc[:, np.argsort(order, kind="stable")]
+    frame.columns = meta["columns"]
+    return frame
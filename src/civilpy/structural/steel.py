@@ -16,21 +16,34 @@
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import numpy as np
-import pandas as pd
-from sympy.combinatorics.fp_groups import define_schreier_generators
 
 from civilpy.general import units
 from civilpy.structural.res.definitions import A325_bolt_weights
+from civilpy.structural.shape_db import ShapeTable
 
+import inspect
 import os
-import sys
 script_dir = os.path.dirname(os.path.abspath(__file__))
 csv_filepath = os.path.join(script_dir, "res", "steel_shapes.csv")
 historic_csv_filepath = os.path.join(script_dir, "res", "aisc_shapes_historic.csv")
 
-steel_tables = pd.read_csv(csv_filepath)
-historic_steel_tables = pd.read_csv(historic_csv_filepath, low_memory=False)
-historic_shapes = historic_steel_tables[historic_steel_tables['Edition']=='Historic']
+# Both shape databases are read on first use (see shape_db.ShapeTable) and
+# indexed by label, so importing this module parses nothing.
+shape_table = ShapeTable(csv_filepath)
+historic_shape_table = ShapeTable(historic_csv_filepath, read_csv={"low_memory": False})
+
+
+def __getattr__(name):
+    # The full DataFrames stay available under their historic module-level
+    # names, loaded when first touched.
+    if name == "steel_tables":
+        return shape_table.frame
+    if name == "historic_steel_tables":
+        return historic_shape_table.frame
+    if name == "historic_shapes":
+        return historic_shape_table.lookup(Edition="Historic")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def conv_frac_str(fraction_string: str) -> float:
     try:
@@ -130,15 +143,7 @@ class SteelSection:
         :param self:
         :return: dataframe of raw values from AISC Shape Table
         """
-        try:
-            shape_values = steel_tables[steel_tables["EDI_Std_Nomenclature"] == self.id]
-            return shape_values
-        except KeyError as e:  # pragma: no cover
-            print(
-                "Value not found in shape table,"
-                "check spelling and try again"
-                f"\n\n{e}"
-            )
+        return shape_table.lookup(EDI_Std_Nomenclature=self.id)
 
 
 class W(SteelSection):
@@ -520,6 +525,190 @@ class Pipe(SteelSection):
         self.D_t = conv_frac_str(self.aisc_value["D/t"].values[0])
 
 
+# ---------------------------------------------------------------------------
+# Bulk queries over the shape table
+# ---------------------------------------------------------------------------
+
+# US-customary unit of the numeric AISC table columns a query is likely to
+# bound or rank on; bounds given as pint Quantities are converted to these.
+SHAPE_COLUMN_UNITS = {
+    "W": "lbf/ft", "A": "in^2",
+    **{c: "in" for c in ("d", "bf", "tw", "tf", "b", "t", "tnom", "tdes", "kdes",
+                         "kdet", "k1", "x", "y", "eo", "xp", "yp", "rx", "ry",
+                         "rz", "ro", "rts", "ho", "T", "OD", "ID", "Ht", "h", "B")},
+    **{c: "in^3" for c in ("Zx", "Sx", "Zy", "Sy", "Sz", "C", "Qf", "Qw")},
+    **{c: "in^4" for c in ("Ix", "Iy", "Iz", "J", "Sw1", "Sw2", "Sw3", "Iw")},
+    "Cw": "in^6", "Wno": "in^2",
+}
+
+# Table types made of two flanges and a web, whose columns map onto the
+# I-girder arguments of the LRFD steel checks.
+_I_SHAPES = ("W", "M", "S", "HP")
+
+# Rows ranked per demand at once in ShapeSet.select; bounds the size of the
+# demands x shapes scratch arrays.
+_SELECT_CHUNK = 4096
+
+
+class ShapeSet:
+    """A set of rows of the AISC shape table, queried as raw float columns.
+
+    ``shapes["Zx"]`` is a float array in the table's US-customary units
+    (see :data:`SHAPE_COLUMN_UNITS`); pint units only appear at the
+    boundary, in :meth:`quantity` and when bounds are given as Quantities.
+    Filtering and ranking never build per-shape objects —
+    :meth:`sections` does that for the final picks.
+
+    >>> w = shapes("W")
+    >>> w.lightest(Zx=(250.0, None), d=(None, 24.5))
+    'W24X94'
+    >>> w.lightest(Zx=([100.0, 400.0], None)).tolist()
+    ['W21X48', 'W33X118']
+    """
+
+    def __init__(self, positions, table: ShapeTable = None):
+        self.table = shape_table if table is None else table
+        self.positions = np.asarray(positions, dtype=np.intp)
+
+    def __len__(self) -> int:
+        return self.positions.shape[0]
+
+    def __repr__(self) -> str:
+        return f"ShapeSet({len(self)} shapes)"
+
+    def __getitem__(self, column: str) -> np.ndarray:
+        return self.table.numeric(column)[self.positions]
+
+    @property
+    def labels(self) -> np.ndarray:
+        """``EDI_Std_Nomenclature`` of each shape."""
+        column = self.table.frame["EDI_Std_Nomenclature"].to_numpy(dtype=object)
+        return column[self.positions]
+
+    def quantity(self, column: str):
+        """``column`` as a pint Quantity array."""
+        return self[column] * units(SHAPE_COLUMN_UNITS[column])
+
+    def take(self, index) -> "ShapeSet":
+        """Subset (or reordering) by position within this set; -1 entries
+        are not allowed."""
+        return ShapeSet(self.positions[np.asarray(index, dtype=np.intp)], self.table)
+
+    def filter(self, **bounds) -> "ShapeSet":
+        """Shapes whose columns lie within ``column=(lo, hi)`` bounds (either
+        end may be None; NaN properties never qualify)."""
+        keep = np.ones(len(self), dtype=bool)
+        for column, (lo, hi) in bounds.items():
+            values = self[column]
+            with np.errstate(invalid="ignore"):
+                if lo is not None:
+                    keep &= values >= self._magnitude(column, lo)
+                if hi is not None:
+                    keep &= values <= self._magnitude(column, hi)
+        return ShapeSet(self.positions[keep], self.table)
+
+    def sort(self, by: str = "W") -> "ShapeSet":
+        return self.take(np.argsort(self[by], kind="stable"))
+
+    def select(self, by: str = "W", top_k: int = 1, **bounds) -> np.ndarray:
+        """The ``top_k`` shapes with the smallest ``by`` that satisfy the
+        bounds, for every demand at once.
+
+        Each bound end may be a scalar or an array of ``m`` demands; the
+        result is an ``(m, top_k)`` array of positions within this set
+        (``m`` = 1 for scalar bounds), -1 where fewer shapes qualify."""
+        limits = {}
+        m = 1
+        for column, (lo, hi) in bounds.items():
+            lo = None if lo is None else np.atleast_1d(self._magnitude(column, lo))
+            hi = None if hi is None else np.atleast_1d(self._magnitude(column, hi))
+            for end in (lo, hi):
+                if end is not None and end.shape[0] != 1:
+                    if m not in (1, end.shape[0]):
+                        raise ValueError(
+                            f"demand arrays differ in length: {m} and {end.shape[0]}"
+                        )
+                    m = end.shape[0]
+            limits[column] = (lo, hi)
+        order = np.argsort(self[by], kind="stable")
+        ranked = {column: self[column][order] for column in limits}
+        picks = np.full((m, top_k), -1, dtype=np.intp)
+        for start in range(0, m, _SELECT_CHUNK):
+            rows = slice(start, min(start + _SELECT_CHUNK, m))
+            ok = np.ones((rows.stop - rows.start, len(self)), dtype=bool)
+            for column, (lo, hi) in limits.items():
+                with np.errstate(invalid="ignore"):
+                    if lo is not None:
+                        ok &= ranked[column] >= _rows(lo, rows)
+                    if hi is not None:
+                        ok &= ranked[column] <= _rows(hi, rows)
+            first = np.argsort(~ok, axis=1, kind="stable")[:, :top_k]
+            found = np.take_along_axis(ok, first, axis=1)
+            picks[rows, :first.shape[1]] = np.where(found, order[first], -1)
+        return picks
+
+    def lightest(self, by: str = "W", **bounds):
+        """Label of the lightest qualifying shape (None if none) — one label
+        for scalar bounds, an object array for arrays of demands."""
+        picks = self.select(by=by, top_k=1, **bounds)[:, 0]
+        labels = np.full(picks.shape, None, dtype=object)
+        hit = picks >= 0
+        labels[hit] = self.labels[picks[hit]]  # never index with -1 (empty sets)
+        scalar = all(np.ndim(self._magnitude(c, end)) == 0
+                     for c, pair in bounds.items() for end in pair
+                     if end is not None)
+        return labels[0] if scalar else labels
+
+    def lrfd_args(self, check) -> dict:
+        """Per-shape arrays for the I-girder arguments ``check`` accepts
+        (b_fc/b_ft = bf, t_fc/t_ft = tf, t_w = tw, web depth d_web = d - 2tf,
+        d_c = d_web/2 for the doubly symmetric noncomposite section), ready
+        for ``check.batch(**shapes.lrfd_args(check), ...)``."""
+        types = self.table.frame["Type"].to_numpy(dtype=object)[self.positions]
+        if not np.isin(types, _I_SHAPES).all():
+            raise ValueError(
+                f"lrfd_args needs I-shapes; use {'/'.join(_I_SHAPES)} rows only"
+            )
+        bf, tf, tw, d = self["bf"], self["tf"], self["tw"], self["d"]
+        d_web = d - 2.0 * tf
+        mapping = {"b_fc": bf, "t_fc": tf, "b_ft": bf, "t_ft": tf, "t_w": tw,
+                   "d_web": d_web, "d_c": d_web / 2.0}
+        accepted = inspect.signature(check).parameters
+        return {k: v for k, v in mapping.items() if k in accepted}
+
+    def sections(self, cls=None) -> list:
+        """Full section objects (default :class:`SteelSection`) for every
+        shape in the set — the pint boundary for a short list of picks."""
+        cls = SteelSection if cls is None else cls
+        return [cls(label) for label in self.labels]
+
+    def to_dataframe(self, columns=("W",)):
+        """Labels plus the requested raw numeric columns."""
+        import pandas as pd
+
+        data = {"EDI_Std_Nomenclature": self.labels}
+        data.update({c: self[c] for c in columns})
+        return pd.DataFrame(data)
+
+    @staticmethod
+    def _magnitude(column: str, value):
+        if hasattr(value, "to"):
+            return value.to(SHAPE_COLUMN_UNITS[column]).magnitude
+        return np.asarray(value, dtype=float) if np.ndim(value) else value
+
+
+def _rows(values: np.ndarray, rows: slice) -> np.ndarray:
+    return (values if values.shape[0] == 1 else values[rows])[:, None]
+
+
+def shapes(shape_type: str | None = None) -> ShapeSet:
+    """All AISC shapes, or those of one table ``Type`` ("W", "HP", "C",
+    "L", "HSS", "PIPE", ...), as a :class:`ShapeSet`."""
+    if shape_type is None:
+        return ShapeSet(np.arange(len(shape_table.frame)))
+    return ShapeSet(shape_table.positions(Type=shape_type.upper()))
+
+
 def get_bolt_weights(length: float, diameter: float, no_of_washers: int) -> float:
     """
     Function to get the bolt weights from the A325_bolt_weights dictionary and calculate the weight per bolt if it's
@@ -704,31 +893,12 @@ class HistoricSteelSection:
         :return: dataframe of raw values from AISC Shape Table
         """
         if designation:
-            try:
-                shape_values = historic_steel_tables[
-                    (historic_steel_tables["Name"] == self.id) &
-                    (historic_steel_tables["Designation"] == designation)
-                ]
-                return shape_values
-            except KeyError as e:  # pragma: no cover
-                print(
-                    "Value not found in shape table,"
-                    "check spelling and try again"
-                    f"\n\n{e}"
-                )
-        else:
-            try:
-                shape_values = historic_steel_tables[historic_steel_tables["Name"] == self.id]
-                if len(shape_values) > 1:
-                    raise Exception('Multiple values found for "' + self.id + '", use the Designation column to specify')
-                else:
-                    return shape_values
-            except KeyError as e:  # pragma: no cover
-                print(
-                    "Value not found in shape table,"
-                    "check spelling and try again"
-                    f"\n\n{e}"
-                )
+            return historic_shape_table.lookup(Name=self.id, Designation=designation)
+        shape_values = historic_shape_table.lookup(Name=self.id)
+        if len(shape_values) > 1:
+            raise Exception('Multiple values found for "' + self.id
+                            + '", use the Designation column to specify')
+        return shape_values
 
 
 class WF(HistoricSteelSection):
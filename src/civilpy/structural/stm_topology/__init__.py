@@ -36,7 +36,7 @@ Typical use::
 
 from .problem import DRegionProblem, Material, Support, Load
 from .mesh import GroundMesh
-from .simp import optimize_density, DensityResult
+from .simp import optimize_density, optimize_density_multilevel, DensityResult
 from .extract import (
     extract_truss, refine_truss, layout_optimize_truss, is_stable,
 )
@@ -50,7 +50,7 @@ from .cost import (
 
 __all__ = [
     "DRegionProblem", "Material", "Support", "Load",
-    "GroundMesh", "optimize_density", "DensityResult",
+    "GroundMesh", "optimize_density", "optimize_density_multilevel", "DensityResult",
     "extract_truss", "refine_truss", "layout_optimize_truss", "is_stable",
     "optimize_to_stm", "STMResult",
     "optimize_pier_cap", "PierCapDesign", "DepthCandidate",
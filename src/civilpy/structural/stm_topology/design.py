@@ -34,11 +34,20 @@ dominates cost — that satisfies the design gates:
 
 The cap *length* is fixed by the girder layout plus an edge distance, and the
 *width* by the columns/bearings, so depth is the free dimension.
+
+Each depth is an independent SIMP + extraction + design run, so the sweep can
+fan out over a process pool (``max_workers``); results come back in sweep
+order regardless of which worker finishes first.  With ``early_stop`` a depth
+whose concrete cost alone already exceeds the best feasible total is skipped —
+concrete grows with depth while steel cost is never negative, so such a depth
+can never win.
 """
 
 from __future__ import annotations
 
 import math
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -72,6 +81,7 @@ class PierCapDesign:
     span: float = 0.0
     thickness: float = 0.0
     min_strut_angle: float = 25.0
+    skipped: list[float] = field(default_factory=list)   # depths pruned by early_stop
 
     # convenience pass-throughs to the optimal design
     @property
@@ -146,6 +156,91 @@ def governing_strut_angle(load_xs, column_xs, depth) -> float:
     return 90.0 if a < 1e-6 else math.degrees(math.atan(depth / a))
 
 
+@dataclass(frozen=True)
+class _CapSpec:
+    """Everything a worker needs to evaluate one depth; sent to each pool
+    process once (at start-up) rather than with every task."""
+
+    loads: tuple
+    load_xs: tuple
+    column_xs: tuple
+    f_c: float
+    thickness: float
+    edge_lo: float
+    span: float
+    vol_frac: float
+    nelx: int
+    column_bearing: float
+    load_bearing: float
+    min_strut_angle: float
+    pin_column: int
+    book: dict
+    pcc: float
+    psl: float
+
+    def concrete_cost(self, depth: float) -> float:
+        return (self.span * depth * self.thickness / 27.0) * self.pcc
+
+
+_WORKER_SPEC: _CapSpec | None = None
+
+
+def _init_worker(spec: _CapSpec):
+    global _WORKER_SPEC
+    _WORKER_SPEC = spec
+
+
+def _evaluate_in_worker(depth: float) -> DepthCandidate:
+    return _evaluate_depth(_WORKER_SPEC, depth)
+
+
+def _evaluate_depth(spec: _CapSpec, depth: float) -> DepthCandidate:
+    """Run the STM pipeline at one cap depth and grade it against the gates."""
+    prob = DRegionProblem.rectangle(spec.span, depth, thickness=spec.thickness,
+                                    origin=(spec.edge_lo, 0.0),
+                                    material=Material(f_c=spec.f_c),
+                                    vol_frac=spec.vol_frac)
+    for i, cx in enumerate(spec.column_xs):
+        prob.add_support(cx, 0.0, fix_x=(i == spec.pin_column), fix_y=True,
+                         bearing=spec.column_bearing)
+    for lx, P in zip(spec.load_xs, spec.loads):
+        prob.add_load(lx, depth, fy=-P, bearing=spec.load_bearing)
+    # a slender cap needs more columns to keep enough mesh rows for a
+    # reliable extraction; cap it so the sweep stays quick
+    nelx_d = min(150, max(spec.nelx, int(math.ceil(16.0 * spec.span / depth))))
+    res = prob.solve(nelx=nelx_d, prices=spec.book)
+
+    concrete_cost = spec.concrete_cost(depth)
+    steel_lb = res.report.cost.steel_lb if res.report.cost else 0.0
+    cost = concrete_cost + steel_lb * spec.psl
+    angle = governing_strut_angle(spec.load_xs, spec.column_xs, depth)
+    checks = res.report.node_checks or []
+    node_ratio = min((c.ratio for c in checks), default=float("inf"))
+    nodes_ok = all(c.ok for c in checks)
+    max_tie = max((t.force for t in res.report.ties), default=0.0)
+    m = res.model
+    total_load = sum(spec.loads)
+    ry = sum(v[1] for v in (m.reactions or {}).values())
+    complete = (len(m.loads) == len(spec.loads)
+                and len(m.supports) == len(spec.column_xs)
+                and abs(ry - total_load) < 0.02 * total_load)
+    feasible = bool(res.stable and complete
+                    and angle >= spec.min_strut_angle and nodes_ok)
+    return DepthCandidate(depth=depth, cost=cost, concrete_cost=concrete_cost,
+                          steel_lb=steel_lb, strut_angle=angle,
+                          node_ratio=node_ratio, max_tie=max_tie,
+                          complete=complete, feasible=feasible, result=res)
+
+
+def _dominated(spec: _CapSpec, depth: float, done: dict, index: int) -> bool:
+    """True when a feasible candidate earlier in the sweep already costs no
+    more than this depth's concrete alone.  Judging only against *earlier*
+    candidates keeps the pruning identical however the pool schedules work."""
+    best = min((c.cost for i, c in done.items() if i < index and c.feasible),
+               default=math.inf)
+    return spec.concrete_cost(depth) >= best
+
+
 def optimize_pier_cap(loads, load_xs, column_xs, *, f_c: float = 5.0,
                       f_y: float = 60.0, thickness: float = 4.0,
                       depth_bounds: tuple[float, float] = (4.0, 12.0),
@@ -155,7 +250,8 @@ def optimize_pier_cap(loads, load_xs, column_xs, *, f_c: float = 5.0,
                       min_strut_angle: float = 25.0,
                       price_concrete_cy: float | None = None,
                       price_steel_lb: float | None = None, prices=None,
-                      pin_column: int | None = None) -> PierCapDesign:
+                      pin_column: int | None = None, max_workers: int | None = 1,
+                      early_stop: bool = False) -> PierCapDesign:
     """Find the most economical pier-cap depth for a set of girder reactions.
 
     Parameters
@@ -179,6 +275,13 @@ def optimize_pier_cap(loads, load_xs, column_xs, *, f_c: float = 5.0,
     pin_column:
         Index of the laterally-restrained (pinned) column; defaults to the one
         nearest mid-length, the rest acting as vertical rollers.
+    max_workers:
+        Processes evaluating depths in parallel; ``1`` (default) runs in this
+        process, ``None`` uses every CPU.  Candidates are returned in sweep
+        order either way.
+    early_stop:
+        Skip depths whose concrete cost alone is no less than a cheaper
+        feasible depth's total; their depths land in ``skipped``.
 
     Returns
     -------
@@ -196,48 +299,51 @@ def optimize_pier_cap(loads, load_xs, column_xs, *, f_c: float = 5.0,
     if pin_column is None:
         pin_column = min(range(len(column_xs)),
                          key=lambda i: abs(column_xs[i] - (x_lo + span / 2)))
-    total_load = sum(loads)
+    spec = _CapSpec(loads=tuple(loads), load_xs=tuple(load_xs),
+                    column_xs=tuple(column_xs), f_c=f_c, thickness=thickness,
+                    edge_lo=x_lo, span=span, vol_frac=vol_frac, nelx=nelx,
+                    column_bearing=column_bearing, load_bearing=load_bearing,
+                    min_strut_angle=min_strut_angle, pin_column=pin_column,
+                    book=dict(book), pcc=pcc, psl=psl)
+    depths = [float(d) for d in np.linspace(*depth_bounds, n_depths)]
 
-    candidates: list[DepthCandidate] = []
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    done: dict[int, DepthCandidate] = {}
+    skipped: set[int] = set()
+    if max_workers <= 1 or len(depths) <= 1:
+        for i, depth in enumerate(depths):
+            if early_stop and _dominated(spec, depth, done, i):
+                skipped.add(i)
+                continue
+            done[i] = _evaluate_depth(spec, depth)
+    else:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(depths)),
+                                 initializer=_init_worker,
+                                 initargs=(spec,)) as pool:
+            pending = {pool.submit(_evaluate_in_worker, d): i
+                       for i, d in enumerate(depths)}
+            while pending:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for fut in finished:
+                    done[pending.pop(fut)] = fut.result()
+                if early_stop:
+                    for fut, i in list(pending.items()):
+                        if _dominated(spec, depths[i], done, i) and fut.cancel():
+                            del pending[fut]
+        if early_stop:
+            # apply the same in-order rule the serial sweep uses, so the
+            # outcome does not depend on which worker finished first
+            for i in sorted(done):
+                if _dominated(spec, depths[i], done, i):
+                    del done[i]
+            skipped = set(range(len(depths))) - set(done)
+
+    candidates = [done[i] for i in sorted(done)]
     best: DepthCandidate | None = None
-    for depth in np.linspace(*depth_bounds, n_depths):
-        depth = float(depth)
-        prob = DRegionProblem.rectangle(span, depth, thickness=thickness,
-                                        origin=(x_lo, 0.0),
-                                        material=Material(f_c=f_c),
-                                        vol_frac=vol_frac)
-        for i, cx in enumerate(column_xs):
-            prob.add_support(cx, 0.0, fix_x=(i == pin_column), fix_y=True,
-                             bearing=column_bearing)
-        for lx, P in zip(load_xs, loads):
-            prob.add_load(lx, depth, fy=-P, bearing=load_bearing)
-        # a slender cap needs more columns to keep enough mesh rows for a
-        # reliable extraction; cap it so the sweep stays quick
-        nelx_d = min(150, max(nelx, int(math.ceil(16.0 * span / depth))))
-        res = prob.solve(nelx=nelx_d, prices=book)
-
-        concrete_cost = (span * depth * thickness / 27.0) * pcc
-        steel_lb = res.report.cost.steel_lb if res.report.cost else 0.0
-        cost = concrete_cost + steel_lb * psl
-        angle = governing_strut_angle(load_xs, column_xs, depth)
-        checks = res.report.node_checks or []
-        node_ratio = min((c.ratio for c in checks), default=float("inf"))
-        nodes_ok = all(c.ok for c in checks)
-        max_tie = max((t.force for t in res.report.ties), default=0.0)
-        m = res.model
-        ry = sum(v[1] for v in (m.reactions or {}).values())
-        complete = (len(m.loads) == len(loads)
-                    and len(m.supports) == len(column_xs)
-                    and abs(ry - total_load) < 0.02 * total_load)
-        feasible = bool(res.stable and complete
-                        and angle >= min_strut_angle and nodes_ok)
-        cand = DepthCandidate(depth=depth, cost=cost, concrete_cost=concrete_cost,
-                              steel_lb=steel_lb, strut_angle=angle,
-                              node_ratio=node_ratio, max_tie=max_tie,
-                              complete=complete, feasible=feasible, result=res)
-        candidates.append(cand)
-        if feasible and (best is None or cost < best.cost):
+    for cand in candidates:
+        if cand.feasible and (best is None or cand.cost < best.cost):
             best = cand
-
     return PierCapDesign(optimal=best, candidates=candidates, span=span,
-                         thickness=thickness, min_strut_angle=min_strut_angle)
+                         thickness=thickness, min_strut_angle=min_strut_angle,
+                         skipped=[depths[i] for i in sorted(skipped)])
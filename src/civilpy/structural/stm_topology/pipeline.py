@@ -28,7 +28,7 @@ from dataclasses import dataclass
 import numpy as np
 
 from .mesh import GroundMesh
-from .simp import optimize_density, DensityResult
+from .simp import optimize_density, optimize_density_multilevel, DensityResult
 from .extract import extract_truss, refine_truss
 from . import cost as _cost
 
@@ -90,19 +90,32 @@ class STMResult:
 def optimize_to_stm(problem, *, nelx: int = 120, threshold: float = 0.3,
                     merge: float | None = None, penal: float = 3.0,
                     rmin: float | None = None, max_iter: int = 120,
-                    fully_stressed: bool = True, verbose: bool = False,
-                    **price_kwargs) -> STMResult:
+                    fully_stressed: bool = True, levels: int = 1,
+                    penal_start: float | None = None, solver: str = "direct",
+                    verbose: bool = False, **price_kwargs) -> STMResult:
     """Run the full pipeline and return an :class:`STMResult`.
 
     Extraction skeletonizes the SIMP field for node positions, then solves an LP
     plastic truss layout optimization for the discrete load path; the resulting
     model carries its own member forces and reactions (an equilibrium load path,
     so no separate solve is needed).
+
+    ``levels > 1`` runs SIMP coarse-to-fine
+    (:func:`~civilpy.structural.stm_topology.simp.optimize_density_multilevel`):
+    the load path is found on meshes 2, 4, ... times coarser and only refined at
+    ``nelx``; ``penal_start`` adds penalty continuation across those levels.
+    ``solver`` selects the SIMP linear-solve backend.
     """
-    mesh = GroundMesh(problem, nelx=nelx)
-    density = optimize_density(mesh, vol_frac=problem.vol_frac, penal=penal,
-                               rmin=rmin, max_iter=max_iter, nu=problem.material.nu,
-                               verbose=verbose)
+    if levels > 1:
+        density = optimize_density_multilevel(
+            problem, nelx, levels=levels, vol_frac=problem.vol_frac, penal=penal,
+            penal_start=penal_start, rmin=rmin, max_iter=max_iter,
+            nu=problem.material.nu, solver=solver, verbose=verbose)
+    else:
+        mesh = GroundMesh(problem, nelx=nelx)
+        density = optimize_density(mesh, vol_frac=problem.vol_frac, penal=penal,
+                                   rmin=rmin, max_iter=max_iter, nu=problem.material.nu,
+                                   solver=solver, verbose=verbose)
 
     model, used, stable = _extract_stable(density, threshold, merge, verbose)
 
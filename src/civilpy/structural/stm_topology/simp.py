@@ -23,19 +23,29 @@ result is a ``(nely, nelx)`` density field — the picture of where concrete wan
 to be — which :mod:`~civilpy.structural.stm_topology.extract` turns into a truss.
 
 Pure NumPy/SciPy; no ``scikit-fem`` needed because the structured grid lets us
-use the closed-form element stiffness directly.
+use the closed-form element stiffness directly.  The sparsity pattern of the
+free-DOF stiffness never changes between iterations, so it is built once
+(:class:`AssemblyPlan`) and each iteration only rewrites the matrix values; the
+linear solve can be a fresh direct factor, a CHOLMOD factor that keeps its
+symbolic analysis, or a CG warm-started from the last displacements and
+preconditioned by an earlier factorization.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import inspect
+from dataclasses import dataclass, field
 
 import numpy as np
 import scipy.sparse as sp
-from scipy.sparse.linalg import spsolve
+from scipy.interpolate import RegularGridInterpolator
+from scipy.sparse.linalg import LinearOperator, cg, splu
 
 from .mesh import GroundMesh
 
+# SciPy 1.12 renamed cg's relative tolerance from ``tol`` to ``rtol``
+_CG_RTOL = "rtol" if "rtol" in inspect.signature(cg).parameters else "tol"
+
 
 def element_stiffness(nu: float) -> np.ndarray:
     """8x8 plane-stress Q4 element stiffness for unit modulus and size
@@ -58,23 +68,147 @@ def element_stiffness(nu: float) -> np.ndarray:
 
 
 def _filter_matrix(nelx, nely, rmin):
-    """Cone-weighted density-filter operator H (normalized rows)."""
+    """Cone-weighted density-filter operator H (normalized rows), built one
+    stencil offset at a time over every element."""
     span = int(np.ceil(rmin)) - 1
+    i, j = (a.ravel() for a in np.meshgrid(np.arange(nelx), np.arange(nely),
+                                            indexing="ij"))
+    e1 = j + i * nely
     iH, jH, sH = [], [], []
-    for i in range(nelx):
-        for j in range(nely):
-            e1 = j + i * nely
-            for ii in range(max(i - span, 0), min(i + span + 1, nelx)):
-                for jj in range(max(j - span, 0), min(j + span + 1, nely)):
-                    e2 = jj + ii * nely
-                    w = rmin - np.hypot(i - ii, j - jj)
-                    if w > 0:
-                        iH.append(e1); jH.append(e2); sH.append(w)
-    H = sp.coo_matrix((sH, (iH, jH)), shape=(nelx * nely, nelx * nely)).tocsr()
+    for di in range(-span, span + 1):
+        for dj in range(-span, span + 1):
+            w = rmin - np.hypot(di, dj)
+            if w <= 0:
+                continue
+            ii, jj = i + di, j + dj
+            ok = (ii >= 0) & (ii < nelx) & (jj >= 0) & (jj < nely)
+            iH.append(e1[ok]); jH.append((jj + ii * nely)[ok])
+            sH.append(np.full(int(ok.sum()), w))
+    H = sp.coo_matrix((np.concatenate(sH), (np.concatenate(iH), np.concatenate(jH))),
+                      shape=(nelx * nely, nelx * nely)).tocsr()
     Hs = np.asarray(H.sum(axis=1)).ravel()
     return H, Hs
 
 
+class AssemblyPlan:
+    """Sparse structure of the free-DOF stiffness ``K[free][:, free]``,
+    precomputed once per mesh and support layout.
+
+    ``scatter`` is a ``(nnz, n_elements)`` matrix taking the per-element
+    modulus vector straight to the CSC ``data`` array (the Q4 ``KE`` entries,
+    summed into their global slot, with every row/column on a fixed DOF
+    dropped), so an iteration's assembly is a single sparse mat-vec instead
+    of COO build, duplicate summing and two fancy-index slices.
+    """
+
+    def __init__(self, edof_mat: np.ndarray, KE: np.ndarray, free: np.ndarray,
+                 ndof: int):
+        n_el = edof_mat.shape[0]
+        # entry KE[a, b] of element e lands on (edof[e, a], edof[e, b])
+        rows = np.repeat(edof_mat, 8, axis=1).ravel()
+        cols = np.tile(edof_mat, (1, 8)).ravel()
+        free_of = np.full(ndof, -1, dtype=np.int64)
+        free_of[free] = np.arange(free.size)
+        fr, fc = free_of[rows], free_of[cols]
+        keep = (fr >= 0) & (fc >= 0)
+        nf = free.size
+        lin = fr[keep] * nf + fc[keep]
+        uniq, slot = np.unique(lin, return_inverse=True)
+        # CSC order is column-major: sort the unique (row, col) by col then row
+        r_u, c_u = uniq // nf, uniq % nf
+        order = np.lexsort((r_u, c_u))
+        position = np.empty(uniq.size, dtype=np.int64)
+        position[order] = np.arange(uniq.size)
+        self.free = free
+        self.indices = r_u[order].astype(np.int32)
+        self.indptr = np.searchsorted(c_u[order], np.arange(nf + 1)).astype(np.int32)
+        element = np.repeat(np.arange(n_el), 64)[keep]
+        values = np.tile(KE.ravel(), n_el)[keep]
+        self.scatter = sp.csr_matrix((values, (position[slot], element)),
+                                     shape=(uniq.size, n_el))
+        self.shape = (nf, nf)
+
+    def assemble(self, modulus: np.ndarray) -> sp.csc_matrix:
+        """Free-DOF stiffness for the per-element ``modulus`` vector."""
+        return sp.csc_matrix((self.scatter @ modulus, self.indices, self.indptr),
+                             shape=self.shape)
+
+
+class _Solver:
+    """Linear solve of ``K u = f`` across SIMP iterations.
+
+    ``"direct"`` re-factors every iteration (SuperLU in symmetric mode — ``K``
+    is SPD, so no pivoting search and a minimum-degree ordering on ``K + K^T``);
+    ``"cholmod"`` keeps CHOLMOD's symbolic analysis and only redoes the
+    numeric factorization (needs ``scikit-sparse``); ``"pcg"`` runs conjugate
+    gradients from the previous displacements, preconditioned by an earlier
+    sparse LU.  Once the layout settles (after the first dozen or so
+    iterations) CG converges in a handful of steps, each far cheaper than a
+    factorization; whenever it needs more than ``refactor_after`` steps the
+    preconditioner is refreshed at the next iteration.
+    """
+
+    def __init__(self, method: str, rtol: float = 1e-8, refactor_after: int = 6):
+        if method not in ("direct", "cholmod", "pcg"):
+            raise ValueError(f"unknown solver {method!r}; use direct/cholmod/pcg")
+        if method == "cholmod":
+            try:
+                from sksparse.cholmod import cholesky  # noqa: F401
+            except ImportError as exc:
+                raise ImportError(
+                    "solver='cholmod' needs scikit-sparse: pip install scikit-sparse"
+                ) from exc
+        self.method, self.rtol, self.refactor_after = method, rtol, refactor_after
+        self._factor = None
+        self._stale = True
+        self._u = None
+        self.factorizations = 0
+        self.cg_iterations = 0
+
+    def solve(self, K: sp.csc_matrix, f: np.ndarray) -> np.ndarray:
+        if self.method == "direct":
+            self._refactor(K)
+            return self._factor.solve(f)
+        if self.method == "cholmod":
+            from sksparse.cholmod import cholesky
+            if self._factor is None:
+                self._factor = cholesky(K)
+            else:
+                self._factor.cholesky_inplace(K)
+            self.factorizations += 1
+            return self._factor(f)
+        return self._pcg(K, f)
+
+    def _pcg(self, K, f):
+        if self._stale:
+            self._refactor(K)
+            self._stale = False
+            self._u = self._factor.solve(f)
+            return self._u
+        count = [0]
+
+        def tick(_):
+            count[0] += 1
+
+        M = LinearOperator(K.shape, matvec=self._factor.solve, dtype=float)
+        u, info = cg(K, f, x0=self._u, atol=0.0, M=M, maxiter=3 * self.refactor_after,
+                     callback=tick, **{_CG_RTOL: self.rtol})
+        self.cg_iterations += count[0]
+        if info != 0:
+            # the preconditioner has drifted too far from K: solve directly
+            self._refactor(K)
+            u = self._factor.solve(f)
+        elif count[0] > self.refactor_after:
+            self._stale = True
+        self._u = u
+        return u
+
+    def _refactor(self, K):
+        self._factor = splu(K, permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0,
+                            options={"SymmetricMode": True})
+        self.factorizations += 1
+
+
 @dataclass
 class DensityResult:
     """Output of the SIMP optimizer."""
@@ -84,17 +218,26 @@ class DensityResult:
     compliance: float
     iterations: int
     history: list                # compliance per iteration
+    # (nelx, iterations, penal) per mesh of a coarse-to-fine run
+    levels: list = field(default_factory=list)
 
 
 def optimize_density(mesh: GroundMesh, *, vol_frac: float = 0.3, penal: float = 3.0,
                      rmin: float | None = None, max_iter: int = 120,
                      move: float = 0.2, tol: float = 0.01,
-                     nu: float = 0.2, verbose: bool = False) -> DensityResult:
+                     nu: float = 0.2, solver: str = "direct",
+                     x_init: np.ndarray | None = None,
+                     verbose: bool = False) -> DensityResult:
     """Run SIMP on ``mesh`` and return the optimized density field.
 
     ``vol_frac`` is the target solid fraction of the *active* (optimizable)
     region.  ``rmin`` (filter radius, element units) defaults to ~3% of the
-    width.  Supports/loads come from ``mesh.problem``.
+    width.  Supports/loads come from ``mesh.problem``.  ``solver`` picks the
+    linear-solve backend: ``"direct"`` (default), ``"cholmod"`` (reused
+    symbolic Cholesky, needs ``scikit-sparse``) or ``"pcg"`` (warm-started CG
+    preconditioned by a reused LU) — see :class:`_Solver`.  ``x_init`` is an
+    optional ``(nely, nelx)`` starting design (e.g. :func:`upsample_density`
+    of a coarser result) in place of the uniform ``vol_frac`` field.
     """
     nelx, nely = mesh.nelx, mesh.nely
     n = nelx * nely
@@ -103,9 +246,8 @@ def optimize_density(mesh: GroundMesh, *, vol_frac: float = 0.3, penal: float =
 
     KE = element_stiffness(nu)
     edofMat = mesh.edof_matrix()
-    iK = np.kron(edofMat, np.ones((8, 1))).flatten()
-    jK = np.kron(edofMat, np.ones((1, 8))).flatten()
     ndof = mesh.n_dofs
+    linear = _Solver(solver)
 
     # loads → global force vector, spread over each load's bearing nodes
     F = np.zeros(ndof)
@@ -136,10 +278,17 @@ def optimize_density(mesh: GroundMesh, *, vol_frac: float = 0.3, penal: float =
         raise ValueError("no loads applied — add at least one Load to the problem")
     if len(fixed) == 0:
         raise ValueError("no supports — add at least one fixed Support")
+    plan = AssemblyPlan(edofMat, KE, free, ndof)
 
     Emin, E0 = 1e-9, 1.0
     x = np.zeros(n)
-    x[active] = vol_frac
+    if x_init is None:
+        x[active] = vol_frac
+    else:
+        if np.shape(x_init) != (nely, nelx):
+            raise ValueError(f"x_init must have shape {(nely, nelx)}, "
+                             f"got {np.shape(x_init)}")
+        x[active] = np.clip(np.asarray(x_init, float).ravel(order="F")[active], 0.0, 1.0)
     x[passive_full] = 1.0
     xPhys = x.copy()
 
@@ -148,12 +297,9 @@ def optimize_density(mesh: GroundMesh, *, vol_frac: float = 0.3, penal: float =
     it = 0
     while change > tol and it < max_iter:
         it += 1
-        sK = (KE.flatten()[:, None] *
-              (Emin + xPhys ** penal * (E0 - Emin))[None, :]).flatten(order="F")
-        K = sp.coo_matrix((sK, (iK, jK)), shape=(ndof, ndof)).tocsc()
-        K = K[free, :][:, free]
+        K = plan.assemble(Emin + xPhys ** penal * (E0 - Emin))
         U = np.zeros(ndof)
-        U[free] = spsolve(K, F[free])
+        U[free] = linear.solve(K, F[free])
 
         ce = np.einsum("ij,jk,ik->i", U[edofMat], KE, U[edofMat])
         c = float(((Emin + xPhys ** penal * (E0 - Emin)) * ce).sum())
@@ -180,6 +326,78 @@ def optimize_density(mesh: GroundMesh, *, vol_frac: float = 0.3, penal: float =
                          iterations=it, history=history)
 
 
+def upsample_density(density: np.ndarray, coarse: GroundMesh,
+                     fine: GroundMesh) -> np.ndarray:
+    """Bilinear interpolation of a ``(nely, nelx)`` density field on
+    ``coarse`` onto the element centroids of ``fine`` (same region, finer
+    grid); centroids past the outermost coarse ones take the edge value."""
+    xs = coarse.cx[0]
+    ys = coarse.cy[::-1, 0]                     # ascending (row 0 is the top)
+    interp = RegularGridInterpolator((ys, xs), np.asarray(density)[::-1],
+                                     bounds_error=False, fill_value=None)
+    qy = np.clip(fine.cy, ys[0], ys[-1])
+    qx = np.clip(fine.cx, xs[0], xs[-1])
+    out = interp(np.column_stack([qy.ravel(), qx.ravel()]))
+    return np.clip(out.reshape(fine.nely, fine.nelx), 0.0, 1.0)
+
+
+def optimize_density_multilevel(problem, nelx: int = 120, *, levels: int = 3,
+                                vol_frac: float = 0.3, penal: float = 3.0,
+                                penal_start: float | None = None,
+                                rmin: float | None = None, max_iter: int = 120,
+                                refine_iter: int | None = None,
+                                move: float = 0.2, tol: float = 0.01,
+                                nu: float = 0.2, solver: str = "direct",
+                                verbose: bool = False) -> DensityResult:
+    """Coarse-to-fine SIMP: optimize on a coarse grid, interpolate the density
+    onto a grid twice as fine, and continue, ending at ``nelx`` elements wide.
+
+    The coarse meshes find the rough load path for a fraction of the cost;
+    the finer ones only sharpen it, so they run at most ``refine_iter``
+    iterations (default ``max_iter // 3``).  ``levels`` counts the meshes
+    (``levels=1`` is plain :func:`optimize_density`); the coarsest is
+    ``nelx / 2**(levels-1)`` wide (never under 8 elements).  ``penal_start``
+    turns on penalty continuation: the SIMP exponent steps linearly from
+    ``penal_start`` on the coarsest mesh to ``penal`` on the finest, which
+    keeps the early, coarse passes away from premature 0/1 layouts.  ``rmin``
+    is in finest-mesh element units and is scaled down on the coarse grids so
+    the physical filter radius stays the same.  The result is on the finest
+    mesh; ``history`` and ``iterations`` cover every level.
+    """
+    if levels < 1:
+        raise ValueError("levels must be >= 1")
+    widths = [max(8, int(round(nelx / 2 ** k))) for k in range(levels - 1, -1, -1)]
+    widths[-1] = int(nelx)
+    if penal_start is None:
+        penalties = [penal] * levels
+    else:
+        penalties = np.linspace(penal_start, penal, levels).tolist()
+    if refine_iter is None:
+        refine_iter = max(1, max_iter // 3)
+
+    history, summary, result, prev_mesh = [], [], None, None
+    for k, (width, p) in enumerate(zip(widths, penalties)):
+        mesh = GroundMesh(problem, nelx=width)
+        x_init = None
+        if result is not None:
+            x_init = upsample_density(result.density, prev_mesh, mesh)
+        level_rmin = None if rmin is None else max(1.5, rmin * width / nelx)
+        if verbose:
+            print(f"level {k + 1}/{levels}: {mesh.nelx}x{mesh.nely}, penal={p:.2f}")
+        result = optimize_density(
+            mesh, vol_frac=vol_frac, penal=p, rmin=level_rmin,
+            max_iter=max_iter if k == 0 else refine_iter, move=move, tol=tol,
+            nu=nu, solver=solver, x_init=x_init, verbose=verbose)
+        history.extend(result.history)
+        summary.append((mesh.nelx, result.iterations, p))
+        prev_mesh = mesh
+
+    return DensityResult(density=result.density, mesh=result.mesh,
+                         compliance=result.compliance,
+                         iterations=sum(lv[1] for lv in summary),
+                         history=history, levels=summary)
+
+
 def _oc_update(x, dc, dv, active, passive_full, vol_frac, move, n_active):
     """Bisection optimality-criteria update, constrained to active elements
     with the target volume measured over the active region."""
@@ -51,15 +51,206 @@ midspan top, 4 ft deep:
 #  along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import math
+import time
 import warnings
+from dataclasses import dataclass
 
 import matplotlib.pyplot as plt
 import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+
+@dataclass(frozen=True)
+class _MemberGeometry:
+    """Member connectivity and direction cosines as arrays (one row per
+    entry of ``StrutAndTieModel.members``)."""
+
+    node_index: dict
+    ia: np.ndarray
+    ib: np.ndarray
+    cx: np.ndarray
+    cy: np.ndarray
+    length: np.ndarray
+
+    @property
+    def dofs(self) -> np.ndarray:
+        """``(n_members, 4)`` global DOF of each member's ends (xa, ya, xb, yb)."""
+        return np.column_stack([2 * self.ia, 2 * self.ia + 1,
+                                2 * self.ib, 2 * self.ib + 1])
+
+
+def _csc_pattern(rows, cols, shape):
+    """CSC matrix holding the union pattern of ``(rows, cols)`` plus the
+    position in its ``data`` array of every input triplet."""
+    lin = rows.astype(np.int64) * shape[1] + cols
+    uniq, inverse = np.unique(lin, return_inverse=True)
+    order = sp.coo_matrix((np.arange(1, uniq.size + 1, dtype=float),
+                           (uniq // shape[1], uniq % shape[1])),
+                          shape=shape).tocsc()
+    position = np.empty(uniq.size, dtype=np.int64)
+    position[order.data.astype(np.int64) - 1] = np.arange(uniq.size)
+    order.data = np.zeros(uniq.size)
+    return order, position[inverse]
+
+
+@dataclass
+class _StiffnessPlan:
+    """Fixed sparsity of ``K`` and of its free-DOF block for one geometry and
+    support layout.  Member stiffnesses are scattered straight into the CSC
+    ``data`` arrays, so a resize re-assembles without rebuilding structure."""
+
+    free_idx: np.ndarray
+    unit: np.ndarray                # (n_members, 16) entries of c c^T
+    k: sp.csc_matrix
+    k_slot: np.ndarray              # (n_members * 16,) position in k.data
+    kff: sp.csc_matrix
+    kff_slot: np.ndarray            # position in kff.data, -1 off the free block
+    b: sp.csc_matrix                # (n_free, n_members) member vectors c
+
+    @classmethod
+    def build(cls, geom: _MemberGeometry, free_idx: np.ndarray, ndof: int):
+        c = np.column_stack([geom.cx, geom.cy, -geom.cx, -geom.cy])
+        unit = (c[:, :, None] * c[:, None, :]).reshape(-1, 16)
+        dofs = geom.dofs
+        rows = np.repeat(dofs, 4, axis=1).ravel()
+        cols = np.tile(dofs, (1, 4)).ravel()
+        k, k_slot = _csc_pattern(rows, cols, (ndof, ndof))
+        free_of = np.full(ndof, -1)
+        free_of[free_idx] = np.arange(free_idx.size)
+        fr, fc = free_of[rows], free_of[cols]
+        inside = (fr >= 0) & (fc >= 0)
+        nf = free_idx.size
+        kff, slot_in = _csc_pattern(fr[inside], fc[inside], (nf, nf))
+        kff_slot = np.full(rows.size, -1, dtype=np.int64)
+        kff_slot[inside] = slot_in
+        bd = free_of[dofs]
+        keep = bd >= 0
+        b = sp.coo_matrix((c[keep], (bd[keep], np.nonzero(keep)[0])),
+                          shape=(nf, len(geom.ia))).tocsc()
+        return cls(free_idx, unit, k, k_slot, kff, kff_slot, b)
+
+    def scatter(self, matrix: str, axial: np.ndarray, members=None,
+                base: sp.csc_matrix | None = None) -> sp.csc_matrix:
+        """``K`` (``matrix="k"``) or its free block (``"kff"``) for member
+        stiffnesses ``axial``.  With ``members`` and ``base`` only those
+        members' entries are added onto a copy of ``base`` (``axial`` is then
+        the stiffness *change*)."""
+        template = self.k if matrix == "k" else self.kff
+        slot = self.k_slot if matrix == "k" else self.kff_slot
+        if members is None:
+            vals = (axial[:, None] * self.unit).ravel()
+            keep = slot >= 0
+            data = np.bincount(slot[keep], vals[keep], minlength=template.nnz)
+        else:
+            idx = (members[:, None] * 16 + np.arange(16)).ravel()
+            vals = (axial[:, None] * self.unit[members]).ravel()
+            keep = slot[idx] >= 0
+            data = base.data.copy()
+            np.add.at(data, slot[idx][keep], vals[keep])
+        return sp.csc_matrix((data, template.indices, template.indptr),
+                             shape=template.shape)
+
+
+class _WoodburySolve:
+    """Solve ``(K + B diag(d) B^T) x = f`` through the existing factor of
+    ``K`` (Sherman-Morrison-Woodbury); ``B`` holds one column per changed
+    member, so each solve costs two back-substitutions plus a small dense
+    ``r x r`` system."""
+
+    def __init__(self, lu, b: np.ndarray, d: np.ndarray):
+        self.lu, self.b = lu, b
+        self.z = lu.solve(b)
+        capacitance = np.diag(1.0 / d) + b.T @ self.z
+        if np.linalg.cond(capacitance) > 1e10:
+            raise RuntimeError("ill-conditioned low-rank update")
+        self.capacitance = np.linalg.inv(capacitance)
+
+    def solve(self, rhs: np.ndarray) -> np.ndarray:
+        y = self.lu.solve(rhs)
+        return y - self.z @ (self.capacitance @ (self.b.T @ y))
+
+
+@dataclass
+class _Factorization:
+    """A factored system shared by every load case solved against it."""
+
+    method: str                     # "joints" or "stiffness"
+    geom: _MemberGeometry
+    reaction_cols: list
+    lu: object                      # scipy SuperLU, or a _WoodburySolve
+    axial: np.ndarray | None = None
+    k: object = None                # full sparse K (stiffness only)
+    free_idx: np.ndarray | None = None
+    plan: _StiffnessPlan | None = None
+    kff: object = None              # free block matching ``axial``
+    anchor: tuple | None = None     # (SuperLU, axial) actually factored
+    update: str = "factor"          # how ``lu`` was obtained
+
+
+@dataclass
+class IterationRecord:
+    """One pass of :meth:`StrutAndTieModel.solve_fully_stressed`."""
+
+    iteration: int
+    seconds: float
+    changed: int                    # members whose area was updated
+    update: str                     # "factor", "woodbury" or "reuse"
+    change: float                   # max relative force change
+
+
+@dataclass
+class LoadCaseForces:
+    """Member forces and reactions for a set of load cases solved against one
+    factorization (:meth:`StrutAndTieModel.solve_cases`).
+
+    ``forces[i, j]`` is the axial force in ``members[i]`` under ``cases[j]``
+    (tension positive); ``reactions[k, j]`` is the reaction component
+    ``reaction_dofs[k] = (node, dof)`` with ``dof`` 0 = x, 1 = y.
+    """
+
+    members: list
+    cases: list
+    forces: np.ndarray
+    reaction_dofs: list
+    reactions: np.ndarray
+
+    def __post_init__(self):
+        self._rows = {m: i for i, m in enumerate(self.members)}
+
+    def member(self, member: tuple[str, str]) -> np.ndarray:
+        """Force in one member for every case."""
+        return self.forces[self._rows[member]]
+
+    def case(self, label) -> dict[tuple[str, str], float]:
+        """``{member: force}`` for one case, like :meth:`StrutAndTieModel.solve`."""
+        j = self.cases.index(label)
+        return dict(zip(self.members, self.forces[:, j].tolist()))
+
+    def reaction(self, node: str, dof: int = 1) -> np.ndarray:
+        """One reaction component (default vertical) for every case."""
+        return self.reactions[self.reaction_dofs.index((node, dof))]
+
+    def envelope(self) -> dict[tuple[str, str], tuple[float, float]]:
+        """``{member: (min, max)}`` force over all cases — the most
+        compressive and most tensile demand."""
+        return dict(zip(self.members, zip(self.forces.min(axis=1).tolist(),
+                                          self.forces.max(axis=1).tolist())))
+
+    def to_dataframe(self):
+        """Members as rows (``start``/``end`` MultiIndex), cases as columns."""
+        import pandas as pd
+        index = pd.MultiIndex.from_tuples(self.members, names=["start", "end"])
+        return pd.DataFrame(self.forces, index=index, columns=list(self.cases))
 
 
 class StrutAndTieModel:
     """A pin-jointed truss idealization of a disturbed region."""
 
+    # Largest number of changed members applied to an existing stiffness
+    # factor as a low-rank (Woodbury) update before re-factoring instead.
+    max_update_rank = 32
+
     def __init__(self, E: float = 1.0):
         self.nodes: dict[str, tuple[float, float]] = {}
         self.members: list[tuple[str, str]] = []
@@ -76,6 +267,10 @@ class StrutAndTieModel:
         # solver; it cancels out for a statically determinate truss.  Member
         # axial stiffness is ``E * area / length``.
         self.E = float(E)
+        self._geometry_cache = None
+        self._factor_cache = None
+        # per-iteration record of the last solve_fully_stressed() call
+        self.iteration_log: list[IterationRecord] = []
 
     # ── Rhino interchange ─────────────────────────────────────────────────
 
@@ -260,6 +455,42 @@ class StrutAndTieModel:
         length = math.hypot(xb - xa, yb - ya)
         return (xb - xa) / length, (yb - ya) / length, length
 
+    def _geometry(self) -> _MemberGeometry:
+        """Vectorized member geometry, cached until the nodes or members
+        change, so repeated solves skip the per-member trigonometry."""
+        key = (tuple(self.members), tuple(self.nodes.items()))
+        if self._geometry_cache is not None and self._geometry_cache[0] == key:
+            return self._geometry_cache[1]
+        node_index = {label: i for i, label in enumerate(self.nodes)}
+        xy = np.array(list(self.nodes.values()), dtype=float).reshape(-1, 2)
+        ia = np.array([node_index[a] for a, _ in self.members], dtype=int)
+        ib = np.array([node_index[b] for _, b in self.members], dtype=int)
+        d = xy[ib] - xy[ia]
+        length = np.hypot(d[:, 0], d[:, 1])
+        if (length == 0.0).any():
+            bad = self.members[int(np.argmin(length))]
+            raise ValueError(f"member {bad} has zero length")
+        geom = _MemberGeometry(node_index, ia, ib, d[:, 0] / length,
+                               d[:, 1] / length, length)
+        self._geometry_cache = (key, geom)
+        return geom
+
+    def _axial_stiffness(self, geom: _MemberGeometry) -> np.ndarray:
+        """``E * A / L`` per member."""
+        areas = np.array([self.areas.get(m, 1.0) for m in self.members], dtype=float)
+        return self.E * areas / geom.length
+
+    def _member_forces(self, geom: _MemberGeometry, axial: np.ndarray,
+                       u: np.ndarray) -> np.ndarray:
+        """Axial force per member (tension +) from nodal displacements ``u``;
+        a 2-D ``u`` (ndof, n_cases) gives one column per case."""
+        dofs = geom.dofs
+        du_x = u[dofs[:, 2]] - u[dofs[:, 0]]
+        du_y = u[dofs[:, 3]] - u[dofs[:, 1]]
+        if u.ndim == 1:
+            return axial * (du_x * geom.cx + du_y * geom.cy)
+        return axial[:, None] * (du_x * geom.cx[:, None] + du_y * geom.cy[:, None])
+
     def _reaction_cols(self) -> list[tuple[str, int]]:
         return [
             (node, dof)
@@ -286,21 +517,99 @@ class StrutAndTieModel:
         picks the load path among the redundant members).  Use
         :meth:`solve_fully_stressed` to converge areas onto the forces.
         """
-        if method == "auto":
-            method = "joints" if self.degree_of_indeterminacy() == 0 else "stiffness"
+        method = self._resolve_method(method)
         if method == "joints":
             return self._solve_joints()
-        if method == "stiffness":
-            return self._solve_stiffness()
+        return self._solve_stiffness()
+
+    def _resolve_method(self, method: str) -> str:
+        if method == "auto":
+            return "joints" if self.degree_of_indeterminacy() == 0 else "stiffness"
+        if method in ("joints", "stiffness"):
+            return method
         raise ValueError(f"unknown method {method!r}; use auto/joints/stiffness")
 
-    def _solve_joints(self) -> dict[tuple[str, str], float]:
+    def solve_cases(self, cases, method: str = "auto") -> LoadCaseForces:
+        """Solve many load cases against a single factorization.
+
+        ``cases`` maps a case label to ``{node: (fx, fy)}`` — the same shape
+        as ``self.loads`` — or is a plain sequence of such mappings (labelled
+        ``0..n-1``).  The equilibrium (joints) or free-DOF stiffness matrix is
+        factored once and every case is a back-substitution, so a sweep of
+        hundreds of panel-point unit loads costs little more than one solve.
+        ``self.loads``, ``self.forces`` and ``self.reactions`` are left alone.
+
+        >>> stm = StrutAndTieModel()
+        >>> for label, x, y in [("A", 0, 0), ("B", 8, 0), ("C", 4, 4)]:
+        ...     stm.add_node(label, x, y)
+        >>> for a, b in [("A", "C"), ("B", "C"), ("A", "B")]:
+        ...     stm.add_member(a, b)
+        >>> stm.add_support("A", fix_x=True, fix_y=True)
+        >>> stm.add_support("B", fix_y=True)
+        >>> res = stm.solve_cases({"down": {"C": (0, -100)},
+        ...                        "side": {"C": (10, 0)}})
+        >>> res.member(("A", "B")).round(2).tolist()
+        [50.0, 5.0]
+        """
+        if isinstance(cases, dict):
+            labels, loads = list(cases), list(cases.values())
+        else:
+            loads = list(cases)
+            labels = list(range(len(loads)))
+        if not loads:
+            raise ValueError("no load cases given")
+        fac = self._factorization(self._resolve_method(method))
+        forces, reactions = self._respond(fac, self._load_matrix(loads, fac.geom))
+        return LoadCaseForces(members=list(self.members), cases=labels,
+                              forces=forces, reaction_dofs=list(fac.reaction_cols),
+                              reactions=reactions)
+
+    def unit_load_cases(self, nodes=None, fx: float = 0.0,
+                        fy: float = -1.0) -> dict[str, dict[str, tuple[float, float]]]:
+        """One :meth:`solve_cases` case per node, each carrying a single unit
+        load (downward by default) — the panel-point influence sweep.
+        ``nodes`` defaults to every node."""
+        nodes = list(self.nodes) if nodes is None else list(nodes)
+        return {n: {n: (fx, fy)} for n in nodes}
+
+    def _load_matrix(self, cases, geom: _MemberGeometry) -> np.ndarray:
+        """``(2*nodes, n_cases)`` global load vectors, one column per case."""
+        f = np.zeros((2 * len(self.nodes), len(cases)))
+        for j, loads in enumerate(cases):
+            for node, (fx, fy) in loads.items():
+                i = geom.node_index[node]
+                f[2 * i, j] += fx
+                f[2 * i + 1, j] += fy
+        return f
+
+    def _factorization(self, method: str) -> _Factorization:
+        """Sparse LU of the joints equilibrium matrix (``method="joints"``) or
+        of the free-DOF stiffness block (``"stiffness"``), cached until the
+        geometry, supports, member areas or ``E`` change so repeated solves
+        with new loads only back-substitute."""
+        geom = self._geometry()
+        reaction_cols = self._reaction_cols()
+        axial = self._axial_stiffness(geom) if method == "stiffness" else None
+        cached = self._factor_cache
+        same_layout = (cached is not None and cached.method == method
+                       and cached.geom is geom and cached.reaction_cols == reaction_cols)
+        if same_layout and (axial is None or np.array_equal(cached.axial, axial)):
+            return cached
+        if method == "joints":
+            fac = self._factor_joints(geom, reaction_cols)
+        elif same_layout:
+            fac = self._refactor_stiffness(cached, axial)
+        else:
+            fac = self._factor_stiffness(geom, reaction_cols, axial)
+        self._factor_cache = fac
+        return fac
+
+    def _factor_joints(self, geom: _MemberGeometry, reaction_cols) -> _Factorization:
         """Method of joints — requires a statically determinate, stable model
         (members + reactions = 2 * nodes)."""
-        node_index = {label: i for i, label in enumerate(self.nodes)}
         n_eq = 2 * len(self.nodes)
-        reaction_cols = self._reaction_cols()
-        n_unknowns = len(self.members) + len(reaction_cols)
+        n_mem = len(self.members)
+        n_unknowns = n_mem + len(reaction_cols)
         if n_unknowns != n_eq:
             detail = "; ".join(self.diagnose())
             raise ValueError(
@@ -311,37 +620,139 @@ class StrutAndTieModel:
                 + (f" [{detail}]" if detail else "")
             )
 
-        a = np.zeros((n_eq, n_unknowns))
-        rhs = np.zeros(n_eq)
-        for m, (na, nb) in enumerate(self.members):
-            cx, cy, _ = self._direction(na, nb)
-            ia, ib = node_index[na], node_index[nb]
-            # tension pulls each joint toward the other end
-            a[2 * ia, m] += cx
-            a[2 * ia + 1, m] += cy
-            a[2 * ib, m] -= cx
-            a[2 * ib + 1, m] -= cy
-        for r, (node, dof) in enumerate(reaction_cols):
-            a[2 * node_index[node] + dof, len(self.members) + r] = 1.0
-        for node, (fx, fy) in self.loads.items():
-            rhs[2 * node_index[node]] -= fx
-            rhs[2 * node_index[node] + 1] -= fy
+        node_index = geom.node_index
+        # tension pulls each joint toward the other end
+        vals = np.column_stack([geom.cx, geom.cy, -geom.cx, -geom.cy]).ravel()
+        rows = geom.dofs.ravel()
+        cols = np.repeat(np.arange(n_mem), 4)
+        r_rows = [2 * node_index[node] + dof for node, dof in reaction_cols]
+        a = sp.coo_matrix(
+            (np.concatenate([vals, np.ones(len(r_rows))]),
+             (np.concatenate([rows, np.array(r_rows, dtype=int)]),
+              np.concatenate([cols, n_mem + np.arange(len(r_rows))]))),
+            shape=(n_eq, n_unknowns)).tocsc()
+        fac = _Factorization("joints", geom, reaction_cols, None)
+        try:
+            fac.lu = splu(a)
+        except RuntimeError as exc:
+            raise self._singular_error(fac, exc) from exc
+        return fac
+
+    def _factor_stiffness(self, geom: _MemberGeometry, reaction_cols,
+                          axial: np.ndarray) -> _Factorization:
+        """Direct stiffness method — handles statically indeterminate trusses.
 
+        Assembles the sparse global stiffness matrix from each member's axial
+        stiffness ``E*A/L``, applies the supported DOF as fixed and factors
+        the free block by sparse LU.  Memory and time scale with the number
+        of members, not the square of the DOF count.
+        """
+        ndof = 2 * len(self.nodes)
+        fixed = np.zeros(ndof, dtype=bool)
+        for node, dof in reaction_cols:
+            fixed[2 * geom.node_index[node] + dof] = True
+        free_idx = np.flatnonzero(~fixed)
+        if free_idx.size == 0:
+            raise ValueError("every DOF is restrained; nothing to solve")
+        plan = _StiffnessPlan.build(geom, free_idx, ndof)
+        fac = _Factorization("stiffness", geom, reaction_cols, None,
+                             axial=axial, k=plan.scatter("k", axial),
+                             free_idx=free_idx, plan=plan,
+                             kff=plan.scatter("kff", axial))
+        return self._factor_free_block(fac)
+
+    def _factor_free_block(self, fac: _Factorization) -> _Factorization:
         try:
-            solution = np.linalg.solve(a, rhs)
-        except np.linalg.LinAlgError as exc:
-            raise ValueError(f"unstable model geometry: {exc}") from exc
+            fac.lu = splu(fac.kff)
+        except RuntimeError as exc:
+            raise self._singular_error(fac, exc) from exc
+        fac.anchor = (fac.lu, fac.axial)
+        fac.update = "factor"
+        return fac
+
+    def _refactor_stiffness(self, cached: _Factorization,
+                            axial: np.ndarray) -> _Factorization:
+        """Re-solve after member stiffness changes on an unchanged layout.
+
+        Only the changed members' entries are added into ``K`` and its free
+        block (the sparsity pattern is reused).  When at most
+        :attr:`max_update_rank` members differ from the last matrix actually
+        factored, the old factor is kept and the change is applied as a
+        Sherman-Morrison-Woodbury low-rank update; otherwise the free block
+        is re-factored.
+        """
+        plan = cached.plan
+        changed = np.flatnonzero(axial != cached.axial)
+        delta = axial[changed] - cached.axial[changed]
+        if changed.size > len(axial) // 2:
+            k, kff = plan.scatter("k", axial), plan.scatter("kff", axial)
+        else:
+            k = plan.scatter("k", delta, changed, cached.k)
+            kff = plan.scatter("kff", delta, changed, cached.kff)
+        fac = _Factorization("stiffness", cached.geom, cached.reaction_cols,
+                             None, axial=axial, k=k, free_idx=cached.free_idx,
+                             plan=plan, kff=kff, anchor=cached.anchor)
+        anchor_lu, anchor_axial = cached.anchor
+        moved = np.flatnonzero(axial != anchor_axial)
+        if 0 < moved.size <= self.max_update_rank:
+            try:
+                fac.lu = _WoodburySolve(anchor_lu, plan.b[:, moved].toarray(),
+                                        axial[moved] - anchor_axial[moved])
+                fac.update = "woodbury"
+                return fac
+            except (RuntimeError, np.linalg.LinAlgError):
+                pass    # near-mechanism update: fall back to a fresh factor
+        return self._factor_free_block(fac)
+
+    def _singular_error(self, fac: _Factorization, exc) -> ValueError:
+        if fac.method == "joints":
+            return ValueError(f"unstable model geometry: {exc}")
+        detail = "; ".join(self.diagnose())
+        return ValueError(
+            f"singular stiffness matrix — the truss has a mechanism "
+            f"(unstable / under-braced): {exc}"
+            + (f" [{detail}]" if detail else "")
+        )
 
-        self.forces = {mem: float(solution[i])
-                       for i, mem in enumerate(self.members)}
+    def _respond(self, fac: _Factorization,
+                 f: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """Member forces ``(n_members, n_cases)`` and reactions
+        ``(n_reactions, n_cases)`` for the load matrix ``f``."""
+        n_mem = len(self.members)
+        if fac.method == "joints":
+            solution = fac.lu.solve(-f)
+            if not np.isfinite(solution).all():
+                raise self._singular_error(fac, "factor is numerically singular")
+            return solution[:n_mem], solution[n_mem:]
+
+        u = np.zeros_like(f)
+        u[fac.free_idx] = fac.lu.solve(f[fac.free_idx])
+        if not np.isfinite(u).all():
+            raise self._singular_error(fac, "factor is numerically singular")
+        # reactions at the fixed DOF: r = K u - f
+        r = fac.k @ u - f
+        rows = [2 * fac.geom.node_index[node] + dof for node, dof in fac.reaction_cols]
+        # member axial force = (EA/L) * relative axial displacement
+        return self._member_forces(fac.geom, fac.axial, u), r[rows]
+
+    def _solve_single(self, method: str) -> dict[tuple[str, str], float]:
+        fac = self._factorization(method)
+        forces, reactions = self._respond(fac, self._load_matrix([self.loads], fac.geom))
+        self.forces = dict(zip(self.members, forces[:, 0].tolist()))
         self.reactions = {}
-        for r, (node, dof) in enumerate(reaction_cols):
-            self.reactions.setdefault(node, [0.0, 0.0])[dof] = float(
-                solution[len(self.members) + r]
-            )
+        for (node, dof), r in zip(fac.reaction_cols, reactions[:, 0].tolist()):
+            self.reactions.setdefault(node, [0.0, 0.0])[dof] = r
         self._warn_member_type_mismatches()
         return self.forces
 
+    def _solve_joints(self) -> dict[tuple[str, str], float]:
+        """Method of joints for a statically determinate, stable model."""
+        return self._solve_single("joints")
+
+    def _solve_stiffness(self) -> dict[tuple[str, str], float]:
+        """Direct stiffness method; tension positive."""
+        return self._solve_single("stiffness")
+
     def _warn_member_type_mismatches(self):
         """Warn when a member forced to ``tie``/``strut`` via ``stm.member``
         solves with the opposite sign -- a useful modeling signal (the author's
@@ -363,73 +774,9 @@ class StrutAndTieModel:
                     stacklevel=2,
                 )
 
-    def _solve_stiffness(self) -> dict[tuple[str, str], float]:
-        """Direct stiffness method — handles statically indeterminate trusses.
-
-        Assembles the global stiffness matrix from each member's axial
-        stiffness ``E*A/L``, applies the supported DOF as fixed, solves
-        ``K u = f`` for the free displacements, then back-calculates each
-        member's axial force and the support reactions.  Tension positive.
-        """
-        node_index = {label: i for i, label in enumerate(self.nodes)}
-        ndof = 2 * len(self.nodes)
-        k = np.zeros((ndof, ndof))
-        # member local axial stiffness assembled into global K
-        for (na, nb) in self.members:
-            cx, cy, length = self._direction(na, nb)
-            ea_l = self.E * self.areas.get((na, nb), 1.0) / length
-            ia, ib = node_index[na], node_index[nb]
-            dofs = [2 * ia, 2 * ia + 1, 2 * ib, 2 * ib + 1]
-            c = np.array([cx, cy, -cx, -cy])
-            ke = ea_l * np.outer(c, c)
-            for p in range(4):
-                for q in range(4):
-                    k[dofs[p], dofs[q]] += ke[p, q]
-
-        f = np.zeros(ndof)
-        for node, (fx, fy) in self.loads.items():
-            f[2 * node_index[node]] += fx
-            f[2 * node_index[node] + 1] += fy
-
-        fixed = np.zeros(ndof, dtype=bool)
-        for node, dof in self._reaction_cols():
-            fixed[2 * node_index[node] + dof] = True
-        free = ~fixed
-        if not free.any():
-            raise ValueError("every DOF is restrained; nothing to solve")
-
-        u = np.zeros(ndof)
-        try:
-            u[free] = np.linalg.solve(k[np.ix_(free, free)], f[free])
-        except np.linalg.LinAlgError as exc:
-            detail = "; ".join(self.diagnose())
-            raise ValueError(
-                f"singular stiffness matrix — the truss has a mechanism "
-                f"(unstable / under-braced): {exc}"
-                + (f" [{detail}]" if detail else "")
-            ) from exc
-
-        # reactions at the fixed DOF: r = K u - f
-        r = k @ u - f
-        self.reactions = {}
-        for node, dof in self._reaction_cols():
-            self.reactions.setdefault(node, [0.0, 0.0])[dof] = float(
-                r[2 * node_index[node] + dof]
-            )
-
-        # member axial force = (EA/L) * relative axial displacement
-        self.forces = {}
-        for (na, nb) in self.members:
-            cx, cy, length = self._direction(na, nb)
-            ea_l = self.E * self.areas.get((na, nb), 1.0) / length
-            ia, ib = node_index[na], node_index[nb]
-            du = np.array([u[2 * ib] - u[2 * ia], u[2 * ib + 1] - u[2 * ia + 1]])
-            self.forces[(na, nb)] = float(ea_l * (du[0] * cx + du[1] * cy))
-        self._warn_member_type_mismatches()
-        return self.forces
-
     def solve_fully_stressed(self, iterations: int = 25, tol: float = 1e-4,
-                             min_ratio: float = 1e-3) -> dict[tuple[str, str], float]:
+                             min_ratio: float = 1e-3, area_tol: float = 0.0,
+                             verbose: bool = False) -> dict[tuple[str, str], float]:
         """Resize members in proportion to their force and re-solve until the
         load path stabilizes (fully-stressed design).
 
@@ -440,16 +787,30 @@ class StrutAndTieModel:
         area (relative to the largest) so lightly loaded members keep the
         truss stable instead of vanishing.  Determinate models are returned
         unchanged after a single solve.
+
+        Each pass re-uses the sparse stiffness layout and only re-scatters
+        the members whose area changed; when few change, the previous
+        factorization is kept and updated at low rank (see
+        :attr:`max_update_rank`).  ``area_tol`` leaves an area alone unless it
+        moves by more than that relative amount, which lets the late,
+        nearly-converged passes take the cheap low-rank path.  Timing per
+        pass lands in :attr:`iteration_log`.
         """
+        self.iteration_log = []
         forces = self.solve(method="auto")
         if self.degree_of_indeterminacy() <= 0:
             return forces
         prev = np.array([forces[m] for m in self.members])
-        for _ in range(iterations):
+        area = np.array([self.areas.get(m, 1.0) for m in self.members], dtype=float)
+        for it in range(1, iterations + 1):
+            t0 = time.perf_counter()
             saved = dict(self.areas)
-            fmax = max(abs(v) for v in forces.values()) or 1.0
-            for m in self.members:
-                self.areas[m] = max(abs(forces[m]) / fmax, min_ratio)
+            fmax = np.abs(prev).max() or 1.0
+            target = np.maximum(np.abs(prev) / fmax, min_ratio)
+            moved = np.abs(target - area) > area_tol * np.abs(area)
+            area = np.where(moved, target, area)
+            self.areas = dict(zip(self.members, area.tolist()))
+            before = self._factor_cache
             try:
                 forces = self._solve_stiffness()
             except ValueError:
@@ -460,7 +821,16 @@ class StrutAndTieModel:
                 break
             cur = np.array([forces[m] for m in self.members])
             denom = max(np.abs(cur).max(), 1e-12)
-            if np.abs(cur - prev).max() / denom < tol:
+            change = float(np.abs(cur - prev).max() / denom)
+            fac = self._factor_cache
+            update = "reuse" if fac is before else fac.update
+            self.iteration_log.append(IterationRecord(
+                it, time.perf_counter() - t0, int(moved.sum()), update, change))
+            if verbose:
+                rec = self.iteration_log[-1]
+                print(f"it {it:3d}  {rec.seconds * 1e3:8.2f} ms  "
+                      f"changed={rec.changed:5d}  {rec.update:<8s}  ch={change:.2e}")
+            if change < tol:
                 break
             prev = cur
         return forces
@@ -45,7 +45,7 @@ class Truss(StrutAndTieModel):
     """Pin-jointed plane truss; see the base class for the full API."""
 
     def member_lengths(self) -> dict[tuple[str, str], float]:
-        return {(a, b): self._direction(a, b)[2] for a, b in self.members}
+        return dict(zip(self.members, self._geometry().length.tolist()))
 
     def member_stresses(self, areas) -> dict[tuple[str, str], float]:
         """Axial stress per member (force units / area units).  ``areas``
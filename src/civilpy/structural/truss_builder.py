@@ -65,6 +65,11 @@ from dataclasses import dataclass, field
 import matplotlib.pyplot as plt
 
 from civilpy.structural.truss import Truss
+from civilpy.structural.strut_and_tie import LoadCaseForces
+from civilpy.structural.influence_lines import (
+    InfluenceLine,
+    influence_line_from_ordinates,
+)
 from civilpy.structural.midas_models import (
     STEEL_PROPS,
     steel_material_block,
@@ -632,6 +637,14 @@ class TrussBridge:
         key = f"{plane}:{case}"
         if key in self._plane_trusses:
             return self._plane_trusses[key]
+        t = self._new_plane_truss()
+        for node, p in self.panel_point_loads(plane, case).items():
+            if p:
+                t.add_load(node, fy=-p)
+        self._plane_trusses[key] = t
+        return t
+
+    def _new_plane_truss(self) -> Truss:
         t = Truss()
         for name, (x, y) in self.nodes.items():
             t.add_node(name, x, y)
@@ -639,12 +652,15 @@ class TrussBridge:
             t.add_member(m.start, m.end)
         t.add_support("L0", fix_x=True, fix_y=True)
         t.add_support(f"L{self.n_panels}", fix_y=True)
-        for node, p in self.panel_point_loads(plane, case).items():
-            if p:
-                t.add_load(node, fy=-p)
-        self._plane_trusses[key] = t
         return t
 
+    def _plane_model(self) -> Truss:
+        """Unloaded plane truss shared by every multi-case solve, so its
+        factorization is reused until the geometry changes."""
+        if "geometry" not in self._plane_trusses:
+            self._plane_trusses["geometry"] = self._new_plane_truss()
+        return self._plane_trusses["geometry"]
+
     def solve(self, plane: str = "near",
               case: str = "total") -> dict[tuple[str, str], float]:
         """Member forces (kips, tension positive) for one truss plane."""
@@ -657,14 +673,50 @@ class TrussBridge:
             t.solve()
         return t.reactions
 
+    def solve_cases(self, cases=("dc", "dw", "total"),
+                    planes=("near", "far")) -> LoadCaseForces:
+        """Member forces for several deck load cases and planes from one
+        factorization of the plane truss.  Case labels are
+        ``(plane, case)`` tuples, e.g. ``res.case(("near", "dc"))``."""
+        loads = {}
+        for plane in planes:
+            for case in cases:
+                loads[(plane, case)] = {
+                    node: (0.0, -p)
+                    for node, p in self.panel_point_loads(plane, case).items() if p}
+        return self._plane_model().solve_cases(loads)
+
+    def panel_point_influence(self) -> LoadCaseForces:
+        """Member forces for a 1-kip downward load at each deck-level panel
+        point in turn — one case per floorbeam point, ordered along the
+        span.  ``res.member(("L1", "L2"))`` is that member's influence
+        ordinates at the panel points; both planes share the geometry."""
+        model = self._plane_model()
+        points = [fb.point for fb in self.floorbeams]
+        return model.solve_cases(model.unit_load_cases(points))
+
+    def member_influence_lines(self) -> dict[Member, InfluenceLine]:
+        """Axial-force influence line of every plane member for a unit load
+        moving along the deck.  Stringers are simply supported between
+        floorbeams, so the line is straight between panel-point ordinates;
+        run trucks with :meth:`InfluenceLine.maximize_axle_train` or
+        :func:`~civilpy.structural.influence_lines.hl93_effects`."""
+        res = self.panel_point_influence()
+        x = [self.nodes[p][0] for p in res.cases]
+        return {m: influence_line_from_ordinates(
+                    x, res.member(m.key), length=self.span_ft,
+                    label=f"{m.name} axial")
+                for m in self.members}
+
     def member_forces(self, case: str = "total") -> dict[Member, float]:
         """Governing (largest-magnitude) force per typed member across
         both truss planes."""
-        near = self.solve("near", case)
-        far = self.solve("far", case)
+        res = self.solve_cases(cases=(case,))
+        j_near, j_far = res.cases.index(("near", case)), res.cases.index(("far", case))
         forces = {}
         for m in self.members:
-            f_near, f_far = near[m.key], far[m.key]
+            row = res.member(m.key)
+            f_near, f_far = float(row[j_near]), float(row[j_far])
             forces[m] = f_near if abs(f_near) >= abs(f_far) else f_far
         return forces
 
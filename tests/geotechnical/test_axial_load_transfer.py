@@ -7,6 +7,7 @@ the API RP 2A t-z / q-z backbones and the nodal-spring discretiser."""
 
 import math
 
+import numpy as np
 import pytest
 
 from civilpy.geotech.axial_load_transfer import (
@@ -92,6 +93,35 @@ def test_axial_pile_springs_needs_two_nodes():
         axial_pile_springs(tz, embedded_length=100.0, n_nodes=1, design_disp=0.1)
 
 
+def test_axial_pile_springs_layered_stack():
+    from civilpy.geotech.curve_stack import CurveStack
+
+    clay = APITZCurve(t_max=1000.0, soil="clay", diameter=24.0)
+    sand = APITZCurve(t_max=750.0, soil="sand", diameter=24.0)
+    springs = axial_pile_springs(CurveStack([clay, sand], tops=[0.0, 120.0]),
+                                 embedded_length=240.0, n_nodes=5, design_disp=0.10)
+    assert springs[0] == axial_pile_springs(clay, 240.0, 5, 0.10)[0]
+    assert springs[-1] == axial_pile_springs(sand, 240.0, 5, 0.10)[-1]
+
+
+# ---------------------------------------------------------------- arrays
+
+def test_tz_qz_arrays_match_scalar():
+    w = np.array([-1.0, -0.01, 0.0, 0.004, 0.05, 0.1, 3.0])
+    for curve in (APITZCurve(t_max=900.0, soil="clay", diameter=18.0),
+                  APITZCurve(t_max=900.0, soil="sand", diameter=18.0)):
+        np.testing.assert_allclose(curve.t_array(w), [curve.t(x) for x in w])
+        np.testing.assert_allclose(curve.secant_array(w),
+                                   [curve.secant_modulus(x) for x in w])
+    qz = APIQZCurve(q_max=5.0e4, diameter=18.0)
+    np.testing.assert_allclose(qz.q_array(w), [qz.q(x) for x in w])
+
+
+def test_tz_array_unknown_soil_raises():
+    with pytest.raises(ValueError):
+        APITZCurve(t_max=1.0, soil="rock").t_array(np.array([0.1]))
+
+
 def test_spring_constant_unit_conversion():
     # 1000 lb/in -> 12 kip/ft
     assert spring_constant_kip_per_in(1000.0) == pytest.approx(1.0)
@@ -0,0 +1,71 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#  (AGPL v3 — see the module header for the full notice)
+
+"""Layered curve stacks (civilpy.geotech.curve_stack): depth-to-layer
+mapping and per-family evaluation with merged parameter arrays."""
+
+import numpy as np
+import pytest
+
+from civilpy.geotech import lateral_pile as lp
+from civilpy.geotech.curve_stack import CurveStack, group_curves
+
+
+def _stack():
+    return CurveStack(
+        [lp.SoftClayPY(cu=5.0, b=12.0, gamma=0.04),
+         lp.SandPY(phi_deg=35, gamma=0.0723, b=12.0),
+         lp.SoftClayPY(cu=12.0, b=12.0, gamma=0.05)],
+        tops=[0.0, 100.0, 200.0],
+    )
+
+
+class TestLayers:
+    def test_layer_index_and_curve_at(self):
+        stack = _stack()
+        depth = np.array([0.0, 99.9, 100.0, 250.0, 1e4])
+        np.testing.assert_array_equal(stack.layer_index(depth), [0, 0, 1, 2, 2])
+        assert stack(150.0) is stack.curves[1]
+        assert len(stack) == 3
+
+    def test_gaps_fall_to_deepest_layer(self):
+        # matches LPileModel.curve_at: a depth in no layer takes the last one
+        stack = CurveStack([lp.LinearPY(k=1.0), lp.LinearPY(k=2.0)],
+                           tops=[0.0, 50.0], bottoms=[40.0, 80.0])
+        np.testing.assert_array_equal(stack.layer_index([10.0, 45.0, 90.0]), [0, 1, 1])
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            CurveStack([], tops=[])
+        with pytest.raises(ValueError):
+            CurveStack([lp.LinearPY(k=1.0)], tops=[0.0, 10.0])
+
+
+class TestEvaluate:
+    def test_matches_scalar_curves(self):
+        stack = _stack()
+        z = np.linspace(0.0, 300.0, 31)
+        y = np.linspace(-2.0, 2.0, 31)
+        expected = [stack(zi).p(yi, zi) for yi, zi in zip(y, z)]
+        np.testing.assert_allclose(stack.evaluate("p_array", z, y, z), expected)
+
+    def test_same_family_layers_merge(self):
+        stack = _stack()
+        groups = stack.groups(np.linspace(0.0, 300.0, 31))
+        # two soft-clay layers -> one merged instance, plus the sand layer
+        assert len(groups) == 2
+        merged = next(c for c, _ in groups if isinstance(c, lp.SoftClayPY))
+        assert np.ndim(merged.cu) == 1
+
+    def test_unmergeable_curves_stay_separate(self):
+        class Custom(lp.PYCurve):
+            def pu(self, z):
+                return 1.0
+
+            def p(self, y, z):
+                return y
+
+        a, b = Custom(), Custom()
+        groups = group_curves([a, a, b])
+        assert [len(nodes) for _, nodes in groups] == [2, 1]
@@ -182,6 +182,114 @@ class TestSolver:
         assert fig2 is not None
 
 
+class TestBatchSolver:
+    def setup_method(self):
+        soft = lp.SoftClayPY(cu=5.0, b=12.0, gamma=0.04)
+        stiff = lp.StiffClayPY(cu=30.0, b=12.0, gamma=0.05)
+        self.layered = lambda z: soft if z < 120 else stiff
+
+    def test_batch_matches_single_solves(self):
+        shears = [5000.0, 20000.0]
+        batch = lp.solve_lateral_pile_batch(
+            self.layered, 300, 1e9, shears, n_elem=100,
+        )
+        assert len(batch) == 2
+        for i, v in enumerate(shears):
+            single = lp.solve_lateral_pile(self.layered, 300, 1e9, shear=v, n_elem=100)
+            assert batch.iterations[i] == single.iterations
+            np.testing.assert_allclose(batch[i].deflection, single.deflection)
+            np.testing.assert_allclose(batch[i].moment, single.moment)
+
+    def test_newton_matches_secant_in_fewer_iterations(self):
+        shears = np.linspace(2000.0, 30000.0, 8)
+        secant = lp.solve_lateral_pile_batch(self.layered, 300, 1e9, shears)
+        newton = lp.solve_lateral_pile_batch(
+            self.layered, 300, 1e9, shears, method="newton",
+        )
+        assert newton.converged.all()
+        assert newton.iterations.max() < secant.iterations.min()
+        np.testing.assert_allclose(
+            newton.head_deflection, secant.head_deflection, rtol=1e-4,
+        )
+        np.testing.assert_allclose(newton.max_moment, secant.max_moment, rtol=1e-4)
+        assert np.all(np.diff(newton.head_deflection) > 0)
+
+    def test_broadcast_pile_configurations(self):
+        c = lp.SandPY(phi_deg=35, gamma=0.0723, b=12.0)
+        res = lp.solve_lateral_pile_batch(
+            c, 300, ei=[1e9, 1e9, 4e9], shear=15000, n_elem=80,
+            fixed_head=[False, True, False], method="newton",
+        )
+        assert res.converged.all()
+        assert res.head_deflection[1] < res.head_deflection[0]
+        assert res.head_deflection[2] < res.head_deflection[0]
+        fixed = lp.solve_lateral_pile(
+            c, 300, 1e9, shear=15000, n_elem=80, fixed_head=True,
+        )
+        assert res[1].head_deflection == pytest.approx(fixed.head_deflection, rel=1e-4)
+
+    def test_linear_newton_one_step(self):
+        res = lp.solve_lateral_pile(
+            lp.LinearPY(k=500.0), 400, 1e9, shear=10000.0, n_elem=100,
+            method="newton",
+        )
+        assert res.converged and res.iterations <= 2
+
+    def test_curve_stack_matches_callable(self):
+        from civilpy.geotech.curve_stack import CurveStack
+
+        soft = lp.SoftClayPY(cu=5.0, b=12.0, gamma=0.04)
+        stiff = lp.StiffClayPY(cu=30.0, b=12.0, gamma=0.05)
+        stack = CurveStack([soft, stiff], tops=[0.0, 120.0])
+        by_stack = lp.solve_lateral_pile(stack, 300, 1e9, shear=20000, n_elem=100)
+        by_callable = lp.solve_lateral_pile(
+            self.layered, 300, 1e9, shear=20000, n_elem=100,
+        )
+        np.testing.assert_array_equal(by_stack.deflection, by_callable.deflection)
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError, match="unknown method"):
+            lp.solve_lateral_pile(lp.LinearPY(k=100.0), 100, 1e9, shear=1.0,
+                                  method="bfgs")
+
+
+class TestCurveArrays:
+    def test_p_array_matches_scalar(self):
+        c = lp.SoftClayPY(cu=5.0, b=12.0, gamma=0.04)
+        y = np.array([[-0.5, 0.0, 0.2], [1.0, 5.0, 30.0]])
+        z = np.array([12.0, 60.0, 120.0])
+        expected = [[c.p(y[i, j], z[j]) for j in range(3)] for i in range(2)]
+        np.testing.assert_allclose(c.p_array(y, z), expected)
+
+    @pytest.mark.parametrize("curve", [
+        lp.LinearPY(k=100.0, p_ult=50.0),
+        lp.SoftClayPY(cu=5.0, b=12.0, gamma=0.04),
+        lp.StiffClayPY(cu=30.0, b=12.0, gamma=0.05),
+        lp.SandPY(phi_deg=35, gamma=0.0723, b=12.0),
+        lp.SandPY(phi_deg=30, gamma=0.06, b=24.0, static=False),
+    ])
+    def test_family_arrays_match_scalar(self, curve):
+        y = np.array([-40.0, -0.5, -1e-7, 0.0, 1e-3, 0.2, 5.0, 40.0])
+        z = np.array([0.0, 12.0, 60.0, 150.0, 400.0, 2000.0])[:, None]
+        expected = np.vectorize(curve.p)(y, z)
+        np.testing.assert_allclose(curve.p_array(y, z), expected, rtol=1e-12)
+        np.testing.assert_allclose(
+            curve.pu_array(z.ravel()), [curve.pu(d) for d in z.ravel()],
+        )
+
+    def test_reese_sand_pu_accepts_arrays(self):
+        z = np.array([12.0, 120.0])
+        pu = lp.reese_sand_pu(35.0, 0.0723, 12.0, z)
+        assert pu[1] == pytest.approx(lp.reese_sand_pu(35.0, 0.0723, 12.0, 120.0))
+        assert isinstance(lp.reese_sand_pu(35.0, 0.0723, 12.0, 12.0), float)
+
+    def test_tangent_and_secant_arrays(self):
+        c = lp.LinearPY(k=100.0)
+        y = np.array([0.0, 0.5, -2.0])
+        np.testing.assert_allclose(c.secant_array(y, 10.0), 100.0)
+        np.testing.assert_allclose(c.tangent_array(y, 10.0), 100.0)
+
+
 class TestPointOfFixity:
     def _result(self, depth, defl):
         n = len(depth)
@@ -0,0 +1,133 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Parallel layer downloads: completeness, retries and checkpoint resume
+against an in-memory stand-in for an ArcGIS query endpoint."""
+
+import threading
+
+import pytest
+
+from civilpy.state.ohio.DOT.arcgis_download import (
+    ArcGISDownloader,
+    IncompleteDownloadError,
+)
+
+URL = "memory://TIMS/Assets/MapServer/5"
+IDS = [i for i in range(1, 2600) if i % 11]  # gaps, as after deletions
+
+
+class _Response:
+    def __init__(self, body, status_code=200):
+        self._body, self.status_code = body, status_code
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+class _Layer:
+    """Answers metadata, ``returnIdsOnly`` and ``objectIds`` queries.
+    ``fail`` maps a page's first id to the number of times it errors;
+    ``short`` lists first ids whose pages come back one feature short."""
+
+    def __init__(self, fail=None, short=(), cap=500):
+        self.fail, self.short, self.cap = dict(fail or {}), set(short), cap
+        self.pages = []
+        self.lock = threading.Lock()
+
+    def get(self, url, params=None, timeout=None):
+        return _Response({"maxRecordCount": self.cap})
+
+    def post(self, url, data=None, timeout=None):
+        if data.get("returnIdsOnly") == "true":
+            return _Response({"objectIdFieldName": "OBJECTID", "objectIds": IDS[::-1]})
+        ids = [int(i) for i in data["objectIds"].split(",")]
+        with self.lock:
+            self.pages.append(ids[0])
+            if self.fail.get(ids[0], 0) > 0:
+                self.fail[ids[0]] -= 1
+                return _Response({}, status_code=503)
+        if ids[0] in self.short:
+            ids = ids[:-1]
+        return _Response({"features": [{"attributes": {"OBJECTID": i, "SFN": f"{i:07d}"}}
+                                       for i in ids]})
+
+
+def test_download_is_complete_and_ordered():
+    layer = _Layer()
+    rows = ArcGISDownloader(URL, max_workers=4, session=layer).run()
+    assert [r["OBJECTID"] for r in rows] == IDS
+    assert len(layer.pages) == -(-len(IDS) // 500)
+
+
+def test_page_size_above_server_cap_is_clamped():
+    layer = _Layer(cap=500)
+    rows = ArcGISDownloader(URL, page_size=2000, session=layer).run()
+    assert [r["OBJECTID"] for r in rows] == IDS
+    assert len(layer.pages) == -(-len(IDS) // 500)
+
+
+def test_transient_failures_are_retried():
+    layer = _Layer(fail={IDS[500]: 2})
+    rows = ArcGISDownloader(URL, backoff=0.0, session=layer).run()
+    assert [r["OBJECTID"] for r in rows] == IDS
+    assert layer.pages.count(IDS[500]) == 3
+
+
+def test_short_page_raises_instead_of_truncating():
+    layer = _Layer(short={IDS[1000]})
+    with pytest.raises(IncompleteDownloadError, match="of 500 features"):
+        ArcGISDownloader(URL, retries=1, backoff=0.0, session=layer).run()
+
+
+def test_short_page_retries_back_off(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr("civilpy.state.ohio.DOT.arcgis_download.time.sleep", sleeps.append)
+
+    class _ShortOnce(_Layer):
+        def post(self, url, data=None, timeout=None):
+            resp = super().post(url, data=data, timeout=timeout)
+            self.short.discard(IDS[0])
+            return resp
+
+    layer = _ShortOnce(short={IDS[0]})
+    downloader = ArcGISDownloader(URL, backoff=0.5, session=layer)
+    assert len(downloader.fetch_page(IDS[:500])) == 500
+    assert len(sleeps) == 1 and 0.5 <= sleeps[0] <= 1.0
+
+
+def test_checkpoint_resumes_missing_pages(tmp_path):
+    checkpoint = str(tmp_path / "pull")
+    failing = _Layer(fail={IDS[1500]: 99})
+    with pytest.raises(IncompleteDownloadError):
+        ArcGISDownloader(URL, retries=1, backoff=0.0, max_workers=1,
+                         checkpoint_dir=checkpoint, session=failing).run()
+
+    layer = _Layer()
+    progress = []
+    rows = ArcGISDownloader(URL, checkpoint_dir=checkpoint, session=layer).run(
+        progress=lambda done, total: progress.append((done, total)))
+    assert [r["OBJECTID"] for r in rows] == IDS
+    assert IDS[1500] in layer.pages
+    assert len(layer.pages) < len(failing.pages)
+    assert progress[-1] == (5, 5)
+
+    with pytest.raises(ValueError, match="different query"):
+        ArcGISDownloader(URL, where="COUNTY_CD='FRA'", checkpoint_dir=checkpoint,
+                         session=layer).run()
@@ -0,0 +1,105 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""ArcGISLayer.query_all and download against a server whose record cap
+is below the layer's max_records, and failures surfacing as errors."""
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+
+from civilpy.state.ohio.DOT.apis import ArcGISLayer  # noqa: E402
+from civilpy.state.ohio.DOT.arcgis_download import IncompleteDownloadError  # noqa: E402
+from civilpy.state.ohio.DOT.http_cache import MemoryCache, ResponseCache  # noqa: E402
+
+URL = "memory://NHD/MapServer/6"
+IDS = list(range(1, 2501))
+
+
+class _Response:
+    def __init__(self, body, status_code=200):
+        self._body, self.status_code, self.headers = body, status_code, {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+class _Server:
+    """Keyset-paged ``/query`` capped at ``cap`` features per response;
+    ``down`` makes every request answer 503."""
+
+    def __init__(self, cap=1000, down=False):
+        self.cap, self.down, self.calls = cap, down, 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        if self.down:
+            return _Response(None, status_code=503)
+        if not url.endswith("/query"):
+            return _Response({"maxRecordCount": self.cap})
+        last = int(params["where"].rsplit(">", 1)[1]) if ">" in params["where"] else 0
+        rows = [i for i in IDS if i > last]
+        limit = min(self.cap, int(params["resultRecordCount"]))
+        body = {"features": [{"attributes": {"OBJECTID": i, "StreamOrder": i % 7}}
+                             for i in rows[:limit]]}
+        if len(rows) > self.cap and limit == self.cap:
+            body["exceededTransferLimit"] = True
+        return _Response(body)
+
+    def post(self, url, data=None, timeout=None):
+        self.calls += 1
+        if data.get("returnIdsOnly") == "true":
+            return _Response({"objectIdFieldName": "OBJECTID", "objectIds": IDS})
+        ids = [int(i) for i in data["objectIds"].split(",")][:self.cap]
+        return _Response({"features": [{"attributes": {"OBJECTID": i}} for i in ids]})
+
+
+@pytest.fixture
+def serve(monkeypatch):
+    monkeypatch.setattr("civilpy.state.ohio.DOT.arcgis_download.time.sleep", lambda s: None)
+
+    def install(server):
+        cache = ResponseCache(MemoryCache(), session=server)
+        monkeypatch.setattr("civilpy.state.ohio.DOT.apis.get_cache", lambda: cache)
+        monkeypatch.setattr("civilpy.state.ohio.DOT.arcgis_download.pooled_session",
+                            lambda pool_size=8: server)
+        return server
+
+    return install
+
+
+def test_query_all_pages_past_a_lower_server_cap(serve):
+    server = serve(_Server(cap=1000))
+    rows = ArcGISLayer(URL, max_records=2000).query_all(out_fields="StreamOrder")
+    assert [r["OBJECTID"] for r in rows] == IDS
+    assert server.calls == 3
+
+
+def test_query_all_raises_where_query_degrades(serve):
+    serve(_Server(down=True))
+    layer = ArcGISLayer(URL)
+    assert layer.query() == []
+    with pytest.raises(IncompleteDownloadError):
+        layer.query_all(out_fields="StreamOrder")
+
+
+def test_download_pages_at_a_lower_server_cap(serve):
+    serve(_Server(cap=1000))
+    rows = ArcGISLayer(URL, max_records=2000).download()
+    assert [r["OBJECTID"] for r in rows] == IDS
@@ -0,0 +1,169 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""AssetWise fan-out: bounded concurrency, lazy input, retries and rate
+limiting for the asyncio client, plus the bounded sync map_assets."""
+
+import asyncio
+import time
+
+from civilpy.state.ohio.DOT.assetwise_client import (
+    AssetWiseClient,
+    AsyncAssetWiseClient,
+    TokenBucket,
+)
+
+
+class _Response:
+    def __init__(self, status, body, headers=None):
+        self.status, self._body, self.headers = status, body, headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def json(self, content_type=None):
+        return self._body
+
+    async def read(self):
+        return self._body
+
+
+class _Session:
+    """aiohttp-shaped fake: inspections per asset id, with a short delay,
+    optional failures per id and a record of peak concurrency."""
+
+    def __init__(self, fail=None, delay=0.002):
+        self.fail, self.delay = dict(fail or {}), delay
+        self.calls, self.active, self.peak = [], 0, 0
+
+    def request(self, method, url, params=None, json=None, headers=None):
+        session = self
+
+        class _Call:
+            async def __aenter__(self):
+                session.calls.append(url)
+                session.active += 1
+                session.peak = max(session.peak, session.active)
+                await asyncio.sleep(session.delay)
+                session.active -= 1
+                as_id = int(url.rsplit("/", 1)[1])
+                status = session.fail.get(as_id)
+                if status:
+                    session.fail[as_id] = None
+                    return _Response(status, None, {"Retry-After": "0"})
+                return _Response(200, {"success": True, "data": [{"as_id": as_id}]})
+
+            async def __aexit__(self, *exc):
+                return False
+
+        return _Call()
+
+
+def _client(session, **kwargs):
+    kwargs.setdefault("rate_limit", None)
+    return AsyncAssetWiseClient(base_url="memory://aw", session=session,
+                                backoff_factor=0.0, **kwargs)
+
+
+def test_amap_assets_streams_with_bounded_concurrency():
+    session = _Session()
+    consumed = []
+
+    def ids():
+        for i in range(200):
+            consumed.append(i)
+            yield i
+
+    async def run():
+        client = _client(session, max_concurrency=4)
+        out = {}
+        async for as_id, result in client.amap_assets(client.get_inspections, ids(),
+                                                      max_in_flight=8):
+            assert len(consumed) - len(out) <= 8  # input is pulled lazily
+            out[as_id] = result
+        return out
+
+    out = asyncio.run(run())
+    assert sorted(out) == list(range(200))
+    assert all(out[i] == [{"as_id": i}] for i in out)
+    assert session.peak <= 4
+
+
+def test_transient_errors_retry_and_exceptions_are_yielded():
+    session = _Session(fail={3: 503, 5: 429})
+
+    async def boom(as_id):
+        raise KeyError(as_id)
+
+    async def run():
+        client = _client(session)
+        got = dict([pair async for pair in client.amap_assets(client.get_inspections,
+                                                              range(8))])
+        errors = [r async for _, r in client.amap_assets(boom, range(2))]
+        return got, errors
+
+    got, errors = asyncio.run(run())
+    assert got[3] == [{"as_id": 3}] and got[5] == [{"as_id": 5}]
+    assert session.calls.count("memory://aw/api/InspectionReport/GetAllApproved/3") == 2
+    assert all(isinstance(e, KeyError) for e in errors)
+
+
+def test_early_exit_cancels_pending():
+    session = _Session(delay=0.05)
+
+    async def run():
+        client = _client(session, max_concurrency=2)
+        stream = client.amap_assets(client.get_inspections, range(1000))
+        async for _ in stream:
+            break
+        await stream.aclose()
+        return len(session.calls)
+
+    assert asyncio.run(run()) <= 4
+
+
+def test_token_bucket_limits_rate():
+    async def run():
+        bucket = TokenBucket(rate=100.0, capacity=1)
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(11)))
+        return time.perf_counter() - start
+
+    assert asyncio.run(run()) >= 0.09
+
+
+def test_sync_map_assets_is_bounded():
+    class _Offline(AssetWiseClient):
+        @staticmethod
+        def _load_auth():
+            return None
+
+    consumed = []
+
+    def ids():
+        for i in range(100):
+            consumed.append(i)
+            yield i
+
+    seen = []
+    for item, result in _Offline().map_assets(lambda i: i * i, ids(), max_workers=3):
+        assert len(consumed) - len(seen) <= 7  # window + the item being yielded
+        seen.append(item)
+        assert result == item * item
+    assert sorted(seen) == list(range(100))
@@ -0,0 +1,141 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Response cache: freshness, conditional revalidation, LRU bounds,
+SQLite persistence and counters, against an in-memory fake server."""
+
+import pytest
+
+from civilpy.state.ohio.DOT.arcgis_download import IncompleteDownloadError, arcgis_json
+from civilpy.state.ohio.DOT.http_cache import (
+    MemoryCache,
+    ResponseCache,
+    SQLiteCache,
+    configure_cache,
+)
+
+URL = "memory://TIMS/Assets/MapServer/5/query"
+
+
+class _Response:
+    def __init__(self, body, status_code=200, headers=None):
+        self._body, self.status_code = body, status_code
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return self._body
+
+
+class _Server:
+    """Serves a versioned body with an ETag, honouring If-None-Match."""
+
+    def __init__(self, etag=True):
+        self.version, self.etag, self.calls = 1, etag, []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls.append(dict(headers or {}))
+        tag = f'"v{self.version}"'
+        if self.etag and (headers or {}).get("If-None-Match") == tag:
+            return _Response(None, status_code=304)
+        body = {"features": [{"attributes": {"SFN": params["sfn"], "v": self.version}}]}
+        return _Response(body, headers={"ETag": tag} if self.etag else {})
+
+
+def _cache(server, backend=None, **kwargs):
+    return ResponseCache(MemoryCache() if backend is None else backend,
+                         session=server, **kwargs)
+
+
+def test_fresh_entries_are_hits():
+    server = _Server()
+    cache = _cache(server)
+    first = cache.get_json(URL, params={"sfn": "1"}, ttl=60)
+    first["features"].clear()  # callers can't corrupt the cached body
+    again = cache.get_json(URL, params={"sfn": "1"}, ttl=60)
+    assert again["features"][0]["attributes"]["SFN"] == "1"
+    cache.get_json(URL, params={"sfn": "2"}, ttl=60)
+    assert len(server.calls) == 2
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert cache.stats.hit_rate == pytest.approx(1 / 3)
+
+
+def test_stale_entry_revalidates_with_etag(monkeypatch):
+    server = _Server()
+    cache = _cache(server)
+    clock = [1000.0]
+    monkeypatch.setattr("civilpy.state.ohio.DOT.http_cache.time.time", lambda: clock[0])
+    cache.get_json(URL, params={"sfn": "1"}, ttl=60)
+    clock[0] += 120
+    assert cache.get_json(URL, params={"sfn": "1"}, ttl=60)["features"][0]["attributes"]["v"] == 1
+    assert server.calls[-1] == {"If-None-Match": '"v1"'}
+    assert cache.stats.revalidated == 1
+    clock[0] += 30  # renewed by the 304
+    cache.get_json(URL, params={"sfn": "1"}, ttl=60)
+    assert len(server.calls) == 2
+
+    server.version = 2
+    clock[0] += 120
+    assert cache.get_json(URL, params={"sfn": "1"}, ttl=60)["features"][0]["attributes"]["v"] == 2
+    assert cache.stats.misses == 2
+
+
+def test_per_layer_ttl_overrides_and_disabled_cache():
+    server = _Server(etag=False)
+    cache = _cache(server, ttls={"memory://TIMS/": 0.0})
+    cache.get_json(URL, params={"sfn": "1"}, ttl=60)
+    cache.get_json(URL, params={"sfn": "1"}, ttl=60)
+    assert len(server.calls) == 2 and server.calls[-1] == {}
+
+    off = ResponseCache(None, session=server)
+    off.get_json(URL, params={"sfn": "1"})
+    off.get_json(URL, params={"sfn": "1"})
+    assert len(server.calls) == 4
+    with pytest.raises(ValueError, match="Unknown cache backend"):
+        configure_cache("redis")
+
+
+def test_lru_evicts_oldest():
+    lru = MemoryCache(max_entries=2)
+    for key in "abc":
+        lru.set(key, ("{}", 0.0, None, None))
+        lru.get("a")
+    assert lru.get("b") is None and lru.get("a") is not None and len(lru) == 2
+
+
+def test_sqlite_backend_persists(tmp_path):
+    path = str(tmp_path / "cache.sqlite")
+    server = _Server()
+    _cache(server, backend=SQLiteCache(path)).get_json(URL, params={"sfn": "7"}, ttl=60)
+    reopened = _cache(server, backend=SQLiteCache(path))
+    assert reopened.get_json(URL, params={"sfn": "7"}, ttl=60)["features"][0]["attributes"]["SFN"] == "7"
+    assert len(server.calls) == 1 and reopened.stats.hits == 1
+
+
+def test_error_payloads_are_not_cached():
+    class _Broken(_Server):
+        def get(self, url, params=None, headers=None, timeout=None):
+            self.calls.append(headers)
+            return _Response({"error": {"code": 400}})
+
+    server = _Broken()
+    cache = _cache(server)
+    for _ in range(2):
+        with pytest.raises(IncompleteDownloadError):
+            cache.get_json(URL, params={"sfn": "1"}, validate=arcgis_json, retries=0)
+    assert len(server.calls) == 2 and len(cache.backend) == 0
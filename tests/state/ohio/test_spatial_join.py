@@ -0,0 +1,102 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Batched point-to-polyline join: must reproduce the per-point box
+intersection the server query performs."""
+
+import numpy as np
+
+from civilpy.state.ohio.DOT.spatial_join import (
+    max_per_point,
+    polyline_segments,
+    segments_in_boxes,
+    tile_groups,
+)
+
+RNG = np.random.default_rng(8)
+HALF_W, HALF_H = 0.1 / 54.6, 0.1 / 69.0
+
+
+def _flowlines(n):
+    features = []
+    for k in range(n):
+        start = RNG.uniform([-83.1, 40.0], [-82.9, 40.2])
+        steps = RNG.normal(0.0, 0.004, (RNG.integers(1, 8), 2))
+        if k % 10 == 0:
+            steps[:, 1] = 0.0  # horizontal reach
+        path = np.vstack((start, start + np.cumsum(steps, axis=0)))
+        features.append({"StreamOrder": None if k % 7 == 0 else int(k % 6) + 1,
+                         "_geometry": {"paths": [path.tolist()]}})
+    features.append({"StreamOrder": 9, "_geometry": {"x": -83.0, "y": 40.1}})
+    return features
+
+
+def _orient(ax, ay, bx, by, cx, cy):
+    return np.sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+def _segments_cross(p1, p2, q1, q2):
+    d1, d2 = _orient(*q1, *q2, *p1), _orient(*q1, *q2, *p2)
+    d3, d4 = _orient(*p1, *p2, *q1), _orient(*p1, *p2, *q2)
+    return d1 * d2 <= 0 and d3 * d4 <= 0 and not (d1 == d2 == d3 == d4 == 0)
+
+
+def _touches(px, py, a, b):
+    lo, hi = (px - HALF_W, py - HALF_H), (px + HALF_W, py + HALF_H)
+    inside = lambda p: lo[0] <= p[0] <= hi[0] and lo[1] <= p[1] <= hi[1]
+    if inside(a) or inside(b):
+        return True
+    corners = [(lo[0], lo[1]), (hi[0], lo[1]), (hi[0], hi[1]), (lo[0], hi[1])]
+    return any(_segments_cross(a, b, corners[i], corners[(i + 1) % 4])
+               for i in range(4))
+
+
+def test_join_matches_brute_force():
+    features = _flowlines(80)
+    px = RNG.uniform(-83.1, -82.9, 150)
+    py = RNG.uniform(40.0, 40.2, 150)
+    px[0], py[0] = -83.0 + 0.5 * HALF_W, 40.1  # on the point feature
+    x0, y0, x1, y1, owner = polyline_segments(features)
+    got = set(zip(*segments_in_boxes(px, py, HALF_W, HALF_H, x0, y0, x1, y1)))
+    expected = {(i, s) for i in range(px.size) for s in range(x0.size)
+                if _touches(px[i], py[i], (x0[s], y0[s]), (x1[s], y1[s]))}
+    assert got == expected
+    assert any(owner[s] == len(features) - 1 for i, s in got if i == 0)
+
+
+def test_max_per_point():
+    pairs = (np.array([0, 0, 2, 2]), np.array([0, 1, 1, 2]))
+    assert max_per_point(3, pairs, [3, None, 5]) == [3, None, 5]
+    owner = np.array([1, 0, 0])
+    assert max_per_point(3, pairs, [4, 2], owner=owner) == [4, None, 4]
+
+
+def test_empty_inputs():
+    x0, y0, x1, y1, owner = polyline_segments([{"_geometry": None}])
+    pt, seg = segments_in_boxes([-83.0], [40.0], HALF_W, HALF_H, x0, y0, x1, y1)
+    assert pt.size == seg.size == 0
+    assert max_per_point(1, (pt, seg), [], owner=owner) == [None]
+
+
+def test_tile_groups_partition_points():
+    lon = RNG.uniform(-84.8, -80.6, 500)
+    lat = RNG.uniform(38.5, 41.9, 500)
+    groups = tile_groups(lon, lat, 25.0)
+    assert sorted(np.concatenate(groups).tolist()) == list(range(500))
+    for idx in groups:
+        assert np.ptp(lat[idx]) <= 25.0 / 69.0
+        assert np.ptp(lon[idx]) <= 25.0 / 54.6
+    assert len(tile_groups(lon[:1], lat[:1], 25.0)) == 1
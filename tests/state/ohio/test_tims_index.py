@@ -0,0 +1,174 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Offline point-layer snapshot: spatial queries against brute-force
+haversine, persistence, and complete-or-nothing pulls from a layer."""
+
+import math
+import os
+
+import numpy as np
+import pytest
+
+from civilpy.state.ohio.DOT.arcgis_download import IncompleteDownloadError
+from civilpy.state.ohio.DOT.tims_index import (
+    PointSnapshot,
+    haversine_miles,
+    load_or_pull,
+    parse_where,
+)
+
+RNG = np.random.default_rng(3)
+N = 2000
+
+
+def _records():
+    lat = RNG.uniform(38.5, 41.9, N)
+    lon = RNG.uniform(-84.8, -80.6, N)
+    records = [
+        {"OBJECTID": i + 1, "SFN": f"{7000000 + i}", "LATITUDE_DD": float(lat[i]),
+         "LONGITUDE_DD": float(lon[i]), "MAINT_RESP_CD": "01" if i % 3 else "02",
+         "COUNTY_CD": "DEL" if i % 2 else "FRA"}
+        for i in range(N)
+    ]
+    records.append({"OBJECTID": N + 1, "SFN": "0000000", "LATITUDE_DD": None,
+                    "LONGITUDE_DD": None, "MAINT_RESP_CD": "01", "COUNTY_CD": "DEL"})
+    return records
+
+
+RECORDS = _records()
+SNAP = PointSnapshot.from_records(RECORDS)
+CENTER = (-82.95, 40.18)
+
+
+def _brute(lon, lat, radius, pred=lambda r: True):
+    out = []
+    for r in RECORDS:
+        if r["LATITUDE_DD"] is None or not pred(r):
+            continue
+        d = haversine_miles(lat, lon, r["LATITUDE_DD"], r["LONGITUDE_DD"])
+        if d <= radius:
+            out.append((float(d), r["SFN"]))
+    return sorted(out)
+
+
+class _Layer:
+    """Stands in for ArcGISLayer.download; ``error`` is raised in place of
+    returning rows, as when a page still fails after retrying."""
+
+    def __init__(self, records, error=None):
+        self.records, self.error, self.calls = records, error, []
+        self._url = "memory://bridges"
+
+    def download(self, where, out_fields, return_geometry, max_workers, checkpoint_dir):
+        self.calls.append(where)
+        if self.error is not None:
+            raise self.error
+        return [dict(r) for r in self.records]
+
+
+class TestQueries:
+    def test_haversine_matches_scalar_formula(self):
+        d = haversine_miles(40.0, -83.0, 41.0, -82.0)
+        dlat, dlon = math.radians(1.0), math.radians(1.0)
+        a = (math.sin(dlat / 2) ** 2 + math.cos(math.radians(40.0))
+             * math.cos(math.radians(41.0)) * math.sin(dlon / 2) ** 2)
+        assert float(d) == pytest.approx(3958.8 * 2 * math.asin(math.sqrt(a)))
+
+    @pytest.mark.parametrize("radius", [0.5, 5.0, 25.0])
+    def test_near_matches_brute_force(self, radius):
+        got = SNAP.near(*CENTER, radius_miles=radius)
+        expected = _brute(*CENTER, radius)
+        assert [r["SFN"] for r in got] == [sfn for _, sfn in expected]
+        assert [r["distance_miles"] for r in got] == [round(d, 2) for d, _ in expected]
+
+    def test_near_with_where_filter(self):
+        got = SNAP.near(*CENTER, radius_miles=20.0, where="MAINT_RESP_CD='01'")
+        expected = _brute(*CENTER, 20.0, lambda r: r["MAINT_RESP_CD"] == "01")
+        assert [r["SFN"] for r in got] == [sfn for _, sfn in expected]
+
+    def test_nearest(self):
+        expected = _brute(*CENTER, 1e9)[:5]
+        got = SNAP.nearest(*CENTER, k=5)
+        assert [r["SFN"] for r in got] == [sfn for _, sfn in expected]
+        filtered = SNAP.nearest(*CENTER, k=3, COUNTY_CD="FRA")
+        assert all(r["COUNTY_CD"] == "FRA" for r in filtered)
+        assert len(filtered) == 3
+
+    def test_within_bbox(self):
+        got = SNAP.within_bbox(-83.2, 40.0, -82.7, 40.4, where="COUNTY_CD='DEL'")
+        expected = [r["SFN"] for r in RECORDS
+                    if r["LATITUDE_DD"] is not None
+                    and -83.2 <= r["LONGITUDE_DD"] <= -82.7
+                    and 40.0 <= r["LATITUDE_DD"] <= 40.4
+                    and r["COUNTY_CD"] == "DEL"]
+        assert [r["SFN"] for r in got] == expected
+
+    def test_unlocated_features_only_answer_filters(self):
+        assert N in SNAP.select(where="SFN='0000000'")
+        assert all(r["SFN"] != "0000000" for r in SNAP.near(*CENTER, 500.0))
+
+    def test_parse_where(self):
+        assert parse_where("1=1") == {}
+        assert parse_where("MAINT_RESP_CD='01' AND COUNTY_CD='DEL'") == {
+            "MAINT_RESP_CD": "01", "COUNTY_CD": "DEL"}
+        assert parse_where("ADT > 1000") is None
+        with pytest.raises(ValueError, match="offline"):
+            SNAP.select(where="ADT > 1000")
+
+
+class TestPersistence:
+    def test_save_load_round_trip(self, tmp_path):
+        path = tmp_path / "bridges.npz"
+        SNAP.save(str(path))
+        loaded = PointSnapshot.load(str(path))
+        assert len(loaded) == len(SNAP)
+        assert loaded.record(7) == SNAP.record(7)
+        assert loaded.near(*CENTER, 5.0) == SNAP.near(*CENTER, 5.0)
+
+    def test_from_layer_downloads_every_feature(self):
+        layer = _Layer(RECORDS)
+        snap = PointSnapshot.from_layer(layer, where="COUNTY_CD='FRA'")
+        assert len(snap) == len(RECORDS)
+        assert layer.calls == ["COUNTY_CD='FRA'"]
+        assert snap.meta["source"] == "memory://bridges"
+
+    def test_failed_or_empty_pull_is_never_saved(self, tmp_path):
+        path = str(tmp_path / "snap.npz")
+        broken = _Layer(RECORDS, error=IncompleteDownloadError("page 3 failed"))
+        with pytest.raises(IncompleteDownloadError):
+            load_or_pull("x", lambda: PointSnapshot.from_layer(broken), path=path)
+        assert not os.path.exists(path)
+
+        SNAP.save(path)
+        with pytest.raises(ValueError, match="no features"):
+            load_or_pull("x", lambda: PointSnapshot.from_layer(_Layer([])),
+                         path=path, refresh=True)
+        assert len(PointSnapshot.load(path)) == len(SNAP)
+
+    def test_load_or_pull_reuses_fresh_file(self, tmp_path):
+        path = str(tmp_path / "snap.npz")
+        pulls = []
+
+        def pull():
+            pulls.append(1)
+            return PointSnapshot.from_records(RECORDS[:10], meta={"pulled": 0.0})
+
+        load_or_pull("x", pull, path=path)
+        load_or_pull("x", pull, path=path)
+        assert len(pulls) == 1
+        load_or_pull("x", pull, path=path, max_age_days=1.0)  # pulled at epoch
+        assert len(pulls) == 2
@@ -0,0 +1,285 @@
+#  CivilPy
+#  Copyright (C) 2026 Dane Parks
+#
+#  This program is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Affero General Public License as published by
+#  the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Affero General Public License for more details.
+#
+#  You should have received a copy of the GNU Affero General Public License
+#  along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+"""Array mode of the LRFD checks: every ``check.batch`` row must match the
+scalar check evaluated on that row's inputs."""
+
+import math
+
+import numpy as np
+import pytest
+
+from civilpy.structural.aashto import lrfd
+
+N = 300
+RNG = np.random.default_rng(11)
+
+
+def _uniform(lo, hi):
+    return RNG.uniform(lo, hi, N)
+
+
+def _assert_rows_match(check, batch, columns, **shared):
+    assert len(batch) == N
+    for i in range(N):
+        kwargs = {k: v[i].item() for k, v in columns.items()}
+        expected = check(**kwargs, **shared)
+        got = batch[i]
+        assert got.article == expected.article
+        assert got.capacity == pytest.approx(expected.capacity, rel=1e-12)
+        assert got.phi == pytest.approx(expected.phi)
+        if expected.demand is None:
+            assert got.demand is None
+        else:
+            assert got.demand == pytest.approx(expected.demand)
+            assert bool(batch.ok[i]) == expected.ok
+        for key, value in expected.details.items():
+            if isinstance(value, float):
+                assert got.details[key] == pytest.approx(value, rel=1e-12), key
+            else:
+                assert got.details[key] == value, key
+
+
+class TestSteelBatch:
+    def test_flange_local_buckling(self):
+        cols = {"b_fc": _uniform(10.0, 26.0), "t_fc": _uniform(0.625, 1.5),
+                "f_yc": RNG.choice([36.0, 50.0, 70.0], N),
+                "f_yw": RNG.choice([36.0, 50.0], N), "f_bu": _uniform(20.0, 60.0)}
+        batch = lrfd.flange_local_buckling_resistance.batch(**cols, r_h=0.98)
+        assert 0 < batch.details["compact"].sum() < N
+        _assert_rows_match(lrfd.flange_local_buckling_resistance, batch, cols,
+                           r_h=0.98)
+
+    def test_lateral_torsional_buckling_covers_all_regimes(self):
+        cols = {"l_b": _uniform(40.0, 600.0), "b_fc": _uniform(12.0, 22.0),
+                "t_fc": _uniform(0.75, 1.5), "d_c": _uniform(20.0, 40.0),
+                "t_w": _uniform(0.4, 0.7), "f_yc": RNG.choice([50.0, 70.0], N),
+                "f_yw": 50.0 + np.zeros(N), "c_b": _uniform(1.0, 1.75),
+                "f_bu": _uniform(10.0, 50.0)}
+        batch = lrfd.lateral_torsional_buckling_resistance.batch(**cols)
+        assert set(batch.details["regime"]) == {
+            "inelastic-plateau", "inelastic", "elastic"
+        }
+        _assert_rows_match(lrfd.lateral_torsional_buckling_resistance, batch,
+                           cols)
+
+    def test_web_shear_mixed_stiffening(self):
+        d_web = _uniform(30.0, 80.0)
+        d_o = np.where(RNG.random(N) < 0.3, np.nan, d_web * _uniform(0.8, 3.0))
+        tension_field = RNG.random(N) < 0.5
+        flanges = {"b_fc": _uniform(8.0, 20.0), "t_fc": _uniform(0.5, 1.5),
+                   "b_ft": _uniform(8.0, 20.0), "t_ft": _uniform(0.5, 1.5)}
+        cols = {"d_web": d_web, "t_w": _uniform(0.375, 0.75),
+                "f_yw": RNG.choice([36.0, 50.0], N), "v_u": _uniform(50, 600),
+                **flanges}
+        batch = lrfd.web_shear_resistance.batch(
+            **cols, d_o=d_o, tension_field=tension_field
+        )
+        assert {"6.10.9.2-1", "6.10.9.3.2-1", "6.10.9.3.2-2",
+                "6.10.9.3.2-8"} <= set(batch.details["equation"])
+        for i in range(N):
+            row = {k: v[i].item() for k, v in cols.items()}
+            expected = lrfd.web_shear_resistance(
+                **row,
+                d_o=None if math.isnan(d_o[i]) else d_o[i].item(),
+                tension_field=bool(tension_field[i]),
+            )
+            assert batch[i].capacity == pytest.approx(expected.capacity)
+            assert batch[i].details["equation"] == expected.details["equation"]
+
+    def test_web_shear_tension_field_needs_flanges(self):
+        with pytest.raises(ValueError, match="flange dimensions"):
+            lrfd.web_shear_resistance.batch(
+                d_web=np.array([60.0, 60.0]), t_w=0.5, f_yw=50.0,
+                d_o=np.array([90.0, np.nan]), tension_field=True,
+            )
+
+    @pytest.mark.parametrize("check, cols", [
+        (lrfd.tension_flange_resistance,
+         {"f_yt": 50.0, "f_bu": (20.0, 60.0), "f_l": (0.0, 10.0)}),
+        (lrfd.hybrid_factor,
+         {"d_n": (20.0, 40.0), "t_w": (0.4, 0.7), "a_fn": (8.0, 30.0),
+          "f_yw": 50.0, "f_n": (40.0, 70.0)}),
+        (lrfd.web_load_shedding_factor,
+         {"d_c": (20.0, 50.0), "t_w": (0.35, 0.7), "b_fc": (12.0, 20.0),
+          "t_fc": (0.75, 1.5), "f_yc": 50.0}),
+        (lrfd.tension_member_resistance,
+         {"a_g": (5.0, 20.0), "f_y": 50.0, "a_n": (4.0, 18.0), "f_u": 65.0,
+          "u_shear_lag": (0.7, 1.0), "p_u": (100.0, 900.0)}),
+        (lrfd.compression_member_resistance,
+         {"a_g": (5.0, 20.0), "f_y": 50.0, "kl_over_r": (20.0, 200.0),
+          "p_u": (50.0, 800.0), "design_year": (1990.0, 2030.0)}),
+    ])
+    def test_closed_form_checks(self, check, cols):
+        arrays = {k: (_uniform(*v) if isinstance(v, tuple) else np.full(N, v))
+                  for k, v in cols.items()}
+        if "design_year" in arrays:
+            arrays["design_year"] = np.floor(arrays["design_year"])
+        _assert_rows_match(check, check.batch(**arrays), arrays)
+
+
+class TestConcreteBatch:
+    def test_rc_shear(self):
+        cols = {"b_v": _uniform(8.0, 48.0), "d_v": _uniform(12.0, 60.0),
+                "f_c": RNG.choice([3.0, 4.0, 5.0], N), "v_u": _uniform(10, 400),
+                "a_v": RNG.choice([0.0, 0.22, 0.4, 0.62], N),
+                "s": _uniform(4.0, 18.0), "theta_deg": _uniform(30.0, 45.0)}
+        batch = lrfd.rc_shear_resistance.batch(**cols)
+        _assert_rows_match(lrfd.rc_shear_resistance, batch, cols)
+
+
+class TestCheckResultBatch:
+    def test_ratio_handles_zero_and_missing_demand(self):
+        batch = lrfd.tension_flange_resistance.batch(
+            f_yt=50.0, f_bu=np.array([25.0, 0.0, np.nan])
+        )
+        assert batch.ratio[0] == pytest.approx(2.0)
+        assert batch.ratio[1] == math.inf
+        assert math.isnan(batch.ratio[2])
+        assert batch.ok.tolist() == [True, True, False]
+        assert batch[2].demand is None and batch[2].ok is None
+
+    def test_no_demand(self):
+        batch = lrfd.hybrid_factor.batch(
+            d_n=np.array([30.0, 35.0]), t_w=0.5, a_fn=16.0, f_yw=36.0, f_n=50.0
+        )
+        assert batch.demand is None and batch.ratio is None
+        assert batch.ok is None
+
+    def test_scalar_inputs_give_one_row(self):
+        batch = lrfd.rc_shear_resistance.batch(b_v=12.0, d_v=20.0, f_c=4.0)
+        assert len(batch) == 1
+        assert batch[0].capacity == pytest.approx(
+            lrfd.rc_shear_resistance(12.0, 20.0, 4.0).capacity
+        )
+
+    def test_unvectorized_check_falls_back_to_loop(self):
+        deltas = np.array([3.0, 12.0, 20.0])
+        batch = lrfd.fatigue_resistance.batch("C", delta_f=deltas)
+        assert isinstance(batch, lrfd.CheckResultBatch)
+        assert batch.capacity.tolist() == [10.0, 10.0, 10.0]
+        assert batch.ok.tolist() == [True, False, False]
+        assert batch[0].details["category"] == "C"
+
+    def test_from_results_round_trip(self):
+        results = [lrfd.flange_local_buckling_resistance(b, 1.0, 50.0, 50.0,
+                                                         f_bu=40.0)
+                   for b in (14.0, 20.0, 24.0)]
+        batch = lrfd.CheckResultBatch.from_results(results)
+        assert [r.capacity for r in batch] == [r.capacity for r in results]
+        assert batch.details["compact"].tolist() == [True, False, False]
+
+    def test_screening_many_sections_is_fast(self):
+        import time
+
+        n = 50_000
+        rng = np.random.default_rng(3)
+        start = time.perf_counter()
+        batch = lrfd.lateral_torsional_buckling_resistance.batch(
+            l_b=rng.uniform(60, 400, n), b_fc=rng.uniform(12, 24, n),
+            t_fc=rng.uniform(0.75, 2.0, n), d_c=rng.uniform(20, 40, n),
+            t_w=rng.uniform(0.44, 0.75, n), f_yc=50.0, f_yw=50.0,
+            f_bu=rng.uniform(10, 50, n),
+        )
+        assert time.perf_counter() - start < 2.0
+        assert len(batch) == n and batch.ok.dtype == bool
+
+
+def _flb_batch(n=6):
+    return lrfd.flange_local_buckling_resistance.batch(
+        b_fc=np.linspace(12.0, 28.0, n), t_fc=1.0, f_yc=50.0, f_yw=50.0,
+        f_bu=np.linspace(30.0, 55.0, n),
+    )
+
+
+class TestLazyDetails:
+    def test_details_are_not_held_until_requested(self):
+        batch = _flb_batch()
+        assert batch._details is None
+        subset = batch.details_for([1, 4])
+        assert batch._details is None
+        eager = lrfd.flange_local_buckling_resistance.batch.__wrapped__(
+            b_fc=np.linspace(12.0, 28.0, 6), t_fc=1.0, f_yc=50.0, f_yw=50.0,
+        ).details
+        for key, column in subset.items():
+            assert column.tolist() == eager[key][[1, 4]].tolist(), key
+
+    def test_failures_carry_details(self):
+        batch = _flb_batch()
+        failing = batch.failing()
+        assert failing.tolist() == np.flatnonzero(batch.ratio < 1.0).tolist()
+        failures = batch.failures()
+        assert [f.capacity for f in failures] == batch.capacity[failing].tolist()
+        assert all(f.ok is False and "lambda_f" in f.details for f in failures)
+
+    def test_looped_checks_recompute_details(self):
+        batch = lrfd.fatigue_resistance.batch(
+            np.array(["A", "C", "E"]), delta_f=np.array([5.0, 12.0, 3.0])
+        )
+        assert batch._details is None
+        assert batch.details_for([2])["category"].tolist() == ["E"]
+        assert batch.failures()[0].details["category"] == "C"
+
+    def test_strings_are_interned_once(self):
+        a, b = _flb_batch(), _flb_batch(3)
+        assert a.article is b.article
+        assert a[0].name is a[5].name
+
+
+class TestMixedBatches:
+    def test_concat_keeps_per_row_checks(self):
+        flb = _flb_batch(4)
+        shear = lrfd.rc_shear_resistance.batch(
+            b_v=np.array([12.0, 18.0]), d_v=20.0, f_c=4.0
+        )
+        table = lrfd.CheckResultBatch.concat([flb, shear])
+        assert len(table) == 6
+        assert table.article.tolist() == ["6.10.8.2.2"] * 4 + ["5.7.3.3"] * 2
+        assert math.isnan(table.demand[5]) and table[5].demand is None
+        assert table[4].capacity == pytest.approx(shear[0].capacity)
+        assert set(table[4].details) == set(shear[0].details)
+        assert table[1].details == flb[1].details
+
+    def test_dataframe_round_trip(self):
+        table = lrfd.CheckResultBatch.concat([
+            _flb_batch(4),
+            lrfd.tension_flange_resistance.batch(f_yt=50.0, f_bu=[40.0, 60.0]),
+        ])
+        frame = table.to_dataframe()
+        assert str(frame["article"].dtype) == "category"
+        assert frame["ok"].tolist() == table.ok.tolist()
+        back = lrfd.CheckResultBatch.from_dataframe(frame)
+        assert back.article.tolist() == table.article.tolist()
+        assert back.capacity.tolist() == table.capacity.tolist()
+        assert back.ratio.tolist() == table.ratio.tolist()
+
+    def test_dataframe_with_details(self):
+        frame = _flb_batch().to_dataframe(details=True)
+        assert frame["compact"].dtype == bool
+        back = lrfd.CheckResultBatch.from_dataframe(frame)
+        assert back[0].details["lambda_f"] == pytest.approx(6.0)
+
+    def test_arrow_round_trip(self):
+        pa = pytest.importorskip("pyarrow")
+        batch = lrfd.tension_flange_resistance.batch(
+            f_yt=50.0, f_bu=np.array([25.0, np.nan, 60.0])
+        )
+        table = batch.to_arrow(details=True)
+        assert pa.types.is_dictionary(table.schema.field("article").type)
+        assert table.column("demand").null_count == 1
+        back = lrfd.CheckResultBatch.from_arrow(table)
+        assert back[1].demand is None
+        assert back.capacity.tolist() == batch.capacity.tolist()
@@ -20,6 +20,7 @@ diagram's anchor points."""
 
 import math
 
+import numpy as np
 import pytest
 
 from civilpy.structural.aashto import lrfd
@@ -155,6 +156,61 @@ class TestCapacityCheck:
         assert 0.60 not in passing  # 8 #7s shouldn't make it
 
 
+class TestDiagramEngine:
+    """Array diagram, section cache, and many-demand checks."""
+
+    def test_points_match_array_diagram(self):
+        points = lrfd.rc_pm_interaction_diagram(**RECT)
+        diagram = lrfd.rc_pm_diagram(**RECT)
+        assert len(points) == len(diagram)
+        assert [pt.p_n for pt in points] == diagram.p_n.tolist()
+        assert [pt.phi_mn for pt in points] == pytest.approx(diagram.phi_mn)
+
+    def test_diagram_cached_by_section(self):
+        first = lrfd.rc_pm_diagram(**RECT)
+        again = lrfd.rc_pm_diagram(**dict(RECT, layers=list(LAYERS)))
+        other = lrfd.rc_pm_diagram(**dict(RECT, f_c=5.0))
+        assert first is again
+        assert other is not first
+        assert not first.p_n.flags.writeable
+
+    def test_moment_capacity_matches_scalar_check(self):
+        diagram = lrfd.rc_pm_diagram(**RECT)
+        p_u = np.linspace(-700.0, 2000.0, 55)
+        expected = [lrfd.rc_pm_capacity_check(p_u=p, m_u=0.0, **RECT).capacity
+                    for p in p_u]
+        np.testing.assert_allclose(diagram.moment_capacity(p_u), expected)
+
+    def test_contains_agrees_with_interpolated_capacity(self):
+        diagram = lrfd.rc_pm_diagram(**RECT)
+        rng = np.random.default_rng(5)
+        p_u = rng.uniform(-800.0, 1600.0, 2000)
+        m_u = rng.uniform(-7000.0, 7000.0, 2000)
+        m_r = diagram.moment_capacity(p_u)
+        clear = np.abs(np.abs(m_u) - m_r) > 1.0  # away from the boundary
+        inside = diagram.contains(p_u, m_u)
+        np.testing.assert_array_equal(inside[clear], (np.abs(m_u) < m_r)[clear])
+
+    def test_capacity_batch_matches_scalar(self):
+        p_u = np.array([-100.0, 200.0, 500.0, 1400.0, 10000.0])
+        m_u = np.array([500.0, 3000.0, 2000.0, 100.0, 100.0])
+        batch = lrfd.rc_pm_capacity_check.batch(p_u, m_u, **RECT)
+        assert batch._details is None  # details are built only for rows asked for
+        for i in range(len(p_u)):
+            expected = lrfd.rc_pm_capacity_check(p_u=p_u[i], m_u=m_u[i], **RECT)
+            assert batch[i].capacity == pytest.approx(expected.capacity)
+            assert bool(batch.ok[i]) == expected.ok
+            assert batch[i].details == pytest.approx(expected.details)
+
+    def test_diagram_phi_follows_phi_flexure(self):
+        from civilpy.structural.aashto.lrfd.concrete import phi_flexure
+
+        diagram = lrfd.rc_pm_diagram(**RECT)
+        np.testing.assert_allclose(diagram.phi[1:], phi_flexure(diagram.eps_t[1:]))
+        assert phi_flexure(np.array([0.001, 0.0035, 0.01])).tolist() == pytest.approx(
+            [phi_flexure(e) for e in (0.001, 0.0035, 0.01)])
+
+
 class TestBiaxial:
     def test_low_axial_moment_contour(self):
         r = lrfd.rc_biaxial_check(
@@ -673,3 +673,99 @@ class TestMovingLoads:
         assert res_ax is None
         plt.close("all")
 
+
+    def test_influence_envelope_matches_symbolic(self):
+        beam = Beam(30)
+        beam.pinned_support = 4
+        beam.rolling_support = 26
+        loads = [PointLoadV(8, 0), PointLoadV(32, 7), PointLoadV(32, 14)]
+
+        fast = beam.get_envelope(loads, step_size=4.0)
+        ref = beam.get_envelope(loads, step_size=4.0, method="symbolic")
+
+        for a, b in zip(fast, ref):
+            assert np.allclose(a, b, atol=1e-9)
+
+    def test_envelope_unknown_method(self):
+        with pytest.raises(ValueError):
+            Beam(10).get_envelope([PointLoadV(10, 0)], method="fem")
+
+    @pytest.mark.parametrize("beam", [
+        CantileverBeam(12),
+        ProppedCantileverBeam(20),
+        FixedFixedBeam(20),
+        ContinuousBeam(20, intermediate_supports=[10]),
+    ])
+    def test_influence_matrices_match_static_solution(self, beam):
+        from sympy import lambdify
+        if isinstance(beam, ContinuousBeam):
+            beam.pinned_support = 0
+            beam.rolling_support = 20
+        loads = [(10, 3), (6, 8)]
+        beam.add_loads([PointLoadV(f, c) for f, c in loads])
+
+        x_vec = np.linspace(0, beam.length, 201)
+        shear = lambdify(x, sum(beam._shear_forces), "numpy")(x_vec)
+        moment = lambdify(x, sum(beam._bending_moments), "numpy")(x_vec)
+
+        shear_il, moment_il = beam.get_influence_matrices(x_vec, [c for _, c in loads])
+        forces = np.array([f for f, _ in loads])
+        assert np.allclose(shear_il @ forces, shear, atol=1e-9)
+        assert np.allclose(moment_il @ forces, moment, atol=1e-9)
+
+    def test_fixed_fixed_moving_load_end_moment(self):
+        # Max fixed-end moment under a single moving load is 4PL/27 at a = L/3
+        L, P = 27, 10
+        beam = FixedFixedBeam(L)
+        _, _, _, _, min_m = beam.get_envelope([PointLoadV(P, 0)], step_size=1.0)
+        assert np.isclose(min_m[0], -4 * P * L / 27)
+
+
+class TestCompiledCache:
+    @staticmethod
+    def _simple_beam():
+        beam = Beam(10)
+        beam.pinned_support = 0
+        beam.rolling_support = 10
+        beam.add_loads([PointLoadV(10, 5)])
+        return beam
+
+    def test_compiled_function_values(self):
+        beam = self._simple_beam()
+        x_vec = np.array([0.0, 2.5, 5.0, 7.5])
+        assert np.allclose(beam.get_compiled_function("moment")(x_vec), [0, 12.5, 25, 12.5])
+        assert np.allclose(beam.get_compiled_function("shear")(x_vec), [5, 5, -5, -5])
+        assert np.allclose(beam.get_compiled_function("normal")(x_vec), 0)
+        defl = beam.get_compiled_function("deflection", E_ksi=29000, I_in4=100)(5.0)
+        assert np.isclose(defl, -10 * 10**3 * 1728 / (48 * 29000 * 100))
+
+    def test_compiled_function_is_reused(self):
+        beam = self._simple_beam()
+        f = beam.get_compiled_function("moment")
+        assert beam.get_compiled_function("moment") is f
+        assert beam.get_moment_function() is beam.get_moment_function()
+        assert beam.get_deflection_function(29000, 100) is beam.get_deflection_function(29000, 100)
+
+    def test_cache_invalidated_by_add_loads(self):
+        beam = self._simple_beam()
+        f = beam.get_compiled_function("moment")
+        beam.add_loads([PointLoadV(10, 5)])
+        g = beam.get_compiled_function("moment")
+        assert g is not f
+        assert np.isclose(g(5.0), 50.0)
+
+    def test_cache_invalidated_by_supports_and_length(self):
+        beam = self._simple_beam()
+        f = beam.get_compiled_function("moment")
+        beam.rolling_support = 8
+        assert beam.get_compiled_function("moment") is not f
+        f = beam.get_compiled_function("moment")
+        beam.length = 12
+        assert beam.get_compiled_function("moment") is not f
+
+    def test_compiled_function_errors(self):
+        beam = self._simple_beam()
+        with pytest.raises(ValueError):
+            beam.get_compiled_function("torsion")
+        with pytest.raises(ValueError):
+            beam.get_compiled_function("deflection")
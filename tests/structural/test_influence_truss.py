@@ -11,7 +11,10 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pytest
 
-from civilpy.structural.influence_lines import InfluenceLine
+from civilpy.structural.influence_lines import (
+    InfluenceLine,
+    influence_line_from_ordinates,
+)
 from civilpy.structural.truss import Truss
 
 
@@ -86,6 +89,45 @@ class TestMovingLoads:
         plt.close("all")
 
 
+class TestExactTrainSearch:
+    def test_closed_form_lines_use_exact_search(self):
+        il = InfluenceLine.moment(span=20.0, section=10.0)
+        assert il.breakpoints.tolist() == [0.0, 10.0, 20.0]
+        r = il.maximize_axle_train([10.0], [0.0])
+        assert r.value == pytest.approx(50.0, abs=1e-9)
+        assert r.position == pytest.approx(10.0, abs=1e-9)
+
+    def test_shear_jump_seen_from_both_sides(self):
+        il = InfluenceLine.shear(span=20.0, section=8.0)
+        assert il.maximize_axle_train([10.0], [0.0]).value == pytest.approx(6.0)
+        # Left limit at the section: 10 * (1 - 8/20 - 1) = -4
+        low = il.maximize_axle_train([10.0], [0.0], sign=-1.0)
+        assert low.value == pytest.approx(-4.0, abs=1e-6)
+
+    def test_exact_beats_stepping_on_sampled_peak(self):
+        # A sharp sampled peak between 0.05 ft steps, with an off-grid spacing
+        il = influence_line_from_ordinates([0.0, 10.023, 24.034, 40.0],
+                                           [0.0, 5.0, 5.0, 0.0])
+        loads, spacing = [20.0, 20.0], [0.0, 14.011]
+        exact = il.maximize_axle_train(loads, spacing)
+        stepped = il.maximize_axle_train(loads, spacing, method="step")
+        assert exact.value == pytest.approx(200.0, abs=1e-9)
+        assert stepped.value < exact.value
+
+    def test_curved_lines_fall_back_to_stepping(self):
+        il = InfluenceLine.two_span_moment((40.0, 40.0), 20.0)
+        assert il.breakpoints is None
+        auto = il.maximize_axle_train([10.0], [0.0])
+        assert auto == il.maximize_axle_train([10.0], [0.0], method="step")
+        with pytest.raises(ValueError):
+            il.maximize_axle_train([10.0], [0.0], method="exact")
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            InfluenceLine.moment(20.0, 10.0).maximize_axle_train(
+                [10.0], [0.0], method="fast")
+
+
 class TestTruss:
     def _tri(self):
         t = Truss()
@@ -17,6 +17,7 @@
 """Spot-checks of the ODOT box-beam standard designs and load ratings
 against PSBDD-1-25."""
 
+import numpy as np
 import pytest
 
 from civilpy.structural.odot import (
@@ -25,8 +26,11 @@ from civilpy.structural.odot import (
     BOX_DESIGNATIONS,
     RATING_VEHICLES,
     box_beam_design,
+    box_beam_designs,
     box_beam_rating,
+    box_beam_rating_factors,
     designs_for_box,
+    shortest_design_for_span,
 )
 
 
@@ -136,3 +140,43 @@ class TestLoadRating:
     def test_missing_rating_raises(self):
         with pytest.raises(KeyError):
             box_beam_rating("CB17-48", 20, 40)
+
+
+class TestBatchLookups:
+    """Indexed and array lookups agree with the scalar ones."""
+
+    def test_rating_factors_match_scalar_lookup(self):
+        boxes = np.array([r.box for r in BOX_BEAM_RATINGS])
+        spans = np.array([r.span for r in BOX_BEAM_RATINGS])
+        widths = np.array([r.width_ft for r in BOX_BEAM_RATINGS])
+        for vehicle in ("inv", "op", "type3s2"):
+            rf = box_beam_rating_factors(boxes, spans, widths, vehicle)
+            expected = [box_beam_rating(b, s, w).rating_factors[vehicle]
+                        for b, s, w in zip(boxes, spans, widths)]
+            np.testing.assert_array_equal(rf, expected)
+
+    def test_rating_factors_broadcast_and_missing(self):
+        rf = box_beam_rating_factors(
+            "CB17-48", np.array([[20], [999]]), [24, 28, 32, 30]
+        )
+        assert rf.shape == (2, 4)
+        assert rf[0, 0] == 2.30
+        assert np.isnan(rf[0, 3]) and np.isnan(rf[1]).all()
+        assert np.isnan(box_beam_rating_factors("XB99-48", 20, 24))
+
+    def test_unknown_vehicle_raises(self):
+        with pytest.raises(ValueError, match="rating vehicle"):
+            box_beam_rating_factors("CB17-48", 20, 24, vehicle="hs20")
+
+    def test_designs_batch(self):
+        found = box_beam_designs(["CB21-48", "CB21-48", "B27-48"], [30, 31, 65])
+        assert found[0] is box_beam_design("CB21-48", 30)
+        assert found[1] is None
+        assert found[2].n_strands == box_beam_design("B27-48", 65).n_strands
+
+    def test_shortest_design_for_span(self):
+        assert shortest_design_for_span("CB21-48", 30).span == 30
+        assert shortest_design_for_span("CB21-48", 30.5).span == 35
+        assert shortest_design_for_span("CB21-48", 10).span == 30
+        with pytest.raises(KeyError):
+            shortest_design_for_span("CB21-48", 61)
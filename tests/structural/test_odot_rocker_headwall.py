@@ -17,6 +17,7 @@
 """Spot-checks of the bonus ODOT tables: structural steel rockers/bolsters
 (RB-1-55) and cast-in-place circular headwalls (HW-2.1)."""
 
+import numpy as np
 import pytest
 
 from civilpy.structural.odot import (
@@ -25,8 +26,11 @@ from civilpy.structural.odot import (
     MAX_MOVEMENT,
     ROCKER_BOLSTERS,
     headwall_for_diameter,
+    headwalls_for_diameters,
     rocker_bolster,
     smallest_for_load,
+    smallest_for_loads,
+    smallest_headwall_for_diameter,
 )
 
 
@@ -80,6 +84,18 @@ class TestRockerBolster:
         with pytest.raises(ValueError):
             smallest_for_load(400_000)
 
+    def test_non_finite_load_is_rejected(self):
+        for bad in (float("nan"), float("inf"), float("-inf")):
+            with pytest.raises(ValueError, match="finite"):
+                smallest_for_load(bad)
+        assert smallest_for_loads([float("nan"), float("-inf"), 60_000]).tolist() == [-1, -1, 75]
+
+    def test_smallest_for_loads_matches_scalar(self):
+        loads = np.linspace(0, 300_000, 1201)
+        expected = [smallest_for_load(x).capacity_kips for x in loads]
+        np.testing.assert_array_equal(smallest_for_loads(loads), expected)
+        assert smallest_for_loads([400_000])[0] == -1
+
     def test_movement_limit(self):
         assert MAX_MOVEMENT == 2.0
 
@@ -126,3 +142,18 @@ class TestHeadwall:
     def test_unknown_diameter_raises(self):
         with pytest.raises(KeyError):
             headwall_for_diameter(13)
+
+    def test_smallest_headwall_for_diameter(self):
+        assert smallest_headwall_for_diameter(12).diameter == 12
+        assert smallest_headwall_for_diameter(13).diameter == 15
+        with pytest.raises(ValueError):
+            smallest_headwall_for_diameter(300)
+
+    def test_headwalls_for_diameters(self):
+        exact = headwalls_for_diameters([12, 13, 36])
+        assert exact[0] is headwall_for_diameter(12)
+        assert exact[1] is None
+        assert exact[2] is headwall_for_diameter(36)
+        fitted = headwalls_for_diameters([13, 300], exact=False)
+        assert fitted[0] is smallest_headwall_for_diameter(13)
+        assert fitted[1] is None
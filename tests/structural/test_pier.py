@@ -60,6 +60,61 @@ class TestContinuousBeam:
         with pytest.raises(ValueError):
             pier.solve_continuous_beam(120, 1e8, supports=[])
 
+    def test_single_support_is_a_mechanism(self):
+        with pytest.raises(ValueError, match="mechanism"):
+            pier.solve_continuous_beam(120, 1e8, supports=[0.0], udl=1.0)
+        with pytest.raises(ValueError, match="mechanism"):
+            pier.solve_continuous_beam(120, 1e8, supports=[60.0, 60.0000001], udl=1.0)
+
+    def test_load_next_to_free_end(self):
+        # a tiny segment in the overhang must not wreck the solve
+        supports = [39.551, 101.642, 187.276]
+        near = pier.solve_continuous_beam(
+            198.45, 1e8, supports=supports, udl=1.4,
+            point_loads=[pier.PointLoad(0.0056, 23.4)], n_per_span=20,
+        )
+        at_end = pier.solve_continuous_beam(
+            198.45, 1e8, supports=supports, udl=1.4,
+            point_loads=[pier.PointLoad(0.0, 23.4)], n_per_span=20,
+        )
+        assert sum(near.reactions.values()) == pytest.approx(1.4 * 198.45 + 23.4, rel=1e-9)
+        for x in supports:
+            assert near.reactions[x] == pytest.approx(at_end.reactions[x], rel=1e-3)
+
+    def test_fine_mesh_three_span_udl(self):
+        # equal spans under UDL: end reactions 0.4wL, interior 1.1wL,
+        # support moment 0.1wL^2
+        span = 1200.0
+        sol = pier.solve_continuous_beam(
+            3 * span, 1e9, supports=[0, span, 2 * span, 3 * span], udl=1.0,
+            n_per_span=400,
+        )
+        assert sol.reactions[0] == pytest.approx(0.4 * span, rel=1e-6)
+        assert sol.reactions[span] == pytest.approx(1.1 * span, rel=1e-6)
+        assert sol.max_moment == pytest.approx(0.1 * span ** 2, rel=1e-4)
+
+    def test_banded_assembly_matches_dense(self):
+        import numpy as np
+
+        h = np.array([10.0, 4.0, 7.5])
+        ke = pier._beam_element_stiffnesses(2.0e6, h)
+        dense = np.zeros((8, 8))
+        for e, he in enumerate(h):
+            np.testing.assert_allclose(ke[e], pier._beam_element_stiffness(2.0e6, he))
+            dense[2 * e:2 * e + 4, 2 * e:2 * e + 4] += ke[e]
+        ab = pier._assemble_banded(ke)
+        for i in range(8):
+            for j in range(i, min(i + 4, 8)):
+                assert ab[3 + i - j, j] == pytest.approx(dense[i, j])
+
+    def test_loads_snap_to_nearest_node(self):
+        # a load just outside the beam lands on the end node
+        sol = pier.solve_continuous_beam(
+            120.0, 1e8, supports=[0.0, 120.0],
+            point_loads=[pier.PointLoad(125.0, 10.0)],
+        )
+        assert sol.reactions[120.0] == pytest.approx(10.0, abs=1e-6)
+
 
 class TestPierCap:
     def test_default_modulus(self):
@@ -248,3 +248,132 @@ class TestBoltMaterial(unittest.TestCase):
     def test_bolt_material_repr(self):
         from src.civilpy.structural.steel import A325
         self.assertIn("A325", repr(A325))
+
+
+class TestShapeTable(unittest.TestCase):
+    def setUp(self):
+        import os
+        import tempfile
+        from unittest import mock
+
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        env = mock.patch.dict(os.environ, {"CIVILPY_CACHE_DIR": self.tmp.name})
+        env.start()
+        self.addCleanup(env.stop)
+        self.csv = os.path.join(self.tmp.name, "shapes.csv")
+        with open(self.csv, "w") as f:
+            f.write("Name,Designation,W\n10WF12,A,11.5\n18WF96,B18a,96.0\n"
+                    "18WF96,B18b,96.5\n")
+
+    def test_loads_on_first_lookup(self):
+        from src.civilpy.structural.shape_db import ShapeTable
+        table = ShapeTable(self.csv)
+        self.assertFalse(table.loaded)
+        rows = table.lookup(Name="18WF96")
+        self.assertTrue(table.loaded)
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(table.lookup(Name="18WF96", Designation="B18b")["W"].values[0], 96.5)
+        self.assertEqual(len(table.lookup(Name="NOPE")), 0)
+
+    def test_cache_is_reused_and_rebuilt_when_csv_changes(self):
+        import os
+        from src.civilpy.structural.shape_db import ShapeTable
+        first = ShapeTable(self.csv)
+        first.frame
+        cached = first.cache_path()
+        self.assertTrue(os.path.exists(cached))
+        second = ShapeTable(self.csv)
+        self.assertEqual(second.cache_path(), cached)
+        self.assertEqual(second.frame["W"].tolist(), first.frame["W"].tolist())
+
+        with open(self.csv, "a") as f:
+            f.write("12WF27,A,27.0\n")
+        third = ShapeTable(self.csv)
+        self.assertNotEqual(third.cache_path(), cached)
+        self.assertEqual(third.lookup(Name="12WF27")["W"].values[0], 27.0)
+
+    def test_cache_is_plain_npz(self):
+        import numpy as np
+        import pandas as pd
+        from src.civilpy.structural.shape_db import ShapeTable
+        parsed = ShapeTable(self.csv).frame
+        path = ShapeTable(self.csv).cache_path()
+        self.assertTrue(path.endswith(".npz"))
+        with np.load(path, allow_pickle=False) as data:
+            self.assertIn("meta", data.files)
+        pd.testing.assert_frame_equal(ShapeTable(self.csv).frame, parsed)
+
+    def test_module_tables_stay_available(self):
+        from src.civilpy.structural import steel
+        frame = steel.steel_tables
+        self.assertIs(frame, steel.shape_table.frame)
+        self.assertEqual(len(SteelSection("W36X150").aisc_value), 1)
+        with self.assertRaises(AttributeError):
+            steel.not_a_table
+
+
+class TestShapeQueries(unittest.TestCase):
+    def test_select_matches_brute_force(self):
+        import numpy as np
+        from src.civilpy.structural.steel import shapes
+        w = shapes("W")
+        rng = np.random.default_rng(5)
+        zx_min = rng.uniform(20.0, 2000.0, 200)
+        d_max = rng.uniform(12.0, 40.0, 200)
+        picks = w.select(top_k=3, Zx=(zx_min, None), d=(None, d_max))
+        weight, zx, d = w["W"], w["Zx"], w["d"]
+        for i in range(200):
+            ok = np.flatnonzero((zx >= zx_min[i]) & (d <= d_max[i]))
+            expected = ok[np.argsort(weight[ok], kind="stable")][:3].tolist()
+            got = [p for p in picks[i].tolist() if p >= 0]
+            self.assertEqual(got, expected)
+
+    def test_quantity_bounds_and_units_at_boundary(self):
+        from src.civilpy.structural.steel import shapes
+        w = shapes("W")
+        by_inches = w.lightest(Zx=(250.0, None), d=(None, 24.5))
+        by_units = w.lightest(Zx=(250.0 * units("in^3"), None),
+                              d=(None, (24.5 / 12.0) * units("ft")))
+        self.assertEqual(by_inches, by_units)
+        self.assertEqual(str(w.quantity("Zx").units), "inch ** 3")
+        self.assertIsNone(w.lightest(Zx=(1e6, None)))
+
+    def test_lightest_on_empty_set(self):
+        import numpy as np
+        from src.civilpy.structural.steel import shapes
+        empty = shapes("W").filter(d=(None, 1.0))
+        self.assertEqual(len(empty), 0)
+        self.assertIsNone(empty.lightest(Zx=(1.0, None)))
+        self.assertEqual(empty.lightest(Zx=(np.array([1.0, 2.0]), None)).tolist(),
+                         [None, None])
+
+    def test_filter_sort_and_sections(self):
+        from src.civilpy.structural.steel import shapes
+        picks = shapes("W").filter(d=(None, 10.5), W=(30.0, None)).sort("W")
+        self.assertTrue((picks["d"] <= 10.5).all())
+        self.assertEqual(picks["W"].tolist(), sorted(picks["W"].tolist()))
+        first = picks.take([0]).sections(W)[0]
+        self.assertEqual(first.weight.magnitude, picks["W"][0])
+
+    def test_mismatched_demands(self):
+        from src.civilpy.structural.steel import shapes
+        with self.assertRaises(ValueError):
+            shapes("W").select(Zx=([1.0, 2.0], None), d=(None, [10.0, 20.0, 30.0]))
+
+    def test_lrfd_args_feed_batch_checks(self):
+        from src.civilpy.structural.aashto import lrfd
+        from src.civilpy.structural.steel import shapes
+        w = shapes("W").filter(d=(None, 21.0))
+        check = lrfd.lateral_torsional_buckling_resistance
+        args = w.lrfd_args(check)
+        self.assertEqual(set(args), {"b_fc", "t_fc", "d_c", "t_w"})
+        batch = check.batch(l_b=180.0, f_yc=50.0, f_yw=50.0, **args)
+        row = W(w.labels[3])
+        d_web = row.depth.magnitude - 2 * row.flange_thickness.magnitude
+        expected = check(l_b=180.0, b_fc=row.flange_width.magnitude,
+                         t_fc=row.flange_thickness.magnitude, d_c=d_web / 2,
+                         t_w=row.web_thickness.magnitude, f_yc=50.0, f_yw=50.0)
+        self.assertAlmostEqual(batch.capacity[3], expected.capacity)
+        with self.assertRaises(ValueError):
+            shapes("HSS").lrfd_args(check)
@@ -25,7 +25,10 @@ import pytest
 from civilpy.structural.strut_and_tie import StrutAndTieModel
 from civilpy.structural.stm_topology import DRegionProblem, Material
 from civilpy.structural.stm_topology.mesh import GroundMesh
-from civilpy.structural.stm_topology.simp import optimize_density, element_stiffness
+from civilpy.structural.stm_topology.simp import (
+    AssemblyPlan, optimize_density, optimize_density_multilevel,
+    upsample_density, element_stiffness,
+)
 from civilpy.structural.stm_topology.extract import (
     zhang_suen, extract_truss, is_stable,
 )
@@ -124,6 +127,73 @@ def test_simp_runs_and_reduces_compliance():
     assert 0.0 <= res.density.min() and res.density.max() <= 1.0 + 1e-9
 
 
+def test_assembly_plan_matches_coo_assembly():
+    import scipy.sparse as sp
+    mesh = GroundMesh(DRegionProblem.rectangle(20, 10, thickness=2.0), nelx=16)
+    KE, edof, ndof = element_stiffness(0.2), mesh.edof_matrix(), mesh.n_dofs
+    free = np.setdiff1d(np.arange(ndof), [0, 1, 7, ndof - 1])
+    modulus = np.random.default_rng(3).uniform(1e-3, 1.0, edof.shape[0])
+    iK = np.kron(edof, np.ones((8, 1))).flatten()
+    jK = np.kron(edof, np.ones((1, 8))).flatten()
+    sK = (KE.flatten()[:, None] * modulus[None, :]).flatten(order="F")
+    ref = sp.coo_matrix((sK, (iK, jK)), shape=(ndof, ndof)).tocsc()[free, :][:, free]
+    K = AssemblyPlan(edof, KE, free, ndof).assemble(modulus)
+    assert K.has_sorted_indices
+    assert abs(K - ref).max() < 1e-12
+
+
+def test_simp_solver_backends_agree():
+    p = DRegionProblem.rectangle(20, 10, thickness=2.0, vol_frac=0.35)
+    p.add_support(1, 0, bearing=1.5)
+    p.add_support(19, 0, fix_x=False, bearing=1.5)
+    p.add_load(10, 10, fy=-600, bearing=1.5)
+    mesh = GroundMesh(p, nelx=40)
+    direct = optimize_density(mesh, vol_frac=0.35, max_iter=40)
+    pcg = optimize_density(mesh, vol_frac=0.35, max_iter=40, solver="pcg")
+    assert pcg.compliance == pytest.approx(direct.compliance, rel=1e-6)
+    assert np.abs(pcg.density - direct.density).max() < 1e-5
+    with pytest.raises(ValueError, match="unknown solver"):
+        optimize_density(mesh, solver="gmres")
+
+
+def test_upsample_density_preserves_layout():
+    p = DRegionProblem.rectangle(20, 10, thickness=2.0)
+    coarse, fine = GroundMesh(p, nelx=20), GroundMesh(p, nelx=40)
+    field = np.clip(coarse.cx / 20.0, 0, 1)           # linear ramp in x
+    up = upsample_density(field, coarse, fine)
+    assert up.shape == (fine.nely, fine.nelx)
+    inner = (fine.cx > coarse.cx[0, 0]) & (fine.cx < coarse.cx[0, -1])
+    assert np.allclose(up[inner], fine.cx[inner] / 20.0)
+
+
+def test_multilevel_simp_matches_single_level():
+    p = DRegionProblem.rectangle(20, 10, thickness=2.0, vol_frac=0.35)
+    p.add_support(1, 0, bearing=1.5)
+    p.add_support(19, 0, fix_x=False, bearing=1.5)
+    p.add_load(10, 10, fy=-600, bearing=1.5)
+    single = optimize_density(GroundMesh(p, nelx=48), vol_frac=0.35, max_iter=60)
+    multi = optimize_density_multilevel(p, 48, levels=3, vol_frac=0.35,
+                                        max_iter=60, penal_start=2.0)
+    assert [lv[0] for lv in multi.levels] == [12, 24, 48]
+    assert [lv[2] for lv in multi.levels] == [2.0, 2.5, 3.0]
+    assert multi.density.shape == single.density.shape
+    assert multi.compliance == pytest.approx(single.compliance, rel=0.05)
+    active = multi.mesh.active
+    assert multi.density[active].mean() == pytest.approx(0.35, abs=0.01)
+
+
+def test_multilevel_pipeline_result_unchanged_shape():
+    p = DRegionProblem.rectangle(20, 10, thickness=2.0, vol_frac=0.35)
+    p.add_support(1, 0, bearing=1.5)
+    p.add_support(19, 0, fix_x=False, bearing=1.5)
+    p.add_load(10, 10, fy=-600, bearing=1.5)
+    result = p.solve(nelx=60, max_iter=40, levels=2)
+    assert result.stable
+    assert result.mesh.nelx == 60
+    ry = sum(v[1] for v in result.model.reactions.values())
+    assert ry == pytest.approx(600.0, abs=1.0)
+
+
 # ── Phase 3: extraction (thinning) ───────────────────────────────────────────
 
 def test_zhang_suen_thins_to_one_pixel():
@@ -302,6 +372,21 @@ def test_optimize_pier_cap_picks_shallowest_feasible():
     assert ry == pytest.approx(1250.0, rel=0.02)
 
 
+def test_optimize_pier_cap_parallel_early_stop_is_deterministic():
+    """A process-pool sweep returns the serial answer in sweep order, and
+    early_stop drops depths whose concrete alone out-costs the optimum."""
+    kwargs = dict(loads=[250, 250, 250, 250, 250],
+                  load_xs=[2.5, 12.5, 20, 27.5, 37.5], column_xs=[5, 20, 35],
+                  depth_bounds=(3.0, 7.0), n_depths=3, nelx=60, early_stop=True)
+    serial = optimize_pier_cap(**kwargs)
+    parallel = optimize_pier_cap(max_workers=2, **kwargs)
+    for design in (serial, parallel):
+        assert [c.depth for c in design.candidates] == [3.0, 5.0]
+        assert design.skipped == [7.0]
+        assert design.optimal.depth == pytest.approx(5.0)
+    assert parallel.optimal.cost == pytest.approx(serial.optimal.cost)
+
+
 # ── pluggable unit-price provider (ODOT estimator tie-in) ─────────────────────
 
 def test_price_provider_injection_and_fallback():
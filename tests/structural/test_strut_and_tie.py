@@ -107,3 +107,166 @@ class TestClassify:
 
     def test_classify_none_before_solve_when_auto(self):
         assert _example_1().classify(("B", "C")) is None
+
+
+def _pratt(panels, braced=False):
+    """Simply supported Pratt truss, 10 ft panels x 12 ft deep, 10-kip panel
+    loads on the bottom chord; ``braced`` adds the second diagonal in every
+    panel (indeterminate, DSM only)."""
+    m = StrutAndTieModel()
+    for i in range(panels + 1):
+        m.add_node(f"L{i}", 10.0 * i, 0.0)
+        m.add_node(f"U{i}", 10.0 * i, 12.0)
+    for i in range(panels):
+        m.add_member(f"L{i}", f"L{i + 1}")
+        m.add_member(f"U{i}", f"U{i + 1}")
+        left = i < panels // 2
+        m.add_member(*((f"L{i}", f"U{i + 1}") if left else (f"U{i}", f"L{i + 1}")))
+        if braced:
+            m.add_member(*((f"U{i}", f"L{i + 1}") if left else (f"L{i}", f"U{i + 1}")))
+    for i in range(panels + 1):
+        m.add_member(f"L{i}", f"U{i}")
+    m.add_support("L0", fix_x=True, fix_y=True)
+    m.add_support(f"L{panels}", fix_y=True)
+    for i in range(1, panels):
+        m.add_load(f"L{i}", fy=-10.0)
+    return m
+
+
+def _residual(m):
+    """Largest nodal equilibrium residual of a solved model."""
+    res = {n: [0.0, 0.0] for n in m.nodes}
+    for (a, b), f in m.forces.items():
+        cx, cy, _ = m._direction(a, b)
+        res[a][0] += f * cx; res[a][1] += f * cy
+        res[b][0] -= f * cx; res[b][1] -= f * cy
+    for n, (fx, fy) in m.loads.items():
+        res[n][0] += fx; res[n][1] += fy
+    for n, (rx, ry) in m.reactions.items():
+        res[n][0] += rx; res[n][1] += ry
+    return max(abs(v) for r in res.values() for v in r)
+
+
+class TestSparseSolvers:
+    def test_large_determinate_joints_matches_stiffness(self):
+        m = _pratt(200)
+        assert m.degree_of_indeterminacy() == 0
+        joints = dict(m.solve(method="joints"))
+        stiffness = m.solve(method="stiffness")
+        for mem, f in joints.items():
+            assert stiffness[mem] == pytest.approx(f, rel=1e-6, abs=1e-6)
+        # midspan bottom chord: M / d = (wL^2/8 equivalent) of the panel loads
+        assert joints[("L99", "L100")] == pytest.approx(
+            (199 * 10.0 / 2 * 1000.0 - 10.0 * sum(10.0 * k for k in range(1, 100)))
+            / 12.0, rel=1e-9)
+
+    def test_large_indeterminate_in_equilibrium(self):
+        m = _pratt(150, braced=True)
+        assert m.degree_of_indeterminacy() > 0
+        m.solve()
+        assert _residual(m) < 1e-6
+        assert m.reactions["L0"][1] == pytest.approx(149 * 10.0 / 2)
+
+    def test_geometry_cache_tracks_node_moves(self):
+        m = _example_1()
+        m.solve(method="stiffness")
+        geom = m._geometry()
+        assert m._geometry() is geom
+        m.add_node("E", 9, 6)               # move E -> new geometry
+        assert m._geometry() is not geom
+        m.solve(method="stiffness")
+        assert _residual(m) < 1e-6
+
+    def test_zero_length_member_raises(self):
+        m = _example_1()
+        m.add_node("G", 18, 16 / 3)
+        m.add_member("F", "G")
+        with pytest.raises(ValueError, match="zero length"):
+            m.solve(method="stiffness")
+
+
+class TestSolveCases:
+    def test_columns_match_single_solves(self):
+        m = _pratt(12, braced=True)
+        cases = m.unit_load_cases([f"L{i}" for i in range(1, 12)])
+        res = m.solve_cases(cases)
+        assert res.forces.shape == (len(m.members), 11)
+        for label, loads in cases.items():
+            m.loads = {n: list(v) for n, v in loads.items()}
+            single = m.solve()
+            for mem, f in res.case(label).items():
+                assert f == pytest.approx(single[mem], abs=1e-9)
+            assert res.reaction("L0")[res.cases.index(label)] == pytest.approx(
+                m.reactions["L0"][1])
+
+    def test_factorization_reused_until_model_changes(self):
+        m = _pratt(8)
+        m.solve_cases([{"L2": (0, -1)}])
+        fac = m._factor_cache
+        m.solve_cases([{"L3": (0, -1)}, {"L4": (5, 0)}])
+        m.solve()
+        assert m._factor_cache is fac
+        m.add_support("L8", fix_x=True, fix_y=True)
+        m.solve_cases([{"L3": (0, -1)}], method="stiffness")
+        assert m._factor_cache is not fac
+
+    def test_envelope_and_no_state_change(self):
+        m = _pratt(4)
+        before = dict(m.loads)
+        res = m.solve_cases({"up": {"L2": (0, 10)}, "down": {"L2": (0, -10)}})
+        lo, hi = res.envelope()[("L1", "L2")]
+        assert lo == pytest.approx(-hi)
+        assert m.forces is None and m.loads == before
+
+    def test_empty_cases_raise(self):
+        with pytest.raises(ValueError, match="no load cases"):
+            _pratt(4).solve_cases({})
+
+
+class TestIncrementalResolve:
+    def test_low_rank_update_matches_fresh_factor(self):
+        m = _pratt(30, braced=True)
+        m.solve()
+        m.areas[("L3", "L4")] = 3.0
+        m.areas[("U7", "L8")] = 0.2
+        updated = dict(m.solve())
+        assert m._factor_cache.update == "woodbury"
+        fresh = _pratt(30, braced=True)
+        fresh.areas = dict(m.areas)
+        for mem, f in fresh.solve().items():
+            assert updated[mem] == pytest.approx(f, abs=1e-7)
+
+    def test_many_changes_refactor(self):
+        m = _pratt(30, braced=True)
+        m.solve()
+        m.areas = {mem: 2.0 + i % 3 for i, mem in enumerate(m.members)}
+        m.solve()
+        assert m._factor_cache.update == "factor"
+
+    def test_fully_stressed_logs_iterations(self):
+        m = _pratt(40, braced=True)
+        m.solve_fully_stressed()
+        log = m.iteration_log
+        assert log and [r.iteration for r in log] == list(range(1, len(log) + 1))
+        assert all(r.seconds >= 0 and r.update in ("factor", "woodbury", "reuse")
+                   for r in log)
+        assert log[0].changed == len(m.members) - 1   # peak member stays at 1.0
+        assert _residual(m) < 1e-6
+
+    def test_area_tol_skips_small_resizes(self):
+        exact, loose = _pratt(40, braced=True), _pratt(40, braced=True)
+        f_exact = exact.solve_fully_stressed()
+        f_loose = loose.solve_fully_stressed(area_tol=1e-2)
+        assert sum(r.changed for r in loose.iteration_log) < sum(
+            r.changed for r in exact.iteration_log)
+        scale = max(abs(f) for f in f_exact.values())
+        for mem, f in f_exact.items():
+            assert f_loose[mem] == pytest.approx(f, abs=0.05 * scale)
+        assert _residual(loose) < 1e-6
+
+    def test_unchanged_pass_logs_reuse(self):
+        m = _pratt(40, braced=True)
+        m.solve_fully_stressed(area_tol=0.05)
+        log = m.iteration_log
+        assert all((r.update == "reuse") == (r.changed == 0) for r in log)
+        assert log[-1].changed == 0 and log[-1].update == "reuse"
@@ -354,3 +354,30 @@ def test_to_midas_sends_in_order_and_reports_errors():
     assert report["NODE"]["sent"] == len(b.midas_payloads()["NODE"])
     # one error does not stop later tables
     assert "LLAN" in report and "sent" in report["LLAN"]
+
+
+def test_solve_cases_match_per_case_solves():
+    b = six_panel_pratt()
+    b.set_deck(Deck(width_ft=18.0, offset_ft=3.0))
+    res = b.solve_cases()
+    for plane in ("near", "far"):
+        for case in ("dc", "dw", "total"):
+            expected = b.solve(plane, case)
+            got = res.case((plane, case))
+            for key, f in expected.items():
+                assert got[key] == pytest.approx(f)
+
+
+def test_member_influence_lines_from_panel_unit_loads():
+    b = six_panel_pratt()
+    res = b.panel_point_influence()
+    assert res.cases == [f"L{i}" for i in range(7)]
+    lines = b.member_influence_lines()
+    bc = b.member("L2", "L3")
+    # unit load at L3 (midspan, x = 75): M = 0.5 * 50 about U2, depth 30
+    assert lines[bc].eta(75.0) == pytest.approx(0.5 * 50.0 / 30.0)
+    # superposing the panel-point ordinates reproduces the dead-load force
+    b.set_deck(Deck(width_ft=20.0))
+    loads = b.panel_point_loads("near")
+    total = sum(p * lines[bc].eta(b.nodes[n][0]) for n, p in loads.items())
+    assert total == pytest.approx(b.solve("near")[bc.key])
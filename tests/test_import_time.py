@@ -0,0 +1,52 @@
+"""Import-cost regression guards for the lazily exporting packages.
+
+Each import runs in a fresh interpreter so earlier tests cannot have
+pre-loaded anything.  The check is that the package import leaves the heavy
+optional stacks (matplotlib, pandas, pint, sympy, sqlalchemy) out of
+``sys.modules`` -- deterministic, unlike a wall-clock comparison.
+"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY = ("matplotlib", "pandas", "pint", "sympy", "sqlalchemy")
+
+LAZY_PACKAGES = (
+    "civilpy.general",
+    "civilpy.geotech",
+    "civilpy.structural.aashto.lrfd",
+    "civilpy.structural.odot",
+)
+
+_PROBE = """
+import json, sys
+import {module}
+print(json.dumps(sorted(m for m in {heavy!r} if m in sys.modules)))
+"""
+
+
+def _heavy_loaded(module: str) -> list:
+    out = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(module=module, heavy=HEAVY)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("module", LAZY_PACKAGES)
+def test_package_import_skips_heavy_dependencies(module):
+    assert _heavy_loaded(module) == []
+
+
+def test_lazy_names_resolve_on_access():
+    from civilpy.geotech import Borehole, spt
+    from civilpy.structural.aashto.lrfd import plot_pm_interaction
+    import civilpy.structural.odot as odot
+
+    assert Borehole.__name__ == "Borehole"
+    assert spt.__name__ == "civilpy.geotech.spt"
+    assert callable(plot_pm_interaction)
+    assert "BridgeRailing" in dir(odot)
+    assert odot.BridgeRailing.__module__ == "civilpy.structural.odot.bridge_railing"